@@ -0,0 +1,96 @@
+# Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+from statistics import mean, median
+from typing import Dict, List
+
+# The imports to measure, each one in fresh interpreters
+IMPORTS = {
+    "import glide": "import glide",
+    "import client": "from glide import GlideClient, GlideClientConfiguration",
+    "import all": "from glide import *",
+}
+
+arguments_parser = argparse.ArgumentParser(
+    description="Measures the time it takes to import glide in a fresh interpreter."
+)
+arguments_parser.add_argument(
+    "--resultsFile",
+    help="Where to write the results file",
+    required=False,
+    default="../results/python-import-results.json",
+)
+arguments_parser.add_argument(
+    "--iterations",
+    help="Number of fresh interpreters to measure every import in",
+    required=False,
+    default="20",
+)
+arguments_parser.add_argument(
+    "--maxImportMs",
+    help="Fail if the median time of `import glide` exceeds this many milliseconds",
+    required=False,
+    default=None,
+)
+args = arguments_parser.parse_args()
+
+
+def measure_import(statement: str) -> float:
+    # The import is timed inside the interpreter, so the interpreter startup isn't measured
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"{statement}; print(time.perf_counter() - start)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return float(result.stdout.strip()) * 1000
+
+
+def measure(statement: str, iterations: int) -> List[float]:
+    # The first import compiles the bytecode caches, it isn't measured
+    measure_import(statement)
+    return [measure_import(statement) for _ in range(iterations)]
+
+
+def main():
+    iterations = int(args.iterations)
+    results: List[Dict] = []
+    for name, statement in IMPORTS.items():
+        timings = measure(statement, iterations)
+        result = {
+            "import": name,
+            "statement": statement,
+            "iterations": iterations,
+            "median_ms": median(timings),
+            "average_ms": mean(timings),
+            "min_ms": min(timings),
+            "max_ms": max(timings),
+            "python": sys.version.split()[0],
+            "timestamp": time.time(),
+        }
+        print(
+            f"{name}: median {result['median_ms']:.1f} ms, average {result['average_ms']:.1f} ms, "
+            f"min {result['min_ms']:.1f} ms"
+        )
+        results.append(result)
+
+    results_file = Path(args.resultsFile)
+    results_file.parent.mkdir(parents=True, exist_ok=True)
+    results_file.write_text(json.dumps(results, indent=2))
+
+    if args.maxImportMs is not None:
+        median_ms = results[0]["median_ms"]
+        if median_ms > float(args.maxImportMs):
+            sys.exit(
+                f"`import glide` took {median_ms:.1f} ms, more than the limit of {args.maxImportMs} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
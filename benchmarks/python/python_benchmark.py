@@ -1,7 +1,6 @@
 # Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
 
 import argparse
-import asyncio
 import functools
 import json
 import math
@@ -13,9 +12,13 @@ from pathlib import Path
 from statistics import mean
 from typing import List
 
+import anyio
 import numpy as np
 import redis.asyncio as redispy  # type: ignore
 from glide import (
+    AdvancedGlideClientConfiguration,
+    AdvancedGlideClusterClientConfiguration,
+    ClientTransport,
     GlideClientConfiguration,
     GlideClusterClientConfiguration,
     GlideClient,
@@ -34,6 +37,13 @@ class ChosenAction(Enum):
 
 PORT = 6379
 
+# The event loops the benchmark can run on, mapped to their anyio backend and its options
+EVENT_LOOPS = {
+    "asyncio": ("asyncio", {}),
+    "uvloop": ("asyncio", {"use_uvloop": True}),
+    "trio": ("trio", {}),
+}
+
 arguments_parser = argparse.ArgumentParser()
 arguments_parser.add_argument(
     "--resultsFile",
@@ -88,6 +98,14 @@ arguments_parser.add_argument(
 arguments_parser.add_argument(
     "--minimal", help="Should run a minimal benchmark", action="store_true"
 )
+arguments_parser.add_argument(
+    "--loops",
+    help="Which event loops to run the clients on",
+    nargs="+",
+    choices=list(EVENT_LOOPS),
+    required=False,
+    default=list(EVENT_LOOPS),
+)
 args = arguments_parser.parse_args()
 
 PROB_GET = 0.8
@@ -95,7 +113,6 @@ PROB_GET_EXISTING_KEY = 0.8
 SIZE_GET_KEYSPACE = 3750000  # 3.75 million
 SIZE_SET_KEYSPACE = 3000000  # 3 million
 started_tasks_counter = 0
-running_tasks = set()
 bench_json_results: List[str] = []
 
 
@@ -176,13 +193,11 @@ async def create_and_run_concurrent_tasks(
     global get_latency
     global set_latency
     started_tasks_counter = 0
-    for _ in range(num_of_concurrent_tasks):
-        task = asyncio.create_task(
-            execute_commands(clients, total_commands, data_size, action_latencies)
-        )
-        running_tasks.add(task)
-        task.add_done_callback(running_tasks.discard)
-    await asyncio.gather(*(list(running_tasks)))
+    async with anyio.create_task_group() as task_group:
+        for _ in range(num_of_concurrent_tasks):
+            task_group.start_soon(
+                execute_commands, clients, total_commands, data_size, action_latencies
+            )
 
 
 def latency_results(prefix, latencies):
@@ -265,7 +280,9 @@ async def main(
     use_tls,
     is_cluster,
 ):
-    if clients_to_run == "all":
+    # redis-py and glide's socket transport run on asyncio loops only
+    is_asyncio = EVENT_LOOPS[event_loop_name][0] == "asyncio"
+    if clients_to_run == "all" and is_asyncio:
         client_class = redispy.RedisCluster if is_cluster else redispy.Redis
         clients = await create_clients(
             client_count,
@@ -288,26 +305,45 @@ async def main(
             await client.aclose()
 
     if clients_to_run == "all" or clients_to_run == "glide":
-        # Glide Socket
-        client_class = GlideClusterClient if is_cluster else GlideClient
-        config = GlideClusterClientConfiguration(
-            [NodeAddress(host=host, port=port)], use_tls=use_tls
-        ) if is_cluster else GlideClientConfiguration(
-            [NodeAddress(host=host, port=port)], use_tls=use_tls
-        )
-        clients = await create_clients(
-            client_count,
-            lambda: client_class.create(config),
-        )
-        await run_clients(
-            clients,
-            "glide",
-            event_loop_name,
-            total_commands,
-            num_of_concurrent_tasks,
-            data_size,
-            is_cluster,
+        transports = (
+            [ClientTransport.SOCKET, ClientTransport.IN_PROCESS]
+            if is_asyncio
+            else [ClientTransport.IN_PROCESS]
         )
+        for transport in transports:
+            client_class = GlideClusterClient if is_cluster else GlideClient
+            config = (
+                GlideClusterClientConfiguration(
+                    [NodeAddress(host=host, port=port)],
+                    use_tls=use_tls,
+                    advanced_config=AdvancedGlideClusterClientConfiguration(
+                        transport=transport
+                    ),
+                )
+                if is_cluster
+                else GlideClientConfiguration(
+                    [NodeAddress(host=host, port=port)],
+                    use_tls=use_tls,
+                    advanced_config=AdvancedGlideClientConfiguration(
+                        transport=transport
+                    ),
+                )
+            )
+            clients = await create_clients(
+                client_count,
+                lambda: client_class.create(config),
+            )
+            await run_clients(
+                clients,
+                "glide" if transport == ClientTransport.SOCKET else "glide_in_process",
+                event_loop_name,
+                total_commands,
+                num_of_concurrent_tasks,
+                data_size,
+                is_cluster,
+            )
+            for client in clients:
+                await client.close()
 
 
 def number_of_iterations(num_of_concurrent_tasks):
@@ -335,13 +371,19 @@ if __name__ == "__main__":
         if int(number_of_clients) <= int(num_of_concurrent_tasks)
     ]
 
-    for data_size, num_of_concurrent_tasks, number_of_clients in product_of_arguments:
-        iterations = (
-            1000 if args.minimal else number_of_iterations(num_of_concurrent_tasks)
-        )
-        asyncio.run(
-            main(
-                "asyncio",
+    for event_loop_name in args.loops:
+        backend, backend_options = EVENT_LOOPS[event_loop_name]
+        for (
+            data_size,
+            num_of_concurrent_tasks,
+            number_of_clients,
+        ) in product_of_arguments:
+            iterations = (
+                1000 if args.minimal else number_of_iterations(num_of_concurrent_tasks)
+            )
+            anyio.run(
+                main,
+                event_loop_name,
                 iterations,
                 num_of_concurrent_tasks,
                 data_size,
@@ -350,7 +392,8 @@ if __name__ == "__main__":
                 number_of_clients,
                 use_tls,
                 is_cluster,
+                backend=backend,
+                backend_options=backend_options,
             )
-        )
 
     process_results()
@@ -13,6 +13,7 @@ with open(output_file_name, "w+") as output_file:
     base_fields = [
         "language",
         "client",
+        "loop",
         "is_cluster",
         "num_of_tasks",
         "data_size",
@@ -52,6 +53,8 @@ with open(output_file_name, "w+") as output_file:
                 raise Exception(f"Unknown language for {json_file_name}")
             for json_object in json_objects:
                 json_object["language"] = language
+                # Only the python benchmark runs on several event loops
+                json_object.setdefault("loop", "")
                 values = [json_object[field] for field in base_fields]
                 writer.writerow(values)
 
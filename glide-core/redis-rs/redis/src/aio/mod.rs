@@ -235,10 +235,29 @@ where
         .query_async(con)
         .await;
 
-    // resubscribe
+    // The invalidation messages of client side caching are pushed on the connection, which requires RESP3
     if connection_info.protocol != ProtocolVersion::RESP3 {
         return Ok(());
     }
+    if let Some(client_tracking) = &connection_info.client_tracking {
+        let mut tracking_command = cmd("CLIENT");
+        tracking_command.arg("TRACKING").arg("ON");
+        if client_tracking.bcast {
+            tracking_command.arg("BCAST");
+            for prefix in client_tracking.prefixes.iter() {
+                tracking_command.arg("PREFIX").arg(prefix);
+            }
+        }
+        match tracking_command.query_async(con).await {
+            Ok(Value::Okay) => {}
+            _ => fail!((
+                ErrorKind::ResponseError,
+                "Redis server refused to enable client tracking"
+            )),
+        }
+    }
+
+    // resubscribe
     static KIND_TO_COMMAND: [(PubSubSubscriptionKind, &str); 3] = [
         (PubSubSubscriptionKind::Exact, "SUBSCRIBE"),
         (PubSubSubscriptionKind::Pattern, "PSUBSCRIBE"),
@@ -998,6 +998,7 @@ pub(crate) fn get_connection_info(
             protocol: cluster_params.protocol,
             db: 0,
             pubsub_subscriptions: cluster_params.pubsub_subscriptions,
+            client_tracking: cluster_params.client_tracking,
         },
     })
 }
@@ -6,7 +6,7 @@ use crate::cluster_topology::{
 use crate::connection::{ConnectionAddr, ConnectionInfo, IntoConnectionInfo};
 use crate::types::{ErrorKind, ProtocolVersion, RedisError, RedisResult};
 use crate::{cluster, cluster::TlsMode};
-use crate::{PubSubSubscriptionInfo, PushInfo};
+use crate::{ClientTrackingInfo, PubSubSubscriptionInfo, PushInfo};
 use rand::Rng;
 #[cfg(feature = "cluster-async")]
 use std::ops::Add;
@@ -50,6 +50,7 @@ struct BuilderParams {
     response_timeout: Option<Duration>,
     protocol: ProtocolVersion,
     pubsub_subscriptions: Option<PubSubSubscriptionInfo>,
+    client_tracking: Option<ClientTrackingInfo>,
     open_telemetry_config: Option<GlideOpenTelemetryConfig>,
 }
 
@@ -150,6 +151,7 @@ pub struct ClusterParams {
     pub(crate) response_timeout: Duration,
     pub(crate) protocol: ProtocolVersion,
     pub(crate) pubsub_subscriptions: Option<PubSubSubscriptionInfo>,
+    pub(crate) client_tracking: Option<ClientTrackingInfo>,
 }
 
 impl ClusterParams {
@@ -182,6 +184,7 @@ impl ClusterParams {
             response_timeout: value.response_timeout.unwrap_or(Duration::MAX),
             protocol: value.protocol,
             pubsub_subscriptions: value.pubsub_subscriptions,
+            client_tracking: value.client_tracking,
         })
     }
 }
@@ -520,6 +523,12 @@ impl ClusterClientBuilder {
         self.builder_params.pubsub_subscriptions = Some(pubsub_subscriptions);
         self
     }
+
+    /// Sets the client side caching mode that is enabled on the connections of the new ClusterClient.
+    pub fn client_tracking(mut self, client_tracking: ClientTrackingInfo) -> ClusterClientBuilder {
+        self.builder_params.client_tracking = Some(client_tracking);
+        self
+    }
 }
 
 /// This is a Redis Cluster client.
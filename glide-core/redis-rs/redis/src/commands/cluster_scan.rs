@@ -62,6 +62,7 @@ type SlotsBitsArray = [u64; BITS_ARRAY_SIZE as usize];
 /// - `count`: Optional limit on number of keys returned per iteration
 /// - `object_type`: Optional filter for specific data types
 /// - `allow_non_covered_slots`: Whether to continue if some slots are uncovered
+/// - `slot_ranges`: Optional slot ranges that the scan is restricted to
 ///
 /// See examples below for usage with the builder pattern.
 /// # Examples
@@ -106,6 +107,10 @@ pub struct ClusterScanArgs {
 
     /// Flag indicating whether to allow scanning when there are slots not covered by the cluster, by default it is set to false and the scan will stop if some slots are not covered.
     pub allow_non_covered_slots: bool,
+
+    /// Optional inclusive slot ranges that the scan is restricted to, used only when the scan is initiated.
+    /// Scans of disjoint slot ranges can run concurrently, and together they have the guarantees of a scan of all of the slots.
+    pub slot_ranges: Option<Vec<(u16, u16)>>,
 }
 
 impl ClusterScanArgs {
@@ -150,6 +155,8 @@ pub struct ClusterScanArgsBuilder {
     object_type: Option<ObjectType>,
     /// By default, the flag to allow scanning non-covered slots is set to `false`, meaning scanning will stop if some slots are not covered.
     allow_non_covered_slots: Option<bool>,
+    /// By default, the slot ranges are set to `None` and all of the slots are scanned.
+    slot_ranges: Option<Vec<(u16, u16)>>,
 }
 
 impl ClusterScanArgsBuilder {
@@ -218,6 +225,23 @@ impl ClusterScanArgsBuilder {
         self
     }
 
+    /// Restricts the scan to the given slot ranges.
+    ///
+    /// # Arguments
+    ///
+    /// * `slot_ranges` - The inclusive `(start, end)` ranges of the slots to scan.
+    ///
+    /// Keys of the slots outside of the ranges may still be returned, when a node that is scanned
+    /// owns slots both in and out of the ranges.
+    ///
+    /// # Returns
+    ///
+    /// The updated [`ClusterScanArgsBuilder`] instance.
+    pub fn with_slot_ranges(mut self, slot_ranges: Vec<(u16, u16)>) -> Self {
+        self.slot_ranges = Some(slot_ranges);
+        self
+    }
+
     /// Builds the [`ClusterScanArgs`] instance with the provided configuration.
     ///
     /// # Returns
@@ -230,6 +254,7 @@ impl ClusterScanArgsBuilder {
             count: self.count,
             object_type: self.object_type,
             allow_non_covered_slots: self.allow_non_covered_slots.unwrap_or(false),
+            slot_ranges: self.slot_ranges,
         }
     }
 }
@@ -389,19 +414,30 @@ impl ScanState {
     /// Initialize a new scan operation.
     /// This method creates a new scan state with the cursor set to 0, the scanned slots map initialized to 0,
     /// and the address set to the address associated with slot 0.
+    /// If the scan is restricted to slot ranges, the slots outside of the ranges are marked as scanned,
+    /// and the address is the address associated with the first slot of the ranges.
     /// The address epoch is set to the epoch of the address.
     /// If the address epoch cannot be retrieved, the method returns an error.
     async fn initiate_scan<C>(
         core: &InnerCore<C>,
         allow_non_covered_slots: bool,
+        slot_ranges: Option<&[(u16, u16)]>,
     ) -> RedisResult<ScanState>
     where
         C: ConnectionLike + Connect + Clone + Send + Sync + 'static,
     {
-        let mut new_scanned_slots_map: SlotsBitsArray = [0; BITS_ARRAY_SIZE as usize];
+        let mut new_scanned_slots_map: SlotsBitsArray = match slot_ranges {
+            Some(slot_ranges) => scanned_slots_map_for_slot_ranges(slot_ranges)?,
+            None => [0; BITS_ARRAY_SIZE as usize],
+        };
         let new_cursor = 0;
-        let address =
-            next_address_to_scan(core, 0, &mut new_scanned_slots_map, allow_non_covered_slots)?;
+        let first_slot = next_slot(&new_scanned_slots_map).unwrap_or(END_OF_SCAN);
+        let address = next_address_to_scan(
+            core,
+            first_slot,
+            &mut new_scanned_slots_map,
+            allow_non_covered_slots,
+        )?;
 
         match address {
             NextNodeResult::AllSlotsCompleted => Ok(ScanState::create_finished_state()),
@@ -504,6 +540,25 @@ fn mark_slot_as_scanned(scanned_slots_map: &mut SlotsBitsArray, slot: u16) {
     scanned_slots_map[slot_index] |= 1 << slot_bit;
 }
 
+/// Creates the scanned slots map of a scan that is restricted to slot ranges, in which all of the
+/// slots outside of the ranges are marked as scanned.
+fn scanned_slots_map_for_slot_ranges(slot_ranges: &[(u16, u16)]) -> RedisResult<SlotsBitsArray> {
+    let mut slots_in_ranges: SlotsBitsArray = [0; BITS_ARRAY_SIZE as usize];
+    for &(start, end) in slot_ranges {
+        if start > end || end >= NUM_OF_SLOTS {
+            return Err(RedisError::from((
+                ErrorKind::ClientError,
+                "Invalid slot range for cluster scan",
+                format!("{start}-{end}"),
+            )));
+        }
+        for slot in start..=end {
+            mark_slot_as_scanned(&mut slots_in_ranges, slot);
+        }
+    }
+    Ok(slots_in_ranges.map(|word| !word))
+}
+
 #[derive(PartialEq, Debug, Clone)]
 /// The address type representing a connection address
 ///
@@ -634,7 +689,13 @@ where
     // - Otherwise, initiate a new scan.
     let scan_state = match scan_state_cursor.state_from_wrapper() {
         Some(state) => state,
-        None => match ScanState::initiate_scan(&core, allow_non_covered_slots).await {
+        None => match ScanState::initiate_scan(
+            &core,
+            allow_non_covered_slots,
+            cluster_scan_args.slot_ranges.as_deref(),
+        )
+        .await
+        {
             Ok(state) => state,
             Err(err) => {
                 // Early return if initiating the scan fails
@@ -820,12 +881,33 @@ mod tests {
             .with_count(100)
             .with_object_type(ObjectType::Hash)
             .allow_non_covered_slots(true)
+            .with_slot_ranges(vec![(0, 100), (200, 300)])
             .build();
 
         assert_eq!(args.match_pattern, Some(b"user:*".to_vec()));
         assert_eq!(args.count, Some(100));
         assert_eq!(args.object_type, Some(ObjectType::Hash));
         assert!(args.allow_non_covered_slots);
+        assert_eq!(args.slot_ranges, Some(vec![(0, 100), (200, 300)]));
+    }
+
+    #[tokio::test]
+    async fn test_scanned_slots_map_for_slot_ranges() {
+        let scanned_slots_map = scanned_slots_map_for_slot_ranges(&[(5, 70), (100, 100)]).unwrap();
+
+        assert_eq!(next_slot(&scanned_slots_map), Some(5));
+        assert_eq!(scanned_slots_map[0], (1 << 5) - 1);
+        assert_eq!(scanned_slots_map[1], !((1 << 7) - 1) & !(1 << (100 - 64)));
+        assert!(scanned_slots_map[2..].iter().all(|&word| word == u64::MAX));
+
+        let mut all_slots_scanned = scanned_slots_map;
+        for slot in (5..=70).chain(100..=100) {
+            mark_slot_as_scanned(&mut all_slots_scanned, slot);
+        }
+        assert_eq!(next_slot(&all_slots_scanned), Some(END_OF_SCAN));
+
+        assert!(scanned_slots_map_for_slot_ranges(&[(10, 5)]).is_err());
+        assert!(scanned_slots_map_for_slot_ranges(&[(0, NUM_OF_SLOTS)]).is_err());
     }
 
     #[tokio::test]
@@ -240,6 +240,16 @@ pub type PubSubChannelOrPattern = Vec<u8>;
 /// Type for pubsub channels/patterns
 pub type PubSubSubscriptionInfo = HashMap<PubSubSubscriptionKind, HashSet<PubSubChannelOrPattern>>;
 
+/// The server-assisted client side caching mode of a connection, see `CLIENT TRACKING`.
+#[derive(Clone, Debug, Default, PartialEq, Eq)]
+pub struct ClientTrackingInfo {
+    /// In broadcasting mode, the server sends the invalidations of every key that starts with one of `prefixes`,
+    /// instead of the invalidations of the keys that the connection read.
+    pub bcast: bool,
+    /// The key prefixes of broadcasting mode. No prefixes means that the invalidations of all keys are sent.
+    pub prefixes: Vec<Vec<u8>>,
+}
+
 /// Redis specific/connection independent information used to establish a connection to redis.
 #[derive(Clone, Debug, Default)]
 pub struct RedisConnectionInfo {
@@ -255,6 +265,8 @@ pub struct RedisConnectionInfo {
     pub client_name: Option<String>,
     /// Optionally a pubsub subscriptions that should be used for connection
     pub pubsub_subscriptions: Option<PubSubSubscriptionInfo>,
+    /// Optionally the client side caching mode that should be enabled on connection. Requires RESP3.
+    pub client_tracking: Option<ClientTrackingInfo>,
 }
 
 impl FromStr for ConnectionInfo {
@@ -422,6 +434,7 @@ fn url_to_tcp_connection_info(url: url::Url) -> RedisResult<ConnectionInfo> {
             },
             client_name: None,
             pubsub_subscriptions: None,
+            client_tracking: None,
         },
     })
 }
@@ -455,6 +468,7 @@ fn url_to_unix_connection_info(url: url::Url) -> RedisResult<ConnectionInfo> {
             },
             client_name: None,
             pubsub_subscriptions: None,
+            client_tracking: None,
         },
     })
 }
@@ -1928,6 +1942,7 @@ mod tests {
                         protocol: ProtocolVersion::RESP2,
                         client_name: None,
                         pubsub_subscriptions: None,
+                        client_tracking: None,
                     },
                 },
             ),
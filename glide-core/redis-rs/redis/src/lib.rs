@@ -370,9 +370,9 @@ pub use crate::commands::{
     Commands, ControlFlow, Direction, LposOptions, PubSubCommands, SetOptions,
 };
 pub use crate::connection::{
-    parse_redis_url, transaction, Connection, ConnectionAddr, ConnectionInfo, ConnectionLike,
-    IntoConnectionInfo, Msg, PubSub, PubSubChannelOrPattern, PubSubSubscriptionInfo,
-    PubSubSubscriptionKind, RedisConnectionInfo, TlsMode,
+    parse_redis_url, transaction, ClientTrackingInfo, Connection, ConnectionAddr, ConnectionInfo,
+    ConnectionLike, IntoConnectionInfo, Msg, PubSub, PubSubChannelOrPattern,
+    PubSubSubscriptionInfo, PubSubSubscriptionKind, RedisConnectionInfo, TlsMode,
 };
 pub use crate::parser::{parse_redis_value, Parser};
 pub use crate::pipeline::Pipeline;
@@ -152,6 +152,66 @@ mod test_cluster_scan_async {
         }
     }
 
+    #[tokio::test]
+    #[serial_test::serial]
+    async fn test_async_cluster_scan_with_slot_ranges() {
+        let cluster = TestClusterContext::new_with_cluster_client_builder(
+            3,
+            0,
+            |builder| builder.retries(1),
+            false,
+        );
+        let mut connection = cluster.async_connection(None).await;
+
+        // Set some keys
+        for i in 0..100 {
+            let key = format!("key{}", i);
+            let _: Result<(), redis::RedisError> = redis::cmd("SET")
+                .arg(&key)
+                .arg("value")
+                .query_async(&mut connection)
+                .await;
+        }
+
+        // Scans of disjoint slot ranges that cover all of the slots scan all of the keys
+        let mut keys: Vec<String> = vec![];
+        for slot_ranges in [vec![(0, 5000)], vec![(5001, 9000), (9001, 16383)]] {
+            let mut scan_state_rc = ScanStateRC::new();
+            loop {
+                let cluster_scan_args = ClusterScanArgs::builder()
+                    .with_slot_ranges(slot_ranges.clone())
+                    .build();
+                let (next_cursor, scan_keys): (ScanStateRC, Vec<Value>) = connection
+                    .cluster_scan(scan_state_rc, cluster_scan_args)
+                    .await
+                    .unwrap();
+                scan_state_rc = next_cursor;
+                let mut scan_keys = scan_keys
+                    .into_iter()
+                    .map(|v| from_redis_value(&v).unwrap())
+                    .collect::<Vec<String>>();
+                keys.append(&mut scan_keys);
+                if scan_state_rc.is_finished() {
+                    break;
+                }
+            }
+        }
+        keys.sort();
+        keys.dedup();
+        let mut expected_keys: Vec<String> = (0..100).map(|i| format!("key{}", i)).collect();
+        expected_keys.sort();
+        assert_eq!(keys, expected_keys);
+
+        // An invalid slot range fails the scan
+        let cluster_scan_args = ClusterScanArgs::builder()
+            .with_slot_ranges(vec![(0, 16384)])
+            .build();
+        let result = connection
+            .cluster_scan(ScanStateRC::new(), cluster_scan_args)
+            .await;
+        assert!(result.is_err());
+    }
+
     #[tokio::test]
     #[serial_test::serial]
     async fn test_async_cluster_scan_with_allow_non_covered_slots() {
@@ -75,6 +75,7 @@ pub(super) fn get_redis_connection_info(
     let db = connection_request.database_id;
     let client_name = connection_request.client_name.clone();
     let pubsub_subscriptions = connection_request.pubsub_subscriptions.clone();
+    let client_tracking = connection_request.client_tracking.clone();
     match &connection_request.authentication_info {
         Some(info) => redis::RedisConnectionInfo {
             db,
@@ -83,12 +84,14 @@ pub(super) fn get_redis_connection_info(
             protocol,
             client_name,
             pubsub_subscriptions,
+            client_tracking,
         },
         None => redis::RedisConnectionInfo {
             db,
             protocol,
             client_name,
             pubsub_subscriptions,
+            client_tracking,
             ..Default::default()
         },
     }
@@ -602,6 +605,9 @@ async fn create_cluster_client(
     if let Some(pubsub_subscriptions) = redis_connection_info.pubsub_subscriptions.clone() {
         builder = builder.pubsub_subscriptions(pubsub_subscriptions);
     }
+    if let Some(client_tracking) = redis_connection_info.client_tracking.clone() {
+        builder = builder.client_tracking(client_tracking);
+    }
 
     // Always use with Glide
     builder = builder.periodic_connections_checks(CONNECTION_CHECKS_INTERVAL);
@@ -777,13 +783,19 @@ fn sanitized_request_string(request: &ConnectionRequest) -> String {
         .map(|pubsub_subscriptions| format!("\nPubsub subscriptions: {pubsub_subscriptions:?}"))
         .unwrap_or_default();
 
+    let client_tracking = request
+        .client_tracking
+        .as_ref()
+        .map(|client_tracking| format!("\nClient tracking: {client_tracking:?}"))
+        .unwrap_or_default();
+
     let inflight_requests_limit = format_optional_value(
         "\nInflight requests limit: {}",
         request.inflight_requests_limit,
     );
 
     format!(
-        "\nAddresses: {addresses}{tls_mode}{cluster_mode}{request_timeout}{connection_timeout}{rfr_strategy}{connection_retry_strategy}{database_id}{protocol}{client_name}{periodic_checks}{pubsub_subscriptions}{inflight_requests_limit}",
+        "\nAddresses: {addresses}{tls_mode}{cluster_mode}{request_timeout}{connection_timeout}{rfr_strategy}{connection_retry_strategy}{database_id}{protocol}{client_name}{periodic_checks}{pubsub_subscriptions}{client_tracking}{inflight_requests_limit}",
     )
 }
 
@@ -24,6 +24,7 @@ pub struct ConnectionRequest {
     pub connection_retry_strategy: Option<ConnectionRetryStrategy>,
     pub periodic_checks: Option<PeriodicCheck>,
     pub pubsub_subscriptions: Option<redis::PubSubSubscriptionInfo>,
+    pub client_tracking: Option<redis::ClientTrackingInfo>,
     pub inflight_requests_limit: Option<u32>,
     pub otel_endpoint: Option<String>,
     pub otel_span_flush_interval_ms: Option<u64>,
@@ -206,6 +207,19 @@ impl From<protobuf::ConnectionRequest> for ConnectionRequest {
             pubsub_subscriptions = Some(redis_pubsub);
         }
 
+        let client_tracking =
+            value
+                .client_tracking
+                .0
+                .map(|protobuf_tracking| redis::ClientTrackingInfo {
+                    bcast: protobuf_tracking.bcast,
+                    prefixes: protobuf_tracking
+                        .prefixes
+                        .iter()
+                        .map(|prefix| prefix.to_vec())
+                        .collect(),
+                });
+
         let inflight_requests_limit = none_if_zero(value.inflight_requests_limit);
 
         let otel_endpoint = chars_to_string_option(&value.opentelemetry_config.collector_end_point);
@@ -225,6 +239,7 @@ impl From<protobuf::ConnectionRequest> for ConnectionRequest {
             connection_retry_strategy,
             periodic_checks,
             pubsub_subscriptions,
+            client_tracking,
             inflight_requests_limit,
             otel_endpoint,
             otel_span_flush_interval_ms,
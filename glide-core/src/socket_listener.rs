@@ -20,8 +20,9 @@ use redis::cluster_routing::{
 };
 use redis::cluster_routing::{ResponsePolicy, Routable};
 use redis::{ClusterScanArgs, Cmd, PushInfo, RedisError, ScanStateRC, Value};
-use std::cell::Cell;
-use std::collections::HashSet;
+use std::cell::{Cell, RefCell};
+use std::collections::hash_map::Entry;
+use std::collections::{HashMap, HashSet};
 use std::ptr::from_mut;
 use std::rc::Rc;
 use std::sync::RwLock;
@@ -179,10 +180,12 @@ async fn write_closing_error(
 async fn write_result(
     resp_result: ClientUsageResult<Value>,
     callback_index: u32,
+    client_id: u32,
     writer: &Rc<Writer>,
 ) -> Result<(), io::Error> {
     let mut response = Response::new();
     response.callback_idx = callback_index;
+    response.client_id = client_id;
     response.is_push = false;
     response.value = match resp_result {
         Ok(Value::Okay) => Some(response::response::Value::ConstantResponse(
@@ -340,6 +343,17 @@ async fn cluster_scan(cluster_scan: ClusterScan, mut client: Client) -> ClientUs
         cluster_scan_args_builder =
             cluster_scan_args_builder.with_object_type(object_type.to_string().into());
     }
+    if !cluster_scan.slot_ranges.is_empty() {
+        // Slots that don't fit in u16 are out of range, and fail the scan
+        let to_slot = |slot: u32| u16::try_from(slot).unwrap_or(u16::MAX);
+        cluster_scan_args_builder = cluster_scan_args_builder.with_slot_ranges(
+            cluster_scan
+                .slot_ranges
+                .iter()
+                .map(|slot_range| (to_slot(slot_range.start), to_slot(slot_range.end)))
+                .collect(),
+        );
+    }
     let cluster_scan_args = cluster_scan_args_builder.build();
 
     client
@@ -531,6 +545,10 @@ fn handle_request(request: CommandRequest, mut client: Client, writer: Rc<Writer
                         )
                         .await
                         .map_err(|err| err.into()),
+                    command_request::Command::ConnectionRequest(_)
+                    | command_request::Command::CloseClient(_) => Err(ClientUsageError::Internal(
+                        "Client management request passed to a client".to_string(),
+                    )),
                 },
                 None => {
                     log_debug(
@@ -551,17 +569,104 @@ fn handle_request(request: CommandRequest, mut client: Client, writer: Rc<Writer
             client_clone.release_inflight_request();
         }
 
-        let _res = write_result(result, request.callback_idx, &writer).await;
+        let _res = write_result(result, request.callback_idx, request.client_id, &writer).await;
+    });
+}
+
+/// A client of a socket connection, along with the task that forwards its push notifications to the socket.
+struct SocketClient {
+    client: Client,
+    push_forwarder: task::JoinHandle<()>,
+}
+
+impl Drop for SocketClient {
+    fn drop(&mut self) {
+        self.push_forwarder.abort();
+    }
+}
+
+/// The logical clients that share a socket connection, by their client id.
+type SocketClients = Rc<RefCell<HashMap<u32, SocketClient>>>;
+
+/// Creates the client `client_id` of a socket connection that is already used by other clients.
+/// Unlike the first client of the connection, a client that fails to connect doesn't close the connection,
+/// the error is returned to the request.
+fn handle_add_client_request(
+    connection_request: Bytes,
+    callback_idx: u32,
+    client_id: u32,
+    clients: SocketClients,
+    writer: Rc<Writer>,
+) {
+    task::spawn_local(async move {
+        let result = match ConnectionRequest::parse_from_tokio_bytes(&connection_request) {
+            Ok(request) => match create_client(request, client_id, &writer).await {
+                Ok(client) => match clients.borrow_mut().entry(client_id) {
+                    Entry::Occupied(_) => Err(ClientUsageError::User(format!(
+                        "Client id {client_id} is already in use"
+                    ))),
+                    Entry::Vacant(entry) => {
+                        entry.insert(client);
+                        Ok(Value::Okay)
+                    }
+                },
+                Err(err) => Err(ClientUsageError::User(err.to_string())),
+            },
+            Err(err) => Err(ClientUsageError::User(format!(
+                "Failed to decode the connection request: {err}"
+            ))),
+        };
+        let _res = write_result(result, callback_idx, client_id, &writer).await;
     });
 }
 
 async fn handle_requests(
     received_requests: Vec<CommandRequest>,
-    client: &Client,
+    clients: &SocketClients,
     writer: &Rc<Writer>,
 ) {
-    for request in received_requests {
-        handle_request(request, client.clone(), writer.clone());
+    for mut request in received_requests {
+        match request.command.take() {
+            Some(command_request::Command::ConnectionRequest(connection_request)) => {
+                handle_add_client_request(
+                    connection_request,
+                    request.callback_idx,
+                    request.client_id,
+                    clients.clone(),
+                    writer.clone(),
+                );
+            }
+            Some(command_request::Command::CloseClient(_)) => {
+                // Requests that are already in flight hold their own reference to the client, and are completed
+                clients.borrow_mut().remove(&request.client_id);
+            }
+            command => {
+                request.command = command;
+                let client = clients
+                    .borrow()
+                    .get(&request.client_id)
+                    .map(|socket_client| socket_client.client.clone());
+                match client {
+                    Some(client) => handle_request(request, client, writer.clone()),
+                    None => {
+                        let writer = writer.clone();
+                        task::spawn_local(async move {
+                            let result = Err(ClientUsageError::User(format!(
+                                "Unknown client id {}",
+                                request.client_id
+                            )));
+                            let _res = write_result(
+                                result,
+                                request.callback_idx,
+                                request.client_id,
+                                &writer,
+                            )
+                            .await;
+                        });
+                    }
+                }
+            }
+        }
     }
     // Yield to ensure that the subtasks aren't starved.
     task::yield_now().await;
@@ -573,29 +678,34 @@ pub fn close_socket(socket_path: &String) {
 }
 
 async fn create_client(
-    writer: &Rc<Writer>,
     request: ConnectionRequest,
-    push_tx: Option<mpsc::UnboundedSender<PushInfo>>,
-) -> Result<Client, ClientCreationError> {
-    let client = match Client::new(request.into(), push_tx).await {
+    client_id: u32,
+    writer: &Rc<Writer>,
+) -> Result<SocketClient, ClientCreationError> {
+    let (push_tx, push_rx) = mpsc::unbounded_channel();
+    let client = match Client::new(request.into(), Some(push_tx)).await {
         Ok(client) => client,
         Err(err) => return Err(ClientCreationError::ConnectionError(err)),
     };
-    write_result(Ok(Value::Okay), 0, writer).await?;
-    Ok(client)
+    let push_forwarder = task::spawn_local(push_manager_loop(push_rx, client_id, writer.clone()));
+    Ok(SocketClient {
+        client,
+        push_forwarder,
+    })
 }
 
 async fn wait_for_connection_configuration_and_create_client(
     client_listener: &mut UnixStreamListener,
     writer: &Rc<Writer>,
-    push_tx: Option<mpsc::UnboundedSender<PushInfo>>,
-) -> Result<Client, ClientCreationError> {
+) -> Result<SocketClient, ClientCreationError> {
     // Wait for the server's address
     match client_listener.next_values::<ConnectionRequest>().await {
         Closed(reason) => Err(ClientCreationError::SocketListenerClosed(reason)),
         ReceivedValues(mut received_requests) => {
             if let Some(request) = received_requests.pop() {
-                create_client(writer, request, push_tx).await
+                let client = create_client(request, 0, writer).await?;
+                write_result(Ok(Value::Okay), 0, 0, writer).await?;
+                Ok(client)
             } else {
                 Err(ClientCreationError::UnhandledError(
                     "No received requests".to_string(),
@@ -607,7 +717,7 @@ async fn wait_for_connection_configuration_and_create_client(
 
 async fn read_values_loop(
     mut client_listener: UnixStreamListener,
-    client: &Client,
+    clients: &SocketClients,
     writer: Rc<Writer>,
 ) -> ClosingReason {
     loop {
@@ -616,24 +726,29 @@ async fn read_values_loop(
                 return reason;
             }
             ReceivedValues(received_requests) => {
-                handle_requests(received_requests, client, &writer).await;
+                handle_requests(received_requests, clients, &writer).await;
             }
         }
     }
 }
 
-async fn push_manager_loop(mut push_rx: mpsc::UnboundedReceiver<PushInfo>, writer: Rc<Writer>) {
+async fn push_manager_loop(
+    mut push_rx: mpsc::UnboundedReceiver<PushInfo>,
+    client_id: u32,
+    writer: Rc<Writer>,
+) {
     loop {
         let result = push_rx.recv().await;
         match result {
             None => {
-                log_error("push manager loop", "got None from push manager");
+                log_debug("push manager loop", "push channel closed");
                 return;
             }
             Some(push_msg) => {
                 log_debug("push manager loop", format!("got PushInfo: {:?}", push_msg));
                 let mut response = Response::new();
                 response.callback_idx = 0; // callback_idx is not used with push notifications
+                response.client_id = client_id;
                 response.is_push = true;
                 response.value = {
                     let push_val = Value::Push {
@@ -658,18 +773,14 @@ async fn listen_on_client_stream(socket: UnixStream) {
     let mut client_listener = UnixStreamListener::new(socket.clone());
     let accumulated_outputs = Cell::new(Vec::new());
     let (sender, mut receiver) = channel(1);
-    let (push_tx, push_rx) = tokio::sync::mpsc::unbounded_channel();
     let writer = Rc::new(Writer {
         socket,
         lock: write_lock,
         accumulated_outputs,
         closing_sender: sender,
     });
-    let client_creation = wait_for_connection_configuration_and_create_client(
-        &mut client_listener,
-        &writer,
-        Some(push_tx),
-    );
+    let client_creation =
+        wait_for_connection_configuration_and_create_client(&mut client_listener, &writer);
     let client = match client_creation.await {
         Ok(conn) => conn,
         Err(ClientCreationError::SocketListenerClosed(ClosingReason::ReadSocketClosed)) => {
@@ -707,8 +818,10 @@ async fn listen_on_client_stream(socket: UnixStream) {
         }
     };
     log_info("connection", "new connection started");
+    // The first client of the connection is client 0, more clients can be added by `ConnectionRequest` commands
+    let clients: SocketClients = Rc::new(RefCell::new(HashMap::from([(0, client)])));
     tokio::select! {
-            reader_closing = read_values_loop(client_listener, &client, writer.clone()) => {
+            reader_closing = read_values_loop(client_listener, &clients, writer.clone()) => {
                 if let ClosingReason::UnhandledError(err) = reader_closing {
                     let _res = write_closing_error(ClosingError{err_message: err.to_string()}, u32::MAX, &writer, "client closing").await;
                 };
@@ -721,10 +834,8 @@ async fn listen_on_client_stream(socket: UnixStream) {
                     log_trace("client closing", "writer closed");
                 }
             },
-            _ = push_manager_loop(push_rx, writer.clone()) => {
-                log_trace("client closing", "push manager closed");
-            }
     }
+    clients.borrow_mut().clear();
     log_trace("client closing", "closing connection");
 }
 
@@ -560,6 +560,83 @@ pub(crate) mod shared_client_tests {
         });
     }
 
+    #[rstest]
+    #[serial_test::serial]
+    #[timeout(SHORT_CLUSTER_TEST_TIMEOUT)]
+    fn test_client_tracking_after_reconnection(
+        #[values(false, true)] use_cluster: bool,
+        #[values(false, true)] bcast: bool,
+    ) {
+        let mut client_info_cmd = redis::Cmd::new();
+        client_info_cmd.arg("CLIENT").arg("INFO");
+        block_on_all(async move {
+            let test_basics = setup_test_basics(
+                use_cluster,
+                TestConfiguration {
+                    shared_server: true,
+                    connection_info: Some(RedisConnectionInfo {
+                        protocol: redis::ProtocolVersion::RESP3,
+                        ..Default::default()
+                    }),
+                    client_tracking: Some(glide_core::connection_request::ClientTracking {
+                        bcast,
+                        prefixes: if bcast {
+                            vec!["prefix:".into()]
+                        } else {
+                            vec![]
+                        },
+                        ..Default::default()
+                    }),
+                    ..Default::default()
+                },
+            )
+            .await;
+
+            for i in 0..2 {
+                // ensure all connections have client tracking enabled
+                let mut client = test_basics.client.clone();
+                let client_infos: HashMap<String, String> = {
+                    let variant_res = client
+                        .send_command(
+                            &client_info_cmd,
+                            Some(RoutingInfo::MultiNode((
+                                MultipleNodeRoutingInfo::AllNodes,
+                                None,
+                            ))),
+                        )
+                        .await
+                        .unwrap();
+
+                    if use_cluster {
+                        redis::from_owned_redis_value(variant_res).unwrap()
+                    } else {
+                        [(
+                            "DONT_CARE".to_string(),
+                            redis::from_owned_redis_value(variant_res).unwrap(),
+                        )]
+                        .into()
+                    }
+                };
+
+                for client_info in client_infos.values() {
+                    let flags = client_info
+                        .split_whitespace()
+                        .find_map(|field| field.strip_prefix("flags="))
+                        .unwrap();
+                    assert!(flags.contains('t'), "{client_info}");
+                    assert_eq!(flags.contains('B'), bcast, "{client_info}");
+                }
+
+                if i == 0 {
+                    // first pass - kill the connections
+                    kill_connection(&mut client).await;
+                    // short sleep to allow the connection validation task to reconnect - 1s is enough since the detection should happen immediately
+                    tokio::time::sleep(std::time::Duration::from_secs(1)).await;
+                }
+            }
+        });
+    }
+
     #[test]
     #[serial_test::serial]
     fn test_client_telemetry_standalone() {
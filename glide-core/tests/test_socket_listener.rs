@@ -798,6 +798,118 @@ mod socket_listener {
         assert_eq!(first_value, second_value);
     }
 
+    #[rstest]
+    #[serial_test::serial]
+    #[timeout(SHORT_STANDALONE_TEST_TIMEOUT)]
+    fn test_socket_clients_share_connection() {
+        const CLIENT_ID: u32 = 1;
+        const CALLBACK1_INDEX: u32 = 100;
+        const CALLBACK2_INDEX: u32 = 101;
+        const CALLBACK3_INDEX: u32 = 102;
+        let mut test_basics = setup_server_test_basics(Tls::NoTls, TestServer::Shared);
+        let address = get_shared_server_address(false);
+        let mut buffer = Vec::with_capacity(100);
+
+        // Add a second client to the connection
+        let connection_request = create_connection_request(
+            &[address],
+            &TestConfiguration {
+                request_timeout: Some(REQUEST_TIMEOUT_MS),
+                ..Default::default()
+            },
+        );
+        let mut request = CommandRequest::new();
+        request.callback_idx = CALLBACK1_INDEX;
+        request.client_id = CLIENT_ID;
+        request.command = Some(
+            command_request::command_request::Command::ConnectionRequest(
+                connection_request.write_to_bytes().unwrap().into(),
+            ),
+        );
+        write_request(&mut buffer, &mut test_basics.socket, request);
+        let response = assert_response(
+            &mut buffer,
+            Some(&mut test_basics.socket),
+            CALLBACK1_INDEX,
+            Some(Value::Okay),
+            ResponseType::Value,
+        );
+        assert_eq!(response.client_id, CLIENT_ID);
+
+        // Both clients use the same server
+        let key = generate_random_string(KEY_LENGTH);
+        let mut request = get_command_request(
+            CALLBACK2_INDEX,
+            vec![key.clone().into(), "value".into()],
+            RequestType::Set.into(),
+            false,
+        );
+        request.client_id = CLIENT_ID;
+        buffer.clear();
+        write_request(&mut buffer, &mut test_basics.socket, request);
+        let response = assert_response(
+            &mut buffer,
+            Some(&mut test_basics.socket),
+            CALLBACK2_INDEX,
+            Some(Value::Okay),
+            ResponseType::Value,
+        );
+        assert_eq!(response.client_id, CLIENT_ID);
+        buffer.clear();
+        write_get(
+            &mut buffer,
+            &mut test_basics.socket,
+            CALLBACK3_INDEX,
+            key.as_str(),
+            false,
+        );
+        let response = assert_value_response(
+            &mut buffer,
+            Some(&mut test_basics.socket),
+            CALLBACK3_INDEX,
+            Value::BulkString(b"value".to_vec()),
+        );
+        assert_eq!(response.client_id, 0);
+
+        // Requests of a closed client fail, without closing the connection
+        let mut request = CommandRequest::new();
+        request.client_id = CLIENT_ID;
+        request.command = Some(command_request::command_request::Command::CloseClient(
+            Default::default(),
+        ));
+        buffer.clear();
+        write_request(&mut buffer, &mut test_basics.socket, request);
+        let mut request = get_command_request(
+            CALLBACK2_INDEX,
+            vec![key.clone().into()],
+            RequestType::Get.into(),
+            false,
+        );
+        request.client_id = CLIENT_ID;
+        buffer.clear();
+        write_request(&mut buffer, &mut test_basics.socket, request);
+        assert_error_response(
+            &mut buffer,
+            &mut test_basics.socket,
+            CALLBACK2_INDEX,
+            ResponseType::RequestError,
+        );
+        buffer.clear();
+        write_get(
+            &mut buffer,
+            &mut test_basics.socket,
+            CALLBACK3_INDEX,
+            key.as_str(),
+            false,
+        );
+        assert_value_response(
+            &mut buffer,
+            Some(&mut test_basics.socket),
+            CALLBACK3_INDEX,
+            Value::BulkString(b"value".to_vec()),
+        );
+    }
+
     #[rstest]
     #[timeout(SHORT_STANDALONE_TEST_TIMEOUT)]
     fn test_socket_get_returns_null(#[values(false, true)] use_arg_pointer: bool) {
@@ -661,6 +661,9 @@ pub fn create_connection_request(
         connection_request.client_az = client_az.deref().into();
     }
 
+    connection_request.client_tracking =
+        protobuf::MessageField::from_option(configuration.client_tracking.clone());
+
     connection_request
 }
 
@@ -677,6 +680,7 @@ pub struct TestConfiguration {
     pub client_name: Option<String>,
     pub client_az: Option<String>,
     pub protocol: ProtocolVersion,
+    pub client_tracking: Option<connection_request::ClientTracking>,
 }
 
 pub(crate) async fn setup_test_basics_internal(configuration: &TestConfiguration) -> TestBasics {
@@ -1,148 +1,8 @@
 # Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
 
-from glide.async_commands.bitmap import (
-    BitEncoding,
-    BitFieldGet,
-    BitFieldIncrBy,
-    BitFieldOffset,
-    BitFieldOverflow,
-    BitFieldSet,
-    BitFieldSubCommands,
-    BitmapIndexType,
-    BitOffset,
-    BitOffsetMultiplier,
-    BitOverflowControl,
-    BitwiseOperation,
-    OffsetOptions,
-    SignedEncoding,
-    UnsignedEncoding,
-)
-from glide.async_commands.command_args import Limit, ListDirection, ObjectType, OrderBy
-from glide.async_commands.core import (
-    ConditionalChange,
-    CoreCommands,
-    ExpireOptions,
-    ExpiryGetEx,
-    ExpirySet,
-    ExpiryType,
-    ExpiryTypeGetEx,
-    FlushMode,
-    FunctionRestorePolicy,
-    InfoSection,
-    InsertPosition,
-    OnlyIfEqual,
-    UpdateOptions,
-)
-from glide.async_commands.server_modules import ft, glide_json, json_transaction
-from glide.async_commands.server_modules.ft_options.ft_aggregate_options import (
-    FtAggregateApply,
-    FtAggregateClause,
-    FtAggregateFilter,
-    FtAggregateGroupBy,
-    FtAggregateLimit,
-    FtAggregateOptions,
-    FtAggregateReducer,
-    FtAggregateSortBy,
-    FtAggregateSortProperty,
-)
-from glide.async_commands.server_modules.ft_options.ft_create_options import (
-    DataType,
-    DistanceMetricType,
-    Field,
-    FieldType,
-    FtCreateOptions,
-    NumericField,
-    TagField,
-    TextField,
-    VectorAlgorithm,
-    VectorField,
-    VectorFieldAttributes,
-    VectorFieldAttributesFlat,
-    VectorFieldAttributesHnsw,
-    VectorType,
-)
-from glide.async_commands.server_modules.ft_options.ft_profile_options import (
-    FtProfileOptions,
-    QueryType,
-)
-from glide.async_commands.server_modules.ft_options.ft_search_options import (
-    FtSearchLimit,
-    FtSearchOptions,
-    ReturnField,
-)
-from glide.async_commands.server_modules.glide_json import (
-    JsonArrIndexOptions,
-    JsonArrPopOptions,
-    JsonGetOptions,
-)
-from glide.async_commands.sorted_set import (
-    AggregationType,
-    GeoSearchByBox,
-    GeoSearchByRadius,
-    GeoSearchCount,
-    GeospatialData,
-    GeoUnit,
-    InfBound,
-    LexBoundary,
-    RangeByIndex,
-    RangeByLex,
-    RangeByScore,
-    ScoreBoundary,
-    ScoreFilter,
-)
-from glide.async_commands.stream import (
-    ExclusiveIdBound,
-    IdBound,
-    MaxId,
-    MinId,
-    StreamAddOptions,
-    StreamClaimOptions,
-    StreamGroupOptions,
-    StreamPendingOptions,
-    StreamRangeBound,
-    StreamReadGroupOptions,
-    StreamReadOptions,
-    StreamTrimOptions,
-    TrimByMaxLen,
-    TrimByMinId,
-)
-from glide.async_commands.transaction import (
-    ClusterTransaction,
-    Transaction,
-    TTransaction,
-)
-from glide.config import (
-    AdvancedGlideClientConfiguration,
-    AdvancedGlideClusterClientConfiguration,
-    BackoffStrategy,
-    GlideClientConfiguration,
-    GlideClusterClientConfiguration,
-    NodeAddress,
-    PeriodicChecksManualInterval,
-    PeriodicChecksStatus,
-    ProtocolVersion,
-    ReadFrom,
-    ServerCredentials,
-)
-from glide.constants import (
-    OK,
-    TOK,
-    FtAggregateResponse,
-    FtInfoResponse,
-    FtProfileResponse,
-    FtSearchResponse,
-    TClusterResponse,
-    TEncodable,
-    TFunctionListResponse,
-    TFunctionStatsFullResponse,
-    TFunctionStatsSingleNodeResponse,
-    TJsonResponse,
-    TJsonUniversalResponse,
-    TResult,
-    TSingleNodeRoute,
-    TXInfoStreamFullResponse,
-    TXInfoStreamResponse,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
 from glide.exceptions import (
     ClosingError,
     ConfigurationError,
@@ -152,23 +12,413 @@ from glide.exceptions import (
     RequestError,
     TimeoutError,
 )
-from glide.glide_client import GlideClient, GlideClusterClient, TGlideClient
 from glide.logger import Level as LogLevel
 from glide.logger import Logger
-from glide.routes import (
-    AllNodes,
-    AllPrimaries,
-    ByAddressRoute,
-    RandomNode,
-    Route,
-    SlotIdRoute,
-    SlotKeyRoute,
-    SlotType,
-)
 
-from .glide import ClusterScanCursor, Script
+if TYPE_CHECKING:
+    from glide.async_commands.bitmap import (
+        BitEncoding,
+        BitFieldGet,
+        BitFieldIncrBy,
+        BitFieldOffset,
+        BitFieldOverflow,
+        BitFieldSet,
+        BitFieldSubCommands,
+        BitmapIndexType,
+        BitOffset,
+        BitOffsetMultiplier,
+        BitOverflowControl,
+        BitwiseOperation,
+        OffsetOptions,
+        SignedEncoding,
+        UnsignedEncoding,
+    )
+    from glide.async_commands.command_args import (
+        Limit,
+        ListDirection,
+        ObjectType,
+        OrderBy,
+        ShardScanCursor,
+    )
+    from glide.async_commands.core import (
+        ConditionalChange,
+        CoreCommands,
+        ExpireOptions,
+        ExpiryGetEx,
+        ExpirySet,
+        ExpiryType,
+        ExpiryTypeGetEx,
+        FlushMode,
+        FunctionRestorePolicy,
+        InfoSection,
+        InsertPosition,
+        OnlyIfEqual,
+        UpdateOptions,
+    )
+    from glide.async_commands.server_modules import ft, glide_json, json_transaction
+    from glide.async_commands.server_modules.ft_options.ft_aggregate_options import (
+        FtAggregateApply,
+        FtAggregateClause,
+        FtAggregateFilter,
+        FtAggregateGroupBy,
+        FtAggregateLimit,
+        FtAggregateOptions,
+        FtAggregateReducer,
+        FtAggregateSortBy,
+        FtAggregateSortProperty,
+    )
+    from glide.async_commands.server_modules.ft_options.ft_create_options import (
+        DataType,
+        DistanceMetricType,
+        Field,
+        FieldType,
+        FtCreateOptions,
+        NumericField,
+        TagField,
+        TextField,
+        VectorAlgorithm,
+        VectorField,
+        VectorFieldAttributes,
+        VectorFieldAttributesFlat,
+        VectorFieldAttributesHnsw,
+        VectorType,
+    )
+    from glide.async_commands.server_modules.ft_options.ft_profile_options import (
+        FtProfileOptions,
+        QueryType,
+    )
+    from glide.async_commands.server_modules.ft_options.ft_search_options import (
+        FtSearchLimit,
+        FtSearchOptions,
+        ReturnField,
+    )
+    from glide.async_commands.server_modules.glide_json import (
+        JsonArrIndexOptions,
+        JsonArrPopOptions,
+        JsonGetOptions,
+    )
+    from glide.async_commands.sorted_set import (
+        AggregationType,
+        GeoSearchByBox,
+        GeoSearchByRadius,
+        GeoSearchCount,
+        GeospatialData,
+        GeoUnit,
+        InfBound,
+        LexBoundary,
+        RangeByIndex,
+        RangeByLex,
+        RangeByScore,
+        ScoreBoundary,
+        ScoreFilter,
+    )
+    from glide.async_commands.stream import (
+        ExclusiveIdBound,
+        IdBound,
+        MaxId,
+        MinId,
+        StreamAddOptions,
+        StreamClaimOptions,
+        StreamGroupOptions,
+        StreamPendingOptions,
+        StreamRangeBound,
+        StreamReadGroupOptions,
+        StreamReadOptions,
+        StreamTrimOptions,
+        TrimByMaxLen,
+        TrimByMinId,
+    )
+    from glide.async_commands.transaction import (
+        Batch,
+        ClusterBatch,
+        ClusterTransaction,
+        Transaction,
+        TTransaction,
+    )
+    from glide.config import (
+        AdvancedGlideClientConfiguration,
+        AdvancedGlideClusterClientConfiguration,
+        BackoffStrategy,
+        ClientCacheConfiguration,
+        ClientTransport,
+        GlideClientConfiguration,
+        GlideClusterClientConfiguration,
+        NodeAddress,
+        PeriodicChecksManualInterval,
+        PeriodicChecksStatus,
+        ProtocolVersion,
+        ReadFrom,
+        ServerCredentials,
+    )
+    from glide.constants import (
+        OK,
+        TOK,
+        FtAggregateResponse,
+        FtInfoResponse,
+        FtProfileResponse,
+        FtSearchResponse,
+        TClusterResponse,
+        TEncodable,
+        TEncodableValue,
+        TFunctionListResponse,
+        TFunctionStatsFullResponse,
+        TFunctionStatsSingleNodeResponse,
+        TJsonResponse,
+        TJsonUniversalResponse,
+        TResult,
+        TSingleNodeRoute,
+        TXInfoStreamFullResponse,
+        TXInfoStreamResponse,
+    )
+    from glide.glide_client import GlideClient, GlideClusterClient, TGlideClient
+    from glide.glide_sync_client import (
+        GlideSyncClient,
+        GlideSyncClusterClient,
+        TGlideSyncClient,
+    )
+    from glide.response_options import (
+        ResultAdapter,
+        decoded_responses,
+        register_result_adapter,
+        result_adapter,
+    )
+    from glide.routes import (
+        AllNodes,
+        AllPrimaries,
+        ByAddressRoute,
+        RandomNode,
+        Route,
+        SlotIdRoute,
+        SlotKeyRoute,
+        SlotType,
+    )
+
+    from .glide import ClusterScanCursor, GlideBuffer, LazyArray, Script
+
+    PubSubMsg = CoreCommands.PubSubMsg
+
+# Most of the exports are imported on their first use, by the module they are defined in, so `import glide` doesn't
+# import the command modules, the server modules and the protobuf modules until they are needed
+_lazy_exports: Dict[str, Tuple[str, ...]] = {
+    "glide.async_commands.bitmap": (
+        "BitEncoding",
+        "BitFieldGet",
+        "BitFieldIncrBy",
+        "BitFieldOffset",
+        "BitFieldOverflow",
+        "BitFieldSet",
+        "BitFieldSubCommands",
+        "BitmapIndexType",
+        "BitOffset",
+        "BitOffsetMultiplier",
+        "BitOverflowControl",
+        "BitwiseOperation",
+        "OffsetOptions",
+        "SignedEncoding",
+        "UnsignedEncoding",
+    ),
+    "glide.async_commands.command_args": (
+        "Limit",
+        "ListDirection",
+        "ObjectType",
+        "OrderBy",
+        "ShardScanCursor",
+    ),
+    "glide.async_commands.core": (
+        "ConditionalChange",
+        "CoreCommands",
+        "ExpireOptions",
+        "ExpiryGetEx",
+        "ExpirySet",
+        "ExpiryType",
+        "ExpiryTypeGetEx",
+        "FlushMode",
+        "FunctionRestorePolicy",
+        "InfoSection",
+        "InsertPosition",
+        "OnlyIfEqual",
+        "UpdateOptions",
+    ),
+    "glide.async_commands.server_modules.ft_options.ft_aggregate_options": (
+        "FtAggregateApply",
+        "FtAggregateClause",
+        "FtAggregateFilter",
+        "FtAggregateGroupBy",
+        "FtAggregateLimit",
+        "FtAggregateOptions",
+        "FtAggregateReducer",
+        "FtAggregateSortBy",
+        "FtAggregateSortProperty",
+    ),
+    "glide.async_commands.server_modules.ft_options.ft_create_options": (
+        "DataType",
+        "DistanceMetricType",
+        "Field",
+        "FieldType",
+        "FtCreateOptions",
+        "NumericField",
+        "TagField",
+        "TextField",
+        "VectorAlgorithm",
+        "VectorField",
+        "VectorFieldAttributes",
+        "VectorFieldAttributesFlat",
+        "VectorFieldAttributesHnsw",
+        "VectorType",
+    ),
+    "glide.async_commands.server_modules.ft_options.ft_profile_options": (
+        "FtProfileOptions",
+        "QueryType",
+    ),
+    "glide.async_commands.server_modules.ft_options.ft_search_options": (
+        "FtSearchLimit",
+        "FtSearchOptions",
+        "ReturnField",
+    ),
+    "glide.async_commands.server_modules.glide_json": (
+        "JsonArrIndexOptions",
+        "JsonArrPopOptions",
+        "JsonGetOptions",
+    ),
+    "glide.async_commands.sorted_set": (
+        "AggregationType",
+        "GeoSearchByBox",
+        "GeoSearchByRadius",
+        "GeoSearchCount",
+        "GeospatialData",
+        "GeoUnit",
+        "InfBound",
+        "LexBoundary",
+        "RangeByIndex",
+        "RangeByLex",
+        "RangeByScore",
+        "ScoreBoundary",
+        "ScoreFilter",
+    ),
+    "glide.async_commands.stream": (
+        "ExclusiveIdBound",
+        "IdBound",
+        "MaxId",
+        "MinId",
+        "StreamAddOptions",
+        "StreamClaimOptions",
+        "StreamGroupOptions",
+        "StreamPendingOptions",
+        "StreamRangeBound",
+        "StreamReadGroupOptions",
+        "StreamReadOptions",
+        "StreamTrimOptions",
+        "TrimByMaxLen",
+        "TrimByMinId",
+    ),
+    "glide.async_commands.transaction": (
+        "Batch",
+        "ClusterBatch",
+        "ClusterTransaction",
+        "Transaction",
+        "TTransaction",
+    ),
+    "glide.config": (
+        "AdvancedGlideClientConfiguration",
+        "AdvancedGlideClusterClientConfiguration",
+        "BackoffStrategy",
+        "ClientCacheConfiguration",
+        "ClientTransport",
+        "GlideClientConfiguration",
+        "GlideClusterClientConfiguration",
+        "NodeAddress",
+        "PeriodicChecksManualInterval",
+        "PeriodicChecksStatus",
+        "ProtocolVersion",
+        "ReadFrom",
+        "ServerCredentials",
+    ),
+    "glide.constants": (
+        "OK",
+        "TOK",
+        "FtAggregateResponse",
+        "FtInfoResponse",
+        "FtProfileResponse",
+        "FtSearchResponse",
+        "TClusterResponse",
+        "TEncodable",
+        "TEncodableValue",
+        "TFunctionListResponse",
+        "TFunctionStatsFullResponse",
+        "TFunctionStatsSingleNodeResponse",
+        "TJsonResponse",
+        "TJsonUniversalResponse",
+        "TResult",
+        "TSingleNodeRoute",
+        "TXInfoStreamFullResponse",
+        "TXInfoStreamResponse",
+    ),
+    "glide.glide_client": (
+        "GlideClient",
+        "GlideClusterClient",
+        "TGlideClient",
+    ),
+    "glide.glide_sync_client": (
+        "GlideSyncClient",
+        "GlideSyncClusterClient",
+        "TGlideSyncClient",
+    ),
+    "glide.response_options": (
+        "ResultAdapter",
+        "decoded_responses",
+        "register_result_adapter",
+        "result_adapter",
+    ),
+    "glide.routes": (
+        "AllNodes",
+        "AllPrimaries",
+        "ByAddressRoute",
+        "RandomNode",
+        "Route",
+        "SlotIdRoute",
+        "SlotKeyRoute",
+        "SlotType",
+    ),
+    "glide.glide": (
+        "ClusterScanCursor",
+        "GlideBuffer",
+        "LazyArray",
+        "Script",
+    ),
+}
+_lazy_export_modules: Dict[str, str] = {
+    name: module for module, names in _lazy_exports.items() for name in names
+}
+# The exported submodules
+_lazy_submodules: Dict[str, str] = {
+    "ft": "glide.async_commands.server_modules.ft",
+    "glide_json": "glide.async_commands.server_modules.glide_json",
+    "json_transaction": "glide.async_commands.server_modules.json_transaction",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name == "PubSubMsg":
+        value = __getattr__("CoreCommands").PubSubMsg
+    elif name in _lazy_submodules:
+        value = importlib.import_module(_lazy_submodules[name])
+    elif name in _lazy_export_modules:
+        value = getattr(importlib.import_module(_lazy_export_modules[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache the export, so it is looked up like an eagerly imported one from now on
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(
+        set(globals())
+        | set(_lazy_export_modules)
+        | set(_lazy_submodules)
+        | {"PubSubMsg"}
+    )
 
-PubSubMsg = CoreCommands.PubSubMsg
 
 __all__ = [
     # Client
@@ -178,22 +428,36 @@ __all__ = [
     "ClusterTransaction",
     "TGlideClient",
     "TTransaction",
+    "Batch",
+    "ClusterBatch",
+    "GlideSyncClient",
+    "GlideSyncClusterClient",
+    "TGlideSyncClient",
     # Config
     "AdvancedGlideClientConfiguration",
     "AdvancedGlideClusterClientConfiguration",
     "GlideClientConfiguration",
     "GlideClusterClientConfiguration",
     "BackoffStrategy",
+    "ClientCacheConfiguration",
+    "ClientTransport",
     "ReadFrom",
     "ServerCredentials",
     "NodeAddress",
     "ProtocolVersion",
     "PeriodicChecksManualInterval",
     "PeriodicChecksStatus",
+    "decoded_responses",
+    "ResultAdapter",
+    "register_result_adapter",
+    "result_adapter",
     # Response
     "OK",
+    "GlideBuffer",
+    "LazyArray",
     "TClusterResponse",
     "TEncodable",
+    "TEncodableValue",
     "TFunctionListResponse",
     "TFunctionStatsFullResponse",
     "TFunctionStatsSingleNodeResponse",
@@ -269,6 +533,7 @@ __all__ = [
     "TrimByMinId",
     "UpdateOptions",
     "ClusterScanCursor",
+    "ShardScanCursor",
     # PubSub
     "PubSubMsg",
     # Json
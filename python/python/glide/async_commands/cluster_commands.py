@@ -2,9 +2,29 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Mapping, Optional, Set, Union, cast
+import asyncio
+import inspect
+from collections import deque
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
-from glide.async_commands.command_args import Limit, ObjectType, OrderBy
+from glide.async_commands.command_args import (
+    Limit,
+    ObjectType,
+    OrderBy,
+    ShardScanCursor,
+)
 from glide.async_commands.core import (
     CoreCommands,
     FlushMode,
@@ -12,7 +32,7 @@ from glide.async_commands.core import (
     InfoSection,
     _build_sort_args,
 )
-from glide.async_commands.transaction import ClusterTransaction
+from glide.async_commands.transaction import ClusterBatch, ClusterTransaction
 from glide.constants import (
     TOK,
     TClusterResponse,
@@ -22,11 +42,27 @@ from glide.constants import (
     TResult,
     TSingleNodeRoute,
 )
+from glide.exceptions import RequestError
 from glide.protobuf.command_request_pb2 import RequestType
 from glide.routes import Route
 
 from ..glide import ClusterScanCursor, Script
 
+# The number of hash slots of a cluster
+_SLOT_COUNT = 16384
+
+
+def _uncovered_slot_ranges(slot_ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    uncovered: List[Tuple[int, int]] = []
+    next_slot = 0
+    for start, end in sorted(slot_ranges):
+        if start > next_slot:
+            uncovered.append((next_slot, start - 1))
+        next_slot = max(next_slot, end + 1)
+    if next_slot < _SLOT_COUNT:
+        uncovered.append((next_slot, _SLOT_COUNT - 1))
+    return uncovered
+
 
 class ClusterCommands(CoreCommands):
     async def custom_command(
@@ -106,6 +142,38 @@ class ClusterCommands(CoreCommands):
         commands = transaction.commands[:]
         return await self._execute_transaction(commands, route)
 
+    async def exec_batch(
+        self,
+        batch: ClusterBatch,
+        route: Optional[TSingleNodeRoute] = None,
+    ) -> List[Union[TResult, RequestError]]:
+        """
+        Execute a batch of commands without MULTI/EXEC, see `ClusterBatch`.
+
+        Every command is routed like a single command, to the node that owns the slot of its keys, so the keys of a
+        batch may belong to any slots. The commands are sent together, without waiting for the response of one command
+        before sending the next one, and the commands that are sent to the same node are pipelined on its connection,
+        so the batch takes about one round trip per node. Unlike a transaction, the batch isn't atomic, and a command
+        that fails doesn't affect the other commands. Batches larger than the client's inflight requests limit are sent
+        in parts of that size.
+
+        Args:
+            batch (ClusterBatch): A `ClusterBatch` object containing a list of commands to be executed.
+            route (Optional[TSingleNodeRoute]): If `route` is provided, all of the commands are routed to the node
+                defined by `route`, instead of being routed by their keys. Defaults to None.
+
+        Returns:
+            List[Union[TResult, RequestError]]: A list of results corresponding to the execution of each command
+                in the batch, in order. If a command failed, its entry is the `RequestError` it failed with.
+
+        Examples:
+            >>> batch = ClusterBatch().set("key1", "value1").set("key2", "value2").incr("key1").get("key2")
+            >>> await client.exec_batch(batch)
+                [OK, OK, RequestError('ERR value is not an integer or out of range'), b'value2']
+        """
+        commands = batch.commands[:]
+        return await self._execute_batch(commands, route)
+
     async def config_resetstat(
         self,
         route: Optional[Route] = None,
@@ -1152,6 +1220,173 @@ class ClusterCommands(CoreCommands):
             ),
         )
 
+    async def scan_parallel(
+        self,
+        match: Optional[TEncodable] = None,
+        count: Optional[int] = None,
+        type: Optional[ObjectType] = None,
+        allow_non_covered_slots: bool = False,
+        parallelism: Optional[int] = None,
+        cursors: Optional[List[ShardScanCursor]] = None,
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Iterates over the keys in the cluster, scanning the shards of the cluster concurrently.
+
+        The slots of each primary are scanned with a cluster scan of their own, so a full iteration takes about as
+        long as the scan of the largest shard, instead of the sum of the scans of all of the shards. Up to
+        `parallelism` SCAN commands are in flight at any time, and the next SCAN command of a shard is sent while the
+        keys of its current one are yielded. The keys of each SCAN command are yielded as soon as its response is
+        received, whatever the order the commands were sent in, so the keys are yielded in no particular order. An
+        iteration that is stopped before its end waits for the SCAN commands that are in flight, so that their
+        cursors are released.
+
+        Each cluster scan has the guarantees of `scan`: slots that move between nodes, or fail over, during the
+        iteration are followed, and the iteration fails if some slots aren't covered by any node, unless
+        `allow_non_covered_slots` is set. Together, the scans of the shards cover all of the slots of the cluster.
+        Like SCAN, the iteration returns all of the keys that were in the cluster from its start to its end, and may
+        return a key more than once.
+
+        On Trio, and in the synchronous clients, the shards are scanned one SCAN command at a time, in turn.
+
+        See https://valkey.io/commands/scan/ for more details.
+
+        Args:
+            match (Optional[TEncodable]): A pattern to match keys against.
+            count (Optional[int]): A hint for the number of keys to fetch per SCAN command.
+            type (Optional[ObjectType]): The type of object to scan for.
+            allow_non_covered_slots (bool): If set to True, the scan will perform even if some slots are not covered by
+                any node, in which case it has no guarantee to cover all keys in the cluster. Defaults to False.
+            parallelism (Optional[int]): The number of shards that are scanned concurrently.
+                If not set, all of the shards are scanned concurrently.
+            cursors (Optional[List[ShardScanCursor]]): The cursors of the shards. If the list is empty, a new scan is
+                started, and the cursors of its shards are added to it. Otherwise, the scan continues from the cursors
+                of an earlier iteration. The cursors are updated once the keys of each of their SCAN commands were
+                yielded, so an interrupted iteration can be resumed with them. If not set, a new scan is started.
+
+        Returns:
+            AsyncGenerator[bytes, None]: An iterator of the keys in the cluster.
+
+        Examples:
+            >>> async for key in client.scan_parallel(match="session:*", count=1000, parallelism=8):
+            ...     print(key)
+            b'session:1'
+            b'session:2'
+
+            >>> # Resume an interrupted iteration
+            >>> cursors = []
+            >>> try:
+            ...     async for key in client.scan_parallel(cursors=cursors):
+            ...         await process(key)
+            ... except ProcessingError:
+            ...     async for key in client.scan_parallel(cursors=cursors):
+            ...         await process(key)
+        """
+        if parallelism is not None and parallelism < 1:
+            raise ValueError("parallelism must be positive")
+        if cursors is None:
+            cursors = []
+        if not cursors:
+            cursors.extend(
+                ShardScanCursor(slot_ranges)
+                for slot_ranges in await self._get_shard_slot_ranges()
+            )
+        waiting = deque(shard for shard in cursors if not shard.is_finished())
+        # The scans in flight, with the shards they scan, in the order they were requested. A scan is either an
+        # `asyncio.Future` of a scan that was sent, or a coroutine that sends the scan when it is awaited
+        in_flight: List[
+            Tuple[
+                ShardScanCursor,
+                ClusterScanCursor,
+                Awaitable[List[Union[ClusterScanCursor, List[bytes]]]],
+            ]
+        ] = []
+
+        def send(shard: ShardScanCursor, cursor: ClusterScanCursor) -> None:
+            # The cursor is kept alive while its command is in flight
+            in_flight.append(
+                (
+                    shard,
+                    cursor,
+                    self._prefetch_cluster_scan(
+                        cursor,
+                        match,
+                        count,
+                        type,
+                        allow_non_covered_slots,
+                        shard.slot_ranges,
+                    ),
+                )
+            )
+
+        async def next_scan() -> int:
+            # Returns the index of the next scan to await: the first one that completes, once all of the scans in
+            # flight were sent, or else the first one that wasn't sent, which is awaited alone
+            unsent = [
+                i
+                for i, (_, _, pending) in enumerate(in_flight)
+                if not isinstance(pending, asyncio.Future)
+            ]
+            if unsent:
+                return unsent[0]
+            done, _ = await asyncio.wait(
+                [cast(asyncio.Future, pending) for _, _, pending in in_flight],
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            return next(
+                i for i, (_, _, pending) in enumerate(in_flight) if pending in done
+            )
+
+        try:
+            while waiting or in_flight:
+                while waiting and (parallelism is None or len(in_flight) < parallelism):
+                    shard = waiting.popleft()
+                    send(shard, shard.cursor)
+                shard, _, pending = in_flight.pop(await next_scan())
+                result = await pending
+                next_cursor = cast(ClusterScanCursor, result[0])
+                if not next_cursor.is_finished():
+                    send(shard, next_cursor)
+                for key in cast(List[bytes], result[1]):
+                    yield key
+                shard.cursor = next_cursor
+        finally:
+            # The iteration was stopped before its end. The scans that weren't sent are dropped, and the responses of
+            # the scans that were sent are awaited, so the core releases the cursors they return
+            sent: List[asyncio.Future] = []
+            for _, _, pending in in_flight:
+                if isinstance(pending, asyncio.Future):
+                    sent.append(pending)
+                elif inspect.iscoroutine(pending):
+                    pending.close()
+            if sent:
+                await asyncio.gather(*sent, return_exceptions=True)
+
+    async def _get_shard_slot_ranges(self) -> List[List[Tuple[int, int]]]:
+        """
+        Returns the slot ranges of each primary in the cluster. The slots that aren't covered by any node are added as
+        a shard of their own, so the scan of the shards covers all of the slots.
+        """
+        slots = cast(
+            List[List[Any]],
+            await self._execute_command(
+                RequestType.CustomCommand, ["CLUSTER", "SLOTS"]
+            ),
+        )
+        shards: Dict[Tuple[Any, Any], List[Tuple[int, int]]] = {}
+        for slot_range in slots:
+            # Each slot range holds its start, its end, and the host and port of its primary first
+            primary = (slot_range[2][0], slot_range[2][1])
+            shards.setdefault(primary, []).append(
+                (int(slot_range[0]), int(slot_range[1]))
+            )
+        shard_slot_ranges = list(shards.values())
+        uncovered = _uncovered_slot_ranges(
+            [slot_range for ranges in shard_slot_ranges for slot_range in ranges]
+        )
+        if uncovered:
+            shard_slot_ranges.append(uncovered)
+        return shard_slot_ranges
+
     async def script_exists(
         self, sha1s: List[TEncodable], route: Optional[Route] = None
     ) -> TClusterResponse[List[bool]]:
@@ -1,7 +1,9 @@
 # Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
 
 from enum import Enum
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
+
+from ..glide import ClusterScanCursor
 
 
 class Limit:
@@ -100,3 +102,27 @@ class ObjectType(Enum):
     """
     Represents a stream data type.
     """
+
+
+class ShardScanCursor:
+    """
+    The progress of the scan of a shard in a parallel cluster scan, see `GlideClusterClient.scan_parallel`.
+
+    A parallel scan scans the slots of each shard with a cursor of its own, and updates the cursors as it progresses,
+    so an interrupted scan can be resumed by passing its cursors to another `scan_parallel` call of the same client.
+
+    Args:
+        slot_ranges (List[Tuple[int, int]]): The inclusive `(start, end)` ranges of the slots of the shard.
+        cursor (Optional[ClusterScanCursor]): The cursor of the scan of the slots. Defaults to a new cursor.
+    """
+
+    def __init__(
+        self,
+        slot_ranges: List[Tuple[int, int]],
+        cursor: Optional[ClusterScanCursor] = None,
+    ):
+        self.slot_ranges = slot_ranges
+        self.cursor = cursor if cursor is not None else ClusterScanCursor()
+
+    def is_finished(self) -> bool:
+        return self.cursor.is_finished()
@@ -1,13 +1,18 @@
 # Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
+import inspect
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
     Dict,
     List,
     Mapping,
     Optional,
     Protocol,
+    Sequence,
     Set,
     Tuple,
     Type,
@@ -58,10 +63,12 @@ from glide.async_commands.stream import (
 from glide.constants import (
     TOK,
     TEncodable,
+    TEncodableValue,
     TResult,
     TXInfoStreamFullResponse,
     TXInfoStreamResponse,
 )
+from glide.exceptions import RequestError
 from glide.protobuf.command_request_pb2 import RequestType
 from glide.routes import Route
 
@@ -379,16 +386,22 @@ class CoreCommands(Protocol):
     async def _execute_command(
         self,
         request_type: RequestType.ValueType,
-        args: List[TEncodable],
+        args: Sequence[TEncodableValue],
         route: Optional[Route] = ...,
     ) -> TResult: ...
 
     async def _execute_transaction(
         self,
-        commands: List[Tuple[RequestType.ValueType, List[TEncodable]]],
+        commands: List[Tuple[RequestType.ValueType, Sequence[TEncodableValue]]],
         route: Optional[Route] = None,
     ) -> List[TResult]: ...
 
+    async def _execute_batch(
+        self,
+        commands: List[Tuple[RequestType.ValueType, Sequence[TEncodableValue]]],
+        route: Optional[Route] = None,
+    ) -> List[Union[TResult, RequestError]]: ...
+
     async def _execute_script(
         self,
         hash: str,
@@ -404,12 +417,57 @@ class CoreCommands(Protocol):
         count: Optional[int] = ...,
         type: Optional[ObjectType] = ...,
         allow_non_covered_slots: bool = ...,
+        slot_ranges: Optional[List[Tuple[int, int]]] = ...,
     ) -> TResult: ...
 
+    def _prefetch_cluster_scan(
+        self,
+        cursor: ClusterScanCursor,
+        match: Optional[TEncodable],
+        count: Optional[int],
+        type: Optional[ObjectType],
+        allow_non_covered_slots: bool,
+        slot_ranges: Optional[List[Tuple[int, int]]],
+    ) -> Awaitable[List[Union[ClusterScanCursor, List[bytes]]]]: ...
+
+    def _prefetch_command(
+        self,
+        request_type: RequestType.ValueType,
+        args: Sequence[TEncodableValue],
+    ) -> Awaitable[TResult]: ...
+
     async def _update_connection_password(
         self, password: Optional[str], immediate_auth: bool
     ) -> TResult: ...
 
+    async def _scan_pages(
+        self,
+        request_type: RequestType.ValueType,
+        key: Optional[TEncodable],
+        options: List[TEncodable],
+    ) -> AsyncGenerator[List[Any], None]:
+        """
+        Yields the pages of a full iteration of a SCAN command, from the first cursor to the last. The next page is
+        requested before a page is yielded, so it is received while the caller processes the page.
+        """
+        key_args: List[TEncodable] = [] if key is None else [key]
+        pending: Optional[Awaitable[TResult]] = self._prefetch_command(
+            request_type, [*key_args, "0", *options]
+        )
+        try:
+            while pending is not None:
+                cursor, page = cast(List[Any], await pending)
+                pending = None
+                if cursor != b"0" and cursor != "0":
+                    pending = self._prefetch_command(
+                        request_type, [*key_args, cursor, *options]
+                    )
+                yield page
+        finally:
+            # The iteration was stopped before its last page
+            if inspect.iscoroutine(pending):
+                pending.close()
+
     async def update_connection_password(
         self, password: Optional[str], immediate_auth=False
     ) -> TOK:
@@ -447,7 +505,7 @@ class CoreCommands(Protocol):
     async def set(
         self,
         key: TEncodable,
-        value: TEncodable,
+        value: TEncodableValue,
         conditional_set: Optional[Union[ConditionalChange, OnlyIfEqual]] = None,
         expiry: Optional[ExpirySet] = None,
         return_old_value: bool = False,
@@ -458,7 +516,8 @@ class CoreCommands(Protocol):
 
         Args:
             key (TEncodable): the key to store.
-            value (TEncodable): the value to store with the given key.
+            value (TEncodableValue): the value to store with the given key.
+                Values that support the buffer protocol are sent without being converted to `bytes`, see `TEncodableValue`.
             conditional_set (Optional[ConditionalChange], optional): set the key only if the given condition is met.
                 Equivalent to [`XX` | `NX` | `IFEQ` comparison-value] in the Valkey API. Defaults to None.
             expiry (Optional[ExpirySet], optional): set expiriation to the given key.
@@ -501,7 +560,7 @@ class CoreCommands(Protocol):
             >>> await client.get("key")
                 b'newest_value" # Set "key" to "new_value" because the provided value was equal to the previous value of "key"
         """
-        args = [key, value]
+        args: List[TEncodableValue] = [key, value]
         if isinstance(conditional_set, ConditionalChange):
             args.append(conditional_set.value)
 
@@ -967,7 +1026,7 @@ class CoreCommands(Protocol):
     async def hset(
         self,
         key: TEncodable,
-        field_value_map: Mapping[TEncodable, TEncodable],
+        field_value_map: Mapping[TEncodable, TEncodableValue],
     ) -> int:
         """
         Sets the specified fields to their respective values in the hash stored at `key`.
@@ -975,7 +1034,7 @@ class CoreCommands(Protocol):
 
         Args:
             key (TEncodable): The key of the hash.
-            field_value_map (Mapping[TEncodable, TEncodable]): A field-value map consisting of fields and their corresponding values
+            field_value_map (Mapping[TEncodable, TEncodableValue]): A field-value map consisting of fields and their corresponding values
             to be set in the hash stored at the specified key.
 
         Returns:
@@ -985,7 +1044,7 @@ class CoreCommands(Protocol):
             >>> await client.hset("my_hash", {"field": "value", "field2": "value2"})
                 2 # Indicates that 2 fields were successfully set in the hash "my_hash".
         """
-        field_value_list: List[TEncodable] = [key]
+        field_value_list: List[TEncodableValue] = [key]
         for pair in field_value_map.items():
             field_value_list.extend(pair)
         return cast(
@@ -2737,7 +2796,7 @@ class CoreCommands(Protocol):
     async def xadd(
         self,
         key: TEncodable,
-        values: List[Tuple[TEncodable, TEncodable]],
+        values: List[Tuple[TEncodable, TEncodableValue]],
         options: Optional[StreamAddOptions] = None,
     ) -> Optional[bytes]:
         """
@@ -2747,7 +2806,7 @@ class CoreCommands(Protocol):
 
         Args:
             key (TEncodable): The key of the stream.
-            values (List[Tuple[TEncodable, TEncodable]]): Field-value pairs to be added to the entry.
+            values (List[Tuple[TEncodable, TEncodableValue]]): Field-value pairs to be added to the entry.
             options (Optional[StreamAddOptions]): Additional options for adding entries to the stream. Default to None. See `StreamAddOptions`.
 
         Returns:
@@ -2761,7 +2820,7 @@ class CoreCommands(Protocol):
             >>> await client.xadd("non_existing_stream", [(field, "foo1"), (field2, "bar1")], StreamAddOptions(id="0-1"))
                 b"0-1"  # Returns the stream id.
         """
-        args: List[TEncodable] = [key]
+        args: List[TEncodableValue] = [key]
         if options:
             args.extend(options.to_args())
         else:
@@ -6177,6 +6236,53 @@ class CoreCommands(Protocol):
             await self._execute_command(RequestType.SScan, args),
         )
 
+    async def sscan_iter(
+        self,
+        key: TEncodable,
+        match: Optional[TEncodable] = None,
+        count: Optional[int] = None,
+        batched: bool = False,
+    ) -> AsyncGenerator[Union[bytes, List[bytes]], None]:
+        """
+        Iterates over all of the members of a set, with as many SSCAN commands as needed.
+
+        The next page of members is requested while the current page is processed, so the round trips of the iteration
+        overlap the processing of its members. Like SSCAN, the iteration returns all of the members that were in the
+        set from its start to its end, and may return a member more than once.
+
+        See https://valkey.io/commands/sscan for more details.
+
+        Args:
+            key (TEncodable): The key of the set.
+            match (Optional[TEncodable]): A pattern to match the members against.
+            count (Optional[int]): A hint for the number of members to fetch per SSCAN command.
+            batched (bool): If True, the members are yielded in lists, a list per SSCAN command, instead of one at a
+                time. Defaults to False.
+
+        Returns:
+            AsyncGenerator[Union[bytes, List[bytes]], None]: An iterator of the members of the set, or of lists of
+                members if `batched` is True.
+
+        Examples:
+            >>> await client.sadd("key", ["member1", "member2"])
+            >>> async for member in client.sscan_iter("key"):
+            ...     print(member)
+            b'member1'
+            b'member2'
+        """
+        args: List[TEncodable] = []
+        if match is not None:
+            args += ["MATCH", match]
+        if count is not None:
+            args += ["COUNT", str(count)]
+
+        async for page in self._scan_pages(RequestType.SScan, key, args):
+            if batched:
+                yield page
+            else:
+                for member in page:
+                    yield member
+
     async def zscan(
         self,
         key: TEncodable,
@@ -6260,6 +6366,71 @@ class CoreCommands(Protocol):
             await self._execute_command(RequestType.ZScan, args),
         )
 
+    async def zscan_iter(
+        self,
+        key: TEncodable,
+        match: Optional[TEncodable] = None,
+        count: Optional[int] = None,
+        no_scores: bool = False,
+        batched: bool = False,
+    ) -> AsyncGenerator[
+        Union[
+            bytes,
+            Tuple[bytes, float],
+            List[bytes],
+            List[Tuple[bytes, float]],
+        ],
+        None,
+    ]:
+        """
+        Iterates over all of the members of a sorted set, with as many ZSCAN commands as needed.
+
+        The next page of members is requested while the current page is processed, so the round trips of the iteration
+        overlap the processing of its members. Like ZSCAN, the iteration returns all of the members that were in the
+        sorted set from its start to its end, and may return a member more than once.
+
+        See https://valkey.io/commands/zscan for more details.
+
+        Args:
+            key (TEncodable): The key of the sorted set.
+            match (Optional[TEncodable]): A pattern to match the members against.
+            count (Optional[int]): A hint for the number of members to fetch per ZSCAN command.
+            no_scores (bool): If `True`, the members are returned without their scores. Since Valkey "8.0.0".
+            batched (bool): If True, the members are yielded in lists, a list per ZSCAN command, instead of one at a
+                time. Defaults to False.
+
+        Returns:
+            AsyncGenerator[Union[bytes, Tuple[bytes, float], List[bytes], List[Tuple[bytes, float]]], None]: An
+                iterator of `(member, score)` tuples, or of the members if `no_scores` is True. If `batched` is True, an
+                iterator of lists of them.
+
+        Examples:
+            >>> await client.zadd("key", {"member1": 1.0, "member2": 2.5})
+            >>> async for member, score in client.zscan_iter("key"):
+            ...     print(member, score)
+            b'member1' 1.0
+            b'member2' 2.5
+        """
+        args: List[TEncodable] = []
+        if match is not None:
+            args += ["MATCH", match]
+        if count is not None:
+            args += ["COUNT", str(count)]
+        if no_scores:
+            args.append("NOSCORES")
+
+        async for page in self._scan_pages(RequestType.ZScan, key, args):
+            if not no_scores:
+                elements = iter(page)
+                page = [
+                    (member, float(score)) for member, score in zip(elements, elements)
+                ]
+            if batched:
+                yield page
+            else:
+                for member in page:
+                    yield member
+
     async def hscan(
         self,
         key: TEncodable,
@@ -6343,6 +6514,69 @@ class CoreCommands(Protocol):
             await self._execute_command(RequestType.HScan, args),
         )
 
+    async def hscan_iter(
+        self,
+        key: TEncodable,
+        match: Optional[TEncodable] = None,
+        count: Optional[int] = None,
+        no_values: bool = False,
+        batched: bool = False,
+    ) -> AsyncGenerator[
+        Union[
+            bytes,
+            Tuple[bytes, bytes],
+            List[bytes],
+            List[Tuple[bytes, bytes]],
+        ],
+        None,
+    ]:
+        """
+        Iterates over all of the fields of a hash, with as many HSCAN commands as needed.
+
+        The next page of fields is requested while the current page is processed, so the round trips of the iteration
+        overlap the processing of its fields. Like HSCAN, the iteration returns all of the fields that were in the hash
+        from its start to its end, and may return a field more than once.
+
+        See https://valkey.io/commands/hscan for more details.
+
+        Args:
+            key (TEncodable): The key of the hash.
+            match (Optional[TEncodable]): A pattern to match the fields against.
+            count (Optional[int]): A hint for the number of fields to fetch per HSCAN command.
+            no_values (bool): If `True`, the fields are returned without their values. Since Valkey "8.0.0".
+            batched (bool): If True, the fields are yielded in lists, a list per HSCAN command, instead of one at a
+                time. Defaults to False.
+
+        Returns:
+            AsyncGenerator[Union[bytes, Tuple[bytes, bytes], List[bytes], List[Tuple[bytes, bytes]]], None]: An
+                iterator of `(field, value)` tuples, or of the fields if `no_values` is True. If `batched` is True, an
+                iterator of lists of them.
+
+        Examples:
+            >>> await client.hset("key", {"field1": "value1", "field2": "value2"})
+            >>> async for field, value in client.hscan_iter("key"):
+            ...     print(field, value)
+            b'field1' b'value1'
+            b'field2' b'value2'
+        """
+        args: List[TEncodable] = []
+        if match is not None:
+            args += ["MATCH", match]
+        if count is not None:
+            args += ["COUNT", str(count)]
+        if no_values:
+            args.append("NOVALUES")
+
+        async for page in self._scan_pages(RequestType.HScan, key, args):
+            if not no_values:
+                elements = iter(page)
+                page = list(zip(elements, elements))
+            if batched:
+                yield page
+            else:
+                for field in page:
+                    yield field
+
     async def fcall(
         self,
         function: TEncodable,
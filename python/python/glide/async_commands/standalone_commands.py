@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Mapping, Optional, Union, cast
+from typing import AsyncGenerator, Dict, List, Mapping, Optional, Union, cast
 
 from glide.async_commands.command_args import ObjectType
 from glide.async_commands.core import (
@@ -11,7 +11,7 @@ from glide.async_commands.core import (
     FunctionRestorePolicy,
     InfoSection,
 )
-from glide.async_commands.transaction import Transaction
+from glide.async_commands.transaction import Batch, Transaction
 from glide.constants import (
     TOK,
     TEncodable,
@@ -19,6 +19,7 @@ from glide.constants import (
     TFunctionStatsFullResponse,
     TResult,
 )
+from glide.exceptions import RequestError
 from glide.protobuf.command_request_pb2 import RequestType
 
 from ..glide import Script
@@ -84,6 +85,33 @@ class StandaloneCommands(CoreCommands):
         commands = transaction.commands[:]
         return await self._execute_transaction(commands)
 
+    async def exec_batch(
+        self,
+        batch: Batch,
+    ) -> List[Union[TResult, RequestError]]:
+        """
+        Execute a batch of commands without MULTI/EXEC, see `Batch`.
+
+        The commands are sent together, without waiting for the response of one command before sending the next one,
+        so the batch takes about one round trip. Unlike a transaction, the batch isn't atomic, and a command that fails
+        doesn't affect the other commands. Batches larger than the client's inflight requests limit are sent in parts
+        of that size.
+
+        Args:
+            batch (Batch): A `Batch` object containing a list of commands to be executed.
+
+        Returns:
+            List[Union[TResult, RequestError]]: A list of results corresponding to the execution of each command
+                in the batch, in order. If a command failed, its entry is the `RequestError` it failed with.
+
+        Examples:
+            >>> batch = Batch().set("key1", "value1").incr("key1").get("key1")
+            >>> await client.exec_batch(batch)
+                [OK, RequestError('ERR value is not an integer or out of range'), b'value1']
+        """
+        commands = batch.commands[:]
+        return await self._execute_batch(commands)
+
     async def select(self, index: int) -> TOK:
         """
         Change the currently selected database.
@@ -842,6 +870,56 @@ class StandaloneCommands(CoreCommands):
             await self._execute_command(RequestType.Scan, args),
         )
 
+    async def scan_iter(
+        self,
+        match: Optional[TEncodable] = None,
+        count: Optional[int] = None,
+        type: Optional[ObjectType] = None,
+        batched: bool = False,
+    ) -> AsyncGenerator[Union[bytes, List[bytes]], None]:
+        """
+        Iterates over all of the keys of the database, with as many SCAN commands as needed.
+
+        The next page of keys is requested while the current page is processed, so the round trips of the iteration
+        overlap the processing of its keys. Like SCAN, the iteration returns all of the keys that were in the database
+        from its start to its end, and may return a key more than once.
+
+        See https://valkey.io/commands/scan for more details.
+
+        Args:
+            match (Optional[TEncodable]): A pattern to match keys against.
+            count (Optional[int]): A hint for the number of keys to fetch per SCAN command.
+            type (Optional[ObjectType]): The type of object to scan for.
+            batched (bool): If True, the keys are yielded in lists, a list per SCAN command, instead of one at a time.
+                Defaults to False.
+
+        Returns:
+            AsyncGenerator[Union[bytes, List[bytes]], None]: An iterator of the keys, or of lists of keys if
+                `batched` is True.
+
+        Examples:
+            >>> async for key in client.scan_iter(match="user:*", type=ObjectType.HASH):
+            ...     print(key)
+            b'user:1'
+            b'user:2'
+            >>> async for keys in client.scan_iter(count=1000, batched=True):
+            ...     await client.unlink(keys)
+        """
+        args: List[TEncodable] = []
+        if match is not None:
+            args.extend(["MATCH", match])
+        if count is not None:
+            args.extend(["COUNT", str(count)])
+        if type is not None:
+            args.extend(["TYPE", type.value])
+
+        async for page in self._scan_pages(RequestType.Scan, None, args):
+            if batched:
+                yield page
+            else:
+                for key in page:
+                    yield key
+
     async def script_exists(self, sha1s: List[TEncodable]) -> List[bool]:
         """
         Check existence of scripts in the script cache by their SHA1 digest.
@@ -1,7 +1,7 @@
 # Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
 
 import threading
-from typing import List, Mapping, Optional, Tuple, TypeVar, Union
+from typing import List, Mapping, Optional, Sequence, Tuple, TypeVar, Union
 
 from glide.async_commands.bitmap import (
     BitFieldGet,
@@ -54,7 +54,7 @@ from glide.async_commands.stream import (
     StreamTrimOptions,
     _create_xpending_range_args,
 )
-from glide.constants import TEncodable
+from glide.constants import TEncodable, TEncodableValue
 from glide.protobuf.command_request_pb2 import RequestType
 
 TTransaction = TypeVar("TTransaction", bound="BaseTransaction")
@@ -76,13 +76,15 @@ class BaseTransaction:
     """
 
     def __init__(self) -> None:
-        self.commands: List[Tuple[RequestType.ValueType, List[TEncodable]]] = []
+        self.commands: List[Tuple[RequestType.ValueType, Sequence[TEncodableValue]]] = (
+            []
+        )
         self.lock = threading.Lock()
 
     def append_command(
         self: TTransaction,
         request_type: RequestType.ValueType,
-        args: List[TEncodable],
+        args: Sequence[TEncodableValue],
     ) -> TTransaction:
         self.lock.acquire()
         try:
@@ -148,7 +150,7 @@ class BaseTransaction:
     def set(
         self: TTransaction,
         key: TEncodable,
-        value: TEncodable,
+        value: TEncodableValue,
         conditional_set: Union[ConditionalChange, None] = None,
         expiry: Union[ExpirySet, None] = None,
         return_old_value: bool = False,
@@ -163,7 +165,7 @@ class BaseTransaction:
 
         Args:
             key (TEncodable): the key to store.
-            value (TEncodable): the value to store with the given key.
+            value (TEncodableValue): the value to store with the given key.
             conditional_set (Optional[ConditionalChange], optional): set the key only if the given condition is met.
                 Equivalent to [`XX` | `NX`] in the Valkey API. Defaults to None.
             expiry (Optional[ExpirySet], optional): set expiriation to the given key.
@@ -178,7 +180,7 @@ class BaseTransaction:
                 If value isn't set because of only_if_exists or only_if_does_not_exist conditions, return None.
                 If return_old_value is set, return the old value as a bytes string.
         """
-        args = [key, value]
+        args: List[TEncodableValue] = [key, value]
         if conditional_set:
             if conditional_set == ConditionalChange.ONLY_IF_EXISTS:
                 args.append("XX")
@@ -559,7 +561,7 @@ class BaseTransaction:
     def hset(
         self: TTransaction,
         key: TEncodable,
-        field_value_map: Mapping[TEncodable, TEncodable],
+        field_value_map: Mapping[TEncodable, TEncodableValue],
     ) -> TTransaction:
         """
         Sets the specified fields to their respective values in the hash stored at `key`.
@@ -567,13 +569,13 @@ class BaseTransaction:
 
         Args:
             key (TEncodable): The key of the hash.
-            field_value_map (Mapping[TEncodable, TEncodable]): A field-value map consisting of fields and their corresponding values
+            field_value_map (Mapping[TEncodable, TEncodableValue]): A field-value map consisting of fields and their corresponding values
             to be set in the hash stored at the specified key.
 
         Command response:
             int: The number of fields that were added to the hash.
         """
-        field_value_list: List[TEncodable] = [key]
+        field_value_list: List[TEncodableValue] = [key]
         for pair in field_value_map.items():
             field_value_list.extend(pair)
         return self.append_command(RequestType.HSet, field_value_list)
@@ -2139,7 +2141,7 @@ class BaseTransaction:
     def xadd(
         self: TTransaction,
         key: TEncodable,
-        values: List[Tuple[TEncodable, TEncodable]],
+        values: List[Tuple[TEncodable, TEncodableValue]],
         options: StreamAddOptions = StreamAddOptions(),
     ) -> TTransaction:
         """
@@ -2149,13 +2151,13 @@ class BaseTransaction:
 
         Args:
             key (TEncodable): The key of the stream.
-            values: List[Tuple[TEncodable, TEncodable]]: Field-value pairs to be added to the entry.
+            values: List[Tuple[TEncodable, TEncodableValue]]: Field-value pairs to be added to the entry.
             options (Optional[StreamAddOptions]): Additional options for adding entries to the stream. Default to None. See `StreamAddOptions`.
 
         Commands response:
             bytes: The id of the added entry, or None if `options.make_stream` is set to False and no stream with the matching `key` exists.
         """
-        args = [key]
+        args: List[TEncodableValue] = [key]
         if options:
             args.extend(options.to_args())
         args.extend([field for pair in values for field in pair])
@@ -5173,3 +5175,45 @@ class ClusterTransaction(BaseTransaction):
         )
 
     # TODO: add all CLUSTER commands
+
+
+class Batch(Transaction):
+    """
+    A batch of commands for a standalone client, sent without MULTI/EXEC by `GlideClient.exec_batch`.
+
+    A batch is built like a `Transaction`, but it isn't atomic: the commands are sent together, without waiting for
+    the response of one command before sending the next one, so the batch takes about one round trip, and other
+    clients' commands may be executed between them. A command that fails doesn't affect the other commands of the
+    batch, its error is returned in its place in the results.
+
+    Command Response:
+        The response for each command depends on the executed command. Specific response types
+        are documented alongside each method.
+
+    Example:
+        batch = Batch()
+        >>> batch.set("key1", "value1").set("key2", "value2").incr("key1").get("key2")
+        >>> await client.exec_batch(batch)
+        [OK, OK, RequestError('ERR value is not an integer or out of range'), b'value2']
+    """
+
+
+class ClusterBatch(ClusterTransaction):
+    """
+    A batch of commands for a cluster client, sent without MULTI/EXEC by `GlideClusterClient.exec_batch`.
+
+    Unlike a `ClusterTransaction`, the keys of a batch may belong to any slots: every command is routed to the node
+    that owns its slot, and the commands that are sent to the same node are pipelined on its connection, so the batch
+    takes about one round trip per node. The results are returned in the order of the commands, and a command that
+    fails doesn't affect the other commands of the batch, its error is returned in its place in the results.
+
+    Command Response:
+        The response for each command depends on the executed command. Specific response types
+        are documented alongside each method.
+
+    Example:
+        batch = ClusterBatch()
+        >>> batch.set("key1", "value1").set("key2", "value2").get("key1").get("key2")
+        >>> await client.exec_batch(batch)
+        [OK, OK, b'value1', b'value2']
+    """
@@ -0,0 +1,308 @@
+# Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
+
+import asyncio
+import contextvars
+import functools
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Set, Union
+
+from glide.constants import TEncodableValue
+from glide.exceptions import ClosingError
+from glide.protobuf.command_request_pb2 import RequestType
+from glide.response_options import _get_response_options
+
+if TYPE_CHECKING:
+    from glide.glide_client import BaseClient
+
+# The keys and fields that can be merged, which must be hashable to be grouped
+TBatchKey = Union[str, bytes]
+
+
+class _Group:
+    """
+    Consecutive pending commands of the same type, which are merged together.
+    """
+
+    def __init__(self, request_type: RequestType.ValueType) -> None:
+        self.request_type = request_type
+        # The callers of GET, by the key they get
+        self.gets: Dict[TBatchKey, List[asyncio.Future]] = {}
+        # The callers of SET, in the order they were called, so the last value of a key is the one that is set
+        self.sets: List[Sequence[TEncodableValue]] = []
+        self.set_futures: List[asyncio.Future] = []
+        # The callers of HGET, by the hash key and the field they get
+        self.hgets: Dict[TBatchKey, Dict[TBatchKey, List[asyncio.Future]]] = {}
+
+
+class _MergedCommand:
+    """
+    A command that is sent for the callers of a group. If `split_result` is True, its result holds an element per
+    group of `callers`, otherwise the result is given to all of them. The callers of an MGET key in `resent_keys` that
+    gets None are sent a GET of the key instead.
+    """
+
+    def __init__(
+        self,
+        request_type: RequestType.ValueType,
+        args: Sequence[TEncodableValue],
+        callers: List[List[asyncio.Future]],
+        split_result: bool = False,
+        resent_keys: Optional[Set[TBatchKey]] = None,
+    ) -> None:
+        self.request_type = request_type
+        self.args = args
+        self.callers = callers
+        self.split_result = split_result
+        self.resent_keys = resent_keys
+
+
+class _PendingCommands:
+    """
+    The commands that wait on an event loop to be merged, with the futures of their callers.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.timer: Optional[asyncio.TimerHandle] = None
+        # The groups of commands, in the order they were called
+        self.groups: List[_Group] = []
+
+
+class AutoBatcher:
+    """
+    Merges the single-key commands that a client is called with concurrently into multi-key commands.
+
+    GET, SET and HGET commands that are called on the same event loop within the batching window are merged, and the
+    results of the merged commands are fanned out to the callers. The window starts with the first pending command,
+    and ends early once `max_commands` commands are pending. At the end of the window, the commands are sent in the
+    order they were called: consecutive GETs are sent as a single MGET, consecutive SETs as a single MSET, and
+    consecutive HGETs as an HMGET per hash, so a command is never sent before a command of another type that was
+    called before it. A group with a single command sends the original command. MGET returns None for a key that holds
+    a value of another type, where GET raises an error. With `type_errors`, a GET whose key gets None from the MGET is
+    sent again as is, so the error reaches its caller, unless a later SET of the window sets the key. In cluster mode,
+    the client splits the merged commands by the slots of their keys, so a command is sent to the server per slot.
+
+    Only commands that the merged command is equivalent to are merged: SET without options, and commands whose
+    responses are converted with the client's default options. Other commands, and commands called outside of an
+    asyncio event loop, are sent as is.
+
+    Args:
+        client (BaseClient): The client that sends the merged commands.
+        window (float): The batching window in seconds.
+        max_commands (Optional[int]): The number of pending commands that ends the window early.
+        type_errors (bool): Whether the GETs that got None from an MGET are sent again.
+    """
+
+    def __init__(
+        self,
+        client: "BaseClient",
+        window: float,
+        max_commands: Optional[int],
+        type_errors: bool,
+    ):
+        self._client = client
+        self._window = window
+        self._max_commands = max_commands
+        self._type_errors = type_errors
+        self._pending: Dict[asyncio.AbstractEventLoop, _PendingCommands] = {}
+
+    def submit(
+        self, request_type: RequestType.ValueType, args: Sequence[TEncodableValue]
+    ) -> Optional[asyncio.Future]:
+        """
+        Adds the command to the pending commands of the running event loop.
+
+        Returns:
+            Optional[asyncio.Future]: The future of the command's result, or None if the command can't be merged
+                and should be sent as is.
+        """
+        if not self._can_merge(request_type, args):
+            return None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Called from a Trio run
+            return None
+        pending = self._pending.get(loop)
+        if pending is None:
+            pending = _PendingCommands()
+            self._pending[loop] = pending
+            pending.timer = loop.call_later(
+                self._window, self._flush, loop, context=contextvars.Context()
+            )
+        group = pending.groups[-1] if pending.groups else None
+        if group is None or group.request_type != request_type:
+            # A command of another type starts a new group, so a GET that is called after a SET of its key is sent
+            # after the SET, and never merged into an MGET that is sent before it
+            group = _Group(request_type)
+            pending.groups.append(group)
+        future = loop.create_future()
+        if request_type == RequestType.Get:
+            group.gets.setdefault(args[0], []).append(future)  # type: ignore[arg-type]
+        elif request_type == RequestType.Set:
+            group.sets.append(args)
+            group.set_futures.append(future)
+        else:
+            fields = group.hgets.setdefault(args[0], {})  # type: ignore[arg-type]
+            fields.setdefault(args[1], []).append(future)  # type: ignore[arg-type]
+        pending.count += 1
+        if self._max_commands is not None and pending.count >= self._max_commands:
+            # The merged commands are sent with the client's default response options
+            contextvars.Context().run(self._flush, loop)
+        return future
+
+    def _can_merge(
+        self, request_type: RequestType.ValueType, args: Sequence[TEncodableValue]
+    ) -> bool:
+        if request_type == RequestType.Get:
+            arg_count = 1
+        elif request_type == RequestType.Set or request_type == RequestType.HGet:
+            arg_count = 2
+        else:
+            return False
+        if len(args) != arg_count:
+            return False
+        if request_type != RequestType.Set and not all(
+            isinstance(arg, (str, bytes)) for arg in args
+        ):
+            return False
+        return (
+            _get_response_options(self._client._response_options, request_type, args)
+            is None
+        )
+
+    def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        pending = self._pending.pop(loop, None)
+        if pending is None:
+            return
+        if pending.timer is not None:
+            pending.timer.cancel()
+        # The keys that are set by the groups after each group
+        written_later: List[Set[TBatchKey]] = []
+        written: Set[TBatchKey] = set()
+        for group in reversed(pending.groups):
+            written_later.append(set(written))
+            written.update(args[0] for args in group.sets)  # type: ignore[misc]
+        # The merged commands of all of the groups are sent together, in the order of the groups
+        commands: List[_MergedCommand] = []
+        for group, keys_written_later in zip(pending.groups, reversed(written_later)):
+            commands += self._merge_group(group, keys_written_later)
+        self._send(commands)
+
+    def _merge_group(
+        self, group: _Group, keys_written_later: Set[TBatchKey]
+    ) -> List[_MergedCommand]:
+        commands: List[_MergedCommand] = []
+        if group.gets:
+            keys = list(group.gets)
+            if len(keys) == 1:
+                commands.append(
+                    _MergedCommand(RequestType.Get, keys, [group.gets[keys[0]]])
+                )
+            else:
+                # With type errors, a GET whose key gets None is sent again as is, unless a later SET of the window
+                # sets its key, since the GET would read the value of that SET
+                commands.append(
+                    _MergedCommand(
+                        RequestType.MGet,
+                        keys,
+                        [group.gets[key] for key in keys],
+                        split_result=True,
+                        resent_keys=(
+                            set(keys) - keys_written_later
+                            if self._type_errors
+                            else None
+                        ),
+                    )
+                )
+        if group.sets:
+            if len(group.sets) == 1:
+                commands.append(
+                    _MergedCommand(RequestType.Set, group.sets[0], [group.set_futures])
+                )
+            else:
+                # MSET replies OK, which is the reply of every SET it replaces
+                commands.append(
+                    _MergedCommand(
+                        RequestType.MSet,
+                        [arg for args in group.sets for arg in args],
+                        [group.set_futures],
+                    )
+                )
+        for key, fields in group.hgets.items():
+            names = list(fields)
+            if len(names) == 1:
+                commands.append(
+                    _MergedCommand(
+                        RequestType.HGet, [key, names[0]], [fields[names[0]]]
+                    )
+                )
+            else:
+                commands.append(
+                    _MergedCommand(
+                        RequestType.HMGet,
+                        [key, *names],
+                        [fields[name] for name in names],
+                        split_result=True,
+                    )
+                )
+        return commands
+
+    def _send(self, commands: List[_MergedCommand]) -> None:
+        """
+        Sends the merged commands, in their order, and fans out their results to their callers.
+        """
+        try:
+            if self._client._is_closed:
+                raise ClosingError(
+                    "Unable to execute requests; the client is closed. Please create a new client."
+                )
+            response_futures = self._client._submit_commands(
+                [(command.request_type, command.args) for command in commands]
+            )
+        except Exception as e:
+            for command in commands:
+                _fail_callers(command.callers, e)
+            return
+        for command, response_future in zip(commands, response_futures):
+            response_future.add_done_callback(
+                functools.partial(self._on_response, command)
+            )
+
+    def _on_response(
+        self, command: _MergedCommand, response_future: asyncio.Future
+    ) -> None:
+        if response_future.cancelled():
+            _fail_callers(command.callers, asyncio.CancelledError())
+            return
+        exception = response_future.exception()
+        if exception is not None:
+            _fail_callers(command.callers, exception)
+            return
+        result = response_future.result()
+        results = result if command.split_result else [result] * len(command.callers)
+        resent: List[_MergedCommand] = []
+        for i, (futures, value) in enumerate(zip(command.callers, results)):
+            if (
+                value is None
+                and command.resent_keys
+                and command.args[i] in command.resent_keys
+            ):
+                # MGET returns None for a key that holds a value of another type, where GET raises an error
+                resent.append(
+                    _MergedCommand(RequestType.Get, [command.args[i]], [futures])
+                )
+                continue
+            for future in futures:
+                if not future.done():
+                    future.set_result(value)
+        if resent:
+            self._send(resent)
+
+
+def _fail_callers(
+    callers: List[List[asyncio.Future]], exception: BaseException
+) -> None:
+    for futures in callers:
+        for future in futures:
+            if not future.done():
+                future.set_exception(exception)
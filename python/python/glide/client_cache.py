@@ -0,0 +1,534 @@
+# Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
+
+from glide.constants import TEncodableValue, TResult
+from glide.protobuf.command_request_pb2 import RequestType
+from glide.response_options import TResponseOptions, _get_response_options
+from glide.routes import Route
+
+# A cached response, by the command that returned it and its encoded arguments
+TCacheKey = Tuple[int, Tuple[bytes, ...]]
+
+# The commands whose responses are cached, by the index of the key they read in their arguments
+_CACHED_COMMANDS: Dict[int, int] = {
+    RequestType.Get: 0,
+    RequestType.HGet: 0,
+    RequestType.HGetAll: 0,
+    RequestType.SMembers: 0,
+    # JSON.GET is sent as a custom command, its first argument is the command name
+    RequestType.CustomCommand: 1,
+}
+
+# The commands that remove all of the keys of the database
+_FLUSH_COMMANDS = (RequestType.FlushAll, RequestType.FlushDB, RequestType.SwapDb)
+
+# The commands that may change the keys of their arguments. Custom commands are also treated as writes, since their
+# names aren't known, and scripts and functions invalidate all of their keys and arguments
+_WRITE_COMMANDS: FrozenSet[int] = frozenset(
+    {
+        # Keys
+        RequestType.Copy,
+        RequestType.Del,
+        RequestType.Expire,
+        RequestType.ExpireAt,
+        RequestType.Migrate,
+        RequestType.Move,
+        RequestType.Persist,
+        RequestType.PExpire,
+        RequestType.PExpireAt,
+        RequestType.Rename,
+        RequestType.RenameNX,
+        RequestType.Restore,
+        RequestType.RestoreAsking,
+        RequestType.Sort,
+        RequestType.Unlink,
+        # Strings
+        RequestType.Append,
+        RequestType.Decr,
+        RequestType.DecrBy,
+        RequestType.GetDel,
+        RequestType.GetEx,
+        RequestType.GetSet,
+        RequestType.Incr,
+        RequestType.IncrBy,
+        RequestType.IncrByFloat,
+        RequestType.MSet,
+        RequestType.MSetNX,
+        RequestType.PSetEx,
+        RequestType.Set,
+        RequestType.SetEx,
+        RequestType.SetNX,
+        RequestType.SetRange,
+        # Bitmaps and HyperLogLogs
+        RequestType.BitField,
+        RequestType.BitOp,
+        RequestType.SetBit,
+        RequestType.PfAdd,
+        RequestType.PfMerge,
+        # Hashes
+        RequestType.HDel,
+        RequestType.HIncrBy,
+        RequestType.HIncrByFloat,
+        RequestType.HMSet,
+        RequestType.HSet,
+        RequestType.HSetNX,
+        # Sets
+        RequestType.SAdd,
+        RequestType.SDiffStore,
+        RequestType.SInterStore,
+        RequestType.SMove,
+        RequestType.SPop,
+        RequestType.SRem,
+        RequestType.SUnionStore,
+        # Lists
+        RequestType.BLMove,
+        RequestType.BLMPop,
+        RequestType.BLPop,
+        RequestType.BRPop,
+        RequestType.BRPopLPush,
+        RequestType.LInsert,
+        RequestType.LMove,
+        RequestType.LMPop,
+        RequestType.LPop,
+        RequestType.LPush,
+        RequestType.LPushX,
+        RequestType.LRem,
+        RequestType.LSet,
+        RequestType.LTrim,
+        RequestType.RPop,
+        RequestType.RPopLPush,
+        RequestType.RPush,
+        RequestType.RPushX,
+        # Sorted sets
+        RequestType.BZMPop,
+        RequestType.BZPopMax,
+        RequestType.BZPopMin,
+        RequestType.ZAdd,
+        RequestType.ZDiffStore,
+        RequestType.ZIncrBy,
+        RequestType.ZInterStore,
+        RequestType.ZMPop,
+        RequestType.ZPopMax,
+        RequestType.ZPopMin,
+        RequestType.ZRangeStore,
+        RequestType.ZRem,
+        RequestType.ZRemRangeByLex,
+        RequestType.ZRemRangeByRank,
+        RequestType.ZRemRangeByScore,
+        RequestType.ZUnionStore,
+        # Geospatial indices and streams
+        RequestType.GeoAdd,
+        RequestType.GeoRadius,
+        RequestType.GeoRadiusByMember,
+        RequestType.GeoSearchStore,
+        RequestType.XAck,
+        RequestType.XAdd,
+        RequestType.XAutoClaim,
+        RequestType.XClaim,
+        RequestType.XDel,
+        RequestType.XGroupCreate,
+        RequestType.XGroupCreateConsumer,
+        RequestType.XGroupDelConsumer,
+        RequestType.XGroupDestroy,
+        RequestType.XGroupSetId,
+        RequestType.XReadGroup,
+        RequestType.XSetId,
+        RequestType.XTrim,
+        # Scripts and functions
+        RequestType.Eval,
+        RequestType.EvalSha,
+        RequestType.FCall,
+        # JSON
+        RequestType.JsonArrAppend,
+        RequestType.JsonArrInsert,
+        RequestType.JsonArrPop,
+        RequestType.JsonArrTrim,
+        RequestType.JsonClear,
+        RequestType.JsonDel,
+        RequestType.JsonForget,
+        RequestType.JsonNumIncrBy,
+        RequestType.JsonNumMultBy,
+        RequestType.JsonSet,
+        RequestType.JsonStrAppend,
+        RequestType.JsonToggle,
+    }
+)
+
+
+def _encode(arg: Any) -> Optional[bytes]:
+    if isinstance(arg, bytes):
+        return arg
+    if isinstance(arg, str):
+        return arg.encode()
+    return None
+
+
+def _is_cached_command(
+    request_type: RequestType.ValueType, args: Sequence[TEncodableValue]
+) -> bool:
+    if request_type == RequestType.MGet:
+        return True
+    if request_type == RequestType.CustomCommand:
+        command_name = _encode(args[0]) if args else None
+        return command_name is not None and command_name.upper() == b"JSON.GET"
+    return request_type in _CACHED_COMMANDS
+
+
+def _estimate_size(value: Any) -> int:
+    """
+    Returns the approximate memory size of a response in bytes, including the objects it contains.
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for field, field_value in value.items():
+            size += _estimate_size(field) + _estimate_size(field_value)
+    elif isinstance(value, (list, set, tuple)):
+        for element in value:
+            size += _estimate_size(element)
+    return size
+
+
+def _copy(value: Any) -> Any:
+    # Callers may modify the containers they get, without changing the cached response
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, set):
+        return set(value)
+    if isinstance(value, list):
+        return list(value)
+    return value
+
+
+class _CacheEntry:
+    __slots__ = ("value", "size", "expires_at", "server_key")
+
+    def __init__(
+        self, value: Any, size: int, expires_at: Optional[float], server_key: bytes
+    ):
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+        self.server_key = server_key
+
+
+class CacheRead:
+    """
+    A read command that the cache was looked up for. If it missed, the response of the command populates the cache,
+    unless one of the keys it reads is invalidated while the command is in flight.
+    """
+
+    __slots__ = (
+        "request_type",
+        "cache_keys",
+        "server_keys",
+        "hit",
+        "value",
+        "invalidated",
+    )
+
+    def __init__(
+        self,
+        request_type: RequestType.ValueType,
+        cache_keys: List[TCacheKey],
+        server_keys: List[bytes],
+    ):
+        self.request_type = request_type
+        self.cache_keys = cache_keys
+        self.server_keys = server_keys
+        self.hit = False
+        self.value: Any = None
+        self.invalidated = False
+
+
+class ClientCache:
+    """
+    A near cache of the responses of read commands, kept consistent by the server with `CLIENT TRACKING`.
+
+    The responses of GET, HGET, HGETALL, MGET, SMEMBERS and JSON.GET are cached by their command and arguments, and
+    the server pushes an invalidation message when a key that was read changes, which removes the responses of the
+    key. MGET is served from, and populates, the responses of GET. A response that is read while one of its keys is
+    invalidated isn't cached, since it may be the value from before the change. The cache is flushed when the server
+    flushes its database, and when a connection is lost, since invalidations may have been missed.
+
+    Write commands, such as SET, DEL or HSET, and custom commands invalidate the responses of their arguments, so a
+    client reads its own writes without waiting for the server's invalidation. Other commands, such as TTL or SCAN,
+    leave the cache as is. Commands with a route, and commands whose responses are converted
+    with options other than the client's default options, aren't cached.
+
+    Entries are evicted by least recent use once the cache holds `max_entries` entries or `max_memory` bytes, and
+    expire `ttl` seconds after they are cached. The cache can be used from any thread.
+
+    Args:
+        max_entries (int): The maximum number of cached responses.
+        max_memory (Optional[int]): The maximum approximate memory size of the cached responses, in bytes.
+        ttl (Optional[float]): The number of seconds a response is cached for.
+        broadcast_prefixes (Optional[List[bytes]]): If not None, the server broadcasts the invalidations of the keys
+            that start with one of the prefixes, and only the responses of these keys are cached. An empty list
+            matches all keys.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_memory: Optional[int] = None,
+        ttl: Optional[float] = None,
+        broadcast_prefixes: Optional[List[bytes]] = None,
+    ):
+        self._max_entries = max_entries
+        self._max_memory = max_memory
+        self._ttl = ttl
+        self._broadcast_prefixes = (
+            tuple(broadcast_prefixes) if broadcast_prefixes else None
+        )
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[TCacheKey, _CacheEntry]" = OrderedDict()
+        # The cached responses of every server key
+        self._cache_keys_by_server_key: Dict[bytes, Set[TCacheKey]] = {}
+        # The reads that are in flight, by the server keys they read
+        self._reads_by_server_key: Dict[bytes, List[CacheRead]] = {}
+        self._memory = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def lookup(
+        self,
+        request_type: RequestType.ValueType,
+        args: Sequence[TEncodableValue],
+        route: Optional[Route],
+        response_options: TResponseOptions,
+    ) -> Optional[CacheRead]:
+        """
+        Looks up the response of a command. A write command invalidates the responses of its arguments.
+
+        Returns:
+            Optional[CacheRead]: The read, with its cached response if it was found, or None if the command isn't
+                cached, and must be sent as is.
+        """
+        if not _is_cached_command(request_type, args):
+            self.invalidate_command(request_type, args)
+            return None
+        if (
+            route is not None
+            or _get_response_options(response_options, request_type, args) is not None
+        ):
+            return None
+        cache_read = self._to_cache_read(request_type, args)
+        if cache_read is None:
+            return None
+        with self._lock:
+            now = time.monotonic()
+            values = [self._get(cache_key, now) for cache_key in cache_read.cache_keys]
+            if all(found for found, _ in values):
+                self._hits += 1
+                cache_read.hit = True
+                cache_read.value = (
+                    [_copy(value) for _, value in values]
+                    if request_type == RequestType.MGet
+                    else _copy(values[0][1])
+                )
+                return cache_read
+            self._misses += 1
+            for server_key in cache_read.server_keys:
+                self._reads_by_server_key.setdefault(server_key, []).append(cache_read)
+        return cache_read
+
+    def _to_cache_read(
+        self, request_type: RequestType.ValueType, args: Sequence[TEncodableValue]
+    ) -> Optional[CacheRead]:
+        encoded_args: List[bytes] = []
+        cache_keys: List[TCacheKey]
+        for arg in args:
+            encoded_arg = _encode(arg)
+            if encoded_arg is None:
+                return None
+            encoded_args.append(encoded_arg)
+        if request_type == RequestType.MGet:
+            if not encoded_args:
+                return None
+            server_keys = encoded_args
+            cache_keys = [(RequestType.Get, (key,)) for key in encoded_args]
+        else:
+            key_index = _CACHED_COMMANDS[request_type]
+            if len(encoded_args) <= key_index:
+                return None
+            server_keys = [encoded_args[key_index]]
+            cache_keys = [(request_type, tuple(encoded_args))]
+        if self._broadcast_prefixes is not None and not all(
+            server_key.startswith(self._broadcast_prefixes)
+            for server_key in server_keys
+        ):
+            # The server doesn't send the invalidations of these keys
+            return None
+        return CacheRead(request_type, cache_keys, server_keys)
+
+    def _get(self, cache_key: TCacheKey, now: float) -> Tuple[bool, Any]:
+        entry = self._entries.get(cache_key)
+        if entry is None:
+            return False, None
+        if entry.expires_at is not None and entry.expires_at <= now:
+            self._remove(cache_key)
+            return False, None
+        self._entries.move_to_end(cache_key)
+        return True, entry.value
+
+    def populate(self, cache_read: CacheRead, response: TResult) -> None:
+        """
+        Caches the response of a read that missed, unless one of its keys was invalidated while it was in flight.
+        """
+        with self._lock:
+            self._release(cache_read)
+            if cache_read.invalidated:
+                return
+            if cache_read.request_type == RequestType.MGet:
+                # A missing key, and a key that holds a value of another type, are both returned as None by MGET
+                for cache_key, server_key, value in zip(
+                    cache_read.cache_keys,
+                    cache_read.server_keys,
+                    response,  # type: ignore[arg-type]
+                ):
+                    if value is not None:
+                        self._put(cache_key, server_key, value)
+            else:
+                self._put(cache_read.cache_keys[0], cache_read.server_keys[0], response)
+
+    def abort(self, cache_read: CacheRead) -> None:
+        """
+        Releases a read that missed and failed.
+        """
+        with self._lock:
+            self._release(cache_read)
+
+    def _release(self, cache_read: CacheRead) -> None:
+        for server_key in cache_read.server_keys:
+            reads = self._reads_by_server_key.get(server_key)
+            if reads is None:
+                continue
+            try:
+                reads.remove(cache_read)
+            except ValueError:
+                pass
+            if not reads:
+                del self._reads_by_server_key[server_key]
+
+    def _put(self, cache_key: TCacheKey, server_key: bytes, value: Any) -> None:
+        if cache_key in self._entries:
+            self._remove(cache_key)
+        size = _estimate_size(value) + _estimate_size(cache_key)
+        if self._max_memory is not None and size > self._max_memory:
+            return
+        expires_at = time.monotonic() + self._ttl if self._ttl is not None else None
+        # The response is also returned to the caller that read it
+        self._entries[cache_key] = _CacheEntry(
+            _copy(value), size, expires_at, server_key
+        )
+        self._cache_keys_by_server_key.setdefault(server_key, set()).add(cache_key)
+        self._memory += size
+        while len(self._entries) > self._max_entries or (
+            self._max_memory is not None and self._memory > self._max_memory
+        ):
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+    def _remove(self, cache_key: TCacheKey) -> None:
+        entry = self._entries.pop(cache_key)
+        self._memory -= entry.size
+        cache_keys = self._cache_keys_by_server_key[entry.server_key]
+        cache_keys.discard(cache_key)
+        if not cache_keys:
+            del self._cache_keys_by_server_key[entry.server_key]
+
+    def invalidate(self, server_keys: Sequence[bytes]) -> None:
+        """
+        Removes the responses of the keys, and marks the reads of the keys that are in flight as invalidated.
+        """
+        with self._lock:
+            for server_key in server_keys:
+                self._invalidate(server_key)
+
+    def _invalidate(self, server_key: bytes) -> None:
+        for cache_read in self._reads_by_server_key.get(server_key, ()):
+            cache_read.invalidated = True
+        cache_keys = self._cache_keys_by_server_key.get(server_key)
+        if cache_keys is None:
+            return
+        self._invalidations += 1
+        for cache_key in list(cache_keys):
+            self._remove(cache_key)
+
+    def invalidate_command(
+        self, request_type: RequestType.ValueType, args: Sequence[TEncodableValue]
+    ) -> None:
+        """
+        Invalidates the responses that a command may change. Commands that only read keys don't change any response.
+        """
+        if request_type in _FLUSH_COMMANDS:
+            self.flush()
+        elif (
+            request_type in _WRITE_COMMANDS or request_type == RequestType.CustomCommand
+        ):
+            self.invalidate_args(args)
+
+    def invalidate_args(self, args: Sequence[Any]) -> None:
+        """
+        Invalidates the responses of the keys that a command may write. The keys of a command aren't known, so all
+        of its string arguments are treated as keys.
+        """
+        with self._lock:
+            if not self._cache_keys_by_server_key and not self._reads_by_server_key:
+                return
+            for arg in args:
+                server_key = _encode(arg)
+                if server_key is not None:
+                    self._invalidate(server_key)
+
+    def flush(self) -> None:
+        """
+        Removes all of the responses, and marks all of the reads that are in flight as invalidated.
+        """
+        with self._lock:
+            for reads in self._reads_by_server_key.values():
+                for cache_read in reads:
+                    cache_read.invalidated = True
+            self._entries.clear()
+            self._cache_keys_by_server_key.clear()
+            self._memory = 0
+
+    def process_push_notification(self, push_notification: Dict[str, Any]) -> bool:
+        """
+        Applies an invalidation message, or flushes the cache if a connection was lost.
+
+        Returns:
+            bool: True if the message was an invalidation message, which is consumed by the cache.
+        """
+        message_kind = push_notification["kind"]
+        if message_kind == "Disconnection":
+            self.flush()
+            return False
+        if message_kind != "Invalidate":
+            return False
+        values = push_notification["values"]
+        # The keys are None when the server flushed its database
+        server_keys = values[0] if values else None
+        if server_keys is None:
+            self.flush()
+        else:
+            self.invalidate(server_keys)
+        return True
+
+    def get_statistics(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "entries": len(self._entries),
+                "memory": self._memory,
+            }
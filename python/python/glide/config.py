@@ -7,11 +7,13 @@ from enum import Enum, IntEnum
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 from glide.async_commands.core import CoreCommands
+from glide.constants import TEncodable
 from glide.exceptions import ConfigurationError
 from glide.protobuf.connection_request_pb2 import ConnectionRequest
 from glide.protobuf.connection_request_pb2 import ProtocolVersion as SentProtocolVersion
 from glide.protobuf.connection_request_pb2 import ReadFrom as ProtobufReadFrom
 from glide.protobuf.connection_request_pb2 import TlsMode
+from glide.response_options import ResultAdapter, TResponseOptions
 
 
 class NodeAddress:
@@ -129,6 +131,75 @@ class PeriodicChecksStatus(Enum):
     """
 
 
+class ClientTransport(Enum):
+    """
+    Represents how the client passes requests to the Rust core.
+    """
+
+    SOCKET = 0
+    """
+    Requests are serialized with protobuf and sent to the core's socket listener over a Unix domain socket.
+    """
+    IN_PROCESS = 1
+    """
+    Requests are handed to the core directly through the native module, without the socket hop and the protobuf framing.
+    Responses are delivered to the event loop each request was issued from, which can also be a Trio run.
+    """
+
+
+class ClientCacheConfiguration:
+    """
+    Represents the configuration of the client side cache, a near cache of the responses of read commands that the
+    server keeps consistent with `CLIENT TRACKING`.
+
+    The responses of GET, HGET, HGETALL, MGET, SMEMBERS and JSON.GET are cached, and removed when the server notifies
+    the client that their keys changed. The whole cache is flushed when a connection to the server is lost, since
+    notifications may have been missed. Cached responses are evicted by least recent use, once the cache is full.
+
+    Args:
+        max_entries (int): The maximum number of cached responses. Defaults to 10000.
+        max_memory (Optional[int]): The maximum approximate memory size of the cached responses, in bytes.
+            If not set, the cache is bounded only by `max_entries`.
+        ttl (Optional[int]): The duration in milliseconds a response is cached for, which bounds how long a response
+            may be served if a notification is lost. If not set, responses are cached until they are invalidated or
+            evicted.
+        broadcast (bool): If True, the server uses broadcasting mode: it notifies the client of the changes of all of
+            the keys that start with one of `prefixes`, instead of the changes of the keys the client read. This saves
+            the server the memory of tracking the keys of every client, at the cost of more notifications, and only
+            the responses of keys that start with one of `prefixes` are cached. Defaults to False.
+        prefixes (Optional[List[TEncodable]]): The key prefixes of broadcasting mode. If not set, the client is
+            notified of the changes of all keys.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        max_memory: Optional[int] = None,
+        ttl: Optional[int] = None,
+        broadcast: bool = False,
+        prefixes: Optional[List[TEncodable]] = None,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        if max_memory is not None and max_memory < 1:
+            raise ValueError("max_memory must be positive")
+        if ttl is not None and ttl < 1:
+            raise ValueError("ttl must be positive")
+        if prefixes and not broadcast:
+            raise ValueError("prefixes can be set only in broadcasting mode")
+        self.max_entries = max_entries
+        self.max_memory = max_memory
+        self.ttl = ttl
+        self.broadcast = broadcast
+        self.prefixes = prefixes
+
+    def _get_encoded_prefixes(self) -> List[bytes]:
+        return [
+            prefix.encode() if isinstance(prefix, str) else prefix
+            for prefix in self.prefixes or []
+        ]
+
+
 class AdvancedBaseClientConfiguration:
     """
     Represents the advanced configuration settings for a base Glide client.
@@ -138,16 +209,130 @@ class AdvancedBaseClientConfiguration:
             This applies both during initial client creation and any reconnections that may occur during request processing.
             **Note**: A high connection timeout may lead to prolonged blocking of the entire command pipeline.
             If not explicitly set, a default value of 250 milliseconds will be used.
+        transport (ClientTransport): How requests are passed to the Rust core. If not set, `SOCKET` will be used.
+        write_coalescing_window_us (Optional[int]): The duration in microseconds that the client waits after a request is
+            issued before writing it to the socket, so that requests issued in the meantime are written together.
+            This trades a few microseconds of latency for fewer, larger socket writes under high concurrency.
+            If not set, buffered requests are written as soon as the event loop gets to them.
+            Applies only to the `SOCKET` transport.
+        write_coalescing_max_requests (Optional[int]): The number of buffered requests that ends the coalescing window
+            early. Used only when `write_coalescing_window_us` is set.
+        zero_copy_response_min_size (Optional[int]): Bulk string responses of at least this many bytes are returned as
+            `GlideBuffer` objects instead of `bytes`. A `GlideBuffer` keeps the memory the response was received into and
+            supports the buffer protocol, so `memoryview`, `numpy.frombuffer` or file writes can consume large values
+            without copying them. Map keys and set members are always returned as `bytes`.
+            If not set, all bulk strings are returned as `bytes`.
+        lazy_response_min_length (Optional[int]): Array responses of at least this many elements are returned as
+            `LazyArray` objects instead of lists. A `LazyArray` keeps the response as it was received and converts an
+            element only when it is indexed or iterated over, so taking the length or a slice of a huge ZRANGE or
+            LRANGE result doesn't convert all of it. `to_list()` converts the whole array.
+            If not set, all arrays are returned as lists.
+        decode_responses (bool): If True, strings in responses are decoded as UTF-8 and returned as `str` instead of
+            `bytes`, including map keys and set members. The decoding happens while the response is converted, so
+            there is no need to decode the results in Python. Strings that aren't valid UTF-8, and bulk strings
+            returned as `GlideBuffer` objects, aren't decoded. Can be overridden for single requests with
+            `decoded_responses`. Defaults to False.
+        share_socket_connection (bool): If True, the client shares its connection to the socket listener with the other
+            clients that enable this option, instead of opening a connection of its own. The clients of a shared
+            connection have their own connections to the server, and their requests are multiplexed over a single Unix
+            domain socket, read by a single reader. This saves file descriptors, event loop wakeups and memory in
+            processes that keep many clients, for example a client per tenant or per database. Clients share a
+            connection only if they are created on the same event loop with the same write coalescing settings.
+            Applies only to the `SOCKET` transport. Defaults to False.
+        lazy_connect (bool): If True, `create` returns without connecting, and the client connects on its first
+            request, so services can start without waiting for their servers. Requests issued while the client
+            connects wait for the connection, and fail with its error if it fails, in which case the next request
+            connects again. PubSub subscriptions are established when the client connects. Defaults to False.
+        auto_batch_window_us (Optional[int]): If set, GET, SET and HGET commands that are called concurrently on the
+            same event loop within this many microseconds are merged into MGET, MSET and HMGET commands, which cuts
+            the number of commands the server executes under fan-out. In cluster mode, the merged
+            commands are split by the slots of their keys. Only SET without options, and commands whose responses are
+            converted with the default options, are merged. The merged commands are sent at the end of the window,
+            in the order the commands were called: only consecutive commands of the same type are merged, so a GET
+            that is called after a SET of its key reads the value that was set. Applies only to the asyncio clients
+            on asyncio event loops.
+            If not set, commands aren't merged.
+        auto_batch_max_commands (Optional[int]): The number of pending commands that ends the batching window early.
+            Used only when `auto_batch_window_us` is set.
+        auto_batch_type_errors (bool): If True, a GET that was merged into an MGET and got None is sent again as is,
+            so the error of a key that holds a value of another type reaches its caller, like it does without merging,
+            at the cost of a second round trip for the keys that don't exist. If False, such a GET returns None, like
+            MGET does. Used only when `auto_batch_window_us` is set. Defaults to False.
+        client_cache (Optional[ClientCacheConfiguration]): If set, the responses of read commands are cached by the
+            client and served without a round trip to the server, see `ClientCacheConfiguration`. Requires RESP3.
+            Applies only to the asyncio clients. If not set, responses aren't cached.
+        deduplicate_reads (bool): If True, a read command, such as GET, HGETALL or JSON.GET, that is called while an
+            identical command, with the same arguments, route and response options, is in flight on the same event
+            loop isn't sent. It gets the response of the command in flight instead, which cuts the load on the server
+            when many callers read the same key at once, for example after a cache miss. A deduplicated read gets the
+            response of a command that was sent before it, so it may not reflect the writes that were sent in between.
+            Only commands whose arguments are strings or bytes are deduplicated. Applies only to the asyncio clients on
+            asyncio event loops. Defaults to False.
+        copy_deduplicated_results (bool): If True, each caller of a deduplicated read gets its own copy of the lists,
+            dictionaries, sets and tuples of the result, so callers may modify their results. If False, the callers
+            share the same result, which saves the copies, and must not modify it. Used only when `deduplicate_reads`
+            is True. Defaults to True.
     """
 
-    def __init__(self, connection_timeout: Optional[int] = None):
+    def __init__(
+        self,
+        connection_timeout: Optional[int] = None,
+        transport: ClientTransport = ClientTransport.SOCKET,
+        write_coalescing_window_us: Optional[int] = None,
+        write_coalescing_max_requests: Optional[int] = None,
+        zero_copy_response_min_size: Optional[int] = None,
+        lazy_response_min_length: Optional[int] = None,
+        decode_responses: bool = False,
+        share_socket_connection: bool = False,
+        lazy_connect: bool = False,
+        auto_batch_window_us: Optional[int] = None,
+        auto_batch_max_commands: Optional[int] = None,
+        auto_batch_type_errors: bool = False,
+        client_cache: Optional[ClientCacheConfiguration] = None,
+        deduplicate_reads: bool = False,
+        copy_deduplicated_results: bool = True,
+    ):
+        if write_coalescing_window_us is not None and write_coalescing_window_us < 0:
+            raise ValueError("write_coalescing_window_us must not be negative")
+        if (
+            write_coalescing_max_requests is not None
+            and write_coalescing_max_requests < 1
+        ):
+            raise ValueError("write_coalescing_max_requests must be positive")
+        if zero_copy_response_min_size is not None and zero_copy_response_min_size < 0:
+            raise ValueError("zero_copy_response_min_size must not be negative")
+        if lazy_response_min_length is not None and lazy_response_min_length < 0:
+            raise ValueError("lazy_response_min_length must not be negative")
+        if auto_batch_window_us is not None and auto_batch_window_us < 0:
+            raise ValueError("auto_batch_window_us must not be negative")
+        if auto_batch_max_commands is not None and auto_batch_max_commands < 1:
+            raise ValueError("auto_batch_max_commands must be positive")
         self.connection_timeout = connection_timeout
+        self.transport = transport
+        self.write_coalescing_window_us = write_coalescing_window_us
+        self.write_coalescing_max_requests = write_coalescing_max_requests
+        self.zero_copy_response_min_size = zero_copy_response_min_size
+        self.lazy_response_min_length = lazy_response_min_length
+        self.decode_responses = decode_responses
+        self.share_socket_connection = share_socket_connection
+        self.lazy_connect = lazy_connect
+        self.auto_batch_window_us = auto_batch_window_us
+        self.auto_batch_max_commands = auto_batch_max_commands
+        self.auto_batch_type_errors = auto_batch_type_errors
+        self.client_cache = client_cache
+        self.deduplicate_reads = deduplicate_reads
+        self.copy_deduplicated_results = copy_deduplicated_results
 
     def _create_a_protobuf_conn_request(
         self, request: ConnectionRequest
     ) -> ConnectionRequest:
         if self.connection_timeout:
             request.connection_timeout = self.connection_timeout
+        if self.client_cache:
+            request.client_tracking.bcast = self.client_cache.broadcast
+            request.client_tracking.prefixes[:] = (
+                self.client_cache._get_encoded_prefixes()
+            )
         return request
 
 
@@ -246,6 +431,13 @@ class BaseClientConfiguration:
         if self.client_az:
             request.client_az = self.client_az
         if self.advanced_config:
+            if (
+                self.advanced_config.client_cache
+                and self.protocol == ProtocolVersion.RESP2
+            ):
+                raise ConfigurationError(
+                    "The client side cache requires RESP3 protocol, but RESP2 was configured."
+                )
             self.advanced_config._create_a_protobuf_conn_request(request)
 
         return request
@@ -253,6 +445,78 @@ class BaseClientConfiguration:
     def _is_pubsub_configured(self) -> bool:
         return False
 
+    def _is_in_process_transport(self) -> bool:
+        return (
+            self.advanced_config is not None
+            and self.advanced_config.transport == ClientTransport.IN_PROCESS
+        )
+
+    def _shares_socket_connection(self) -> bool:
+        return (
+            self.advanced_config is not None
+            and self.advanced_config.share_socket_connection
+        )
+
+    def _is_lazy_connect(self) -> bool:
+        return self.advanced_config is not None and self.advanced_config.lazy_connect
+
+    def _get_write_coalescing(self) -> Tuple[Optional[float], Optional[int]]:
+        """
+        Returns the write coalescing window in seconds and the number of requests that ends it early.
+        """
+        if (
+            self.advanced_config is None
+            or not self.advanced_config.write_coalescing_window_us
+        ):
+            return None, None
+        return (
+            self.advanced_config.write_coalescing_window_us / 1_000_000,
+            self.advanced_config.write_coalescing_max_requests,
+        )
+
+    def _get_auto_batching(self) -> Optional[Tuple[float, Optional[int], bool]]:
+        """
+        Returns the auto batching window in seconds, the number of commands that ends it early, and whether the GETs
+        that got None from an MGET are sent again, or None if commands aren't merged.
+        """
+        if (
+            self.advanced_config is None
+            or self.advanced_config.auto_batch_window_us is None
+        ):
+            return None
+        return (
+            self.advanced_config.auto_batch_window_us / 1_000_000,
+            self.advanced_config.auto_batch_max_commands,
+            self.advanced_config.auto_batch_type_errors,
+        )
+
+    def _get_read_deduplication(self) -> Optional[bool]:
+        """
+        Returns whether the results of deduplicated reads are copied for each of their callers, or None if reads
+        aren't deduplicated.
+        """
+        if self.advanced_config is None or not self.advanced_config.deduplicate_reads:
+            return None
+        return self.advanced_config.copy_deduplicated_results
+
+    def _get_client_cache(self) -> Optional[ClientCacheConfiguration]:
+        if self.advanced_config is None:
+            return None
+        return self.advanced_config.client_cache
+
+    def _get_response_options(self) -> TResponseOptions:
+        """
+        Returns the options of the conversion of responses into Python objects.
+        """
+        if self.advanced_config is None:
+            return None, None, False, ResultAdapter.NONE
+        return (
+            self.advanced_config.zero_copy_response_min_size,
+            self.advanced_config.lazy_response_min_length,
+            self.advanced_config.decode_responses,
+            ResultAdapter.NONE,
+        )
+
     def _get_pubsub_callback_and_context(
         self,
     ) -> Tuple[Optional[Callable[[CoreCommands.PubSubMsg, Any], None]], Any]:
@@ -264,10 +528,6 @@ class AdvancedGlideClientConfiguration(AdvancedBaseClientConfiguration):
     Represents the advanced configuration settings for a Standalone Glide client.
     """
 
-    def __init__(self, connection_timeout: Optional[int] = None):
-
-        super().__init__(connection_timeout)
-
 
 class GlideClientConfiguration(BaseClientConfiguration):
     """
@@ -423,9 +683,6 @@ class AdvancedGlideClusterClientConfiguration(AdvancedBaseClientConfiguration):
     Represents the advanced configuration settings for a Glide Cluster client.
     """
 
-    def __init__(self, connection_timeout: Optional[int] = None):
-        super().__init__(connection_timeout)
-
 
 class GlideClusterClientConfiguration(BaseClientConfiguration):
     """
@@ -1,6 +1,18 @@
 # Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
 
-from typing import Any, Dict, List, Literal, Mapping, Optional, Set, TypeVar, Union
+from typing import (
+    Any,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from glide.protobuf.command_request_pb2 import CommandRequest
 from glide.protobuf.connection_request_pb2 import ConnectionRequest
@@ -26,7 +38,12 @@ TResult = Union[
     Dict[bytes, "TResult"],
     Mapping[bytes, "TResult"],
 ]
-TRequest = Union[CommandRequest, ConnectionRequest]
+# Single commands are buffered as (callback_idx, request_type, args, serialized route, client id) tuples
+TRequest = Union[
+    CommandRequest,
+    ConnectionRequest,
+    Tuple[int, int, Sequence[Any], Optional[bytes], int],
+]
 # When routing to a single node, response will be T
 # Otherwise, response will be : {Address : response , ... } with type of Dict[str, T].
 TClusterResponse = Union[T, Dict[bytes, T]]
@@ -55,6 +72,12 @@ TJsonResponse = Union[T, List[Optional[T]]]
 # For more information, see: https://redis.io/docs/data-types/json/path/ .
 TJsonUniversalResponse = Union[T, List[T]]
 TEncodable = Union[str, bytes]
+# Values that may also be passed as objects that support the buffer protocol.
+# Their memory is read in place instead of being converted to `bytes` first, which saves one copy; the core still copies
+# each value once, into the command it sends. When the client talks to the core through the socket, large values are
+# read after the command is submitted, so they must not be modified until the command completes. Other buffer objects,
+# such as `mmap` or NumPy arrays, can be wrapped with `memoryview` without copying them.
+TEncodableValue = Union[str, bytes, bytearray, memoryview]
 TFunctionListResponse = List[
     Mapping[
         bytes,
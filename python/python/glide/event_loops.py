@@ -0,0 +1,180 @@
+# Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
+
+import asyncio
+import sys
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+    cast,
+)
+
+# Trio isn't a dependency of glide, it is used only when a client is called from a Trio run
+# (directly, or through anyio's Trio backend), in which case it is already imported.
+
+
+class TrioEventLoop:
+    """
+    The part of the asyncio event loop interface that the client uses, implemented for a Trio run.
+
+    Callbacks are scheduled with the run's `TrioToken`, so they can be called from any thread. Loops of the same
+    run are equal, so responses can be grouped by the loop of their request.
+    """
+
+    def __init__(self, token: Any):
+        self._token = token
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, TrioEventLoop) and other._token is self._token
+
+    def __hash__(self) -> int:
+        return id(self._token)
+
+    def call_soon_threadsafe(self, callback: Callable[..., Any], *args: Any) -> None:
+        trio = sys.modules["trio"]
+        try:
+            self._token.run_sync_soon(callback, *args)
+        except trio.RunFinishedError:
+            # Raised like the RuntimeError of a closed asyncio loop
+            raise RuntimeError("The Trio run has finished")
+
+    def create_future(self) -> "TrioFuture":
+        return TrioFuture(self)
+
+    def is_closed(self) -> bool:
+        return False
+
+    def is_running(self) -> bool:
+        return True
+
+
+class TrioFuture:
+    """
+    The part of the `asyncio.Future` interface that the client uses, awaitable by a single Trio task.
+
+    Like an asyncio future, it must be completed on its loop, see `get_loop`.
+    """
+
+    def __init__(self, loop: TrioEventLoop):
+        self._loop = loop
+        self._done = False
+        self._cancelled = False
+        self._result: Any = None
+        self._exception: Optional[BaseException] = None
+        self._waiting_task: Any = None
+
+    def get_loop(self) -> TrioEventLoop:
+        return self._loop
+
+    def done(self) -> bool:
+        return self._done
+
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def set_result(self, result: Any) -> None:
+        self._result = result
+        self._complete()
+
+    def set_exception(self, exception: BaseException) -> None:
+        self._exception = exception
+        self._complete()
+
+    def result(self) -> Any:
+        if self._cancelled:
+            raise asyncio.CancelledError()
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def __await__(self) -> Generator[Any, None, Any]:
+        return self._wait().__await__()
+
+    def _complete(self) -> None:
+        if self._done:
+            raise asyncio.InvalidStateError("The future is already done")
+        self._done = True
+        if self._waiting_task is not None:
+            trio = sys.modules["trio"]
+            trio.lowlevel.reschedule(self._waiting_task)
+            self._waiting_task = None
+
+    async def _wait(self) -> Any:
+        if not self._done:
+            trio = sys.modules["trio"]
+            self._waiting_task = trio.lowlevel.current_task()
+
+            def abort(raise_cancel: Any) -> Any:
+                # The waiting task was cancelled, a response that arrives later is ignored
+                self._waiting_task = None
+                self._done = True
+                self._cancelled = True
+                return trio.lowlevel.Abort.SUCCEEDED
+
+            await trio.lowlevel.wait_task_rescheduled(abort)
+        return self.result()
+
+
+TEventLoop = Union[asyncio.AbstractEventLoop, TrioEventLoop]
+
+
+def _get_trio_event_loop() -> Optional[TrioEventLoop]:
+    trio = sys.modules.get("trio")
+    if trio is None:
+        return None
+    try:
+        return TrioEventLoop(trio.lowlevel.current_trio_token())
+    except RuntimeError:
+        return None
+
+
+def get_running_event_loop() -> TEventLoop:
+    """
+    Returns the running asyncio event loop, or a `TrioEventLoop` if called from a Trio run.
+
+    Raises:
+        RuntimeError: If there is no running event loop.
+    """
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        trio_loop = _get_trio_event_loop()
+        if trio_loop is None:
+            raise
+        return trio_loop
+
+
+def create_future() -> asyncio.Future:
+    """
+    Creates a future on the running event loop, see `get_running_event_loop`.
+    """
+    return cast(asyncio.Future, get_running_event_loop().create_future())
+
+
+async def gather_return_exceptions(
+    awaitables: Sequence[Awaitable[Any]],
+) -> List[Any]:
+    """
+    Runs the awaitables concurrently on the running event loop, like `asyncio.gather` with `return_exceptions=True`:
+    returns their results in order, with the exception raised by an awaitable in place of its result.
+    """
+    if not isinstance(get_running_event_loop(), TrioEventLoop):
+        return await asyncio.gather(*awaitables, return_exceptions=True)
+    trio = sys.modules["trio"]
+    results: List[Any] = [None] * len(awaitables)
+
+    async def run(index: int, awaitable: Awaitable[Any]) -> None:
+        try:
+            results[index] = await awaitable
+        except Exception as e:
+            results[index] = e
+
+    async with trio.open_nursery() as nursery:
+        for index, awaitable in enumerate(awaitables):
+            nursery.start_soon(run, index, awaitable)
+    return results
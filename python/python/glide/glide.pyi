@@ -1,11 +1,22 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterator, Sequence
 from enum import Enum
-from typing import List, Optional, Union
+from typing import Any, List, Optional, Tuple, Union, overload
 
 from glide.constants import TResult
 
 DEFAULT_TIMEOUT_IN_MILLISECONDS: int = ...
+DEFAULT_INFLIGHT_REQUESTS_LIMIT: int = ...
 MAX_REQUEST_ARGS_LEN: int = ...
+RESPONSE_KIND_VALUE: int = ...
+RESPONSE_KIND_NIL: int = ...
+RESPONSE_KIND_OK: int = ...
+RESPONSE_KIND_REQUEST_ERROR: int = ...
+RESPONSE_KIND_CLOSING_ERROR: int = ...
+RESPONSE_KIND_PUSH: int = ...
+RESULT_ADAPTER_NONE: int = ...
+RESULT_ADAPTER_PAIRS: int = ...
+RESULT_ADAPTER_PARALLEL_ARRAYS: int = ...
+RESULT_ADAPTER_ROWS: int = ...
 
 class Level(Enum):
     Error = 0
@@ -27,10 +38,91 @@ class ClusterScanCursor:
     def get_cursor(self) -> str: ...
     def is_finished(self) -> bool: ...
 
+class GlideBuffer:
+    def __buffer__(self, flags: int) -> memoryview: ...
+    def __len__(self) -> int: ...
+    def __bytes__(self) -> bytes: ...
+    def __eq__(self, other: object) -> bool: ...
+    def __hash__(self) -> int: ...
+    def decode(self, encoding: str = "utf-8", errors: str = "strict") -> str: ...
+
+class LazyArray(Sequence[Any]):
+    def __len__(self) -> int: ...
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+    @overload
+    def __getitem__(self, index: slice) -> List[Any]: ...
+    def __iter__(self) -> Iterator[Any]: ...
+    def __eq__(self, other: object) -> bool: ...
+    def to_list(self) -> List[Any]: ...
+
+class NativeClient:
+    @staticmethod
+    def create(
+        connection_request: bytes, wakeup: Callable, init_callback: Callable
+    ) -> None: ...
+    @staticmethod
+    def connect(
+        connection_request: bytes,
+    ) -> Tuple[Optional[NativeClient], Optional[str]]: ...
+    def take_completions(self) -> List[Tuple[int, int, Any]]: ...
+    def send_command(
+        self,
+        callback_idx: int,
+        request_type: int,
+        args: Sequence[Any],
+        route: Optional[bytes] = None,
+    ) -> Optional[Tuple[int, int, Any]]: ...
+    def send_transaction(
+        self,
+        callback_idx: int,
+        commands: List[Tuple[int, List[Any]]],
+        route: Optional[bytes] = None,
+    ) -> Optional[Tuple[int, int, Any]]: ...
+    def send_commands(
+        self,
+        callback_idxs: List[int],
+        commands: List[Tuple[int, Sequence[Any]]],
+        route: Optional[bytes] = None,
+    ) -> Optional[List[Tuple[int, int, Any]]]: ...
+    def invoke_script(
+        self,
+        callback_idx: int,
+        hash: str,
+        keys: List[Any],
+        args: List[Any],
+        route: Optional[bytes] = None,
+    ) -> Optional[Tuple[int, int, Any]]: ...
+    def cluster_scan(
+        self,
+        callback_idx: int,
+        cursor: str,
+        match_pattern: Optional[bytes] = None,
+        count: Optional[int] = None,
+        object_type: Optional[str] = None,
+        allow_non_covered_slots: bool = False,
+        slot_ranges: Optional[List[Tuple[int, int]]] = None,
+    ) -> Optional[Tuple[int, int, Any]]: ...
+    def update_connection_password(
+        self, callback_idx: int, password: Optional[str], immediate_auth: bool
+    ) -> Optional[Tuple[int, int, Any]]: ...
+    def close(self) -> None: ...
+
 def start_socket_listener_external(init_callback: Callable) -> None: ...
-def value_from_pointer(pointer: int) -> TResult: ...
+def reset_runtime_after_fork() -> None: ...
+def value_from_pointer(
+    pointer: int,
+    buffer_min_size: Optional[int] = None,
+    lazy_min_length: Optional[int] = None,
+    decode: bool = False,
+    adapter: int = 0,
+) -> TResult: ...
+def encode_requests(requests: List[Any]) -> bytearray: ...
+def decode_responses(
+    buffer: Any,
+) -> Tuple[List[Tuple[int, List[Tuple[int, int, Any]]]], int]: ...
 def create_leaked_value(message: str) -> int: ...
-def create_leaked_bytes_vec(args_vec: List[bytes]) -> int: ...
+def create_leaked_bytes_vec(args_vec: List[Any]) -> int: ...
 def get_statistics() -> dict: ...
 def py_init(level: Optional[Level], file_name: Optional[str]) -> Level: ...
 def py_log(log_level: Level, log_identifier: str, message: str) -> None: ...
@@ -1,16 +1,39 @@
 # Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
 
 import asyncio
+import os
 import sys
 import threading
-from typing import Any, Dict, List, Optional, Tuple, Type, Union, cast
+import weakref
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from glide.async_commands.cluster_commands import ClusterCommands
 from glide.async_commands.command_args import ObjectType
 from glide.async_commands.core import CoreCommands
 from glide.async_commands.standalone_commands import StandaloneCommands
+from glide.auto_batching import AutoBatcher
+from glide.client_cache import CacheRead, ClientCache
 from glide.config import BaseClientConfiguration, ServerCredentials
-from glide.constants import DEFAULT_READ_BYTES_SIZE, OK, TEncodable, TRequest, TResult
+from glide.constants import OK, TEncodable, TEncodableValue, TRequest, TResult
+from glide.event_loops import (
+    TEventLoop,
+    TrioEventLoop,
+    create_future,
+    gather_return_exceptions,
+    get_running_event_loop,
+)
 from glide.exceptions import (
     ClosingError,
     ConfigurationError,
@@ -19,29 +42,38 @@ from glide.exceptions import (
     RequestError,
     TimeoutError,
 )
+from glide.inflight_requests import InflightRequests
 from glide.logger import Level as LogLevel
 from glide.logger import Logger as ClientLogger
 from glide.protobuf.command_request_pb2 import Command, CommandRequest, RequestType
 from glide.protobuf.connection_request_pb2 import ConnectionRequest
-from glide.protobuf.response_pb2 import RequestErrorType, Response
-from glide.protobuf_codec import PartialMessageException, ProtobufCodec
-from glide.routes import Route, set_protobuf_route
+from glide.protobuf.response_pb2 import RequestErrorType
+from glide.response_options import TResponseOptions, _get_response_options
+from glide.routes import Route, serialize_protobuf_route, set_protobuf_route
+from glide.single_flight import SingleFlight
+from glide.socket_connection import SocketConnection, _shared_connections
 
 from .glide import (
-    DEFAULT_TIMEOUT_IN_MILLISECONDS,
+    DEFAULT_INFLIGHT_REQUESTS_LIMIT,
     MAX_REQUEST_ARGS_LEN,
+    RESPONSE_KIND_CLOSING_ERROR,
+    RESPONSE_KIND_NIL,
+    RESPONSE_KIND_OK,
+    RESPONSE_KIND_PUSH,
+    RESPONSE_KIND_REQUEST_ERROR,
+    RESPONSE_KIND_VALUE,
     ClusterScanCursor,
+    NativeClient,
     create_leaked_bytes_vec,
     get_statistics,
+    reset_runtime_after_fork,
     start_socket_listener_external,
     value_from_pointer,
 )
 
 if sys.version_info >= (3, 11):
-    import asyncio as async_timeout
     from typing import Self
 else:
-    import async_timeout
     from typing_extensions import Self
 
 
@@ -59,27 +91,188 @@ def get_request_error_class(
     return RequestError
 
 
+# A future, and either the result or the exception it should be completed with
+TSettlement = Tuple[asyncio.Future, Any, Optional[BaseException]]
+
+# A push notification, as a pointer to the value received from the core, or as the value converted from it
+TPushNotification = Union[int, Dict[str, Any]]
+
+
+def _set_result_if_pending(future: asyncio.Future, result: Any = None) -> None:
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_exception_if_pending(future: asyncio.Future, exception: BaseException) -> None:
+    if not future.done():
+        future.set_exception(exception)
+
+
+def _settle_futures(settlements: List[TSettlement]) -> None:
+    for future, result, exception in settlements:
+        if exception is None:
+            _set_result_if_pending(future, result)
+        else:
+            _set_exception_if_pending(future, exception)
+
+
+def _call_in_loop(loop: TEventLoop, callback: Callable[..., None], *args: Any) -> None:
+    """
+    Calls `callback` on `loop`: directly if `loop` is the running loop, otherwise through `call_soon_threadsafe`,
+    since the loop may be running in another thread. Nothing is called if the loop is closed.
+    """
+    try:
+        running_loop: Optional[TEventLoop] = get_running_event_loop()
+    except RuntimeError:
+        running_loop = None
+    if loop == running_loop:
+        callback(*args)
+        return
+    try:
+        loop.call_soon_threadsafe(callback, *args)
+    except RuntimeError:
+        # The loop is closed, nobody can wait on its futures anymore
+        pass
+
+
+def _to_cluster_scan_result(
+    response: Any,
+) -> List[Union[ClusterScanCursor, List[bytes]]]:
+    cursor = response[0]
+    if not isinstance(cursor, str):
+        # The cursor is bytes, unless the response was decoded
+        cursor = bytes(cursor).decode()
+    return [ClusterScanCursor(cursor), response[1]]
+
+
+# The clients of this process, reset in the child process after a fork
+_clients: "weakref.WeakSet[Any]" = weakref.WeakSet()
+# The state of clients inherited from the parent process. It can't be used in the child process, and it is kept alive
+# since releasing it could close connections, or wait for threads, that belong to the parent process.
+_inherited_client_states: List[Any] = []
+# The socket path of the socket listener of this process, once it was started
+_socket_listener_path: Optional[str] = None
+
+
+async def _start_socket_listener() -> str:
+    """
+    Starts the socket listener of the process, if it isn't started yet, and returns its socket path. The socket
+    listener is started once, the clients created afterwards connect to it without waiting for its initialization.
+    """
+    global _socket_listener_path
+    if _socket_listener_path is not None:
+        return _socket_listener_path
+    loop = asyncio.get_running_loop()
+    init_future: asyncio.Future = loop.create_future()
+
+    def init_callback(socket_path: Optional[str], err: Optional[str]):
+        if err is None and socket_path is None:
+            err = "Socket initialization error: Missing valid socket path."
+        if err is not None:
+            loop.call_soon_threadsafe(
+                _set_exception_if_pending, init_future, ClosingError(err)
+            )
+        else:
+            loop.call_soon_threadsafe(_set_result_if_pending, init_future, socket_path)
+
+    start_socket_listener_external(init_callback=init_callback)
+    _socket_listener_path = await init_future
+    return _socket_listener_path
+
+
+def _reset_socket_listener_path() -> None:
+    # The socket listener stopped, or belongs to the parent process, it is started again by the next client
+    global _socket_listener_path
+    _socket_listener_path = None
+
+
+def _after_fork_in_child() -> None:
+    reset_runtime_after_fork()
+    _reset_socket_listener_path()
+    _inherited_client_states.append(_shared_connections.copy())
+    _shared_connections.clear()
+    for client in list(_clients):
+        client._after_fork_in_child()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
 class BaseClient(CoreCommands):
     def __init__(self, config: BaseClientConfiguration):
         """
         To create a new client, use the `create` classmethod
         """
         self.config: BaseClientConfiguration = config
-        self._available_futures: Dict[int, asyncio.Future] = {}
-        self._available_callback_indexes: List[int] = list()
-        self._buffered_requests: List[TRequest] = list()
-        self._writer_lock = threading.Lock()
-        self.socket_path: Optional[str] = None
-        self._reader_task: Optional[asyncio.Task] = None
         self._is_closed: bool = False
+        self._reset_connection_state()
+        _clients.add(self)
+
+    def _reset_connection_state(self) -> None:
+        config = self.config
+        self._inflight_requests = InflightRequests(
+            config.inflight_requests_limit or DEFAULT_INFLIGHT_REQUESTS_LIMIT
+        )
+        self._response_options: TResponseOptions = config._get_response_options()
+        self.socket_path: Optional[str] = None
+        self._socket_connection: Optional[SocketConnection] = None
+        # The id of the client on its socket connection, which other clients may share
+        self._client_id: int = 0
+        self._close_task: Optional[asyncio.Task] = None
         self._pubsub_futures: List[asyncio.Future] = []
         self._pubsub_lock = threading.Lock()
-        self._pending_push_notifications: List[Response] = list()
+        self._pending_push_notifications: List[TPushNotification] = list()
+        self._native_client: Optional[NativeClient] = None
+        self._loop: Optional[TEventLoop] = None
+        auto_batching = config._get_auto_batching()
+        self._auto_batcher: Optional[AutoBatcher] = (
+            AutoBatcher(self, *auto_batching) if auto_batching is not None else None
+        )
+        copy_deduplicated_results = config._get_read_deduplication()
+        self._single_flight: Optional[SingleFlight] = (
+            SingleFlight(copy_deduplicated_results)
+            if copy_deduplicated_results is not None
+            else None
+        )
+        client_cache = config._get_client_cache()
+        self._client_cache: Optional[ClientCache] = (
+            ClientCache(
+                client_cache.max_entries,
+                client_cache.max_memory,
+                client_cache.ttl / 1000 if client_cache.ttl is not None else None,
+                (
+                    client_cache._get_encoded_prefixes()
+                    if client_cache.broadcast
+                    else None
+                ),
+            )
+            if client_cache is not None
+            else None
+        )
+        # Set until a lazily connected client, or a client inherited by a forked child process, is connected
+        self._is_connection_pending: bool = False
+        self._connect_waiters: Optional[List[asyncio.Future]] = None
 
     @classmethod
     async def create(cls, config: BaseClientConfiguration) -> Self:
         """Creates a Glide client.
 
+        The client can be shared by multiple threads and event loops, for example one loop per worker thread, and
+        the response of every request is delivered to the loop the request was issued from. With the socket
+        transport, the loop that created the client owns its connection to the socket listener, so it must keep
+        running while the client is used. The in-process transport has no such requirement.
+
+        Any asyncio event loop can be used, including uvloop. Trio, directly or through anyio's Trio backend, is
+        supported with the in-process transport.
+
+        The client is fork-safe: a client inherited by a forked child process, for example a worker of a preforking
+        server, connects again on its first use in the child, with the same configuration. Scripts loaded with
+        `Script` before the fork remain loaded in the child.
+
+        With the `lazy_connect` option of the advanced configuration, `create` returns without connecting, and the
+        client connects on its first use. To create several clients at once, see `create_many`.
+
         Args:
             config (ClientConfiguration): The client configurations.
                 If no configuration is provided, a default client to "localhost":6379 will be created.
@@ -88,54 +281,247 @@ class BaseClient(CoreCommands):
             Self: a Glide Client instance.
         """
         config = config
+        if not config._is_in_process_transport() and isinstance(
+            get_running_event_loop(), TrioEventLoop
+        ):
+            raise ConfigurationError(
+                "Trio is supported only with the in-process transport, see `ClientTransport.IN_PROCESS`."
+            )
         self = cls(config)
-        init_future: asyncio.Future = asyncio.Future()
-        loop = asyncio.get_event_loop()
-
-        def init_callback(socket_path: Optional[str], err: Optional[str]):
-            if err is not None:
-                raise ClosingError(err)
-            elif socket_path is None:
-                raise ClosingError(
-                    "Socket initialization error: Missing valid socket path."
-                )
-            else:
-                # Received socket path
-                self.socket_path = socket_path
-                loop.call_soon_threadsafe(init_future.set_result, True)
+        if config._is_lazy_connect():
+            self._is_connection_pending = True
+        else:
+            await self._connect()
+        return self
+
+    @classmethod
+    async def create_many(
+        cls, configs: Sequence[BaseClientConfiguration]
+    ) -> List[Self]:
+        """Creates several Glide clients concurrently.
+
+        The socket listener is started once for all of the clients, then the clients connect concurrently, so
+        creating them takes about as long as creating the slowest of them, instead of the sum of their creation
+        times. If a client fails to be created, the clients that were created are closed, and the first error is
+        raised.
 
-        start_socket_listener_external(init_callback=init_callback)
+        Args:
+            configs (Sequence[ClientConfiguration]): The configurations of the clients, see `create`.
+
+        Returns:
+            List[Self]: The Glide Client instances, in the order of their configurations.
+
+        Examples:
+            >>> cache_client, queue_client = await GlideClient.create_many([cache_config, queue_config])
+        """
+        if any(not config._is_in_process_transport() for config in configs):
+            # The clients share the initialization of the socket listener
+            await _start_socket_listener()
+        results = await gather_return_exceptions(
+            [cls.create(config) for config in configs]
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            for result in results:
+                if not isinstance(result, BaseException):
+                    await result.close()
+            raise errors[0]
+        return cast(List[Self], results)
+
+    async def _connect(self) -> None:
+        if self.config._is_in_process_transport():
+            await self._create_native_client()
+            return
+        self._loop = asyncio.get_running_loop()
+        # Wait for the socket listener to complete its initialization, unless it was already started
+        self.socket_path = await _start_socket_listener()
 
         # will log if the logger was created (wrapper or costumer) on info
         # level or higher
         ClientLogger.log(LogLevel.INFO, "connection info", "new connection established")
-        # Wait for the socket listener to complete its initialization
-        await init_future
-        # Create UDS connection
-        await self._create_uds_connection()
-        # Start the reader loop as a background task
-        self._reader_task = asyncio.create_task(self._reader_loop())
+        # Join a connection to the socket listener, responses are processed as they are received
+        await self._add_to_socket_connection()
         # Set the client configurations
         await self._set_connection_configurations()
-        return self
 
-    async def _create_uds_connection(self) -> None:
-        try:
-            # Open an UDS connection
-            async with async_timeout.timeout(DEFAULT_TIMEOUT_IN_MILLISECONDS):
-                reader, writer = await asyncio.open_unix_connection(
-                    path=self.socket_path
+    def _after_fork_in_child(self) -> None:
+        # The connections, tasks and futures of the client belong to the parent process
+        _inherited_client_states.append(self.__dict__.copy())
+        self._reset_connection_state()
+        self._is_connection_pending = True
+
+    async def _connect_on_first_use(self) -> None:
+        """
+        Connects a lazily connected client, or a client inherited by a forked child process, on its first use.
+        Concurrent requests wait for the same connection, and fail with its error if it fails. The client is connected
+        again by its next request.
+        """
+        while self._is_connection_pending:
+            if self._connect_waiters is not None:
+                # Another request is already connecting the client
+                waiter = create_future()
+                self._connect_waiters.append(waiter)
+                await waiter
+                continue
+            self._connect_waiters = []
+            error: Optional[BaseException] = None
+            try:
+                await self._connect()
+            except BaseException as e:
+                error = e
+            waiters, self._connect_waiters = self._connect_waiters, None
+            if error is None:
+                self._is_connection_pending = False
+            else:
+                await self._release_failed_connection()
+            for waiter in waiters:
+                _call_in_loop(
+                    waiter.get_loop(), _settle_futures, [(waiter, None, error)]
                 )
-            self._reader = reader
-            self._writer = writer
-        except Exception as e:
-            await self.close(f"Failed to create UDS connection: {e}")
+            if error is not None:
+                raise error
+
+    async def _release_failed_connection(self) -> None:
+        # Let the client finish closing the connection that failed, then reset it so it can connect again
+        if self._close_task is not None:
+            await asyncio.gather(self._close_task, return_exceptions=True)
+        if self._is_closed:
+            # The client was closed by the failure, its connection is already released
+            self._is_closed = False
+        elif self._native_client is not None:
+            self._native_client.close()
+        elif self._socket_connection is not None:
+            self._socket_connection.remove_client(self._client_id)
+        self._reset_connection_state()
+        self._is_connection_pending = True
+
+    async def _create_native_client(self) -> None:
+        loop = get_running_event_loop()
+        init_future = create_future()
+        self._loop = loop
+
+        def settle(native_client: Optional[NativeClient], err: Optional[str]) -> None:
+            if init_future.done():
+                # The creation was cancelled or timed out, the client that connected late isn't used
+                if native_client is not None:
+                    native_client.close()
+            elif err is not None:
+                _set_exception_if_pending(init_future, ClosingError(err))
+            else:
+                _set_result_if_pending(init_future, native_client)
+
+        def init_callback(native_client: Optional[NativeClient], err: Optional[str]):
+            # Called from a core runtime thread
+            try:
+                loop.call_soon_threadsafe(settle, native_client, err)
+            except RuntimeError:
+                # The loop is closed
+                if native_client is not None:
+                    native_client.close()
+
+        NativeClient.create(
+            self._get_protobuf_conn_request().SerializeToString(),
+            self._on_native_completions,
+            init_callback,
+        )
+        self._native_client = await init_future
+        ClientLogger.log(LogLevel.INFO, "connection info", "new connection established")
+
+    def _on_native_completions(self) -> None:
+        # Called from a core runtime thread when completed requests are waiting to be taken.
+        # The responses are routed from here to the loops their requests were issued from,
+        # so they don't depend on the loop that created the client
+        if self._native_client is None:
+            return
+        responses = []
+        for callback_idx, kind, payload in self._native_client.take_completions():
+            if kind == RESPONSE_KIND_PUSH:
+                self._process_push_notification(payload)
+            else:
+                responses.append((callback_idx, kind, payload))
+        self._resolve_responses(responses)
+
+    def _resolve_responses(self, responses: List[Tuple[int, int, Any]]) -> None:
+        # Complete the futures on their own loops, with a single call per loop
+        settlements: Dict[TEventLoop, List[TSettlement]] = {}
+        for callback_idx, kind, payload in responses:
+            settlement = self._settle_response(callback_idx, kind, payload)
+            if settlement is not None:
+                loop: TEventLoop = settlement[0].get_loop()
+                settlements.setdefault(loop, []).append(settlement)
+        for loop, loop_settlements in settlements.items():
+            _call_in_loop(loop, _settle_futures, loop_settlements)
+
+    def _settle_response(
+        self, callback_idx: int, kind: int, payload: Any
+    ) -> Optional[TSettlement]:
+        response_options = (
+            self._inflight_requests.get_response_options(callback_idx)
+            or self._response_options
+        )
+        res_future = self._inflight_requests.release(callback_idx)
+        # The value must be converted even if nobody waits for it, to release its memory
+        if kind == RESPONSE_KIND_VALUE:
+            payload = value_from_pointer(payload, *response_options)
+        if res_future is None:
+            ClientLogger.log(
+                LogLevel.WARN,
+                "unknown response",
+                f"Received a response for an unknown callback index: {callback_idx}",
+            )
+            return None
+        if kind == RESPONSE_KIND_VALUE:
+            return (res_future, payload, None)
+        elif kind == RESPONSE_KIND_OK:
+            return (res_future, OK, None)
+        elif kind == RESPONSE_KIND_NIL:
+            return (res_future, None, None)
+        elif kind == RESPONSE_KIND_REQUEST_ERROR:
+            error_type, message = payload
+            return (res_future, None, get_request_error_class(error_type)(message))
+        return (res_future, None, ClosingError(payload))
+
+    async def _write_native_request_await_response(
+        self,
+        submit: Callable[..., Any],
+        *args: Any,
+        future: Optional[Tuple[int, asyncio.Future]] = None,
+    ) -> TResult:
+        callback_idx, response_future = future or self._get_future()
+        try:
+            submit(callback_idx, *args)
+        except Exception:
+            self._inflight_requests.release(callback_idx)
             raise
+        await response_future
+        return response_future.result()
+
+    async def _add_to_socket_connection(self) -> None:
+        loop = asyncio.get_running_loop()
+        write_coalescing = self.config._get_write_coalescing()
+        while True:
+            if self.config._shares_socket_connection():
+                connection = SocketConnection.get_shared(loop, write_coalescing)
+            else:
+                connection = SocketConnection(loop, write_coalescing)
+            try:
+                await connection.open(cast(str, self.socket_path))
+            except Exception as e:
+                _reset_socket_listener_path()
+                await self.close(f"Failed to create UDS connection: {e}")
+                raise
+            client_id = await connection.add_client(self)
+            if client_id is not None:
+                self._socket_connection = connection
+                self._client_id = client_id
+                return
+            # The shared connection was closed while the client waited for its first client to connect,
+            # because the first client failed to connect or was closed, so the client joins a new connection
 
     def __del__(self) -> None:
         try:
-            if self._reader_task:
-                self._reader_task.cancel()
+            if self._socket_connection is not None:
+                self._socket_connection.remove_client(self._client_id)
         except RuntimeError as e:
             if "no running event loop" in str(e):
                 # event loop already closed
@@ -151,137 +537,357 @@ class BaseClient(CoreCommands):
             Defaults to None.
         """
         self._is_closed = True
-        for response_future in self._available_futures.values():
-            if not response_future.done():
-                err_message = "" if err_message is None else err_message
-                response_future.set_exception(ClosingError(err_message))
+        err_message = "" if err_message is None else err_message
+        if self._client_cache is not None:
+            self._client_cache.flush()
+        for response_future in self._inflight_requests.futures():
+            _call_in_loop(
+                response_future.get_loop(),
+                _set_exception_if_pending,
+                response_future,
+                ClosingError(err_message),
+            )
         try:
             self._pubsub_lock.acquire()
             for pubsub_future in self._pubsub_futures:
-                if not pubsub_future.done() and not pubsub_future.cancelled():
-                    pubsub_future.set_exception(ClosingError(""))
+                _call_in_loop(
+                    pubsub_future.get_loop(),
+                    _set_exception_if_pending,
+                    pubsub_future,
+                    ClosingError(""),
+                )
         finally:
             self._pubsub_lock.release()
 
-        self._writer.close()
-        await self._writer.wait_closed()
+        if self._native_client is not None:
+            self._native_client.close()
+        elif self._socket_connection is not None:
+            # The socket transport is used only with asyncio loops
+            loop = cast(Optional[asyncio.AbstractEventLoop], self._loop)
+            if loop is None or loop is asyncio.get_running_loop():
+                await self._close_connection()
+            elif loop.is_running():
+                # The connection belongs to the loop that created the client
+                await asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(self._close_connection(), loop)
+                )
+            else:
+                self._socket_connection.remove_client(self._client_id)
         self.__del__()
 
-    def _get_future(self, callback_idx: int) -> asyncio.Future:
-        response_future: asyncio.Future = asyncio.Future()
-        self._available_futures.update({callback_idx: response_future})
-        return response_future
+    async def _close_connection(self) -> None:
+        connection = self._socket_connection
+        assert connection is not None
+        connection.remove_client(self._client_id)
+        if connection.is_closed():
+            await connection.wait_closed()
+
+    def _get_future(
+        self,
+        request_type: Optional[RequestType.ValueType] = None,
+        args: Sequence[TEncodableValue] = (),
+    ) -> Tuple[int, asyncio.Future]:
+        # Create a response future on the loop of the new request and store it in a free slot
+        # of the inflight requests table, along with the response options of the current context
+        response_future: asyncio.Future = create_future()
+        callback_idx = self._inflight_requests.allocate(
+            response_future,
+            _get_response_options(self._response_options, request_type, args),
+        )
+        return (callback_idx, response_future)
 
     def _get_protobuf_conn_request(self) -> ConnectionRequest:
         return self.config._create_a_protobuf_conn_request()
 
     async def _set_connection_configurations(self) -> None:
+        connection = cast(SocketConnection, self._socket_connection)
         conn_request = self._get_protobuf_conn_request()
-        response_future: asyncio.Future = self._get_future(0)
-        await self._write_or_buffer_request(conn_request)
-        await response_future
+        # The connection request is answered on callback index 0, which is the first
+        # index handed out by the inflight requests table
+        _, response_future = self._get_future()
+        if self._client_id == 0:
+            # The first client of a connection is created by the request that starts the stream
+            connection.buffer_request(conn_request)
+        else:
+            request = CommandRequest()
+            request.client_id = self._client_id
+            request.connection_request = conn_request.SerializeToString()
+            connection.buffer_request(request)
+        try:
+            await response_future
+        except RequestError as e:
+            # A client that joined a shared connection fails to connect without closing the connection
+            await self.close(str(e))
+            raise ClosingError(str(e))
         if response_future.result() is not OK:
             raise ClosingError(response_future.result())
+        connection.client_connected(self._client_id)
 
-    def _create_write_task(self, request: TRequest):
-        asyncio.create_task(self._write_or_buffer_request(request))
+    def _fail_request(self, request: TRequest, exception: Exception) -> None:
+        callback_idx = (
+            request[0]
+            if isinstance(request, tuple)
+            else getattr(request, "callback_idx", 0)
+        )
+        response_future = self._inflight_requests.release(callback_idx)
+        if response_future is not None:
+            _call_in_loop(
+                response_future.get_loop(),
+                _set_exception_if_pending,
+                response_future,
+                exception,
+            )
 
-    async def _write_or_buffer_request(self, request: TRequest):
-        self._buffered_requests.append(request)
-        if self._writer_lock.acquire(False):
-            try:
-                while len(self._buffered_requests) > 0:
-                    await self._write_buffered_requests_to_socket()
-
-            finally:
-                self._writer_lock.release()
-
-    async def _write_buffered_requests_to_socket(self) -> None:
-        requests = self._buffered_requests
-        self._buffered_requests = list()
-        b_arr = bytearray()
-        for request in requests:
-            ProtobufCodec.encode_delimited(b_arr, request)
-        self._writer.write(b_arr)
-        await self._writer.drain()
-
-    def _encode_arg(self, arg: TEncodable) -> bytes:
+    def _encode_arg(self, arg: Any) -> bytes:
         """
-        Converts a string argument to bytes.
+        Converts an argument to bytes.
 
         Args:
-            arg (str): An encodable argument.
+            arg (TEncodableValue): An encodable argument. `int`, `float` and any other object that supports the
+                buffer protocol are accepted as well.
 
         Returns:
             bytes: The encoded argument as bytes.
         """
+        if isinstance(arg, bytes):
+            return arg
         if isinstance(arg, str):
             # TODO: Allow passing different encoding options
             return bytes(arg, encoding="utf8")
-        return arg
+        if isinstance(arg, bool):
+            raise TypeError(
+                "Expected a str, bytes, int or float argument, or an object that supports the buffer protocol, got bool"
+            )
+        if isinstance(arg, (int, float)):
+            return str(arg).encode()
+        return bytes(arg)
 
     def _encode_and_sum_size(
         self,
-        args_list: Optional[List[TEncodable]],
-    ) -> Tuple[List[bytes], int]:
+        args_list: Optional[Sequence[TEncodableValue]],
+    ) -> Tuple[List[Any], int]:
         """
-        Encodes the list and calculates the total memory size.
+        Encodes the list and calculates the total length of the encoded arguments, in a single pass.
+        If the arguments reach `MAX_REQUEST_ARGS_LEN`, objects that support the buffer protocol are returned as is,
+        so `create_leaked_bytes_vec` can pass their memory to the core without converting them to `bytes`.
 
         Args:
-            args_list (Optional[List[TEncodable]]): A list of strings to be converted to bytes.
+            args_list (Optional[Sequence[TEncodableValue]]): A list of arguments to be converted to bytes.
                                                            If None or empty, returns ([], 0).
 
         Returns:
-            int: The total memory size of the encoded arguments in bytes.
+            Tuple[List[Any], int]: The encoded arguments, and their total length in bytes.
         """
         args_size = 0
-        encoded_args_list: List[bytes] = []
+        encoded_args_list: List[Any] = []
         if not args_list:
             return (encoded_args_list, args_size)
+        has_buffers = False
         for arg in args_list:
-            encoded_arg = self._encode_arg(arg) if isinstance(arg, str) else arg
-            encoded_args_list.append(encoded_arg)
-            args_size += sys.getsizeof(encoded_arg)
+            if isinstance(arg, (bytes, str, int, float)):
+                encoded_arg = self._encode_arg(arg)
+                args_size += len(encoded_arg)
+                encoded_args_list.append(encoded_arg)
+            else:
+                # Buffers are passed as is, unless the arguments are small enough to be encoded below
+                args_size += memoryview(arg).nbytes
+                has_buffers = True
+                encoded_args_list.append(arg)
+        if has_buffers and args_size < MAX_REQUEST_ARGS_LEN:
+            encoded_args_list = [self._encode_arg(arg) for arg in encoded_args_list]
         return (encoded_args_list, args_size)
 
     async def _execute_command(
         self,
         request_type: RequestType.ValueType,
-        args: List[TEncodable],
+        args: Sequence[TEncodableValue],
         route: Optional[Route] = None,
     ) -> TResult:
         if self._is_closed:
             raise ClosingError(
                 "Unable to execute requests; the client is closed. Please create a new client."
             )
-        request = CommandRequest()
-        request.callback_idx = self._get_callback_index()
-        request.single_command.request_type = request_type
-        request.single_command.args_array.args[:] = [
-            bytes(elem, encoding="utf8") if isinstance(elem, str) else elem
-            for elem in args
-        ]
-        (encoded_args, args_size) = self._encode_and_sum_size(args)
-        if args_size < MAX_REQUEST_ARGS_LEN:
-            request.single_command.args_array.args[:] = encoded_args
-        else:
-            request.single_command.args_vec_pointer = create_leaked_bytes_vec(
-                encoded_args
+        if self._is_connection_pending:
+            await self._connect_on_first_use()
+        if self._client_cache is not None:
+            cache_read = self._client_cache.lookup(
+                request_type, args, route, self._response_options
             )
-        set_protobuf_route(request, route)
-        return await self._write_request_await_response(request)
+            if cache_read is not None:
+                return await self._execute_cached_read(
+                    self._client_cache, cache_read, request_type, args
+                )
+        response_future = self._submit_or_merge_command(request_type, args, route)
+        await response_future
+        return response_future.result()
+
+    async def _execute_cached_read(
+        self,
+        client_cache: ClientCache,
+        cache_read: CacheRead,
+        request_type: RequestType.ValueType,
+        args: Sequence[TEncodableValue],
+    ) -> TResult:
+        if cache_read.hit:
+            return cache_read.value
+        try:
+            response_future = self._submit_or_merge_command(request_type, args)
+            await response_future
+            result = response_future.result()
+        except BaseException:
+            client_cache.abort(cache_read)
+            raise
+        client_cache.populate(cache_read, result)
+        return result
+
+    def _prefetch_command(
+        self,
+        request_type: RequestType.ValueType,
+        args: Sequence[TEncodableValue],
+    ) -> Awaitable[TResult]:
+        # Sends the command right away, so its response is received while the caller does other work
+        if self._is_closed or self._is_connection_pending:
+            return self._execute_command(request_type, args)
+        # The prefetched commands, such as the pages of a scan, only read keys, so they don't invalidate the cache
+        return self._submit_or_merge_command(request_type, args)
+
+    def _submit_or_merge_command(
+        self,
+        request_type: RequestType.ValueType,
+        args: Sequence[TEncodableValue],
+        route: Optional[Route] = None,
+    ) -> asyncio.Future:
+        if self._single_flight is not None:
+            response_future = self._single_flight.submit(
+                request_type,
+                args,
+                route,
+                self._response_options,
+                lambda: self._submit_through_auto_batcher(request_type, args, route),
+            )
+            if response_future is not None:
+                return response_future
+        return self._submit_through_auto_batcher(request_type, args, route)
+
+    def _submit_through_auto_batcher(
+        self,
+        request_type: RequestType.ValueType,
+        args: Sequence[TEncodableValue],
+        route: Optional[Route] = None,
+    ) -> asyncio.Future:
+        response_future = None
+        if self._auto_batcher is not None and route is None:
+            response_future = self._auto_batcher.submit(request_type, args)
+        if response_future is None:
+            response_future = self._submit_command(request_type, args, route)
+        return response_future
+
+    def _submit_command(
+        self,
+        request_type: RequestType.ValueType,
+        args: Sequence[TEncodableValue],
+        route: Optional[Route] = None,
+    ) -> asyncio.Future:
+        # Sends the command without waiting for its response, and returns the future of the response
+        serialized_route = serialize_protobuf_route(route)
+        callback_idx, response_future = self._get_future(request_type, args)
+        if self._native_client is not None:
+            try:
+                self._native_client.send_command(
+                    callback_idx, request_type, args, serialized_route
+                )
+            except Exception:
+                self._inflight_requests.release(callback_idx)
+                raise
+            return response_future
+        # Single commands, including their arguments, are encoded natively in a single
+        # pass when the buffered requests are flushed
+        request = (callback_idx, request_type, args, serialized_route, self._client_id)
+        self._submit_request(request)
+        return response_future
+
+    def _submit_commands(
+        self,
+        commands: List[Tuple[RequestType.ValueType, Sequence[TEncodableValue]]],
+        route: Optional[Route] = None,
+    ) -> List[asyncio.Future]:
+        # Sends the commands without waiting for their responses, and returns the futures of the responses. The
+        # commands are sent in their order, so a command is never executed before a command that precedes it.
+        if self._native_client is None:
+            # The requests are written to the socket in the order they are buffered
+            return [
+                self._submit_command(request_type, args, route)
+                for request_type, args in commands
+            ]
+        callback_idxs: List[int] = []
+        response_futures: List[asyncio.Future] = []
+        for request_type, args in commands:
+            callback_idx, response_future = self._get_future(request_type, args)
+            callback_idxs.append(callback_idx)
+            response_futures.append(response_future)
+        try:
+            # Separate native requests run concurrently on the runtime, so the commands are sent by a single one
+            self._native_client.send_commands(
+                callback_idxs, commands, serialize_protobuf_route(route)
+            )
+        except Exception:
+            for callback_idx in callback_idxs:
+                self._inflight_requests.release(callback_idx)
+            raise
+        return response_futures
+
+    async def _execute_batch(
+        self,
+        commands: List[Tuple[RequestType.ValueType, Sequence[TEncodableValue]]],
+        route: Optional[Route] = None,
+    ) -> List[Union[TResult, RequestError]]:
+        if self._is_closed:
+            raise ClosingError(
+                "Unable to execute requests; the client is closed. Please create a new client."
+            )
+        if self._is_connection_pending:
+            await self._connect_on_first_use()
+        self._invalidate_cached_args(commands)
+        # The commands of a part are submitted before any of their responses is awaited, so they are flushed
+        # together, and the core routes each of them, like a single command, to the node of its slot
+        part_size = (
+            self.config.inflight_requests_limit or DEFAULT_INFLIGHT_REQUESTS_LIMIT
+        )
+        results: List[Union[TResult, RequestError]] = []
+        for start in range(0, len(commands), part_size):
+            response_futures = self._submit_commands(
+                commands[start : start + part_size], route
+            )
+            for response_future in response_futures:
+                try:
+                    await response_future
+                    results.append(response_future.result())
+                except RequestError as e:
+                    results.append(e)
+        return results
 
     async def _execute_transaction(
         self,
-        commands: List[Tuple[RequestType.ValueType, List[TEncodable]]],
+        commands: List[Tuple[RequestType.ValueType, Sequence[TEncodableValue]]],
         route: Optional[Route] = None,
     ) -> List[TResult]:
         if self._is_closed:
             raise ClosingError(
                 "Unable to execute requests; the client is closed. Please create a new client."
             )
+        if self._is_connection_pending:
+            await self._connect_on_first_use()
+        self._invalidate_cached_args(commands)
+        if self._native_client is not None:
+            return cast(
+                List[TResult],
+                await self._write_native_request_await_response(
+                    self._native_client.send_transaction,
+                    commands,
+                    serialize_protobuf_route(route),
+                ),
+            )
         request = CommandRequest()
-        request.callback_idx = self._get_callback_index()
         transaction_commands = []
         for requst_type, args in commands:
             command = Command()
@@ -296,7 +902,16 @@ class BaseClient(CoreCommands):
             transaction_commands.append(command)
         request.transaction.commands.extend(transaction_commands)
         set_protobuf_route(request, route)
-        return await self._write_request_await_response(request)
+        request.callback_idx, response_future = self._get_future()
+        return await self._write_request_await_response(request, response_future)
+
+    def _invalidate_cached_args(
+        self, commands: List[Tuple[RequestType.ValueType, Sequence[TEncodableValue]]]
+    ) -> None:
+        # The commands of transactions and batches aren't cached, they may write the keys of cached responses
+        if self._client_cache is not None:
+            for request_type, args in commands:
+                self._client_cache.invalidate_command(request_type, args)
 
     async def _execute_script(
         self,
@@ -309,8 +924,19 @@ class BaseClient(CoreCommands):
             raise ClosingError(
                 "Unable to execute requests; the client is closed. Please create a new client."
             )
+        if self._is_connection_pending:
+            await self._connect_on_first_use()
+        if self._client_cache is not None:
+            self._client_cache.invalidate_args([*(keys or []), *(args or [])])
+        if self._native_client is not None:
+            return await self._write_native_request_await_response(
+                self._native_client.invoke_script,
+                hash,
+                keys or [],
+                args or [],
+                serialize_protobuf_route(route),
+            )
         request = CommandRequest()
-        request.callback_idx = self._get_callback_index()
         (encoded_keys, keys_size) = self._encode_and_sum_size(keys)
         (encoded_args, args_size) = self._encode_and_sum_size(args)
         if (keys_size + args_size) < MAX_REQUEST_ARGS_LEN:
@@ -327,13 +953,16 @@ class BaseClient(CoreCommands):
                 encoded_args
             )
         set_protobuf_route(request, route)
-        return await self._write_request_await_response(request)
+        request.callback_idx, response_future = self._get_future()
+        return await self._write_request_await_response(request, response_future)
 
     async def get_pubsub_message(self) -> CoreCommands.PubSubMsg:
         if self._is_closed:
             raise ClosingError(
                 "Unable to execute requests; the client is closed. Please create a new client."
             )
+        if self._is_connection_pending:
+            await self._connect_on_first_use()
 
         if not self.config._is_pubsub_configured():
             raise ConfigurationError(
@@ -346,7 +975,7 @@ class BaseClient(CoreCommands):
             )
 
         # locking might not be required
-        response_future: asyncio.Future = asyncio.Future()
+        response_future: asyncio.Future = create_future()
         try:
             self._pubsub_lock.acquire()
             self._pubsub_futures.append(response_future)
@@ -386,15 +1015,21 @@ class BaseClient(CoreCommands):
     def _cancel_pubsub_futures_with_exception_safe(self, exception: ConnectionError):
         while len(self._pubsub_futures):
             next_future = self._pubsub_futures.pop(0)
-            if not next_future.cancelled():
-                next_future.set_exception(exception)
+            _call_in_loop(
+                next_future.get_loop(),
+                _set_exception_if_pending,
+                next_future,
+                exception,
+            )
 
     def _notification_to_pubsub_message_safe(
-        self, response: Response
+        self, notification: TPushNotification
     ) -> Optional[CoreCommands.PubSubMsg]:
         pubsub_message = None
-        push_notification = cast(
-            Dict[str, Any], value_from_pointer(response.resp_pointer)
+        push_notification = (
+            cast(Dict[str, Any], value_from_pointer(notification))
+            if isinstance(notification, int)
+            else notification
         )
         message_kind = push_notification["kind"]
         if message_kind == "Disconnection":
@@ -442,109 +1077,131 @@ class BaseClient(CoreCommands):
                 next_push_notification
             )
             if pubsub_message:
-                self._pubsub_futures.pop(0).set_result(pubsub_message)
+                next_future = self._pubsub_futures.pop(0)
+                _call_in_loop(
+                    next_future.get_loop(),
+                    _set_result_if_pending,
+                    next_future,
+                    pubsub_message,
+                )
 
-    async def _write_request_await_response(self, request: CommandRequest):
-        # Create a response future for this request and add it to the available
-        # futures map
-        response_future = self._get_future(request.callback_idx)
-        self._create_write_task(request)
+    async def _write_request_await_response(
+        self, request: TRequest, response_future: asyncio.Future
+    ):
+        self._submit_request(request)
         await response_future
         return response_future.result()
 
-    def _get_callback_index(self) -> int:
-        try:
-            return self._available_callback_indexes.pop()
-        except IndexError:
-            # The list is empty
-            return len(self._available_futures)
-
-    async def _process_response(self, response: Response) -> None:
-        res_future = self._available_futures.pop(response.callback_idx, None)
-        if not res_future or response.HasField("closing_error"):
-            err_msg = (
-                response.closing_error
-                if response.HasField("closing_error")
-                else f"Client Error - closing due to unknown error. callback index:  {response.callback_idx}"
-            )
-            if res_future is not None:
-                res_future.set_exception(ClosingError(err_msg))
-            await self.close(err_msg)
-            raise ClosingError(err_msg)
+    def _submit_request(self, request: TRequest) -> None:
+        assert self._loop is not None and self._socket_connection is not None
+        if isinstance(request, CommandRequest):
+            request.client_id = self._client_id
+        if self._loop.is_closed():
+            self._fail_request(
+                request,
+                ClosingError(
+                    "Unable to execute requests; the event loop that created the client is closed."
+                ),
+            )
         else:
-            self._available_callback_indexes.append(response.callback_idx)
-            if response.HasField("request_error"):
-                error_type = get_request_error_class(response.request_error.type)
-                res_future.set_exception(error_type(response.request_error.message))
-            elif response.HasField("resp_pointer"):
-                res_future.set_result(value_from_pointer(response.resp_pointer))
-            elif response.HasField("constant_response"):
-                res_future.set_result(OK)
+            # The socket is written by the loop that created the client
+            _call_in_loop(self._loop, self._socket_connection.buffer_request, request)
+
+    def _process_responses(self, responses: List[Tuple[int, int, Any]]) -> None:
+        resolved_responses: List[Tuple[int, int, Any]] = []
+        for callback_idx, kind, payload in responses:
+            if kind == RESPONSE_KIND_PUSH:
+                self._process_push_notification(payload)
+            elif (
+                kind == RESPONSE_KIND_CLOSING_ERROR
+                or callback_idx not in self._inflight_requests
+            ):
+                err_msg = (
+                    payload
+                    if kind == RESPONSE_KIND_CLOSING_ERROR
+                    else f"Client Error - closing due to unknown error. callback index:  {callback_idx}"
+                )
+                self._resolve_responses(resolved_responses)
+                res_future = self._inflight_requests.release(callback_idx)
+                if res_future is not None:
+                    _call_in_loop(
+                        res_future.get_loop(),
+                        _set_exception_if_pending,
+                        res_future,
+                        ClosingError(err_msg),
+                    )
+                self._close_task = asyncio.create_task(self.close(err_msg))
+                return
             else:
-                res_future.set_result(None)
-
-    async def _process_push(self, response: Response) -> None:
-        if response.HasField("closing_error") or not response.HasField("resp_pointer"):
-            err_msg = (
-                response.closing_error
-                if response.HasField("closing_error")
-                else "Client Error - push notification without resp_pointer"
-            )
-            await self.close(err_msg)
-            raise ClosingError(err_msg)
-
+                resolved_responses.append((callback_idx, kind, payload))
+        self._resolve_responses(resolved_responses)
+
+    def _on_connection_lost(self, exc: Optional[Exception]) -> None:
+        if not self._is_closed:
+            err_msg = "The communication layer was unexpectedly closed."
+            if exc is not None:
+                err_msg = f"{err_msg} {exc}"
+            self._close_task = asyncio.create_task(self.close(err_msg))
+
+    def _process_push_notification(self, resp_pointer: int) -> None:
+        notification: TPushNotification = resp_pointer
+        if self._client_cache is not None:
+            notification = cast(Dict[str, Any], value_from_pointer(resp_pointer))
+            if self._client_cache.process_push_notification(notification):
+                # An invalidation message of the client side cache
+                return
         try:
             self._pubsub_lock.acquire()
             callback, context = self.config._get_pubsub_callback_and_context()
             if callback:
-                pubsub_message = self._notification_to_pubsub_message_safe(response)
-                if pubsub_message:
-                    callback(pubsub_message, context)
+                pubsub_message = self._notification_to_pubsub_message_safe(notification)
+                if pubsub_message and self._loop is not None:
+                    # The callback is called on the loop that created the client
+                    _call_in_loop(self._loop, callback, pubsub_message, context)
             else:
-                self._pending_push_notifications.append(response)
+                self._pending_push_notifications.append(notification)
                 self._complete_pubsub_futures_safe()
         finally:
             self._pubsub_lock.release()
 
-    async def _reader_loop(self) -> None:
-        # Socket reader loop
-        remaining_read_bytes = bytearray()
-        while True:
-            read_bytes = await self._reader.read(DEFAULT_READ_BYTES_SIZE)
-            if len(read_bytes) == 0:
-                err_msg = "The communication layer was unexpectedly closed."
-                await self.close(err_msg)
-                raise ClosingError(err_msg)
-            read_bytes = remaining_read_bytes + bytearray(read_bytes)
-            read_bytes_view = memoryview(read_bytes)
-            offset = 0
-            while offset <= len(read_bytes):
-                try:
-                    response, offset = ProtobufCodec.decode_delimited(
-                        read_bytes, read_bytes_view, offset, Response
-                    )
-                except PartialMessageException:
-                    # Received only partial response, break the inner loop
-                    remaining_read_bytes = read_bytes[offset:]
-                    break
-                response = cast(Response, response)
-                if response.is_push:
-                    await self._process_push(response=response)
-                else:
-                    await self._process_response(response=response)
-
     async def get_statistics(self) -> dict:
         return get_statistics()
 
+    async def get_client_cache_statistics(self) -> Dict[str, int]:
+        """
+        Returns the statistics of the client side cache, see `ClientCacheConfiguration`.
+
+        Returns:
+            Dict[str, int]: The number of `hits`, `misses`, `evictions` and `invalidations` since the client was
+                created, and the number of `entries` and the approximate `memory` size in bytes of the cache.
+
+        Raises:
+            ConfigurationError: If the client side cache isn't configured.
+        """
+        if self._client_cache is None:
+            raise ConfigurationError("The client side cache isn't configured.")
+        return self._client_cache.get_statistics()
+
     async def _update_connection_password(
         self, password: Optional[str], immediate_auth: bool
     ) -> TResult:
-        request = CommandRequest()
-        request.callback_idx = self._get_callback_index()
-        if password is not None:
-            request.update_connection_password.password = password
-        request.update_connection_password.immediate_auth = immediate_auth
-        response = await self._write_request_await_response(request)
+        if self._is_connection_pending:
+            await self._connect_on_first_use()
+        if self._native_client is not None:
+            response = await self._write_native_request_await_response(
+                self._native_client.update_connection_password,
+                password,
+                immediate_auth,
+            )
+        else:
+            request = CommandRequest()
+            if password is not None:
+                request.update_connection_password.password = password
+            request.update_connection_password.immediate_auth = immediate_auth
+            request.callback_idx, response_future = self._get_future()
+            response = await self._write_request_await_response(
+                request, response_future
+            )
         # Update the client binding side password if managed to change core configuration password
         if response is OK:
             if self.config.credentials is None:
@@ -567,15 +1224,82 @@ class GlideClusterClient(BaseClient, ClusterCommands):
         count: Optional[int] = None,
         type: Optional[ObjectType] = None,
         allow_non_covered_slots: bool = False,
+        slot_ranges: Optional[List[Tuple[int, int]]] = None,
     ) -> List[Union[ClusterScanCursor, List[bytes]]]:
         if self._is_closed:
             raise ClosingError(
                 "Unable to execute requests; the client is closed. Please create a new client."
             )
-        request = CommandRequest()
-        request.callback_idx = self._get_callback_index()
+        if self._is_connection_pending:
+            await self._connect_on_first_use()
+        return await self._await_cluster_scan(
+            self._submit_cluster_scan(
+                cursor, match, count, type, allow_non_covered_slots, slot_ranges
+            )
+        )
+
+    def _prefetch_cluster_scan(
+        self,
+        cursor: ClusterScanCursor,
+        match: Optional[TEncodable],
+        count: Optional[int],
+        type: Optional[ObjectType],
+        allow_non_covered_slots: bool,
+        slot_ranges: Optional[List[Tuple[int, int]]],
+    ) -> Awaitable[List[Union[ClusterScanCursor, List[bytes]]]]:
+        # On asyncio, the scan is sent right away, and its response is converted by a task, so the response is received
+        # while the caller does other work. Otherwise, a coroutine that sends the scan when it is awaited is returned
+        if (
+            self._is_closed
+            or self._is_connection_pending
+            or isinstance(get_running_event_loop(), TrioEventLoop)
+        ):
+            return self._cluster_scan(
+                cursor, match, count, type, allow_non_covered_slots, slot_ranges
+            )
+        return asyncio.ensure_future(
+            self._await_cluster_scan(
+                self._submit_cluster_scan(
+                    cursor, match, count, type, allow_non_covered_slots, slot_ranges
+                )
+            )
+        )
+
+    async def _await_cluster_scan(
+        self, response_future: asyncio.Future
+    ) -> List[Union[ClusterScanCursor, List[bytes]]]:
+        await response_future
+        return _to_cluster_scan_result(response_future.result())
+
+    def _submit_cluster_scan(
+        self,
+        cursor: ClusterScanCursor,
+        match: Optional[TEncodable],
+        count: Optional[int],
+        type: Optional[ObjectType],
+        allow_non_covered_slots: bool,
+        slot_ranges: Optional[List[Tuple[int, int]]],
+    ) -> asyncio.Future:
         # Take out the id string from the wrapping object
         cursor_string = cursor.get_cursor()
+        callback_idx, response_future = self._get_future()
+        if self._native_client is not None:
+            try:
+                self._native_client.cluster_scan(
+                    callback_idx,
+                    cursor_string,
+                    self._encode_arg(match) if match is not None else None,
+                    count,
+                    type.value if type is not None else None,
+                    allow_non_covered_slots,
+                    slot_ranges,
+                )
+            except Exception:
+                self._inflight_requests.release(callback_idx)
+                raise
+            return response_future
+        request = CommandRequest()
+        request.callback_idx = callback_idx
         request.cluster_scan.cursor = cursor_string
         request.cluster_scan.allow_non_covered_slots = allow_non_covered_slots
         if match is not None:
@@ -586,8 +1310,12 @@ class GlideClusterClient(BaseClient, ClusterCommands):
             request.cluster_scan.count = count
         if type is not None:
             request.cluster_scan.object_type = type.value
-        response = await self._write_request_await_response(request)
-        return [ClusterScanCursor(bytes(response[0]).decode()), response[1]]
+        for start, end in slot_ranges or []:
+            slot_range = request.cluster_scan.slot_ranges.add()
+            slot_range.start = start
+            slot_range.end = end
+        self._submit_request(request)
+        return response_future
 
     def _get_protobuf_conn_request(self) -> ConnectionRequest:
         return self.config._create_a_protobuf_conn_request(cluster_mode=True)
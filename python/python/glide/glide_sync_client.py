@@ -0,0 +1,421 @@
+# Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
+
+import functools
+import inspect
+import sys
+import threading
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+
+from glide.async_commands.cluster_commands import ClusterCommands
+from glide.async_commands.command_args import ObjectType
+from glide.async_commands.core import CoreCommands
+from glide.async_commands.standalone_commands import StandaloneCommands
+from glide.config import BaseClientConfiguration, ServerCredentials
+from glide.constants import OK, TEncodable, TEncodableValue, TResult
+from glide.exceptions import ClosingError, ConfigurationError, RequestError
+from glide.glide_client import (
+    _clients,
+    _inherited_client_states,
+    _to_cluster_scan_result,
+    get_request_error_class,
+)
+from glide.logger import Level as LogLevel
+from glide.logger import Logger as ClientLogger
+from glide.protobuf.command_request_pb2 import RequestType
+from glide.protobuf.connection_request_pb2 import ConnectionRequest
+from glide.response_options import TResponseOptions, _get_response_options
+from glide.routes import Route, serialize_protobuf_route
+
+from .glide import (
+    DEFAULT_INFLIGHT_REQUESTS_LIMIT,
+    RESPONSE_KIND_NIL,
+    RESPONSE_KIND_OK,
+    RESPONSE_KIND_REQUEST_ERROR,
+    RESPONSE_KIND_VALUE,
+    ClusterScanCursor,
+    NativeClient,
+    get_statistics,
+    value_from_pointer,
+)
+
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
+
+
+def _run_blocking(coroutine: Coroutine[Any, Any, Any]) -> Any:
+    # The commands of a synchronous client wait for their responses while they are
+    # executed, so their coroutines complete without being suspended
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coroutine.close()
+    raise RuntimeError(
+        "A command of a synchronous client attempted to wait on an event loop."
+    )
+
+
+def _blocking(method: Callable[..., Coroutine[Any, Any, Any]]) -> Callable[..., Any]:
+    @functools.wraps(method)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return _run_blocking(method(*args, **kwargs))
+
+    return wrapper
+
+
+def _blocking_generator(
+    method: Callable[..., AsyncIterator[Any]],
+) -> Callable[..., Iterator[Any]]:
+    @functools.wraps(method)
+    def wrapper(*args: Any, **kwargs: Any) -> Iterator[Any]:
+        iterator = cast(AsyncGenerator[Any, None], method(*args, **kwargs))
+        try:
+            while True:
+                try:
+                    yield _run_blocking(
+                        cast(Coroutine[Any, Any, Any], iterator.__anext__())
+                    )
+                except StopAsyncIteration:
+                    return
+        finally:
+            _run_blocking(cast(Coroutine[Any, Any, Any], iterator.aclose()))
+
+    return wrapper
+
+
+class BaseSyncClient(CoreCommands):
+    """
+    Base class of the synchronous clients.
+
+    The commands of a synchronous client have the same signatures as the commands of the asyncio clients, but they
+    block until their response is received and return it, instead of returning a coroutine. The iterators of the
+    asyncio clients, such as `scan_iter`, are regular iterators, that block while they wait for a page. The GIL is
+    released while a command waits, and the client can be shared by any number of threads: the requests of all of the
+    threads are multiplexed over the connections of the client.
+
+    The synchronous clients always call the core in-process, so the `transport` and write coalescing options of the
+    advanced configuration don't apply to them. PubSub subscriptions and the client side cache aren't supported, and
+    the commands of the server modules (`glide.ft`, `glide.json`) can be used only with the asyncio clients.
+
+    Like the asyncio clients, the synchronous clients are fork-safe: a client inherited by a forked child process
+    connects again on its first use in the child.
+    """
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # The command implementations are shared with the asyncio clients. Their blocking signatures are declared
+        # by the generated `glide_sync_client.pyi` stub, see `tests/utils/sync_client_stub.py`
+        for name in dir(cls):
+            if name.startswith("_"):
+                continue
+            method = getattr(cls, name)
+            if inspect.iscoroutinefunction(method):
+                setattr(cls, name, _blocking(method))
+            elif inspect.isasyncgenfunction(method):
+                setattr(cls, name, _blocking_generator(method))
+
+    def __init__(self, config: BaseClientConfiguration):
+        """
+        To create a new client, use the `create` classmethod
+        """
+        self.config: BaseClientConfiguration = config
+        self._response_options: TResponseOptions = config._get_response_options()
+        self._native_client: Optional[NativeClient] = None
+        self._connect_lock = threading.Lock()
+        self._is_closed: bool = False
+        _clients.add(self)
+
+    @classmethod
+    def create(cls, config: BaseClientConfiguration) -> Self:
+        """Creates a synchronous Glide client, and blocks until it is connected.
+
+        With the `lazy_connect` option of the advanced configuration, `create` returns without connecting, and the
+        client connects on its first command. If the connection fails, the command raises its error, and the next
+        command connects again.
+
+        Args:
+            config (ClientConfiguration): The client configurations.
+                If no configuration is provided, a default client to "localhost":6379 will be created.
+
+        Returns:
+            Self: a synchronous Glide Client instance.
+        """
+        if config._is_pubsub_configured():
+            raise ConfigurationError(
+                "PubSub subscriptions aren't supported by the synchronous clients."
+            )
+        if config._get_client_cache() is not None:
+            raise ConfigurationError(
+                "The client side cache isn't supported by the synchronous clients."
+            )
+        self = cls(config)
+        if not config._is_lazy_connect():
+            self._connect()
+        return self
+
+    def _connect(self) -> None:
+        native_client, err = NativeClient.connect(
+            self._get_protobuf_conn_request().SerializeToString()
+        )
+        if err is not None:
+            raise ClosingError(err)
+        ClientLogger.log(LogLevel.INFO, "connection info", "new connection established")
+        self._native_client = native_client
+
+    def _after_fork_in_child(self) -> None:
+        # The connections of the client belong to the parent process
+        _inherited_client_states.append(self._native_client)
+        self._native_client = None
+        self._connect_lock = threading.Lock()
+
+    def close(self, err_message: Optional[str] = None) -> None:
+        """
+        Terminate the client by closing its connections. Commands that are already waiting for their responses are
+        allowed to complete, new commands fail with a `ClosingError`.
+
+        Args:
+            err_message (Optional[str]): Not used, kept for compatibility with the asyncio clients.
+            Defaults to None.
+        """
+        self._is_closed = True
+        if self._native_client is not None:
+            self._native_client.close()
+
+    def _get_protobuf_conn_request(self) -> ConnectionRequest:
+        return self.config._create_a_protobuf_conn_request()
+
+    def _get_native_client(self) -> NativeClient:
+        if self._is_closed:
+            raise ClosingError(
+                "Unable to execute requests; the client is closed. Please create a new client."
+            )
+        native_client = self._native_client
+        if native_client is None:
+            # A lazily connected client, or a client inherited by a forked child process, is connected on its first use
+            with self._connect_lock:
+                if self._native_client is None:
+                    self._connect()
+            native_client = cast(NativeClient, self._native_client)
+        return native_client
+
+    def _send_native_request(
+        self,
+        submit: Callable[..., Any],
+        *args: Any,
+        response_options: Optional[TResponseOptions] = None,
+    ) -> TResult:
+        # Requests of a blocking native client return their response, so the callback index isn't used
+        return self._parse_native_response(submit(0, *args), response_options)
+
+    def _parse_native_response(
+        self,
+        response: Tuple[int, int, Any],
+        response_options: Optional[TResponseOptions] = None,
+    ) -> TResult:
+        _, kind, payload = response
+        if kind == RESPONSE_KIND_VALUE:
+            return value_from_pointer(
+                payload, *(response_options or self._response_options)
+            )
+        if kind == RESPONSE_KIND_OK:
+            return OK
+        if kind == RESPONSE_KIND_NIL:
+            return None
+        if kind == RESPONSE_KIND_REQUEST_ERROR:
+            error_type, message = payload
+            raise get_request_error_class(error_type)(message)
+        raise ClosingError(payload)
+
+    async def _execute_command(
+        self,
+        request_type: RequestType.ValueType,
+        args: Sequence[TEncodableValue],
+        route: Optional[Route] = None,
+    ) -> TResult:
+        native_client = self._get_native_client()
+        return self._send_native_request(
+            native_client.send_command,
+            request_type,
+            args,
+            serialize_protobuf_route(route),
+            response_options=_get_response_options(
+                self._response_options, request_type, args
+            ),
+        )
+
+    def _prefetch_command(
+        self,
+        request_type: RequestType.ValueType,
+        args: Sequence[TEncodableValue],
+    ) -> Awaitable[TResult]:
+        # A blocking native client can't send a command without waiting for its response
+        return self._execute_command(request_type, args)
+
+    async def _execute_transaction(
+        self,
+        commands: List[Tuple[RequestType.ValueType, Sequence[TEncodableValue]]],
+        route: Optional[Route] = None,
+    ) -> List[TResult]:
+        native_client = self._get_native_client()
+        return cast(
+            List[TResult],
+            self._send_native_request(
+                native_client.send_transaction,
+                commands,
+                serialize_protobuf_route(route),
+                response_options=_get_response_options(self._response_options),
+            ),
+        )
+
+    async def _execute_batch(
+        self,
+        commands: List[Tuple[RequestType.ValueType, Sequence[TEncodableValue]]],
+        route: Optional[Route] = None,
+    ) -> List[Union[TResult, RequestError]]:
+        native_client = self._get_native_client()
+        # The commands of a part are sent before any of their responses is waited for, so they are flushed
+        # together, and the core routes each of them, like a single command, to the node of its slot
+        part_size = (
+            self.config.inflight_requests_limit or DEFAULT_INFLIGHT_REQUESTS_LIMIT
+        )
+        serialized_route = serialize_protobuf_route(route)
+        results: List[Union[TResult, RequestError]] = []
+        for start in range(0, len(commands), part_size):
+            part = commands[start : start + part_size]
+            # The callback indexes aren't used by a blocking native client
+            responses = cast(
+                List[Tuple[int, int, Any]],
+                native_client.send_commands([0] * len(part), part, serialized_route),
+            )
+            for (request_type, args), response in zip(part, responses):
+                try:
+                    results.append(
+                        self._parse_native_response(
+                            response,
+                            _get_response_options(
+                                self._response_options, request_type, args
+                            ),
+                        )
+                    )
+                except RequestError as e:
+                    results.append(e)
+        return results
+
+    async def _execute_script(
+        self,
+        hash: str,
+        keys: Optional[List[Union[str, bytes]]] = None,
+        args: Optional[List[Union[str, bytes]]] = None,
+        route: Optional[Route] = None,
+    ) -> TResult:
+        native_client = self._get_native_client()
+        return self._send_native_request(
+            native_client.invoke_script,
+            hash,
+            keys or [],
+            args or [],
+            serialize_protobuf_route(route),
+            response_options=_get_response_options(self._response_options),
+        )
+
+    async def _update_connection_password(
+        self, password: Optional[str], immediate_auth: bool
+    ) -> TResult:
+        native_client = self._get_native_client()
+        response = self._send_native_request(
+            native_client.update_connection_password,
+            password,
+            immediate_auth,
+        )
+        # Update the client binding side password if managed to change core configuration password
+        if response is OK:
+            if self.config.credentials is None:
+                self.config.credentials = ServerCredentials(password=password or "")
+                self.config.credentials.password = password or ""
+        return response
+
+    def get_pubsub_message(self) -> CoreCommands.PubSubMsg:  # type: ignore[override]
+        raise ConfigurationError(
+            "PubSub subscriptions aren't supported by the synchronous clients."
+        )
+
+    def try_get_pubsub_message(self) -> Optional[CoreCommands.PubSubMsg]:
+        raise ConfigurationError(
+            "PubSub subscriptions aren't supported by the synchronous clients."
+        )
+
+    def get_statistics(self) -> dict:
+        return get_statistics()
+
+
+class GlideSyncClusterClient(BaseSyncClient, ClusterCommands):
+    """
+    Synchronous client used for connection to cluster servers.
+    For full documentation, see
+    https://github.com/valkey-io/valkey-glide/wiki/Python-wrapper#cluster
+    """
+
+    async def _cluster_scan(
+        self,
+        cursor: ClusterScanCursor,
+        match: Optional[TEncodable] = None,
+        count: Optional[int] = None,
+        type: Optional[ObjectType] = None,
+        allow_non_covered_slots: bool = False,
+        slot_ranges: Optional[List[Tuple[int, int]]] = None,
+    ) -> List[Union[ClusterScanCursor, List[bytes]]]:
+        native_client = self._get_native_client()
+        response = self._send_native_request(
+            native_client.cluster_scan,
+            cursor.get_cursor(),
+            match.encode() if isinstance(match, str) else match,
+            count,
+            type.value if type is not None else None,
+            allow_non_covered_slots,
+            slot_ranges,
+        )
+        return _to_cluster_scan_result(response)
+
+    def _prefetch_cluster_scan(
+        self,
+        cursor: ClusterScanCursor,
+        match: Optional[TEncodable],
+        count: Optional[int],
+        type: Optional[ObjectType],
+        allow_non_covered_slots: bool,
+        slot_ranges: Optional[List[Tuple[int, int]]],
+    ) -> Awaitable[List[Union[ClusterScanCursor, List[bytes]]]]:
+        # A blocking native client can't send a scan without waiting for its response
+        return self._cluster_scan(
+            cursor, match, count, type, allow_non_covered_slots, slot_ranges
+        )
+
+    def _get_protobuf_conn_request(self) -> ConnectionRequest:
+        return self.config._create_a_protobuf_conn_request(cluster_mode=True)
+
+
+class GlideSyncClient(BaseSyncClient, StandaloneCommands):
+    """
+    Synchronous client used for connection to standalone servers.
+    For full documentation, see
+    https://github.com/valkey-io/valkey-glide/wiki/Python-wrapper#standalone
+    """
+
+
+TGlideSyncClient = Union[GlideSyncClient, GlideSyncClusterClient]
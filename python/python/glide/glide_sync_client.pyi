@@ -0,0 +1,921 @@
+# Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
+
+# Generated by `python -m tests.utils.sync_client_stub`, don't edit it manually.
+
+from typing import Dict, Generator, List, Mapping, Optional, Set, Tuple, Union
+
+from glide.async_commands.bitmap import (
+    BitFieldGet,
+    BitFieldSubCommands,
+    BitwiseOperation,
+    OffsetOptions,
+)
+from glide.async_commands.command_args import (
+    Limit,
+    ListDirection,
+    ObjectType,
+    OrderBy,
+    ShardScanCursor,
+)
+from glide.async_commands.core import (
+    ConditionalChange,
+    CoreCommands,
+    ExpireOptions,
+    ExpiryGetEx,
+    ExpirySet,
+    FlushMode,
+    FunctionRestorePolicy,
+    InfoSection,
+    InsertPosition,
+    OnlyIfEqual,
+    UpdateOptions,
+)
+from glide.async_commands.sorted_set import (
+    AggregationType,
+    GeoSearchByBox,
+    GeoSearchByRadius,
+    GeoSearchCount,
+    GeospatialData,
+    GeoUnit,
+    InfBound,
+    LexBoundary,
+    RangeByIndex,
+    RangeByLex,
+    RangeByScore,
+    ScoreBoundary,
+    ScoreFilter,
+)
+from glide.async_commands.stream import (
+    StreamAddOptions,
+    StreamClaimOptions,
+    StreamGroupOptions,
+    StreamPendingOptions,
+    StreamRangeBound,
+    StreamReadGroupOptions,
+    StreamReadOptions,
+    StreamTrimOptions,
+)
+from glide.async_commands.transaction import (
+    Batch,
+    ClusterBatch,
+    ClusterTransaction,
+    Transaction,
+)
+from glide.config import BaseClientConfiguration
+from glide.constants import (
+    TOK,
+    TClusterResponse,
+    TEncodable,
+    TEncodableValue,
+    TFunctionListResponse,
+    TFunctionStatsFullResponse,
+    TFunctionStatsSingleNodeResponse,
+    TResult,
+    TSingleNodeRoute,
+    TXInfoStreamFullResponse,
+    TXInfoStreamResponse,
+)
+from glide.exceptions import RequestError
+from glide.glide import ClusterScanCursor, Script
+from glide.routes import Route
+from typing_extensions import Self
+
+class BaseSyncClient:
+    config: BaseClientConfiguration
+
+    def __init__(self, config: BaseClientConfiguration) -> None: ...
+    @classmethod
+    def create(cls, config: BaseClientConfiguration) -> Self: ...
+    def close(self, err_message: Optional[str] = None) -> None: ...
+    def get_pubsub_message(self) -> CoreCommands.PubSubMsg: ...
+    def try_get_pubsub_message(self) -> Optional[CoreCommands.PubSubMsg]: ...
+    def get_statistics(self) -> dict: ...
+    def update_connection_password(
+        self, password: Optional[str], immediate_auth=False
+    ) -> TOK: ...
+    def set(
+        self,
+        key: TEncodable,
+        value: TEncodableValue,
+        conditional_set: Optional[Union[ConditionalChange, OnlyIfEqual]] = None,
+        expiry: Optional[ExpirySet] = None,
+        return_old_value: bool = False,
+    ) -> Optional[bytes]: ...
+    def get(self, key: TEncodable) -> Optional[bytes]: ...
+    def getdel(self, key: TEncodable) -> Optional[bytes]: ...
+    def getrange(self, key: TEncodable, start: int, end: int) -> bytes: ...
+    def append(self, key: TEncodable, value: TEncodable) -> int: ...
+    def strlen(self, key: TEncodable) -> int: ...
+    def rename(self, key: TEncodable, new_key: TEncodable) -> TOK: ...
+    def renamenx(self, key: TEncodable, new_key: TEncodable) -> bool: ...
+    def delete(self, keys: List[TEncodable]) -> int: ...
+    def incr(self, key: TEncodable) -> int: ...
+    def incrby(self, key: TEncodable, amount: int) -> int: ...
+    def incrbyfloat(self, key: TEncodable, amount: float) -> float: ...
+    def setrange(self, key: TEncodable, offset: int, value: TEncodable) -> int: ...
+    def mset(self, key_value_map: Mapping[TEncodable, TEncodable]) -> TOK: ...
+    def msetnx(self, key_value_map: Mapping[TEncodable, TEncodable]) -> bool: ...
+    def mget(self, keys: List[TEncodable]) -> List[Optional[bytes]]: ...
+    def decr(self, key: TEncodable) -> int: ...
+    def decrby(self, key: TEncodable, amount: int) -> int: ...
+    def touch(self, keys: List[TEncodable]) -> int: ...
+    def hset(
+        self, key: TEncodable, field_value_map: Mapping[TEncodable, TEncodableValue]
+    ) -> int: ...
+    def hget(self, key: TEncodable, field: TEncodable) -> Optional[bytes]: ...
+    def hsetnx(self, key: TEncodable, field: TEncodable, value: TEncodable) -> bool: ...
+    def hincrby(self, key: TEncodable, field: TEncodable, amount: int) -> int: ...
+    def hincrbyfloat(
+        self, key: TEncodable, field: TEncodable, amount: float
+    ) -> float: ...
+    def hexists(self, key: TEncodable, field: TEncodable) -> bool: ...
+    def hgetall(self, key: TEncodable) -> Dict[bytes, bytes]: ...
+    def hmget(
+        self, key: TEncodable, fields: List[TEncodable]
+    ) -> List[Optional[bytes]]: ...
+    def hdel(self, key: TEncodable, fields: List[TEncodable]) -> int: ...
+    def hlen(self, key: TEncodable) -> int: ...
+    def hvals(self, key: TEncodable) -> List[bytes]: ...
+    def hkeys(self, key: TEncodable) -> List[bytes]: ...
+    def hrandfield(self, key: TEncodable) -> Optional[bytes]: ...
+    def hrandfield_count(self, key: TEncodable, count: int) -> List[bytes]: ...
+    def hrandfield_withvalues(
+        self, key: TEncodable, count: int
+    ) -> List[List[bytes]]: ...
+    def hstrlen(self, key: TEncodable, field: TEncodable) -> int: ...
+    def lpush(self, key: TEncodable, elements: List[TEncodable]) -> int: ...
+    def lpushx(self, key: TEncodable, elements: List[TEncodable]) -> int: ...
+    def lpop(self, key: TEncodable) -> Optional[bytes]: ...
+    def lpop_count(self, key: TEncodable, count: int) -> Optional[List[bytes]]: ...
+    def blpop(
+        self, keys: List[TEncodable], timeout: float
+    ) -> Optional[List[bytes]]: ...
+    def lmpop(
+        self,
+        keys: List[TEncodable],
+        direction: ListDirection,
+        count: Optional[int] = None,
+    ) -> Optional[Mapping[bytes, List[bytes]]]: ...
+    def blmpop(
+        self,
+        keys: List[TEncodable],
+        direction: ListDirection,
+        timeout: float,
+        count: Optional[int] = None,
+    ) -> Optional[Mapping[bytes, List[bytes]]]: ...
+    def lrange(self, key: TEncodable, start: int, end: int) -> List[bytes]: ...
+    def lindex(self, key: TEncodable, index: int) -> Optional[bytes]: ...
+    def lset(self, key: TEncodable, index: int, element: TEncodable) -> TOK: ...
+    def rpush(self, key: TEncodable, elements: List[TEncodable]) -> int: ...
+    def rpushx(self, key: TEncodable, elements: List[TEncodable]) -> int: ...
+    def rpop(self, key: TEncodable) -> Optional[bytes]: ...
+    def rpop_count(self, key: TEncodable, count: int) -> Optional[List[bytes]]: ...
+    def brpop(
+        self, keys: List[TEncodable], timeout: float
+    ) -> Optional[List[bytes]]: ...
+    def linsert(
+        self,
+        key: TEncodable,
+        position: InsertPosition,
+        pivot: TEncodable,
+        element: TEncodable,
+    ) -> int: ...
+    def lmove(
+        self,
+        source: TEncodable,
+        destination: TEncodable,
+        where_from: ListDirection,
+        where_to: ListDirection,
+    ) -> Optional[bytes]: ...
+    def blmove(
+        self,
+        source: TEncodable,
+        destination: TEncodable,
+        where_from: ListDirection,
+        where_to: ListDirection,
+        timeout: float,
+    ) -> Optional[bytes]: ...
+    def sadd(self, key: TEncodable, members: List[TEncodable]) -> int: ...
+    def srem(self, key: TEncodable, members: List[TEncodable]) -> int: ...
+    def smembers(self, key: TEncodable) -> Set[bytes]: ...
+    def scard(self, key: TEncodable) -> int: ...
+    def spop(self, key: TEncodable) -> Optional[bytes]: ...
+    def spop_count(self, key: TEncodable, count: int) -> Set[bytes]: ...
+    def sismember(self, key: TEncodable, member: TEncodable) -> bool: ...
+    def smove(
+        self, source: TEncodable, destination: TEncodable, member: TEncodable
+    ) -> bool: ...
+    def sunion(self, keys: List[TEncodable]) -> Set[bytes]: ...
+    def sunionstore(self, destination: TEncodable, keys: List[TEncodable]) -> int: ...
+    def sdiffstore(self, destination: TEncodable, keys: List[TEncodable]) -> int: ...
+    def sinter(self, keys: List[TEncodable]) -> Set[bytes]: ...
+    def sinterstore(self, destination: TEncodable, keys: List[TEncodable]) -> int: ...
+    def sintercard(
+        self, keys: List[TEncodable], limit: Optional[int] = None
+    ) -> int: ...
+    def sdiff(self, keys: List[TEncodable]) -> Set[bytes]: ...
+    def smismember(self, key: TEncodable, members: List[TEncodable]) -> List[bool]: ...
+    def ltrim(self, key: TEncodable, start: int, end: int) -> TOK: ...
+    def lrem(self, key: TEncodable, count: int, element: TEncodable) -> int: ...
+    def llen(self, key: TEncodable) -> int: ...
+    def exists(self, keys: List[TEncodable]) -> int: ...
+    def unlink(self, keys: List[TEncodable]) -> int: ...
+    def expire(
+        self, key: TEncodable, seconds: int, option: Optional[ExpireOptions] = None
+    ) -> bool: ...
+    def expireat(
+        self, key: TEncodable, unix_seconds: int, option: Optional[ExpireOptions] = None
+    ) -> bool: ...
+    def pexpire(
+        self, key: TEncodable, milliseconds: int, option: Optional[ExpireOptions] = None
+    ) -> bool: ...
+    def pexpireat(
+        self,
+        key: TEncodable,
+        unix_milliseconds: int,
+        option: Optional[ExpireOptions] = None,
+    ) -> bool: ...
+    def expiretime(self, key: TEncodable) -> int: ...
+    def pexpiretime(self, key: TEncodable) -> int: ...
+    def ttl(self, key: TEncodable) -> int: ...
+    def pttl(self, key: TEncodable) -> int: ...
+    def persist(self, key: TEncodable) -> bool: ...
+    def type(self, key: TEncodable) -> bytes: ...
+    def xadd(
+        self,
+        key: TEncodable,
+        values: List[Tuple[TEncodable, TEncodableValue]],
+        options: Optional[StreamAddOptions] = None,
+    ) -> Optional[bytes]: ...
+    def xdel(self, key: TEncodable, ids: List[TEncodable]) -> int: ...
+    def xtrim(self, key: TEncodable, options: StreamTrimOptions) -> int: ...
+    def xlen(self, key: TEncodable) -> int: ...
+    def xrange(
+        self,
+        key: TEncodable,
+        start: StreamRangeBound,
+        end: StreamRangeBound,
+        count: Optional[int] = None,
+    ) -> Optional[Mapping[bytes, List[List[bytes]]]]: ...
+    def xrevrange(
+        self,
+        key: TEncodable,
+        end: StreamRangeBound,
+        start: StreamRangeBound,
+        count: Optional[int] = None,
+    ) -> Optional[Mapping[bytes, List[List[bytes]]]]: ...
+    def xread(
+        self,
+        keys_and_ids: Mapping[TEncodable, TEncodable],
+        options: Optional[StreamReadOptions] = None,
+    ) -> Optional[Mapping[bytes, Mapping[bytes, List[List[bytes]]]]]: ...
+    def xgroup_create(
+        self,
+        key: TEncodable,
+        group_name: TEncodable,
+        group_id: TEncodable,
+        options: Optional[StreamGroupOptions] = None,
+    ) -> TOK: ...
+    def xgroup_destroy(self, key: TEncodable, group_name: TEncodable) -> bool: ...
+    def xgroup_create_consumer(
+        self, key: TEncodable, group_name: TEncodable, consumer_name: TEncodable
+    ) -> bool: ...
+    def xgroup_del_consumer(
+        self, key: TEncodable, group_name: TEncodable, consumer_name: TEncodable
+    ) -> int: ...
+    def xgroup_set_id(
+        self,
+        key: TEncodable,
+        group_name: TEncodable,
+        stream_id: TEncodable,
+        entries_read: Optional[int] = None,
+    ) -> TOK: ...
+    def xreadgroup(
+        self,
+        keys_and_ids: Mapping[TEncodable, TEncodable],
+        group_name: TEncodable,
+        consumer_name: TEncodable,
+        options: Optional[StreamReadGroupOptions] = None,
+    ) -> Optional[Mapping[bytes, Mapping[bytes, Optional[List[List[bytes]]]]]]: ...
+    def xack(
+        self, key: TEncodable, group_name: TEncodable, ids: List[TEncodable]
+    ) -> int: ...
+    def xpending(
+        self, key: TEncodable, group_name: TEncodable
+    ) -> List[Union[int, bytes, List[List[bytes]], None]]: ...
+    def xpending_range(
+        self,
+        key: TEncodable,
+        group_name: TEncodable,
+        start: StreamRangeBound,
+        end: StreamRangeBound,
+        count: int,
+        options: Optional[StreamPendingOptions] = None,
+    ) -> List[List[Union[bytes, int]]]: ...
+    def xclaim(
+        self,
+        key: TEncodable,
+        group: TEncodable,
+        consumer: TEncodable,
+        min_idle_time_ms: int,
+        ids: List[TEncodable],
+        options: Optional[StreamClaimOptions] = None,
+    ) -> Mapping[bytes, List[List[bytes]]]: ...
+    def xclaim_just_id(
+        self,
+        key: TEncodable,
+        group: TEncodable,
+        consumer: TEncodable,
+        min_idle_time_ms: int,
+        ids: List[TEncodable],
+        options: Optional[StreamClaimOptions] = None,
+    ) -> List[bytes]: ...
+    def xautoclaim(
+        self,
+        key: TEncodable,
+        group_name: TEncodable,
+        consumer_name: TEncodable,
+        min_idle_time_ms: int,
+        start: TEncodable,
+        count: Optional[int] = None,
+    ) -> List[Union[bytes, Mapping[bytes, List[List[bytes]]], List[bytes]]]: ...
+    def xautoclaim_just_id(
+        self,
+        key: TEncodable,
+        group_name: TEncodable,
+        consumer_name: TEncodable,
+        min_idle_time_ms: int,
+        start: TEncodable,
+        count: Optional[int] = None,
+    ) -> List[Union[bytes, List[bytes]]]: ...
+    def xinfo_groups(
+        self, key: TEncodable
+    ) -> List[Mapping[bytes, Union[bytes, int, None]]]: ...
+    def xinfo_consumers(
+        self, key: TEncodable, group_name: TEncodable
+    ) -> List[Mapping[bytes, Union[bytes, int]]]: ...
+    def xinfo_stream(self, key: TEncodable) -> TXInfoStreamResponse: ...
+    def xinfo_stream_full(
+        self, key: TEncodable, count: Optional[int] = None
+    ) -> TXInfoStreamFullResponse: ...
+    def geoadd(
+        self,
+        key: TEncodable,
+        members_geospatialdata: Mapping[TEncodable, GeospatialData],
+        existing_options: Optional[ConditionalChange] = None,
+        changed: bool = False,
+    ) -> int: ...
+    def geodist(
+        self,
+        key: TEncodable,
+        member1: TEncodable,
+        member2: TEncodable,
+        unit: Optional[GeoUnit] = None,
+    ) -> Optional[float]: ...
+    def geohash(
+        self, key: TEncodable, members: List[TEncodable]
+    ) -> List[Optional[bytes]]: ...
+    def geopos(
+        self, key: TEncodable, members: List[TEncodable]
+    ) -> List[Optional[List[float]]]: ...
+    def geosearch(
+        self,
+        key: TEncodable,
+        search_from: Union[str, bytes, GeospatialData],
+        search_by: Union[GeoSearchByRadius, GeoSearchByBox],
+        order_by: Optional[OrderBy] = None,
+        count: Optional[GeoSearchCount] = None,
+        with_coord: bool = False,
+        with_dist: bool = False,
+        with_hash: bool = False,
+    ) -> List[Union[bytes, List[Union[bytes, float, int, List[float]]]]]: ...
+    def geosearchstore(
+        self,
+        destination: TEncodable,
+        source: TEncodable,
+        search_from: Union[str, bytes, GeospatialData],
+        search_by: Union[GeoSearchByRadius, GeoSearchByBox],
+        count: Optional[GeoSearchCount] = None,
+        store_dist: bool = False,
+    ) -> int: ...
+    def zadd(
+        self,
+        key: TEncodable,
+        members_scores: Mapping[TEncodable, float],
+        existing_options: Optional[ConditionalChange] = None,
+        update_condition: Optional[UpdateOptions] = None,
+        changed: bool = False,
+    ) -> int: ...
+    def zadd_incr(
+        self,
+        key: TEncodable,
+        member: TEncodable,
+        increment: float,
+        existing_options: Optional[ConditionalChange] = None,
+        update_condition: Optional[UpdateOptions] = None,
+    ) -> Optional[float]: ...
+    def zcard(self, key: TEncodable) -> int: ...
+    def zcount(
+        self,
+        key: TEncodable,
+        min_score: Union[InfBound, ScoreBoundary],
+        max_score: Union[InfBound, ScoreBoundary],
+    ) -> int: ...
+    def zincrby(
+        self, key: TEncodable, increment: float, member: TEncodable
+    ) -> float: ...
+    def zpopmax(
+        self, key: TEncodable, count: Optional[int] = None
+    ) -> Mapping[bytes, float]: ...
+    def bzpopmax(
+        self, keys: List[TEncodable], timeout: float
+    ) -> Optional[List[Union[bytes, float]]]: ...
+    def zpopmin(
+        self, key: TEncodable, count: Optional[int] = None
+    ) -> Mapping[bytes, float]: ...
+    def bzpopmin(
+        self, keys: List[TEncodable], timeout: float
+    ) -> Optional[List[Union[bytes, float]]]: ...
+    def zrange(
+        self,
+        key: TEncodable,
+        range_query: Union[RangeByIndex, RangeByLex, RangeByScore],
+        reverse: bool = False,
+    ) -> List[bytes]: ...
+    def zrange_withscores(
+        self,
+        key: TEncodable,
+        range_query: Union[RangeByIndex, RangeByScore],
+        reverse: bool = False,
+    ) -> Mapping[bytes, float]: ...
+    def zrangestore(
+        self,
+        destination: TEncodable,
+        source: TEncodable,
+        range_query: Union[RangeByIndex, RangeByLex, RangeByScore],
+        reverse: bool = False,
+    ) -> int: ...
+    def zrank(self, key: TEncodable, member: TEncodable) -> Optional[int]: ...
+    def zrank_withscore(
+        self, key: TEncodable, member: TEncodable
+    ) -> Optional[List[Union[int, float]]]: ...
+    def zrevrank(self, key: TEncodable, member: TEncodable) -> Optional[int]: ...
+    def zrevrank_withscore(
+        self, key: TEncodable, member: TEncodable
+    ) -> Optional[List[Union[int, float]]]: ...
+    def zrem(self, key: TEncodable, members: List[TEncodable]) -> int: ...
+    def zremrangebyscore(
+        self,
+        key: TEncodable,
+        min_score: Union[InfBound, ScoreBoundary],
+        max_score: Union[InfBound, ScoreBoundary],
+    ) -> int: ...
+    def zremrangebylex(
+        self,
+        key: TEncodable,
+        min_lex: Union[InfBound, LexBoundary],
+        max_lex: Union[InfBound, LexBoundary],
+    ) -> int: ...
+    def zremrangebyrank(self, key: TEncodable, start: int, end: int) -> int: ...
+    def zlexcount(
+        self,
+        key: TEncodable,
+        min_lex: Union[InfBound, LexBoundary],
+        max_lex: Union[InfBound, LexBoundary],
+    ) -> int: ...
+    def zscore(self, key: TEncodable, member: TEncodable) -> Optional[float]: ...
+    def zmscore(
+        self, key: TEncodable, members: List[TEncodable]
+    ) -> List[Optional[float]]: ...
+    def zdiff(self, keys: List[TEncodable]) -> List[bytes]: ...
+    def zdiff_withscores(self, keys: List[TEncodable]) -> Mapping[bytes, float]: ...
+    def zdiffstore(self, destination: TEncodable, keys: List[TEncodable]) -> int: ...
+    def zinter(self, keys: List[TEncodable]) -> List[bytes]: ...
+    def zinter_withscores(
+        self,
+        keys: Union[List[TEncodable], List[Tuple[TEncodable, float]]],
+        aggregation_type: Optional[AggregationType] = None,
+    ) -> Mapping[bytes, float]: ...
+    def zinterstore(
+        self,
+        destination: TEncodable,
+        keys: Union[List[TEncodable], List[Tuple[TEncodable, float]]],
+        aggregation_type: Optional[AggregationType] = None,
+    ) -> int: ...
+    def zunion(self, keys: List[TEncodable]) -> List[bytes]: ...
+    def zunion_withscores(
+        self,
+        keys: Union[List[TEncodable], List[Tuple[TEncodable, float]]],
+        aggregation_type: Optional[AggregationType] = None,
+    ) -> Mapping[bytes, float]: ...
+    def zunionstore(
+        self,
+        destination: TEncodable,
+        keys: Union[List[TEncodable], List[Tuple[TEncodable, float]]],
+        aggregation_type: Optional[AggregationType] = None,
+    ) -> int: ...
+    def zrandmember(self, key: TEncodable) -> Optional[bytes]: ...
+    def zrandmember_count(self, key: TEncodable, count: int) -> List[bytes]: ...
+    def zrandmember_withscores(
+        self, key: TEncodable, count: int
+    ) -> List[List[Union[bytes, float]]]: ...
+    def zmpop(
+        self, keys: List[TEncodable], filter: ScoreFilter, count: Optional[int] = None
+    ) -> Optional[List[Union[bytes, Mapping[bytes, float]]]]: ...
+    def bzmpop(
+        self,
+        keys: List[TEncodable],
+        modifier: ScoreFilter,
+        timeout: float,
+        count: Optional[int] = None,
+    ) -> Optional[List[Union[bytes, Mapping[bytes, float]]]]: ...
+    def zintercard(
+        self, keys: List[TEncodable], limit: Optional[int] = None
+    ) -> int: ...
+    def script_show(self, sha1: TEncodable) -> bytes: ...
+    def pfadd(self, key: TEncodable, elements: List[TEncodable]) -> int: ...
+    def pfcount(self, keys: List[TEncodable]) -> int: ...
+    def pfmerge(
+        self, destination: TEncodable, source_keys: List[TEncodable]
+    ) -> TOK: ...
+    def bitcount(
+        self, key: TEncodable, options: Optional[OffsetOptions] = None
+    ) -> int: ...
+    def setbit(self, key: TEncodable, offset: int, value: int) -> int: ...
+    def getbit(self, key: TEncodable, offset: int) -> int: ...
+    def bitpos(
+        self, key: TEncodable, bit: int, options: Optional[OffsetOptions] = None
+    ) -> int: ...
+    def bitop(
+        self,
+        operation: BitwiseOperation,
+        destination: TEncodable,
+        keys: List[TEncodable],
+    ) -> int: ...
+    def bitfield(
+        self, key: TEncodable, subcommands: List[BitFieldSubCommands]
+    ) -> List[Optional[int]]: ...
+    def bitfield_read_only(
+        self, key: TEncodable, subcommands: List[BitFieldGet]
+    ) -> List[int]: ...
+    def object_encoding(self, key: TEncodable) -> Optional[bytes]: ...
+    def object_freq(self, key: TEncodable) -> Optional[int]: ...
+    def object_idletime(self, key: TEncodable) -> Optional[int]: ...
+    def object_refcount(self, key: TEncodable) -> Optional[int]: ...
+    def srandmember(self, key: TEncodable) -> Optional[bytes]: ...
+    def srandmember_count(self, key: TEncodable, count: int) -> List[bytes]: ...
+    def getex(
+        self, key: TEncodable, expiry: Optional[ExpiryGetEx] = None
+    ) -> Optional[bytes]: ...
+    def dump(self, key: TEncodable) -> Optional[bytes]: ...
+    def restore(
+        self,
+        key: TEncodable,
+        ttl: int,
+        value: TEncodable,
+        replace: bool = False,
+        absttl: bool = False,
+        idletime: Optional[int] = None,
+        frequency: Optional[int] = None,
+    ) -> TOK: ...
+    def sscan(
+        self,
+        key: TEncodable,
+        cursor: TEncodable,
+        match: Optional[TEncodable] = None,
+        count: Optional[int] = None,
+    ) -> List[Union[bytes, List[bytes]]]: ...
+    def sscan_iter(
+        self,
+        key: TEncodable,
+        match: Optional[TEncodable] = None,
+        count: Optional[int] = None,
+        batched: bool = False,
+    ) -> Generator[Union[bytes, List[bytes]], None, None]: ...
+    def zscan(
+        self,
+        key: TEncodable,
+        cursor: TEncodable,
+        match: Optional[TEncodable] = None,
+        count: Optional[int] = None,
+        no_scores: bool = False,
+    ) -> List[Union[bytes, List[bytes]]]: ...
+    def zscan_iter(
+        self,
+        key: TEncodable,
+        match: Optional[TEncodable] = None,
+        count: Optional[int] = None,
+        no_scores: bool = False,
+        batched: bool = False,
+    ) -> Generator[
+        Union[bytes, Tuple[bytes, float], List[bytes], List[Tuple[bytes, float]]],
+        None,
+        None,
+    ]: ...
+    def hscan(
+        self,
+        key: TEncodable,
+        cursor: TEncodable,
+        match: Optional[TEncodable] = None,
+        count: Optional[int] = None,
+        no_values: bool = False,
+    ) -> List[Union[bytes, List[bytes]]]: ...
+    def hscan_iter(
+        self,
+        key: TEncodable,
+        match: Optional[TEncodable] = None,
+        count: Optional[int] = None,
+        no_values: bool = False,
+        batched: bool = False,
+    ) -> Generator[
+        Union[bytes, Tuple[bytes, bytes], List[bytes], List[Tuple[bytes, bytes]]],
+        None,
+        None,
+    ]: ...
+    def fcall(
+        self,
+        function: TEncodable,
+        keys: Optional[List[TEncodable]] = None,
+        arguments: Optional[List[TEncodable]] = None,
+    ) -> TResult: ...
+    def fcall_ro(
+        self,
+        function: TEncodable,
+        keys: Optional[List[TEncodable]] = None,
+        arguments: Optional[List[TEncodable]] = None,
+    ) -> TResult: ...
+    def watch(self, keys: List[TEncodable]) -> TOK: ...
+    def lcs(self, key1: TEncodable, key2: TEncodable) -> bytes: ...
+    def lcs_len(self, key1: TEncodable, key2: TEncodable) -> int: ...
+    def lcs_idx(
+        self,
+        key1: TEncodable,
+        key2: TEncodable,
+        min_match_len: Optional[int] = None,
+        with_match_len: Optional[bool] = False,
+    ) -> Mapping[bytes, Union[List[List[Union[List[int], int]]], int]]: ...
+    def lpos(
+        self,
+        key: TEncodable,
+        element: TEncodable,
+        rank: Optional[int] = None,
+        count: Optional[int] = None,
+        max_len: Optional[int] = None,
+    ) -> Union[int, List[int], None]: ...
+    def pubsub_channels(self, pattern: Optional[TEncodable] = None) -> List[bytes]: ...
+    def pubsub_numpat(self) -> int: ...
+    def pubsub_numsub(
+        self, channels: Optional[List[TEncodable]] = None
+    ) -> Mapping[bytes, int]: ...
+    def sort(
+        self,
+        key: TEncodable,
+        by_pattern: Optional[TEncodable] = None,
+        limit: Optional[Limit] = None,
+        get_patterns: Optional[List[TEncodable]] = None,
+        order: Optional[OrderBy] = None,
+        alpha: Optional[bool] = None,
+    ) -> List[Optional[bytes]]: ...
+    def sort_ro(
+        self,
+        key: TEncodable,
+        by_pattern: Optional[TEncodable] = None,
+        limit: Optional[Limit] = None,
+        get_patterns: Optional[List[TEncodable]] = None,
+        order: Optional[OrderBy] = None,
+        alpha: Optional[bool] = None,
+    ) -> List[Optional[bytes]]: ...
+    def sort_store(
+        self,
+        key: TEncodable,
+        destination: TEncodable,
+        by_pattern: Optional[TEncodable] = None,
+        limit: Optional[Limit] = None,
+        get_patterns: Optional[List[TEncodable]] = None,
+        order: Optional[OrderBy] = None,
+        alpha: Optional[bool] = None,
+    ) -> int: ...
+
+class GlideSyncClusterClient(BaseSyncClient):
+    def custom_command(
+        self, command_args: List[TEncodable], route: Optional[Route] = None
+    ) -> TClusterResponse[TResult]: ...
+    def info(
+        self,
+        sections: Optional[List[InfoSection]] = None,
+        route: Optional[Route] = None,
+    ) -> TClusterResponse[bytes]: ...
+    def exec(
+        self, transaction: ClusterTransaction, route: Optional[TSingleNodeRoute] = None
+    ) -> Optional[List[TResult]]: ...
+    def exec_batch(
+        self, batch: ClusterBatch, route: Optional[TSingleNodeRoute] = None
+    ) -> List[Union[TResult, RequestError]]: ...
+    def config_resetstat(self, route: Optional[Route] = None) -> TOK: ...
+    def config_rewrite(self, route: Optional[Route] = None) -> TOK: ...
+    def client_id(self, route: Optional[Route] = None) -> TClusterResponse[int]: ...
+    def ping(
+        self, message: Optional[TEncodable] = None, route: Optional[Route] = None
+    ) -> bytes: ...
+    def config_get(
+        self, parameters: List[TEncodable], route: Optional[Route] = None
+    ) -> TClusterResponse[Dict[bytes, bytes]]: ...
+    def config_set(
+        self,
+        parameters_map: Mapping[TEncodable, TEncodable],
+        route: Optional[Route] = None,
+    ) -> TOK: ...
+    def client_getname(
+        self, route: Optional[Route] = None
+    ) -> TClusterResponse[Optional[bytes]]: ...
+    def dbsize(self, route: Optional[Route] = None) -> int: ...
+    def echo(
+        self, message: TEncodable, route: Optional[Route] = None
+    ) -> TClusterResponse[bytes]: ...
+    def function_load(
+        self,
+        library_code: TEncodable,
+        replace: bool = False,
+        route: Optional[Route] = None,
+    ) -> bytes: ...
+    def function_list(
+        self,
+        library_name_pattern: Optional[TEncodable] = None,
+        with_code: bool = False,
+        route: Optional[Route] = None,
+    ) -> TClusterResponse[TFunctionListResponse]: ...
+    def function_flush(
+        self, mode: Optional[FlushMode] = None, route: Optional[Route] = None
+    ) -> TOK: ...
+    def function_delete(
+        self, library_name: TEncodable, route: Optional[Route] = None
+    ) -> TOK: ...
+    def function_kill(self, route: Optional[Route] = None) -> TOK: ...
+    def fcall_route(
+        self,
+        function: TEncodable,
+        arguments: Optional[List[TEncodable]] = None,
+        route: Optional[Route] = None,
+    ) -> TClusterResponse[TResult]: ...
+    def fcall_ro_route(
+        self,
+        function: TEncodable,
+        arguments: Optional[List[TEncodable]] = None,
+        route: Optional[Route] = None,
+    ) -> TClusterResponse[TResult]: ...
+    def function_stats(
+        self, route: Optional[Route] = None
+    ) -> TClusterResponse[TFunctionStatsSingleNodeResponse]: ...
+    def function_dump(
+        self, route: Optional[Route] = None
+    ) -> TClusterResponse[bytes]: ...
+    def function_restore(
+        self,
+        payload: TEncodable,
+        policy: Optional[FunctionRestorePolicy] = None,
+        route: Optional[Route] = None,
+    ) -> TOK: ...
+    def time(self, route: Optional[Route] = None) -> TClusterResponse[List[bytes]]: ...
+    def lastsave(self, route: Optional[Route] = None) -> TClusterResponse[int]: ...
+    def publish(
+        self, message: TEncodable, channel: TEncodable, sharded: bool = False
+    ) -> int: ...
+    def pubsub_shardchannels(
+        self, pattern: Optional[TEncodable] = None
+    ) -> List[bytes]: ...
+    def pubsub_shardnumsub(
+        self, channels: Optional[List[TEncodable]] = None
+    ) -> Mapping[bytes, int]: ...
+    def flushall(
+        self, flush_mode: Optional[FlushMode] = None, route: Optional[Route] = None
+    ) -> TOK: ...
+    def flushdb(
+        self, flush_mode: Optional[FlushMode] = None, route: Optional[Route] = None
+    ) -> TOK: ...
+    def copy(
+        self,
+        source: TEncodable,
+        destination: TEncodable,
+        replace: Optional[bool] = None,
+    ) -> bool: ...
+    def lolwut(
+        self,
+        version: Optional[int] = None,
+        parameters: Optional[List[int]] = None,
+        route: Optional[Route] = None,
+    ) -> TClusterResponse[bytes]: ...
+    def random_key(self, route: Optional[Route] = None) -> Optional[bytes]: ...
+    def wait(
+        self, numreplicas: int, timeout: int, route: Optional[Route] = None
+    ) -> int: ...
+    def unwatch(self, route: Optional[Route] = None) -> TOK: ...
+    def scan(
+        self,
+        cursor: ClusterScanCursor,
+        match: Optional[TEncodable] = None,
+        count: Optional[int] = None,
+        type: Optional[ObjectType] = None,
+        allow_non_covered_slots: bool = False,
+    ) -> List[Union[ClusterScanCursor, List[bytes]]]: ...
+    def scan_parallel(
+        self,
+        match: Optional[TEncodable] = None,
+        count: Optional[int] = None,
+        type: Optional[ObjectType] = None,
+        allow_non_covered_slots: bool = False,
+        parallelism: Optional[int] = None,
+        cursors: Optional[List[ShardScanCursor]] = None,
+    ) -> Generator[bytes, None, None]: ...
+    def script_exists(
+        self, sha1s: List[TEncodable], route: Optional[Route] = None
+    ) -> TClusterResponse[List[bool]]: ...
+    def script_flush(
+        self, mode: Optional[FlushMode] = None, route: Optional[Route] = None
+    ) -> TOK: ...
+    def script_kill(self, route: Optional[Route] = None) -> TOK: ...
+    def invoke_script(
+        self,
+        script: Script,
+        keys: Optional[List[TEncodable]] = None,
+        args: Optional[List[TEncodable]] = None,
+    ) -> TClusterResponse[TResult]: ...
+    def invoke_script_route(
+        self,
+        script: Script,
+        args: Optional[List[TEncodable]] = None,
+        route: Optional[Route] = None,
+    ) -> TClusterResponse[TResult]: ...
+
+class GlideSyncClient(BaseSyncClient):
+    def custom_command(self, command_args: List[TEncodable]) -> TResult: ...
+    def info(self, sections: Optional[List[InfoSection]] = None) -> bytes: ...
+    def exec(self, transaction: Transaction) -> Optional[List[TResult]]: ...
+    def exec_batch(self, batch: Batch) -> List[Union[TResult, RequestError]]: ...
+    def select(self, index: int) -> TOK: ...
+    def config_resetstat(self) -> TOK: ...
+    def config_rewrite(self) -> TOK: ...
+    def client_id(self) -> int: ...
+    def ping(self, message: Optional[TEncodable] = None) -> bytes: ...
+    def config_get(self, parameters: List[TEncodable]) -> Dict[bytes, bytes]: ...
+    def config_set(self, parameters_map: Mapping[TEncodable, TEncodable]) -> TOK: ...
+    def client_getname(self) -> Optional[bytes]: ...
+    def dbsize(self) -> int: ...
+    def echo(self, message: TEncodable) -> bytes: ...
+    def function_load(
+        self, library_code: TEncodable, replace: bool = False
+    ) -> bytes: ...
+    def function_list(
+        self, library_name_pattern: Optional[TEncodable] = None, with_code: bool = False
+    ) -> TFunctionListResponse: ...
+    def function_flush(self, mode: Optional[FlushMode] = None) -> TOK: ...
+    def function_delete(self, library_name: TEncodable) -> TOK: ...
+    def function_kill(self) -> TOK: ...
+    def function_stats(self) -> TFunctionStatsFullResponse: ...
+    def function_dump(self) -> bytes: ...
+    def function_restore(
+        self, payload: TEncodable, policy: Optional[FunctionRestorePolicy] = None
+    ) -> TOK: ...
+    def time(self) -> List[bytes]: ...
+    def lastsave(self) -> int: ...
+    def move(self, key: TEncodable, db_index: int) -> bool: ...
+    def publish(self, message: TEncodable, channel: TEncodable) -> int: ...
+    def flushall(self, flush_mode: Optional[FlushMode] = None) -> TOK: ...
+    def flushdb(self, flush_mode: Optional[FlushMode] = None) -> TOK: ...
+    def copy(
+        self,
+        source: TEncodable,
+        destination: TEncodable,
+        destinationDB: Optional[int] = None,
+        replace: Optional[bool] = None,
+    ) -> bool: ...
+    def lolwut(
+        self, version: Optional[int] = None, parameters: Optional[List[int]] = None
+    ) -> bytes: ...
+    def random_key(self) -> Optional[bytes]: ...
+    def wait(self, numreplicas: int, timeout: int) -> int: ...
+    def unwatch(self) -> TOK: ...
+    def scan(
+        self,
+        cursor: TEncodable,
+        match: Optional[TEncodable] = None,
+        count: Optional[int] = None,
+        type: Optional[ObjectType] = None,
+    ) -> List[Union[bytes, List[bytes]]]: ...
+    def scan_iter(
+        self,
+        match: Optional[TEncodable] = None,
+        count: Optional[int] = None,
+        type: Optional[ObjectType] = None,
+        batched: bool = False,
+    ) -> Generator[Union[bytes, List[bytes]], None, None]: ...
+    def script_exists(self, sha1s: List[TEncodable]) -> List[bool]: ...
+    def script_flush(self, mode: Optional[FlushMode] = None) -> TOK: ...
+    def script_kill(self) -> TOK: ...
+    def invoke_script(
+        self,
+        script: Script,
+        keys: Optional[List[TEncodable]] = None,
+        args: Optional[List[TEncodable]] = None,
+    ) -> TResult: ...
+
+TGlideSyncClient = Union[GlideSyncClient, GlideSyncClusterClient]
@@ -0,0 +1,90 @@
+# Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
+
+import asyncio
+import threading
+from typing import Any, Iterator, List, Optional
+
+
+class InflightRequests:
+    """
+    An array-backed table of the requests that are waiting for a response, indexed by their callback index.
+
+    Free callback indexes are kept on a stack, so allocating and releasing an index are O(1). An index is pushed
+    back to the stack only when its slot is released, and only an occupied slot can be released, so an index is
+    never handed out while a request that uses it is still in flight.
+    When all of the slots are taken, the table doubles its capacity.
+    Every slot can also hold the options the response of its request should be converted with.
+    The table is thread-safe, requests can be allocated and released from any thread or event loop.
+
+    Args:
+        capacity (int): The initial number of slots. Should match the client's inflight requests limit, so the
+            table doesn't need to grow under the expected load.
+    """
+
+    def __init__(self, capacity: int):
+        capacity = max(capacity, 1)
+        self._futures: List[Optional[asyncio.Future]] = [None] * capacity
+        self._response_options: List[Any] = [None] * capacity
+        # Reversed, so the lowest indexes are handed out first
+        self._free_indexes: List[int] = list(range(capacity - 1, -1, -1))
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._futures) - len(self._free_indexes)
+
+    def __contains__(self, callback_idx: int) -> bool:
+        return self.get(callback_idx) is not None
+
+    def capacity(self) -> int:
+        return len(self._futures)
+
+    def allocate(self, future: asyncio.Future, response_options: Any = None) -> int:
+        """
+        Stores the future, and the options its response should be converted with, in a free slot.
+
+        Returns:
+            int: The callback index of the slot.
+        """
+        with self._lock:
+            if not self._free_indexes:
+                self._grow()
+            callback_idx = self._free_indexes.pop()
+            self._futures[callback_idx] = future
+            self._response_options[callback_idx] = response_options
+        return callback_idx
+
+    def get(self, callback_idx: int) -> Optional[asyncio.Future]:
+        if 0 <= callback_idx < len(self._futures):
+            return self._futures[callback_idx]
+        return None
+
+    def get_response_options(self, callback_idx: int) -> Any:
+        if 0 <= callback_idx < len(self._response_options):
+            return self._response_options[callback_idx]
+        return None
+
+    def release(self, callback_idx: int) -> Optional[asyncio.Future]:
+        """
+        Frees the slot of the given callback index.
+
+        Returns:
+            Optional[asyncio.Future]: The future that was stored in the slot, or None if the slot wasn't in use.
+        """
+        with self._lock:
+            future = self.get(callback_idx)
+            if future is not None:
+                self._futures[callback_idx] = None
+                self._response_options[callback_idx] = None
+                self._free_indexes.append(callback_idx)
+        return future
+
+    def futures(self) -> Iterator[asyncio.Future]:
+        with self._lock:
+            futures = [future for future in self._futures if future is not None]
+        return iter(futures)
+
+    def _grow(self) -> None:
+        old_capacity = len(self._futures)
+        self._futures.extend([None] * old_capacity)
+        self._response_options.extend([None] * old_capacity)
+        self._free_indexes.extend(range(2 * old_capacity - 1, old_capacity - 1, -1))
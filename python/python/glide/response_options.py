@@ -0,0 +1,176 @@
+# Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Any, Dict, FrozenSet, Iterator, Optional, Sequence, Tuple
+
+from glide.protobuf.command_request_pb2 import RequestType
+
+from .glide import (
+    RESULT_ADAPTER_NONE,
+    RESULT_ADAPTER_PAIRS,
+    RESULT_ADAPTER_PARALLEL_ARRAYS,
+    RESULT_ADAPTER_ROWS,
+)
+
+# The arguments passed to `value_from_pointer` after the pointer:
+# (buffer_min_size, lazy_min_length, decode, adapter)
+TResponseOptions = Tuple[Optional[int], Optional[int], bool, int]
+
+
+class ResultAdapter(IntEnum):
+    """
+    Changes the shape of a command's result. The result is built in the shape directly, while the response is
+    converted into Python objects, so the intermediate containers of the default result aren't created.
+    """
+
+    NONE = RESULT_ADAPTER_NONE
+    """
+    The default result.
+    """
+    PAIRS = RESULT_ADAPTER_PAIRS
+    """
+    A map result, such as the result of `hgetall` or `zrange_withscores`, is returned as a list of
+    `(key, value)` tuples instead of a dictionary.
+    """
+    PARALLEL_ARRAYS = RESULT_ADAPTER_PARALLEL_ARRAYS
+    """
+    A map result is returned as a `(keys, values)` tuple of two lists instead of a dictionary.
+    For example, the result of `zrange_withscores` is returned as a list of members and a list of their scores.
+    """
+    ROWS = RESULT_ADAPTER_ROWS
+    """
+    A map of maps, such as the documents in the result of `ft.search`, is returned as a list of
+    `(key, field1, value1, field2, value2, ...)` rows.
+    """
+
+
+_MAP_ADAPTERS = frozenset({ResultAdapter.PAIRS, ResultAdapter.PARALLEL_ARRAYS})
+
+_result_adapters: Dict[int, FrozenSet[ResultAdapter]] = {
+    RequestType.HGetAll: _MAP_ADAPTERS,
+    RequestType.ConfigGet: _MAP_ADAPTERS,
+    RequestType.ZRange: _MAP_ADAPTERS,
+    RequestType.ZPopMin: _MAP_ADAPTERS,
+    RequestType.ZPopMax: _MAP_ADAPTERS,
+    RequestType.ZDiff: _MAP_ADAPTERS,
+    RequestType.ZInter: _MAP_ADAPTERS,
+    RequestType.ZUnion: _MAP_ADAPTERS,
+    RequestType.XRange: _MAP_ADAPTERS,
+    RequestType.XRevRange: _MAP_ADAPTERS,
+    RequestType.FtSearch: frozenset({ResultAdapter.ROWS}),
+}
+
+# Module commands are sent as custom commands, their request type is found by their name
+_custom_command_request_types: Dict[bytes, int] = {
+    b"FT.SEARCH": RequestType.FtSearch,
+}
+
+_result_adapter_override: ContextVar[ResultAdapter] = ContextVar(
+    "glide_result_adapter", default=ResultAdapter.NONE
+)
+_decode_responses_override: ContextVar[Optional[bool]] = ContextVar(
+    "glide_decode_responses", default=None
+)
+
+
+def register_result_adapter(
+    request_type: RequestType.ValueType, adapter: ResultAdapter
+) -> None:
+    """
+    Allows `adapter` to be used with the commands of `request_type`.
+
+    Adapters change the shape of a response regardless of the command that returned it, so an adapter can be
+    registered for any command whose result has the shape the adapter expects.
+    """
+    _result_adapters[request_type] = _result_adapters.get(request_type, frozenset()) | {
+        adapter
+    }
+
+
+@contextmanager
+def result_adapter(adapter: ResultAdapter) -> Iterator[None]:
+    """
+    Converts the results of the commands issued inside the block with `adapter`.
+
+    The adapter is applied only to the commands it is registered for, see `register_result_adapter`. The results
+    of other commands are returned as usual.
+
+    Adapted results don't match the return types declared by the command methods, so type checkers need them to be
+    cast to the adapted shape, e.g. `cast(List[Tuple[bytes, bytes]], await client.hgetall("my_hash"))`.
+
+    Example:
+        >>> with result_adapter(ResultAdapter.PARALLEL_ARRAYS):
+        ...     await client.zrange_withscores("my_sorted_set", RangeByIndex(0, -1))
+        ([b'member1', b'member2'], [10.5, 20.0])
+        >>> with result_adapter(ResultAdapter.PAIRS):
+        ...     await client.hgetall("my_hash")
+        [(b'field1', b'value1'), (b'field2', b'value2')]
+    """
+    token = _result_adapter_override.set(adapter)
+    try:
+        yield
+    finally:
+        _result_adapter_override.reset(token)
+
+
+@contextmanager
+def decoded_responses(enabled: bool = True) -> Iterator[None]:
+    """
+    Overrides the client's `decode_responses` setting for the requests issued inside the block.
+
+    Strings in the responses of these requests are returned as `str` instead of `bytes` when `enabled` is True,
+    and as `bytes` when it is False. Strings that aren't valid UTF-8 are always returned as `bytes`.
+
+    The setting is taken when a request is issued, so it applies to tasks created inside the block as well, and
+    doesn't change for requests that were issued before the block.
+
+    Example:
+        >>> with decoded_responses():
+        ...     await client.mget(["key1", "key2"])
+        ['value1', 'value2']
+        >>> await client.mget(["key1", "key2"])
+        [b'value1', b'value2']
+    """
+    token = _decode_responses_override.set(enabled)
+    try:
+        yield
+    finally:
+        _decode_responses_override.reset(token)
+
+
+def _get_adapter(request_type: Optional[int], args: Sequence[Any]) -> ResultAdapter:
+    adapter = _result_adapter_override.get()
+    if adapter == ResultAdapter.NONE or request_type is None:
+        return ResultAdapter.NONE
+    if request_type == RequestType.CustomCommand and args:
+        name = args[0]
+        name = name.encode() if isinstance(name, str) else bytes(name)
+        request_type = _custom_command_request_types.get(name.upper())
+    if adapter not in _result_adapters.get(request_type, frozenset()):  # type: ignore
+        return ResultAdapter.NONE
+    return adapter
+
+
+def _get_response_options(
+    default: TResponseOptions,
+    request_type: Optional[int] = None,
+    args: Sequence[Any] = (),
+) -> Optional[TResponseOptions]:
+    """
+    Returns the response options of a request issued in the current context, or None if the client's default
+    options apply.
+
+    Result adapters apply only to commands, so `request_type` should be given only for them.
+    """
+    decode = _decode_responses_override.get()
+    adapter = _get_adapter(request_type, args)
+    if (decode is None or decode == default[2]) and adapter == ResultAdapter.NONE:
+        return None
+    return (
+        default[0],
+        default[1],
+        default[2] if decode is None else decode,
+        adapter,
+    )
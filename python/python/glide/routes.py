@@ -4,7 +4,7 @@ from enum import Enum
 from typing import Optional
 
 from glide.exceptions import RequestError
-from glide.protobuf.command_request_pb2 import CommandRequest, SimpleRoutes
+from glide.protobuf.command_request_pb2 import CommandRequest, Routes, SimpleRoutes
 from glide.protobuf.command_request_pb2 import SlotTypes as ProtoSlotTypes
 
 
@@ -95,20 +95,35 @@ def to_protobuf_slot_type(slot_type: SlotType) -> ProtoSlotTypes.ValueType:
 def set_protobuf_route(request: CommandRequest, route: Optional[Route]) -> None:
     if route is None:
         return
-    elif isinstance(route, AllNodes):
-        request.route.simple_routes = SimpleRoutes.AllNodes
+    _set_protobuf_routes(request.route, route)
+
+
+def serialize_protobuf_route(route: Optional[Route]) -> Optional[bytes]:
+    """
+    Serializes the route into a protobuf `Routes` message, as expected by the native client.
+    """
+    if route is None:
+        return None
+    routes = Routes()
+    _set_protobuf_routes(routes, route)
+    return routes.SerializeToString()
+
+
+def _set_protobuf_routes(routes: Routes, route: Route) -> None:
+    if isinstance(route, AllNodes):
+        routes.simple_routes = SimpleRoutes.AllNodes
     elif isinstance(route, AllPrimaries):
-        request.route.simple_routes = SimpleRoutes.AllPrimaries
+        routes.simple_routes = SimpleRoutes.AllPrimaries
     elif isinstance(route, RandomNode):
-        request.route.simple_routes = SimpleRoutes.Random
+        routes.simple_routes = SimpleRoutes.Random
     elif isinstance(route, SlotKeyRoute):
-        request.route.slot_key_route.slot_type = to_protobuf_slot_type(route.slot_type)
-        request.route.slot_key_route.slot_key = route.slot_key
+        routes.slot_key_route.slot_type = to_protobuf_slot_type(route.slot_type)
+        routes.slot_key_route.slot_key = route.slot_key
     elif isinstance(route, SlotIdRoute):
-        request.route.slot_id_route.slot_type = to_protobuf_slot_type(route.slot_type)
-        request.route.slot_id_route.slot_id = route.slot_id
+        routes.slot_id_route.slot_type = to_protobuf_slot_type(route.slot_type)
+        routes.slot_id_route.slot_id = route.slot_id
     elif isinstance(route, ByAddressRoute):
-        request.route.by_address_route.host = route.host
-        request.route.by_address_route.port = route.port
+        routes.by_address_route.host = route.host
+        routes.by_address_route.port = route.port
     else:
         raise RequestError(f"Received invalid route type: {type(route)}")
@@ -0,0 +1,164 @@
+# Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
+
+import asyncio
+from typing import Any, Callable, Dict, FrozenSet, Hashable, List, Optional, Sequence
+
+from glide.constants import TEncodableValue
+from glide.protobuf.command_request_pb2 import RequestType
+from glide.response_options import TResponseOptions, _get_response_options
+from glide.routes import Route, serialize_protobuf_route
+
+# The commands that only read keys, so identical commands that are in flight at the same time get the same response
+_READ_COMMANDS: FrozenSet[int] = frozenset(
+    {
+        RequestType.Get,
+        RequestType.MGet,
+        RequestType.Strlen,
+        RequestType.GetRange,
+        RequestType.HGet,
+        RequestType.HMGet,
+        RequestType.HGetAll,
+        RequestType.HKeys,
+        RequestType.HVals,
+        RequestType.HLen,
+        RequestType.HExists,
+        RequestType.HStrlen,
+        RequestType.SMembers,
+        RequestType.SIsMember,
+        RequestType.SMIsMember,
+        RequestType.SCard,
+        RequestType.LRange,
+        RequestType.LLen,
+        RequestType.LIndex,
+        RequestType.ZRange,
+        RequestType.ZScore,
+        RequestType.ZMScore,
+        RequestType.ZCard,
+        RequestType.ZRank,
+        RequestType.Exists,
+        RequestType.TTL,
+        RequestType.PTTL,
+        RequestType.Type,
+        RequestType.XRange,
+        RequestType.XRevRange,
+    }
+)
+
+# Read commands of the server modules, which are sent as custom commands
+_CUSTOM_READ_COMMANDS: FrozenSet[bytes] = frozenset({b"JSON.GET"})
+
+
+def _copy(value: Any) -> Any:
+    # Containers are copied recursively, other objects, such as strings and numbers, are immutable
+    if isinstance(value, dict):
+        return {
+            _copy(field): _copy(field_value) for field, field_value in value.items()
+        }
+    if isinstance(value, list):
+        return [_copy(element) for element in value]
+    if isinstance(value, set):
+        return {_copy(element) for element in value}
+    if isinstance(value, tuple):
+        return tuple(_copy(element) for element in value)
+    return value
+
+
+class _Flight:
+    """
+    A command that is in flight, with the futures of the callers that wait for its response.
+    """
+
+    def __init__(self) -> None:
+        self.waiters: List[asyncio.Future] = []
+
+
+class SingleFlight:
+    """
+    Deduplicates identical read commands that a client is called with concurrently.
+
+    A read command that is called on an event loop while an identical command, with the same request type, arguments,
+    route and response options, is in flight on that loop isn't sent. It waits for the response of the command in
+    flight instead, so any number of concurrent callers cost a single round trip and a single conversion of the
+    response. A caller that is cancelled doesn't cancel the command of the other callers.
+
+    Only commands whose arguments are strings or bytes are deduplicated. Commands called outside of an asyncio event
+    loop are sent as is.
+
+    Args:
+        copy_results (bool): If True, each caller gets its own copy of the lists, dictionaries, sets and tuples of the
+            result, so callers may modify their results. Otherwise, all of the callers get the same objects.
+    """
+
+    def __init__(self, copy_results: bool):
+        self._copy_results = copy_results
+        self._flights: Dict[Hashable, _Flight] = {}
+
+    def submit(
+        self,
+        request_type: RequestType.ValueType,
+        args: Sequence[TEncodableValue],
+        route: Optional[Route],
+        response_options: TResponseOptions,
+        send: Callable[[], asyncio.Future],
+    ) -> Optional[asyncio.Future]:
+        """
+        Joins the identical command that is in flight on the running event loop, or sends the command with `send`.
+
+        Returns:
+            Optional[asyncio.Future]: The future of the command's result, or None if the command can't be
+                deduplicated and should be sent as is.
+        """
+        if not self._can_deduplicate(request_type, args):
+            return None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Called from a Trio run
+            return None
+        flight_key = (
+            loop,
+            request_type,
+            tuple(args),
+            serialize_protobuf_route(route),
+            _get_response_options(response_options, request_type, args),
+        )
+        flight = self._flights.get(flight_key)
+        if flight is None:
+            response_future = send()
+            flight = _Flight()
+            self._flights[flight_key] = flight
+            response_future.add_done_callback(
+                lambda response_future: self._land(flight_key, response_future)
+            )
+        waiter = loop.create_future()
+        flight.waiters.append(waiter)
+        return waiter
+
+    def _can_deduplicate(
+        self, request_type: RequestType.ValueType, args: Sequence[TEncodableValue]
+    ) -> bool:
+        if not all(isinstance(arg, (str, bytes)) for arg in args):
+            return False
+        if request_type == RequestType.CustomCommand:
+            if not args:
+                return False
+            name = args[0].encode() if isinstance(args[0], str) else bytes(args[0])
+            return name.upper() in _CUSTOM_READ_COMMANDS
+        return request_type in _READ_COMMANDS
+
+    def _land(self, flight_key: Hashable, response_future: asyncio.Future) -> None:
+        flight = self._flights.pop(flight_key)
+        if response_future.cancelled():
+            exception: Optional[BaseException] = asyncio.CancelledError()
+        else:
+            exception = response_future.exception()
+        if exception is not None:
+            for waiter in flight.waiters:
+                if not waiter.done():
+                    waiter.set_exception(exception)
+            return
+        result = response_future.result()
+        for i, waiter in enumerate(flight.waiters):
+            if not waiter.done():
+                # The first caller gets the result itself
+                waiter.set_result(_copy(result) if self._copy_results and i else result)
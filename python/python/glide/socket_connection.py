@@ -0,0 +1,261 @@
+# Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
+
+import asyncio
+import sys
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from glide.constants import TRequest
+from glide.protobuf.command_request_pb2 import CommandRequest
+from glide.uds_connection import TResponse, UdsConnection
+
+from .glide import (
+    DEFAULT_TIMEOUT_IN_MILLISECONDS,
+    RESPONSE_KIND_PUSH,
+    RESPONSE_KIND_VALUE,
+    encode_requests,
+    value_from_pointer,
+)
+
+if TYPE_CHECKING:
+    from glide.glide_client import BaseClient
+
+if sys.version_info >= (3, 11):
+    import asyncio as async_timeout
+else:
+    import async_timeout
+
+# The write coalescing window in seconds, and the number of buffered requests that ends it early
+TWriteCoalescing = Tuple[Optional[float], Optional[int]]
+
+# The shared connections of this process, by their event loop and write coalescing settings
+_shared_connections: Dict[
+    Tuple[asyncio.AbstractEventLoop, Optional[float], Optional[int]],
+    "SocketConnection",
+] = {}
+
+
+class SocketConnection:
+    """
+    A connection to the socket listener, used by one or more clients.
+
+    The connection owns the Unix domain socket, the protocol that reads and decodes its responses, and the single task
+    that writes the buffered requests. Requests carry the id of their client, which the socket listener echoes in
+    their responses, so the responses are dispatched to the client they belong to.
+
+    The first client of a connection, client 0, is created in the socket listener by the `ConnectionRequest` that
+    starts the stream, and the socket listener closes the stream if it fails to connect. That's why the other clients
+    of a shared connection are added only once client 0 is connected, by a `CommandRequest` that carries their
+    connection request. The stream is closed when its last client is removed.
+
+    Args:
+        loop (asyncio.AbstractEventLoop): The event loop the connection is used on.
+        write_coalescing (TWriteCoalescing): The write coalescing settings of the clients of the connection.
+        shared (bool): Whether the connection is returned by `get_shared` to other clients.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        write_coalescing: TWriteCoalescing,
+        shared: bool = False,
+    ):
+        self._loop = loop
+        self._shared = shared
+        self._write_coalescing_window, self._write_coalescing_max_requests = (
+            write_coalescing
+        )
+        self._clients: Dict[int, "BaseClient"] = {}
+        self._next_client_id = 0
+        self._first_client_connected: asyncio.Future = loop.create_future()
+        self._is_closed = False
+        self._open_task: Optional[asyncio.Future] = None
+        self._connection: Optional[UdsConnection] = None
+        self._buffered_requests: List[TRequest] = list()
+        self._write_event = asyncio.Event()
+        self._writer_task: Optional[asyncio.Task] = None
+        self._flush_waiter: Optional[asyncio.Future] = None
+
+    @classmethod
+    def get_shared(
+        cls, loop: asyncio.AbstractEventLoop, write_coalescing: TWriteCoalescing
+    ) -> "SocketConnection":
+        """
+        Returns the shared connection of the event loop and the write coalescing settings, creating it if needed.
+        """
+        key = (loop, *write_coalescing)
+        connection = _shared_connections.get(key)
+        if connection is None:
+            connection = cls(loop, write_coalescing, shared=True)
+            _shared_connections[key] = connection
+        return connection
+
+    def is_closed(self) -> bool:
+        return self._is_closed
+
+    async def open(self, socket_path: str) -> None:
+        """
+        Connects to the socket listener. Clients that share the connection wait for the same socket.
+        """
+        if self._open_task is None:
+            self._open_task = asyncio.ensure_future(self._open(socket_path))
+        await asyncio.shield(self._open_task)
+
+    async def _open(self, socket_path: str) -> None:
+        try:
+            async with async_timeout.timeout(DEFAULT_TIMEOUT_IN_MILLISECONDS):
+                _, self._connection = await self._loop.create_unix_connection(
+                    lambda: UdsConnection(
+                        self._process_responses, self._on_connection_lost
+                    ),
+                    path=socket_path,
+                )
+        except Exception:
+            self._close()
+            raise
+        # Start the writer loop as a background task
+        self._writer_task = asyncio.create_task(self._writer_loop())
+
+    async def add_client(self, client: "BaseClient") -> Optional[int]:
+        """
+        Adds a client to the connection. A client other than the first waits until the first client is connected.
+
+        Returns:
+            Optional[int]: The client id, or None if the connection was closed before the client could be added.
+        """
+        client_id = self._next_client_id
+        self._next_client_id += 1
+        if client_id != 0 and not await asyncio.shield(self._first_client_connected):
+            return None
+        if self._is_closed:
+            return None
+        self._clients[client_id] = client
+        return client_id
+
+    def client_connected(self, client_id: int) -> None:
+        if client_id == 0 and not self._first_client_connected.done():
+            self._first_client_connected.set_result(True)
+
+    def remove_client(self, client_id: int) -> None:
+        """
+        Removes a client from the connection. The socket listener releases the client, and the socket is closed once
+        the connection has no clients left.
+        """
+        if self._clients.pop(client_id, None) is None:
+            return
+        if not self._clients:
+            self._close()
+        elif not self._is_closed:
+            request = CommandRequest()
+            request.client_id = client_id
+            request.close_client.SetInParent()
+            self.buffer_request(request)
+
+    async def wait_closed(self) -> None:
+        if self._connection is not None:
+            await self._connection.wait_closed()
+
+    def _close(self) -> None:
+        self._is_closed = True
+        if self._shared:
+            key = (
+                self._loop,
+                self._write_coalescing_window,
+                self._write_coalescing_max_requests,
+            )
+            if _shared_connections.get(key) is self:
+                del _shared_connections[key]
+        if not self._first_client_connected.done():
+            self._first_client_connected.set_result(False)
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+        if self._connection is not None:
+            self._connection.close()
+
+    def _process_responses(self, client_id: int, responses: List[TResponse]) -> None:
+        client = self._clients.get(client_id)
+        if client is not None:
+            client._process_responses(responses)
+            return
+        # The client was removed while its requests were in flight, their values must still be released
+        for _, kind, payload in responses:
+            if kind == RESPONSE_KIND_VALUE or kind == RESPONSE_KIND_PUSH:
+                value_from_pointer(payload)
+
+    def _on_connection_lost(self, exc: Optional[Exception]) -> None:
+        clients = list(self._clients.values())
+        self._close()
+        for client in clients:
+            client._on_connection_lost(exc)
+
+    def buffer_request(self, request: TRequest) -> None:
+        self._buffered_requests.append(request)
+        self._write_event.set()
+        if (
+            self._flush_waiter is not None
+            and self._write_coalescing_max_requests is not None
+            and len(self._buffered_requests) >= self._write_coalescing_max_requests
+            and not self._flush_waiter.done()
+        ):
+            self._flush_waiter.set_result(None)
+
+    async def _writer_loop(self) -> None:
+        # The single writer of the socket, woken up whenever requests are buffered
+        try:
+            while True:
+                await self._write_event.wait()
+                self._write_event.clear()
+                if self._write_coalescing_window is not None:
+                    await self._wait_for_write_coalescing(self._write_coalescing_window)
+                while len(self._buffered_requests) > 0:
+                    await self._write_buffered_requests_to_socket()
+        except ConnectionResetError:
+            # The connection was lost, its clients are being closed
+            pass
+
+    async def _wait_for_write_coalescing(self, window: float) -> None:
+        """
+        Waits until the coalescing window elapses, or until enough requests are buffered.
+        """
+        if (
+            self._write_coalescing_max_requests is not None
+            and len(self._buffered_requests) >= self._write_coalescing_max_requests
+        ):
+            return
+        self._flush_waiter = self._loop.create_future()
+        timer = self._loop.call_later(window, self._end_write_coalescing)
+        try:
+            await self._flush_waiter
+        finally:
+            timer.cancel()
+            self._flush_waiter = None
+
+    def _end_write_coalescing(self) -> None:
+        if self._flush_waiter is not None and not self._flush_waiter.done():
+            self._flush_waiter.set_result(None)
+
+    async def _write_buffered_requests_to_socket(self) -> None:
+        requests = self._buffered_requests
+        self._buffered_requests = list()
+        assert self._connection is not None
+        try:
+            encoded_requests = encode_requests(requests)
+        except Exception:
+            # Encode the requests one by one, so only the ones that can't be encoded fail
+            encoded_requests = bytearray()
+            for request in requests:
+                try:
+                    encoded_requests += encode_requests([request])
+                except Exception as e:
+                    self._fail_request(request, e)
+        self._connection.write(encoded_requests)
+        await self._connection.drain()
+
+    def _fail_request(self, request: TRequest, exception: Exception) -> None:
+        client_id = (
+            request[4]
+            if isinstance(request, tuple)
+            else getattr(request, "client_id", 0)
+        )
+        client = self._clients.get(client_id)
+        if client is not None:
+            client._fail_request(request, exception)
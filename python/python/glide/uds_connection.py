@@ -0,0 +1,113 @@
+# Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
+
+import asyncio
+from typing import Any, Callable, List, Optional, Tuple
+
+from glide.constants import DEFAULT_READ_BYTES_SIZE
+
+from .glide import decode_responses
+
+TResponse = Tuple[int, int, Any]
+
+
+class UdsConnection(asyncio.BufferedProtocol):
+    """
+    Protocol of the Unix domain socket connection to the socket listener.
+
+    Incoming bytes are read straight into a preallocated buffer and complete response frames are decoded in place.
+    Only the bytes of a partially received frame are moved, to the start of the buffer, and the buffer grows only
+    when a single frame takes most of it.
+
+    Args:
+        on_responses (Callable[[int, List[TResponse]], None]): Called with a client id and the `(callback_idx, kind,
+            payload)` tuples of every batch of decoded responses of that client.
+        on_connection_lost (Callable[[Optional[Exception]], None]): Called once the connection is closed.
+        buffer_size (int): The initial size of the read buffer.
+    """
+
+    def __init__(
+        self,
+        on_responses: Callable[[int, List[TResponse]], None],
+        on_connection_lost: Callable[[Optional[Exception]], None],
+        buffer_size: int = DEFAULT_READ_BYTES_SIZE,
+    ):
+        self._on_responses = on_responses
+        self._on_connection_lost = on_connection_lost
+        self._buffer = bytearray(buffer_size)
+        self._buffer_view = memoryview(self._buffer)
+        # The received bytes that weren't decoded yet are self._buffer[self._start : self._end]
+        self._start = 0
+        self._end = 0
+        self._transport: Optional[asyncio.Transport] = None
+        self._can_write = asyncio.Event()
+        self._can_write.set()
+        self._closed: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self._transport = transport  # type: ignore
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        if len(self._buffer) - self._end < len(self._buffer) // 4:
+            self._make_room()
+        return self._buffer_view[self._end :]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        self._end += nbytes
+        client_responses, leftover_bytes = decode_responses(
+            self._buffer_view[self._start : self._end]
+        )
+        self._start = self._end - leftover_bytes
+        if self._start == self._end:
+            self._start = self._end = 0
+        for client_id, responses in client_responses:
+            self._on_responses(client_id, responses)
+
+    def eof_received(self) -> bool:
+        # Returning False lets the transport close itself
+        return False
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        # Wake up writers waiting on drain, they will find the connection closed
+        self._can_write.set()
+        if not self._closed.done():
+            self._closed.set_result(None)
+        self._on_connection_lost(exc)
+
+    def pause_writing(self) -> None:
+        self._can_write.clear()
+
+    def resume_writing(self) -> None:
+        self._can_write.set()
+
+    def write(self, data: Any) -> None:
+        assert self._transport is not None
+        self._transport.write(data)
+
+    async def drain(self) -> None:
+        """
+        Waits until the transport's write buffer drops below its high-water mark.
+        """
+        if self._closed.done():
+            raise ConnectionResetError("Connection lost")
+        await self._can_write.wait()
+
+    def close(self) -> None:
+        if self._transport is not None:
+            self._transport.close()
+
+    async def wait_closed(self) -> None:
+        await self._closed
+
+    def _make_room(self) -> None:
+        pending = self._end - self._start
+        if pending >= len(self._buffer) // 2:
+            # A single frame takes most of the buffer, grow it so reading the rest of the frame
+            # doesn't copy the received part over and over again
+            buffer = bytearray(len(self._buffer) * 2)
+            buffer[:pending] = self._buffer_view[self._start : self._end]
+            self._buffer = buffer
+            self._buffer_view = memoryview(buffer)
+        else:
+            self._buffer_view[:pending] = self._buffer_view[self._start : self._end]
+        self._start = 0
+        self._end = pending
@@ -8,6 +8,8 @@ from glide.config import (
     AdvancedGlideClientConfiguration,
     AdvancedGlideClusterClientConfiguration,
     BackoffStrategy,
+    ClientCacheConfiguration,
+    ClientTransport,
     GlideClientConfiguration,
     GlideClusterClientConfiguration,
     NodeAddress,
@@ -17,6 +19,11 @@ from glide.config import (
 )
 from glide.exceptions import ClosingError
 from glide.glide_client import GlideClient, GlideClusterClient, TGlideClient
+from glide.glide_sync_client import (
+    GlideSyncClient,
+    GlideSyncClusterClient,
+    TGlideSyncClient,
+)
 from glide.logger import Level as logLevel
 from glide.logger import Logger
 from glide.routes import AllNodes
@@ -224,6 +231,19 @@ async def glide_client(
     await client.close()
 
 
+@pytest.fixture(scope="function")
+async def glide_sync_client(
+    request,
+    cluster_mode: bool,
+    protocol: ProtocolVersion,
+) -> AsyncGenerator[TGlideSyncClient, None]:
+    "Get synchronous client for tests"
+    client = create_sync_client(request, cluster_mode, protocol=protocol)
+    yield client
+    await test_teardown(request, cluster_mode, protocol)
+    client.close()
+
+
 @pytest.fixture(scope="function")
 async def management_client(
     request,
@@ -258,6 +278,20 @@ async def create_client(
     client_az: Optional[str] = None,
     reconnect_strategy: Optional[BackoffStrategy] = None,
     valkey_cluster: Optional[ValkeyCluster] = None,
+    transport: ClientTransport = ClientTransport.SOCKET,
+    write_coalescing_window_us: Optional[int] = None,
+    write_coalescing_max_requests: Optional[int] = None,
+    zero_copy_response_min_size: Optional[int] = None,
+    lazy_response_min_length: Optional[int] = None,
+    decode_responses: bool = False,
+    share_socket_connection: bool = False,
+    lazy_connect: bool = False,
+    auto_batch_window_us: Optional[int] = None,
+    auto_batch_max_commands: Optional[int] = None,
+    auto_batch_type_errors: bool = False,
+    client_cache: Optional[ClientCacheConfiguration] = None,
+    deduplicate_reads: bool = False,
+    copy_deduplicated_results: bool = True,
 ) -> Union[GlideClient, GlideClusterClient]:
     # Create async socket client
     use_tls = request.config.getoption("--tls")
@@ -278,7 +312,23 @@ async def create_client(
             inflight_requests_limit=inflight_requests_limit,
             read_from=read_from,
             client_az=client_az,
-            advanced_config=AdvancedGlideClusterClientConfiguration(connection_timeout),
+            advanced_config=AdvancedGlideClusterClientConfiguration(
+                connection_timeout=connection_timeout,
+                transport=transport,
+                write_coalescing_window_us=write_coalescing_window_us,
+                write_coalescing_max_requests=write_coalescing_max_requests,
+                zero_copy_response_min_size=zero_copy_response_min_size,
+                lazy_response_min_length=lazy_response_min_length,
+                decode_responses=decode_responses,
+                share_socket_connection=share_socket_connection,
+                lazy_connect=lazy_connect,
+                auto_batch_window_us=auto_batch_window_us,
+                auto_batch_max_commands=auto_batch_max_commands,
+                auto_batch_type_errors=auto_batch_type_errors,
+                client_cache=client_cache,
+                deduplicate_reads=deduplicate_reads,
+                copy_deduplicated_results=copy_deduplicated_results,
+            ),
         )
         return await GlideClusterClient.create(cluster_config)
     else:
@@ -297,12 +347,65 @@ async def create_client(
             inflight_requests_limit=inflight_requests_limit,
             read_from=read_from,
             client_az=client_az,
-            advanced_config=AdvancedGlideClientConfiguration(connection_timeout),
+            advanced_config=AdvancedGlideClientConfiguration(
+                connection_timeout=connection_timeout,
+                transport=transport,
+                write_coalescing_window_us=write_coalescing_window_us,
+                write_coalescing_max_requests=write_coalescing_max_requests,
+                zero_copy_response_min_size=zero_copy_response_min_size,
+                lazy_response_min_length=lazy_response_min_length,
+                decode_responses=decode_responses,
+                share_socket_connection=share_socket_connection,
+                lazy_connect=lazy_connect,
+                auto_batch_window_us=auto_batch_window_us,
+                auto_batch_max_commands=auto_batch_max_commands,
+                auto_batch_type_errors=auto_batch_type_errors,
+                client_cache=client_cache,
+                deduplicate_reads=deduplicate_reads,
+                copy_deduplicated_results=copy_deduplicated_results,
+            ),
             reconnect_strategy=reconnect_strategy,
         )
         return await GlideClient.create(config)
 
 
+def create_sync_client(
+    request,
+    cluster_mode: bool,
+    protocol: ProtocolVersion = ProtocolVersion.RESP3,
+    request_timeout: Optional[int] = 1000,
+    connection_timeout: Optional[int] = 1000,
+    decode_responses: bool = False,
+) -> TGlideSyncClient:
+    # Create a synchronous client
+    use_tls = request.config.getoption("--tls")
+    if cluster_mode:
+        assert type(pytest.valkey_cluster) is ValkeyCluster
+        k = min(3, len(pytest.valkey_cluster.nodes_addr))
+        cluster_config = GlideClusterClientConfiguration(
+            addresses=random.sample(pytest.valkey_cluster.nodes_addr, k=k),
+            use_tls=use_tls,
+            protocol=protocol,
+            request_timeout=request_timeout,
+            advanced_config=AdvancedGlideClusterClientConfiguration(
+                connection_timeout, decode_responses=decode_responses
+            ),
+        )
+        return GlideSyncClusterClient.create(cluster_config)
+    else:
+        assert type(pytest.standalone_cluster) is ValkeyCluster
+        config = GlideClientConfiguration(
+            addresses=pytest.standalone_cluster.nodes_addr,
+            use_tls=use_tls,
+            protocol=protocol,
+            request_timeout=request_timeout,
+            advanced_config=AdvancedGlideClientConfiguration(
+                connection_timeout, decode_responses=decode_responses
+            ),
+        )
+        return GlideSyncClient.create(config)
+
+
 NEW_PASSWORD = "new_secure_password"
 WRONG_PASSWORD = "wrong_password"
 
@@ -1,5 +1,7 @@
 # Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
 import ast
+import subprocess
+import sys
 from pathlib import Path
 
 import glide
@@ -31,14 +33,45 @@ excluded_symbol_list = [
     # python/python/glide/glide_client.py
     "get_request_error_class",  # FunctionDef
     "BaseClient",  # ClassDef
+    "TSettlement",  # Tuple
+    "TPushNotification",  # Union
+    # python/python/glide/event_loops.py
+    "TrioEventLoop",  # ClassDef
+    "TrioFuture",  # ClassDef
+    "TEventLoop",  # Union
+    "get_running_event_loop",  # FunctionDef
+    "create_future",  # FunctionDef
+    "gather_return_exceptions",  # AsyncFunctionDef
+    # python/python/glide/glide_sync_client.py
+    "BaseSyncClient",  # ClassDef
     # python/python/glide/routes.py
     "to_protobuf_slot_type",  # FunctionDef
     "set_protobuf_route",  # FunctionDef
+    "serialize_protobuf_route",  # FunctionDef
     # python/python/glide/config.py
     "BaseClientConfiguration",  # ClassDef
     # python/python/glide/protobuf_codec.py
     "ProtobufCodec",  # ClassDef
     "PartialMessageException",  # Exception
+    # python/python/glide/inflight_requests.py
+    "InflightRequests",  # ClassDef
+    # python/python/glide/response_options.py
+    "TResponseOptions",  # Tuple
+    # python/python/glide/uds_connection.py
+    "TResponse",  # Tuple
+    "UdsConnection",  # ClassDef
+    # python/python/glide/auto_batching.py
+    "TBatchKey",  # Union
+    "AutoBatcher",  # ClassDef
+    # python/python/glide/client_cache.py
+    "TCacheKey",  # Tuple
+    "CacheRead",  # ClassDef
+    "ClientCache",  # ClassDef
+    # python/python/glide/single_flight.py
+    "SingleFlight",  # ClassDef
+    # python/python/glide/socket_connection.py
+    "TWriteCoalescing",  # Tuple
+    "SocketConnection",  # ClassDef
     # python/python/glide/async_commands/transaction.py
     "BaseTransaction",  # ClassDef
     # python/python/glide/async_commands/standalone_commands.py
@@ -147,3 +180,58 @@ class TestAPIExport:
                 ]
             )
         )
+
+    def test_lazy_exports(self):
+        """
+        Tests that the heavy submodules aren't imported by `import glide`, and that every exported symbol can be
+        imported from the package.
+        """
+        code = (
+            "import sys, glide; "
+            "print(' '.join(m for m in ('glide.async_commands.core', 'glide.async_commands.transaction', "
+            "'glide.async_commands.server_modules.ft', 'glide.glide_client', 'glide.protobuf.command_request_pb2') "
+            "if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == ""
+
+        for name in glide.__all__:
+            assert getattr(glide, name) is not None, name
+        assert glide.PubSubMsg is glide.CoreCommands.PubSubMsg
+        assert set(glide.__all__) <= set(dir(glide))
+
+    def test_export_lists_agree(self):
+        """
+        Tests that the names imported under `TYPE_CHECKING`, the lazy exports and `__all__` of the package agree, and
+        that every lazy export can be imported.
+        """
+        root_init_file = Path(__file__).parent.parent / "glide" / "__init__.py"
+        tree = ast.parse(root_init_file.read_text())
+        type_checking_names = set()
+        eager_names = set()
+        for node in tree.body:
+            if isinstance(node, ast.If) and ast.unparse(node.test) == "TYPE_CHECKING":
+                for import_node in node.body:
+                    if isinstance(import_node, ast.ImportFrom):
+                        type_checking_names.update(
+                            alias.asname or alias.name for alias in import_node.names
+                        )
+            elif isinstance(node, ast.ImportFrom) and node.module.startswith("glide"):
+                eager_names.update(alias.asname or alias.name for alias in node.names)
+
+        lazy_names = set(glide._lazy_export_modules)
+        submodule_names = set(glide._lazy_submodules)
+        assert type_checking_names == lazy_names | submodule_names
+        # CoreCommands is only exported lazily to resolve PubSubMsg
+        assert set(glide.__all__) == (
+            (lazy_names - {"CoreCommands"})
+            | submodule_names
+            | eager_names
+            | {"PubSubMsg"}
+        )
+        assert len(glide.__all__) == len(set(glide.__all__))
+
+        for name in lazy_names | submodule_names:
+            assert getattr(glide, name) is not None, name
@@ -6,12 +6,28 @@ from __future__ import annotations
 import asyncio
 import copy
 import math
+import mmap
+import multiprocessing
+import tempfile
 import time
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Dict, List, Mapping, Optional, Tuple, Union, cast
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple, Union, cast
+from unittest.mock import patch
 
+import glide.response_options as response_options
 import pytest
-from glide import ClosingError, RequestError, Script
+from glide import (
+    ClosingError,
+    ClusterScanCursor,
+    GlideBuffer,
+    LazyArray,
+    RequestError,
+    ResultAdapter,
+    Script,
+    decoded_responses,
+    register_result_adapter,
+    result_adapter,
+)
 from glide.async_commands.bitmap import (
     BitFieldGet,
     BitFieldIncrBy,
@@ -73,15 +89,22 @@ from glide.async_commands.stream import (
 )
 from glide.async_commands.transaction import ClusterTransaction, Transaction
 from glide.config import (
+    AdvancedGlideClientConfiguration,
+    AdvancedGlideClusterClientConfiguration,
     BackoffStrategy,
+    ClientCacheConfiguration,
+    ClientTransport,
     GlideClientConfiguration,
     GlideClusterClientConfiguration,
+    NodeAddress,
     ProtocolVersion,
     ServerCredentials,
 )
 from glide.constants import OK, TEncodable, TFunctionStatsSingleNodeResponse, TResult
+from glide.exceptions import ConfigurationError
 from glide.exceptions import TimeoutError as GlideTimeoutError
 from glide.glide_client import GlideClient, GlideClusterClient, TGlideClient
+from glide.protobuf.command_request_pb2 import RequestType
 from glide.routes import (
     AllNodes,
     AllPrimaries,
@@ -388,6 +411,987 @@ class TestGlideClients:
         # Clean up the main client
         await client.close()
 
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP2, ProtocolVersion.RESP3])
+    async def test_in_process_transport(self, request, cluster_mode, protocol):
+        client = await create_client(
+            request,
+            cluster_mode=cluster_mode,
+            protocol=protocol,
+            transport=ClientTransport.IN_PROCESS,
+        )
+        key = get_random_string(10)
+        value = get_random_string(10)
+        assert await client.set(key, value) == OK
+        assert await client.get(key) == value.encode()
+        assert await client.get(get_random_string(10)) is None
+        assert await client.incr(f"{{{key}}}num") == 1
+
+        with pytest.raises(RequestError):
+            await client.incr(key)
+
+        transaction = ClusterTransaction() if cluster_mode else Transaction()
+        transaction.set(key, "1")
+        transaction.incr(key)
+        transaction.get(key)
+        assert await client.exec(transaction) == [OK, 2, b"2"]
+
+        script = Script("return { KEYS[1], ARGV[1] }")
+        assert await client.invoke_script(script, keys=[key], args=["arg"]) == [
+            key.encode(),
+            b"arg",
+        ]
+        await client.close()
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    async def test_in_process_transport_concurrent_requests(
+        self, request, cluster_mode, protocol
+    ):
+        client = await create_client(
+            request,
+            cluster_mode=cluster_mode,
+            protocol=protocol,
+            transport=ClientTransport.IN_PROCESS,
+        )
+        keys = [get_random_string(10) for _ in range(200)]
+        assert await asyncio.gather(*[client.set(key, key) for key in keys]) == [
+            OK
+        ] * len(keys)
+        assert await asyncio.gather(*[client.get(key) for key in keys]) == [
+            key.encode() for key in keys
+        ]
+        await client.close()
+        with pytest.raises(ClosingError):
+            await client.get(keys[0])
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    @pytest.mark.parametrize(
+        "transport", [ClientTransport.SOCKET, ClientTransport.IN_PROCESS]
+    )
+    async def test_client_shared_by_event_loops(
+        self, request, cluster_mode, protocol, transport
+    ):
+        client = await create_client(
+            request, cluster_mode=cluster_mode, protocol=protocol, transport=transport
+        )
+
+        async def set_and_get(keys: List[str]) -> List[TResult]:
+            for key in keys:
+                assert await client.set(key, key) == OK
+            return await asyncio.gather(*[client.get(key) for key in keys])
+
+        def run_in_new_loop(keys: List[str]) -> List[TResult]:
+            # Every worker thread runs its own event loop
+            return asyncio.run(set_and_get(keys))
+
+        keys_per_loop = [[get_random_string(10) for _ in range(20)] for _ in range(4)]
+        results = await asyncio.gather(
+            set_and_get(keys_per_loop[0]),
+            *[asyncio.to_thread(run_in_new_loop, keys) for keys in keys_per_loop[1:]],
+        )
+        assert results == [[key.encode() for key in keys] for keys in keys_per_loop]
+        await client.close()
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    @pytest.mark.parametrize(
+        "transport", [ClientTransport.SOCKET, ClientTransport.IN_PROCESS]
+    )
+    async def test_client_inherited_by_forked_process(
+        self, request, cluster_mode, protocol, transport
+    ):
+        client = await create_client(
+            request, cluster_mode=cluster_mode, protocol=protocol, transport=transport
+        )
+        key = get_random_string(10)
+        script = Script("return redis.call('GET', KEYS[1])")
+        assert await client.set(key, "value") == OK
+        assert await client.invoke_script(script, keys=[key]) == b"value"
+
+        async def use_inherited_client() -> List[TResult]:
+            return await asyncio.gather(
+                client.get(key), client.invoke_script(script, keys=[key])
+            )
+
+        def run_in_child(results: multiprocessing.Queue):
+            results.put(asyncio.run(use_inherited_client()))
+
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+        process = context.Process(target=run_in_child, args=(results,))
+        process.start()
+        assert await asyncio.to_thread(results.get, timeout=10) == [b"value", b"value"]
+        await asyncio.to_thread(process.join)
+        assert process.exitcode == 0
+        # The client of the parent process isn't affected
+        assert await client.get(key) == b"value"
+        await client.close()
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    @pytest.mark.parametrize(
+        "transport", [ClientTransport.SOCKET, ClientTransport.IN_PROCESS]
+    )
+    async def test_uvloop(self, request, cluster_mode, protocol, transport):
+        uvloop = pytest.importorskip("uvloop")
+
+        async def run_commands():
+            client = await create_client(
+                request,
+                cluster_mode=cluster_mode,
+                protocol=protocol,
+                transport=transport,
+            )
+            key = get_random_string(10)
+            assert await client.set(key, "value") == OK
+            assert await asyncio.gather(client.get(key), client.get(key)) == [
+                b"value",
+                b"value",
+            ]
+            await client.close()
+
+        def run_in_uvloop():
+            loop = uvloop.new_event_loop()
+            try:
+                loop.run_until_complete(run_commands())
+            finally:
+                loop.close()
+
+        await asyncio.to_thread(run_in_uvloop)
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    async def test_trio(self, request, cluster_mode, protocol):
+        trio = pytest.importorskip("trio")
+
+        async def run_commands():
+            client = await create_client(
+                request,
+                cluster_mode=cluster_mode,
+                protocol=protocol,
+                transport=ClientTransport.IN_PROCESS,
+            )
+            keys = [get_random_string(10) for _ in range(10)]
+            results = {}
+
+            async def set_and_get(key: str):
+                assert await client.set(key, key) == OK
+                results[key] = await client.get(key)
+
+            async with trio.open_nursery() as nursery:
+                for key in keys:
+                    nursery.start_soon(set_and_get, key)
+            assert results == {key: key.encode() for key in keys}
+            with pytest.raises(RequestError):
+                await client.incr(keys[0])
+            await client.close()
+
+            # The socket transport is asyncio only
+            with pytest.raises(ConfigurationError):
+                await create_client(
+                    request,
+                    cluster_mode=cluster_mode,
+                    protocol=protocol,
+                    transport=ClientTransport.SOCKET,
+                )
+
+        await asyncio.to_thread(trio.run, run_commands)
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    @pytest.mark.parametrize(
+        "transport", [ClientTransport.SOCKET, ClientTransport.IN_PROCESS]
+    )
+    async def test_command_arg_types(self, request, cluster_mode, protocol, transport):
+        client = await create_client(
+            request, cluster_mode=cluster_mode, protocol=protocol, transport=transport
+        )
+        key = get_random_string(10)
+        assert (
+            await client.custom_command(["SET", key, memoryview(b"value")])  # type: ignore
+            == OK
+        )
+        assert await client.get(key) == b"value"
+        assert await client.custom_command(["SET", key, 10]) == OK  # type: ignore
+        assert await client.custom_command(["INCRBYFLOAT", key, 1.5]) == b"11.5"  # type: ignore
+        assert await client.custom_command(["GET", bytearray(key.encode())]) == b"11.5"  # type: ignore
+        with pytest.raises(TypeError):
+            await client.custom_command(["SET", key, None])  # type: ignore
+        # The client keeps serving requests after an argument fails to encode
+        assert await client.get(key) == b"11.5"
+        await client.close()
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    @pytest.mark.parametrize(
+        "transport", [ClientTransport.SOCKET, ClientTransport.IN_PROCESS]
+    )
+    async def test_buffer_protocol_values(
+        self, request, cluster_mode, protocol, transport
+    ):
+        client = await create_client(
+            request, cluster_mode=cluster_mode, protocol=protocol, transport=transport
+        )
+        key = get_random_string(10)
+        small_value = bytearray(b"small")
+        large_value = bytes(range(256)) * 1024
+        assert await client.set(key, small_value) == OK
+        assert await client.get(key) == b"small"
+        assert await client.set(key, memoryview(large_value)) == OK
+        assert await client.get(key) == large_value
+
+        with tempfile.TemporaryFile() as file:
+            file.write(large_value)
+            file.flush()
+            with mmap.mmap(file.fileno(), 0) as mapped_file:
+                mapped_view = memoryview(mapped_file)
+                assert await client.hset(key + "hash", {"field": mapped_view}) == 1
+                mapped_view.release()
+        assert await client.hget(key + "hash", "field") == large_value
+
+        # Non-contiguous buffers are copied
+        assert await client.set(key, memoryview(large_value)[::2]) == OK
+        assert await client.get(key) == large_value[::2]
+
+        transaction = (
+            ClusterTransaction()
+            if isinstance(client, GlideClusterClient)
+            else Transaction()
+        )
+        transaction.set(key, bytearray(large_value))
+        transaction.get(key)
+        transaction.xadd(key + "stream", [("field", memoryview(large_value))])
+        result = await client.exec(transaction)
+        assert result is not None
+        assert result[:2] == [OK, large_value]
+        await client.close()
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP2, ProtocolVersion.RESP3])
+    @pytest.mark.parametrize(
+        "transport", [ClientTransport.SOCKET, ClientTransport.IN_PROCESS]
+    )
+    async def test_zero_copy_responses(
+        self, request, cluster_mode, protocol, transport
+    ):
+        client = await create_client(
+            request,
+            cluster_mode=cluster_mode,
+            protocol=protocol,
+            transport=transport,
+            zero_copy_response_min_size=1024,
+        )
+        key = get_random_string(10)
+        large_value = bytes(range(256)) * 1024
+        assert await client.set(key, large_value) == OK
+        result = await client.get(key)
+        assert isinstance(result, GlideBuffer)
+        assert len(result) == len(large_value)
+        assert result == large_value
+        assert bytes(result) == large_value
+        view = memoryview(result)
+        assert view.readonly
+        assert view.nbytes == len(large_value)
+        assert view.tobytes() == large_value
+        with pytest.raises(TypeError):
+            view[0] = 0
+        view.release()
+        # The buffer can be passed back to the client without copying it
+        assert await client.set(key + "copy", result) == OK
+        assert await client.get(key + "copy") == large_value
+
+        # Values below the minimal size are returned as bytes
+        assert await client.set(key, "small") == OK
+        assert await client.get(key) == b"small"
+
+        # Map keys are always bytes, so they can be used as dictionary keys
+        assert await client.hset(key + "hash", {"field": large_value}) == 1
+        hash_value = await client.hgetall(key + "hash")
+        assert list(hash_value.keys()) == [b"field"]
+        assert isinstance(hash_value[b"field"], GlideBuffer)
+        assert hash_value[b"field"] == large_value
+        await client.close()
+
+    async def test_zero_copy_response_config_validation(self):
+        with pytest.raises(ValueError):
+            AdvancedGlideClientConfiguration(zero_copy_response_min_size=-1)
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP2, ProtocolVersion.RESP3])
+    @pytest.mark.parametrize(
+        "transport", [ClientTransport.SOCKET, ClientTransport.IN_PROCESS]
+    )
+    async def test_lazy_responses(self, request, cluster_mode, protocol, transport):
+        client = await create_client(
+            request,
+            cluster_mode=cluster_mode,
+            protocol=protocol,
+            transport=transport,
+            lazy_response_min_length=100,
+        )
+        key = get_random_string(10)
+        elements = [f"element{i}" for i in range(1000)]
+        expected = [element.encode() for element in elements]
+        assert await client.rpush(key, elements) == len(elements)
+
+        result = await client.lrange(key, 0, -1)
+        assert isinstance(result, LazyArray)
+        assert len(result) == len(elements)
+        assert result[0] == expected[0]
+        assert result[-1] == expected[-1]
+        assert result[10:20] == expected[10:20]
+        assert result[::-100] == expected[::-100]
+        with pytest.raises(IndexError):
+            result[len(elements)]
+        assert list(result) == expected
+        assert result == expected
+        assert result.to_list() == expected
+
+        # Short arrays are returned as lists
+        assert await client.lrange(key, 0, 9) == expected[:10]
+        assert isinstance(await client.lrange(key, 0, 9), list)
+
+        # Set members are always converted, so they can be hashed
+        assert await client.sadd(key + "set", elements) == len(elements)
+        assert await client.smembers(key + "set") == set(expected)
+        await client.close()
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP2, ProtocolVersion.RESP3])
+    @pytest.mark.parametrize(
+        "transport", [ClientTransport.SOCKET, ClientTransport.IN_PROCESS]
+    )
+    async def test_decode_responses(self, request, cluster_mode, protocol, transport):
+        client = await create_client(
+            request,
+            cluster_mode=cluster_mode,
+            protocol=protocol,
+            transport=transport,
+            decode_responses=True,
+        )
+        key = get_random_string(10)
+        assert await client.set(key, "value") == OK
+        assert await client.get(key) == "value"
+        assert await client.hset(key + "hash", {"field": "ünïcödé"}) == 1
+        assert await client.hgetall(key + "hash") == {"field": "ünïcödé"}
+        assert await client.sadd(key + "set", ["a", "b"]) == 2
+        assert await client.smembers(key + "set") == {"a", "b"}
+        # Strings that aren't valid UTF-8 are returned as bytes
+        assert await client.set(key, b"\xff\xfe") == OK
+        assert await client.get(key) == b"\xff\xfe"
+
+        # The client's setting can be overridden per request
+        assert await client.set(key, "value") == OK
+        with decoded_responses(False):
+            assert await client.get(key) == b"value"
+        assert await client.get(key) == "value"
+        await client.close()
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    async def test_decoded_responses_per_request(self, glide_client: TGlideClient):
+        key = get_random_string(10)
+        assert await glide_client.set(key, "value") == OK
+        with decoded_responses():
+            assert await glide_client.get(key) == "value"
+            # Tasks created inside the block inherit the setting
+            assert await asyncio.gather(
+                glide_client.get(key), glide_client.get(key)
+            ) == ["value", "value"]
+            if isinstance(glide_client, GlideClusterClient):
+                cursor = ClusterScanCursor()
+                while not cursor.is_finished():
+                    result = await glide_client.scan(cursor, match=key)
+                    cursor = cast(ClusterScanCursor, result[0])
+                    keys = cast(List[str], result[1])
+                    assert all(k == key for k in keys)
+        assert await glide_client.get(key) == b"value"
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP2, ProtocolVersion.RESP3])
+    async def test_result_adapters(self, glide_client: TGlideClient, monkeypatch):
+        key = get_random_string(10)
+        assert await glide_client.hset(key, {"f1": "v1", "f2": "v2"}) == 2
+        with result_adapter(ResultAdapter.PAIRS):
+            pairs = await glide_client.hgetall(key)
+            # Commands the adapter isn't registered for return their usual result
+            assert await glide_client.hget(key, "f1") == b"v1"
+            assert await glide_client.hkeys(key) in ([b"f1", b"f2"], [b"f2", b"f1"])
+        assert sorted(pairs) == [(b"f1", b"v1"), (b"f2", b"v2")]
+        assert await glide_client.hgetall(key) == {b"f1": b"v1", b"f2": b"v2"}
+
+        zset_key = key + "zset"
+        members_scores = {"one": 1.0, "two": 2.0, "three": 3.0}
+        assert await glide_client.zadd(zset_key, members_scores) == 3
+        with result_adapter(ResultAdapter.PARALLEL_ARRAYS):
+            members, scores = await glide_client.zrange_withscores(
+                zset_key, RangeByIndex(0, -1)
+            )
+        assert members == [b"one", b"two", b"three"]
+        assert scores == [1.0, 2.0, 3.0]
+
+        with result_adapter(ResultAdapter.PAIRS), decoded_responses():
+            assert await glide_client.zpopmin(zset_key) == [("one", 1.0)]
+
+        # Adapters can be registered for more commands
+        stream_key = key + "stream"
+        assert (
+            await glide_client.xadd(
+                stream_key, [("field", "value")], StreamAddOptions("1-0")
+            )
+            == b"1-0"
+        )
+        with result_adapter(ResultAdapter.PAIRS):
+            assert isinstance(await glide_client.xread({stream_key: "0-0"}), dict)
+        # The registry is global, it is restored for the other tests once the test ends
+        monkeypatch.setattr(
+            response_options,
+            "_result_adapters",
+            dict(response_options._result_adapters),
+        )
+        register_result_adapter(RequestType.XRead, ResultAdapter.PAIRS)
+        with result_adapter(ResultAdapter.PAIRS):
+            assert await glide_client.xread({stream_key: "0-0"}) == [
+                (stream_key.encode(), {b"1-0": [[b"field", b"value"]]})
+            ]
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    @pytest.mark.parametrize("write_coalescing_max_requests", [None, 10])
+    async def test_write_coalescing(
+        self, request, cluster_mode, protocol, write_coalescing_max_requests
+    ):
+        client = await create_client(
+            request,
+            cluster_mode=cluster_mode,
+            protocol=protocol,
+            write_coalescing_window_us=500,
+            write_coalescing_max_requests=write_coalescing_max_requests,
+        )
+        keys = [get_random_string(10) for _ in range(100)]
+        assert await asyncio.gather(*[client.set(key, key) for key in keys]) == [
+            OK
+        ] * len(keys)
+        assert await asyncio.gather(*[client.get(key) for key in keys]) == [
+            key.encode() for key in keys
+        ]
+        # A single request is written once the window elapses
+        assert await client.get(keys[0]) == keys[0].encode()
+        await client.close()
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    async def test_shared_socket_connection(self, request, cluster_mode, protocol):
+        clients = await asyncio.gather(
+            *[
+                create_client(
+                    request,
+                    cluster_mode=cluster_mode,
+                    protocol=protocol,
+                    share_socket_connection=True,
+                )
+                for _ in range(5)
+            ]
+        )
+        connection = clients[0]._socket_connection
+        assert all(client._socket_connection is connection for client in clients)
+        assert sorted(client._client_id for client in clients) == list(range(5))
+        keys = [get_random_string(10) for _ in clients]
+        assert await asyncio.gather(
+            *[client.set(key, key) for client, key in zip(clients, keys)]
+        ) == [OK] * len(keys)
+        assert await asyncio.gather(
+            *[client.get(key) for client, key in zip(reversed(clients), keys)]
+        ) == [key.encode() for key in keys]
+
+        # A client that doesn't share its connection has a connection of its own
+        client = await create_client(
+            request, cluster_mode=cluster_mode, protocol=protocol
+        )
+        assert client._socket_connection is not connection
+        await client.close()
+
+        # Closing a client doesn't affect the other clients of the connection
+        await clients[0].close()
+        assert await clients[1].get(keys[0]) == keys[0].encode()
+        for client in clients[1:]:
+            await client.close()
+        assert connection is not None and connection.is_closed()
+
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    async def test_shared_socket_connection_databases(self, request, protocol):
+        clients = [
+            await create_client(
+                request,
+                cluster_mode=False,
+                protocol=protocol,
+                database_id=database_id,
+                share_socket_connection=True,
+            )
+            for database_id in range(3)
+        ]
+        key = get_random_string(10)
+        for database_id, client in enumerate(clients):
+            assert await client.set(key, str(database_id)) == OK
+        for database_id, client in enumerate(clients):
+            assert await client.get(key) == str(database_id).encode()
+            await client.close()
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    @pytest.mark.parametrize(
+        "transport", [ClientTransport.SOCKET, ClientTransport.IN_PROCESS]
+    )
+    async def test_lazy_connect(self, request, cluster_mode, protocol, transport):
+        client = await create_client(
+            request,
+            cluster_mode=cluster_mode,
+            protocol=protocol,
+            transport=transport,
+            lazy_connect=True,
+        )
+        assert client._is_connection_pending
+        assert client._socket_connection is None and client._native_client is None
+
+        # Concurrent requests wait for the same connection
+        key = get_random_string(10)
+        assert await client.set(key, "value") == OK
+        assert (
+            await asyncio.gather(*[client.get(key) for _ in range(10)])
+            == [b"value"] * 10
+        )
+        assert not client._is_connection_pending
+        await client.close()
+
+    @pytest.mark.parametrize("cluster_mode", [False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    async def test_lazy_connect_failure(self, request, cluster_mode, protocol):
+        client = await create_client(
+            request,
+            cluster_mode=cluster_mode,
+            protocol=protocol,
+            addresses=[NodeAddress("localhost", 1)],
+            lazy_connect=True,
+        )
+        # The requests fail with the error of the connection, and the next request connects again
+        for _ in range(2):
+            with pytest.raises(ClosingError):
+                await client.get("foo")
+            assert client._is_connection_pending
+        await client.close()
+        with pytest.raises(ClosingError, match="the client is closed"):
+            await client.get("foo")
+
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    async def test_create_many(self, request, protocol):
+        use_tls = request.config.getoption("--tls")
+        addresses = pytest.standalone_cluster.nodes_addr
+        configs = [
+            GlideClientConfiguration(
+                addresses, use_tls=use_tls, database_id=database_id, protocol=protocol
+            )
+            for database_id in range(3)
+        ]
+        clients = await GlideClient.create_many(configs)
+        assert [client.config for client in clients] == configs
+        key = get_random_string(10)
+        for database_id, client in enumerate(clients):
+            assert await client.set(key, str(database_id)) == OK
+        for database_id, client in enumerate(clients):
+            assert await client.get(key) == str(database_id).encode()
+            await client.close()
+
+        # If a client fails to be created, the clients that were created are closed
+        configs.append(
+            GlideClientConfiguration(
+                [NodeAddress("localhost", 1)],
+                use_tls=use_tls,
+                protocol=protocol,
+                advanced_config=AdvancedGlideClientConfiguration(
+                    connection_timeout=500
+                ),
+            )
+        )
+        created_clients = []
+        original_create = GlideClient.create
+
+        async def create(config):
+            client = await original_create(config)
+            created_clients.append(client)
+            return client
+
+        with patch.object(GlideClient, "create", create):
+            with pytest.raises(ClosingError):
+                await GlideClient.create_many(configs)
+        assert len(created_clients) == 3
+        assert all(client._is_closed for client in created_clients)
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    @pytest.mark.parametrize(
+        "transport", [ClientTransport.SOCKET, ClientTransport.IN_PROCESS]
+    )
+    async def test_auto_batching(self, request, cluster_mode, protocol, transport):
+        client = await create_client(
+            request,
+            cluster_mode=cluster_mode,
+            protocol=protocol,
+            transport=transport,
+            auto_batch_window_us=10_000,
+        )
+        keys = [f"{{auto-batch}}-{get_random_string(10)}" for _ in range(50)]
+        assert await asyncio.gather(*[client.set(key, key) for key in keys]) == [
+            OK
+        ] * len(keys)
+        # A key that is called concurrently more than once, and a key that doesn't exist
+        get_keys = keys + keys[:5] + [get_random_string(10)]
+        assert await asyncio.gather(*[client.get(key) for key in get_keys]) == [
+            key.encode() for key in keys + keys[:5]
+        ] + [None]
+
+        hash_key = get_random_string(10)
+        assert await client.hset(hash_key, {"f1": "v1", "f2": "v2"}) == 2
+        assert await asyncio.gather(
+            client.hget(hash_key, "f1"),
+            client.hget(hash_key, "f2"),
+            client.hget(hash_key, "f3"),
+            client.hget(hash_key, "f1"),
+        ) == [b"v1", b"v2", None, b"v1"]
+        # Like MGET, a merged GET of a key that holds a value of another type gets None
+        assert await asyncio.gather(client.get(keys[1]), client.get(hash_key)) == [
+            keys[1].encode(),
+            None,
+        ]
+
+        # The commands were merged, the server executed a single MGET
+        if not cluster_mode:
+            assert await client.config_resetstat() == OK
+            await asyncio.gather(*[client.get(key) for key in keys])
+            info = await client.info([InfoSection.COMMAND_STATS])
+            assert b"cmdstat_mget:calls=1," in info
+            assert b"cmdstat_get:" not in info
+
+        # Commands that can't be merged are sent as is, and the errors of merged commands reach their callers
+        with decoded_responses():
+            assert await asyncio.gather(client.get(keys[0]), client.get(keys[1])) == [
+                keys[0],
+                keys[1],
+            ]
+        assert await client.set(keys[0], "value", return_old_value=True) == (
+            keys[0].encode()
+        )
+        with pytest.raises(RequestError):
+            await asyncio.gather(client.hget(keys[0], "f1"), client.hget(keys[0], "f2"))
+        await client.close()
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    @pytest.mark.parametrize(
+        "transport", [ClientTransport.SOCKET, ClientTransport.IN_PROCESS]
+    )
+    async def test_auto_batching_order(
+        self, request, cluster_mode, protocol, transport
+    ):
+        client = await create_client(
+            request,
+            cluster_mode=cluster_mode,
+            protocol=protocol,
+            transport=transport,
+            auto_batch_window_us=10_000,
+            auto_batch_type_errors=True,
+        )
+        key1 = get_random_string(10)
+        key2 = get_random_string(10)
+        assert await client.set(key1, "old") == OK
+        # A GET that is called after a SET of its key reads the value that was set
+        assert await asyncio.gather(client.set(key1, "new"), client.get(key1)) == [
+            OK,
+            b"new",
+        ]
+        assert await asyncio.gather(
+            client.get(key1),
+            client.set(key1, "newer"),
+            client.set(key2, "value"),
+            client.get(key1),
+            client.get(key2),
+        ) == [b"new", OK, OK, b"newer", b"value"]
+
+        # The error of a GET that was merged into an MGET reaches its caller
+        hash_key = get_random_string(10)
+        assert await client.hset(hash_key, {"field": "value"}) == 1
+        results = await asyncio.gather(
+            client.get(key1),
+            client.get(hash_key),
+            client.get(get_random_string(10)),
+            return_exceptions=True,
+        )
+        assert results[0] == b"newer"
+        assert isinstance(results[1], RequestError)
+        assert results[2] is None
+        await client.close()
+
+    @pytest.mark.parametrize("cluster_mode", [False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    async def test_auto_batching_max_commands(self, request, cluster_mode, protocol):
+        # A window this long is ended by the number of pending commands
+        client = await create_client(
+            request,
+            cluster_mode=cluster_mode,
+            protocol=protocol,
+            auto_batch_window_us=60_000_000,
+            auto_batch_max_commands=10,
+        )
+        keys = [get_random_string(10) for _ in range(10)]
+        assert await asyncio.wait_for(
+            asyncio.gather(*[client.get(key) for key in keys]), timeout=5
+        ) == [None] * len(keys)
+        await client.close()
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP2, ProtocolVersion.RESP3])
+    @pytest.mark.parametrize(
+        "transport", [ClientTransport.SOCKET, ClientTransport.IN_PROCESS]
+    )
+    async def test_deduplicate_reads(self, request, cluster_mode, protocol, transport):
+        client = await create_client(
+            request,
+            cluster_mode=cluster_mode,
+            protocol=protocol,
+            transport=transport,
+            deduplicate_reads=True,
+        )
+        key = get_random_string(10)
+        hash_key = get_random_string(10)
+        assert await client.set(key, "value") == OK
+        assert await client.hset(hash_key, {"f1": "v1", "f2": "v2"}) == 2
+        assert (
+            await asyncio.gather(*[client.get(key) for _ in range(50)])
+            == [b"value"] * 50
+        )
+
+        # Each caller gets its own copy of the result
+        results = await asyncio.gather(*[client.hgetall(hash_key) for _ in range(10)])
+        assert all(result == {b"f1": b"v1", b"f2": b"v2"} for result in results)
+        assert len({id(result) for result in results}) == len(results)
+
+        # The concurrent reads were sent once
+        if not cluster_mode:
+            assert await client.config_resetstat() == OK
+            await asyncio.gather(*[client.get(key) for _ in range(50)])
+            info = await client.info([InfoSection.COMMAND_STATS])
+            assert b"cmdstat_get:calls=1," in info
+
+        # Reads with other response options and writes aren't deduplicated, and errors reach all of the callers
+        with decoded_responses():
+            assert await asyncio.gather(client.get(key), client.get(key)) == [
+                "value",
+                "value",
+            ]
+        assert await asyncio.gather(
+            client.incr(get_random_string(10)), client.get(key)
+        ) == [1, b"value"]
+        with pytest.raises(RequestError):
+            await asyncio.gather(client.hget(key, "f1"), client.hget(key, "f1"))
+        await client.close()
+
+    @pytest.mark.parametrize("cluster_mode", [False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    async def test_deduplicate_reads_shared_results(
+        self, request, cluster_mode, protocol
+    ):
+        client = await create_client(
+            request,
+            cluster_mode=cluster_mode,
+            protocol=protocol,
+            deduplicate_reads=True,
+            copy_deduplicated_results=False,
+        )
+        set_key = get_random_string(10)
+        assert await client.sadd(set_key, ["m1", "m2"]) == 2
+        first, second = await asyncio.gather(
+            client.smembers(set_key), client.smembers(set_key)
+        )
+        assert first == {b"m1", b"m2"}
+        assert first is second
+        await client.close()
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    @pytest.mark.parametrize(
+        "transport", [ClientTransport.SOCKET, ClientTransport.IN_PROCESS]
+    )
+    async def test_client_cache(self, request, cluster_mode, protocol, transport):
+        client = await create_client(
+            request,
+            cluster_mode=cluster_mode,
+            protocol=protocol,
+            transport=transport,
+            client_cache=ClientCacheConfiguration(),
+        )
+        other_client = await create_client(
+            request, cluster_mode=cluster_mode, protocol=protocol
+        )
+        key = f"{{client-cache}}-{get_random_string(10)}"
+        other_key = f"{{client-cache}}-{get_random_string(10)}"
+        hash_key = get_random_string(10)
+        set_key = get_random_string(10)
+        assert await client.set(key, "v1") == OK
+        assert await client.set(other_key, "v2") == OK
+        assert await client.hset(hash_key, {"f1": "v1", "f2": "v2"}) == 2
+        assert await client.sadd(set_key, ["m1", "m2"]) == 2
+
+        # The first reads miss, the others are served from the cache
+        for _ in range(3):
+            assert await client.get(key) == b"v1"
+            assert await client.hget(hash_key, "f1") == b"v1"
+            assert await client.hgetall(hash_key) == {b"f1": b"v1", b"f2": b"v2"}
+            assert await client.smembers(set_key) == {b"m1", b"m2"}
+        # MGET is served from the responses of GET
+        assert await client.get(other_key) == b"v2"
+        assert await client.mget([key, other_key]) == [b"v1", b"v2"]
+        stats = await client.get_client_cache_statistics()
+        assert stats["misses"] == 5
+        assert stats["hits"] == 9
+        assert stats["entries"] == 5
+        assert stats["memory"] > 0
+
+        # The cached responses can be modified by their callers
+        cast(Dict[bytes, bytes], await client.hgetall(hash_key)).clear()
+        empty_set_key = get_random_string(10)
+        cast(Set[bytes], await client.smembers(empty_set_key)).add(b"m")
+        assert await client.smembers(empty_set_key) == set()
+        assert await client.hgetall(hash_key) == {b"f1": b"v1", b"f2": b"v2"}
+
+        # Commands that only read keys don't invalidate the cached responses
+        hits = (await client.get_client_cache_statistics())["hits"]
+        assert await client.ttl(key) == -1
+        assert await client.exists([key, hash_key]) == 2
+        assert await client.type(hash_key) == b"hash"
+        assert (await client.hscan(hash_key, "0"))[0] == b"0"
+        assert {field async for field, _ in client.hscan_iter(hash_key)} == {
+            b"f1",
+            b"f2",
+        }
+        assert await client.get(key) == b"v1"
+        assert await client.hgetall(hash_key) == {b"f1": b"v1", b"f2": b"v2"}
+        assert (await client.get_client_cache_statistics())["hits"] == hits + 2
+
+        # The writes of the client are read by it immediately
+        assert await client.set(key, "v3") == OK
+        assert await client.get(key) == b"v3"
+        # The writes of another client invalidate the responses through the server
+        assert await client.hgetall(hash_key) == {b"f1": b"v1", b"f2": b"v2"}
+        assert await other_client.hset(hash_key, {"f3": "v3"}) == 1
+        start = time.time()
+        while len(cast(Dict[bytes, bytes], await client.hgetall(hash_key))) != 3:
+            assert time.time() - start < 5
+            await asyncio.sleep(0.01)
+        assert (await client.get_client_cache_statistics())["invalidations"] > 0
+
+        # Commands with other response options aren't cached
+        with decoded_responses():
+            assert await client.get(key) == "v3"
+
+        # Flushing the database flushes the cache
+        assert await other_client.custom_command(["FLUSHALL"]) == OK
+        start = time.time()
+        while await client.get(key) is not None:
+            assert time.time() - start < 5
+            await asyncio.sleep(0.01)
+        await client.close()
+        await other_client.close()
+
+    @pytest.mark.parametrize("cluster_mode", [False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    async def test_client_cache_broadcast(self, request, cluster_mode, protocol):
+        client = await create_client(
+            request,
+            cluster_mode=cluster_mode,
+            protocol=protocol,
+            client_cache=ClientCacheConfiguration(broadcast=True, prefixes=["bcast:"]),
+        )
+        other_client = await create_client(
+            request, cluster_mode=cluster_mode, protocol=protocol
+        )
+        key = f"bcast:{get_random_string(10)}"
+        other_key = get_random_string(10)
+        assert await client.set(key, "v1") == OK
+        assert await client.set(other_key, "v1") == OK
+        for _ in range(2):
+            assert await client.get(key) == b"v1"
+            assert await client.get(other_key) == b"v1"
+        # Only the keys of the prefixes are cached
+        stats = await client.get_client_cache_statistics()
+        assert stats["hits"] == 1
+        assert stats["entries"] == 1
+
+        assert await other_client.set(key, "v2") == OK
+        start = time.time()
+        while await client.get(key) != b"v2":
+            assert time.time() - start < 5
+            await asyncio.sleep(0.01)
+        await client.close()
+        await other_client.close()
+
+    @pytest.mark.parametrize("cluster_mode", [False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    async def test_client_cache_eviction(self, request, cluster_mode, protocol):
+        client = await create_client(
+            request,
+            cluster_mode=cluster_mode,
+            protocol=protocol,
+            client_cache=ClientCacheConfiguration(max_entries=2, ttl=1000),
+        )
+        keys = [get_random_string(10) for _ in range(3)]
+        for key in keys:
+            assert await client.set(key, key) == OK
+            assert await client.get(key) == key.encode()
+        stats = await client.get_client_cache_statistics()
+        assert stats["evictions"] == 1
+        assert stats["entries"] == 2
+        # The least recently used response was evicted
+        assert await client.get(keys[0]) == keys[0].encode()
+        assert (await client.get_client_cache_statistics())["hits"] == 0
+        # The responses expire
+        assert await client.get(keys[2]) == keys[2].encode()
+        await asyncio.sleep(1.1)
+        assert await client.get(keys[2]) == keys[2].encode()
+        assert (await client.get_client_cache_statistics())["hits"] == 1
+        await client.close()
+
+    async def test_client_cache_config_validation(self):
+        with pytest.raises(ValueError):
+            ClientCacheConfiguration(max_entries=0)
+        with pytest.raises(ValueError):
+            ClientCacheConfiguration(max_memory=0)
+        with pytest.raises(ValueError):
+            ClientCacheConfiguration(prefixes=["prefix:"])
+        config = GlideClientConfiguration(
+            [NodeAddress()],
+            protocol=ProtocolVersion.RESP2,
+            advanced_config=AdvancedGlideClientConfiguration(
+                client_cache=ClientCacheConfiguration()
+            ),
+        )
+        with pytest.raises(ConfigurationError):
+            config._create_a_protobuf_conn_request()
+
+    async def test_write_coalescing_config_validation(self):
+        with pytest.raises(ValueError):
+            AdvancedGlideClientConfiguration(write_coalescing_window_us=-1)
+        with pytest.raises(ValueError):
+            AdvancedGlideClusterClientConfiguration(
+                write_coalescing_window_us=100, write_coalescing_max_requests=0
+            )
+        with pytest.raises(ValueError):
+            AdvancedGlideClientConfiguration(auto_batch_window_us=-1)
+        with pytest.raises(ValueError):
+            AdvancedGlideClusterClientConfiguration(
+                auto_batch_window_us=100, auto_batch_max_commands=0
+            )
+
 
 @pytest.mark.asyncio
 class TestCommands:
@@ -0,0 +1,49 @@
+# Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
+
+import asyncio
+import threading
+
+import pytest
+from glide.event_loops import (
+    TrioEventLoop,
+    TrioFuture,
+    create_future,
+    get_running_event_loop,
+)
+
+
+@pytest.mark.asyncio
+class TestEventLoops:
+    async def test_asyncio_event_loop(self):
+        assert get_running_event_loop() is asyncio.get_running_loop()
+        assert isinstance(create_future(), asyncio.Future)
+
+    async def test_trio_future(self):
+        trio = pytest.importorskip("trio")
+
+        async def wait_for_result():
+            loop = get_running_event_loop()
+            assert isinstance(loop, TrioEventLoop)
+            assert loop == get_running_event_loop()
+            future = create_future()
+            assert isinstance(future, TrioFuture)
+            # Completed from another thread, like the responses of the in-process transport
+            threading.Thread(
+                target=loop.call_soon_threadsafe, args=(future.set_result, "value")
+            ).start()
+            assert await future == "value"
+            assert future.result() == "value"
+
+            future = create_future()
+            loop.call_soon_threadsafe(future.set_exception, ValueError("error"))
+            with pytest.raises(ValueError):
+                await future
+
+            future = create_future()
+            with trio.move_on_after(0.01):
+                await future
+            assert future.cancelled()
+            # A response that arrives after the cancellation is ignored
+            assert future.done()
+
+        await asyncio.to_thread(trio.run, wait_for_result)
@@ -0,0 +1,85 @@
+# Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
+
+import asyncio
+import random
+import threading
+from typing import List, cast
+
+import pytest
+from glide.inflight_requests import InflightRequests
+
+
+@pytest.mark.asyncio
+class TestInflightRequests:
+    async def test_allocate_and_release(self):
+        inflight_requests = InflightRequests(2)
+        first_future: asyncio.Future = asyncio.Future()
+        second_future: asyncio.Future = asyncio.Future()
+        assert inflight_requests.allocate(first_future) == 0
+        assert inflight_requests.allocate(second_future) == 1
+        assert len(inflight_requests) == 2
+        assert 1 in inflight_requests
+        assert inflight_requests.release(1) is second_future
+        assert 1 not in inflight_requests
+        assert inflight_requests.release(1) is None
+        assert inflight_requests.release(5) is None
+        assert inflight_requests.allocate(asyncio.Future()) == 1
+        assert list(inflight_requests.futures())[0] is first_future
+
+    async def test_grows_when_full(self):
+        inflight_requests = InflightRequests(4)
+        indexes = [inflight_requests.allocate(asyncio.Future()) for _ in range(9)]
+        assert indexes == list(range(9))
+        assert inflight_requests.capacity() == 16
+        assert len(inflight_requests) == 9
+
+    async def test_response_options(self):
+        inflight_requests = InflightRequests(1)
+        options = (None, None, True)
+        callback_idx = inflight_requests.allocate(asyncio.Future(), options)
+        assert inflight_requests.get_response_options(callback_idx) is options
+        inflight_requests.release(callback_idx)
+        assert inflight_requests.get_response_options(callback_idx) is None
+        callback_idx = inflight_requests.allocate(asyncio.Future())
+        assert inflight_requests.get_response_options(callback_idx) is None
+
+    async def test_index_is_never_shared(self):
+        inflight_requests = InflightRequests(8)
+        inflight = {}
+        for _ in range(10000):
+            if inflight and random.random() < 0.5:
+                callback_idx = random.choice(list(inflight))
+                assert inflight_requests.release(callback_idx) is inflight.pop(
+                    callback_idx
+                )
+            else:
+                future: asyncio.Future = asyncio.Future()
+                callback_idx = inflight_requests.allocate(future)
+                assert callback_idx not in inflight
+                inflight[callback_idx] = future
+            assert len(inflight_requests) == len(inflight)
+
+    async def test_concurrent_threads(self):
+        inflight_requests = InflightRequests(1)
+        allocated: List[List[int]] = []
+
+        def allocate_and_release() -> None:
+            indexes = []
+            for _ in range(1000):
+                # The threads have no event loop, the table only holds the futures
+                future = cast(asyncio.Future, object())
+                indexes.append(inflight_requests.allocate(future))
+                if len(indexes) > 2:
+                    assert inflight_requests.release(indexes.pop(0)) is not None
+            allocated.append(indexes)
+
+        threads = [threading.Thread(target=allocate_and_release) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # Every thread holds its last two indexes, no index was handed out twice
+        held = [callback_idx for indexes in allocated for callback_idx in indexes]
+        assert len(held) == 16
+        assert len(set(held)) == 16
+        assert len(inflight_requests) == 16
@@ -1,8 +1,21 @@
 # Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
 
 import pytest
-from glide.protobuf.command_request_pb2 import CommandRequest, RequestType
-from glide.protobuf.response_pb2 import Response
+from glide.glide import (
+    MAX_REQUEST_ARGS_LEN,
+    RESPONSE_KIND_CLOSING_ERROR,
+    RESPONSE_KIND_NIL,
+    RESPONSE_KIND_OK,
+    RESPONSE_KIND_PUSH,
+    RESPONSE_KIND_REQUEST_ERROR,
+    RESPONSE_KIND_VALUE,
+    create_leaked_value,
+    decode_responses,
+    encode_requests,
+    value_from_pointer,
+)
+from glide.protobuf.command_request_pb2 import CommandRequest, RequestType, Routes
+from glide.protobuf.response_pb2 import ConstantResponse, RequestErrorType, Response
 from glide.protobuf_codec import PartialMessageException, ProtobufCodec
 
 
@@ -55,3 +68,151 @@ class TestProtobufCodec:
         decoded_varint, res_len = ProtobufCodec._decode_varint_32(varint, 0)
         assert res_len == len(varint)
         assert decoded_varint == value
+
+
+class TestEncodeRequests:
+    def test_encode_requests(self):
+        routes = Routes()
+        routes.slot_key_route.slot_key = "foo"
+        script_request = CommandRequest()
+        script_request.callback_idx = 2
+        script_request.script_invocation.hash = "hash"
+        script_request.script_invocation.keys[:] = [b"key"]
+        requests = [
+            (0, RequestType.Get, [b"foo"], None, 0),
+            (
+                1000,
+                RequestType.Set,
+                [b"foo", b"bar" * 100],
+                routes.SerializeToString(),
+                0,
+            ),
+            script_request,
+        ]
+
+        b_arr = encode_requests(requests)
+        b_arr_view = memoryview(b_arr)
+        get_request, offset = ProtobufCodec.decode_delimited(
+            b_arr, b_arr_view, 0, CommandRequest
+        )
+        assert get_request.callback_idx == 0
+        assert get_request.single_command.request_type == RequestType.Get
+        assert get_request.single_command.args_array.args == [b"foo"]
+        assert not get_request.HasField("route")
+        set_request, offset = ProtobufCodec.decode_delimited(
+            b_arr, b_arr_view, offset, CommandRequest
+        )
+        assert set_request.callback_idx == 1000
+        assert set_request.single_command.request_type == RequestType.Set
+        assert set_request.single_command.args_array.args == [b"foo", b"bar" * 100]
+        assert set_request.route == routes
+        parsed_script_request, offset = ProtobufCodec.decode_delimited(
+            b_arr, b_arr_view, offset, CommandRequest
+        )
+        assert parsed_script_request == script_request
+        assert offset == len(b_arr)
+
+    def test_encode_requests_matches_protobuf_encoding(self):
+        request = CommandRequest()
+        request.callback_idx = 1
+        request.single_command.request_type = RequestType.Set
+        request.single_command.args_array.args[:] = [b"foo", b"bar"]
+        b_arr = bytearray()
+        ProtobufCodec.encode_delimited(b_arr, request)
+        assert (
+            encode_requests([(1, RequestType.Set, [b"foo", b"bar"], None, 0)]) == b_arr
+        )
+        request.client_id = 7
+        b_arr = bytearray()
+        ProtobufCodec.encode_delimited(b_arr, request)
+        assert (
+            encode_requests([(1, RequestType.Set, [b"foo", b"bar"], None, 7)]) == b_arr
+        )
+
+    def test_encode_requests_arg_types(self):
+        args = ["foo", bytearray(b"bar"), memoryview(b"baz"), 5, 2**70, 1.5]
+        b_arr = encode_requests([(1, RequestType.CustomCommand, args, None, 0)])
+        request, _ = ProtobufCodec.decode_delimited(
+            b_arr, memoryview(b_arr), 0, CommandRequest
+        )
+        assert request.single_command.args_array.args == [
+            b"foo",
+            b"bar",
+            b"baz",
+            b"5",
+            str(2**70).encode(),
+            b"1.5",
+        ]
+        with pytest.raises(TypeError):
+            encode_requests([(1, RequestType.CustomCommand, [True], None, 0)])
+        with pytest.raises(TypeError):
+            encode_requests([(1, RequestType.CustomCommand, [None], None, 0)])
+
+    def test_encode_requests_leaks_large_args(self):
+        args = [b"foo", b"a" * MAX_REQUEST_ARGS_LEN]
+        b_arr = encode_requests([(1, RequestType.Set, args, None, 0)])
+        request, _ = ProtobufCodec.decode_delimited(
+            b_arr, memoryview(b_arr), 0, CommandRequest
+        )
+        assert request.single_command.WhichOneof("args") == "args_vec_pointer"
+        assert len(b_arr) < MAX_REQUEST_ARGS_LEN
+
+
+class TestDecodeResponses:
+    def test_decode_responses(self):
+        b_arr = bytearray()
+        ok_response = Response()
+        ok_response.callback_idx = 1
+        ok_response.constant_response = ConstantResponse.OK
+        ProtobufCodec.encode_delimited(b_arr, ok_response)
+        error_response = Response()
+        error_response.callback_idx = 2
+        error_response.request_error.type = RequestErrorType.Timeout
+        error_response.request_error.message = "timed out"
+        ProtobufCodec.encode_delimited(b_arr, error_response)
+        value_response = Response()
+        value_response.callback_idx = 3
+        value_response.resp_pointer = create_leaked_value("foo")
+        ProtobufCodec.encode_delimited(b_arr, value_response)
+        nil_response = Response()
+        nil_response.callback_idx = 4
+        ProtobufCodec.encode_delimited(b_arr, nil_response)
+
+        [(client_id, responses)], leftover_bytes = decode_responses(b_arr)
+        assert leftover_bytes == 0
+        assert client_id == 0
+        assert responses[0] == (1, RESPONSE_KIND_OK, None)
+        assert responses[1] == (
+            2,
+            RESPONSE_KIND_REQUEST_ERROR,
+            (RequestErrorType.Timeout, "timed out"),
+        )
+        callback_idx, kind, payload = responses[2]
+        assert (callback_idx, kind) == (3, RESPONSE_KIND_VALUE)
+        assert value_from_pointer(payload) == b"foo"
+        assert responses[3] == (4, RESPONSE_KIND_NIL, None)
+
+    def test_decode_responses_keeps_partial_frame(self):
+        b_arr = bytearray()
+        response = Response()
+        response.callback_idx = 1
+        response.closing_error = "closing"
+        ProtobufCodec.encode_delimited(b_arr, response)
+        ProtobufCodec.encode_delimited(b_arr, response)
+        partial = b_arr[:-3]
+        client_responses, leftover_bytes = decode_responses(partial)
+        assert client_responses == [(0, [(1, RESPONSE_KIND_CLOSING_ERROR, "closing")])]
+        assert leftover_bytes == len(b_arr) // 2 - 3
+
+    def test_decode_responses_push(self):
+        b_arr = bytearray()
+        response = Response()
+        response.is_push = True
+        response.resp_pointer = create_leaked_value("push")
+        ProtobufCodec.encode_delimited(b_arr, response)
+        [(_, [(_, kind, payload)])], leftover_bytes = decode_responses(
+            memoryview(b_arr)
+        )
+        assert leftover_bytes == 0
+        assert kind == RESPONSE_KIND_PUSH
+        assert value_from_pointer(payload) == b"push"
@@ -1,9 +1,9 @@
 import asyncio
-from typing import AsyncGenerator, List, cast
+from typing import AsyncGenerator, List, Tuple, Union, cast
 
 import pytest
-from glide import ByAddressRoute
-from glide.async_commands.command_args import ObjectType
+from glide import AllPrimaries, ByAddressRoute
+from glide.async_commands.command_args import ObjectType, ShardScanCursor
 from glide.config import ProtocolVersion
 from glide.exceptions import RequestError
 from glide.glide import ClusterScanCursor
@@ -400,6 +400,105 @@ class TestScan:
             cursor = cast(ClusterScanCursor, result[0])
         assert set(keys) == set(results)
 
+        # The slots that aren't covered are scanned like the slots of a shard, with the same guarantees
+        with pytest.raises(RequestError) as e:
+            async for _ in glide_client_scoped.scan_parallel():
+                pass
+        assert "Could not find an address covering a slot" in str(e.value)
+        assert {
+            key
+            async for key in glide_client_scoped.scan_parallel(
+                allow_non_covered_slots=True
+            )
+        } == set(keys)
+
+    @pytest.mark.parametrize("cluster_mode", [True])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP2, ProtocolVersion.RESP3])
+    async def test_cluster_scan_parallel(self, glide_client: GlideClusterClient):
+        key = get_random_string(10)
+        expected_keys = {f"key:{key}:{i}".encode() for i in range(1000)}
+        await glide_client.mset({k: "value" for k in expected_keys})
+        await glide_client.sadd(f"key:{key}:set", ["value"])
+
+        assert {
+            key
+            async for key in glide_client.scan_parallel(
+                match=f"key:{key}:*", count=100, type=ObjectType.STRING
+            )
+        } == expected_keys
+
+        # Every shard has a cursor of its own, and together they cover all of the slots
+        cursors: List[ShardScanCursor] = []
+        keys = {
+            key
+            async for key in glide_client.scan_parallel(
+                match=f"key:{key}:*", parallelism=1, cursors=cursors
+            )
+        }
+        assert keys == expected_keys | {f"key:{key}:set".encode()}
+        assert len(cursors) == len(await glide_client.info(route=AllPrimaries()))
+        assert all(cursor.is_finished() for cursor in cursors)
+        assert sorted(
+            slot
+            for cursor in cursors
+            for start, end in cursor.slot_ranges
+            for slot in range(start, end + 1)
+        ) == list(range(16384))
+
+        with pytest.raises(ValueError):
+            async for _ in glide_client.scan_parallel(parallelism=0):
+                pass
+
+    @pytest.mark.parametrize("cluster_mode", [True])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    async def test_cluster_scan_parallel_resume(self, glide_client: GlideClusterClient):
+        key = get_random_string(10)
+        expected_keys = {f"{key}:{i}".encode() for i in range(1000)}
+        await glide_client.mset({k: "value" for k in expected_keys})
+
+        # An interrupted iteration continues from the cursors of its shards
+        cursors: List[ShardScanCursor] = []
+        keys = set()
+        async for scanned_key in glide_client.scan_parallel(
+            match=f"{key}:*", count=10, parallelism=2, cursors=cursors
+        ):
+            keys.add(scanned_key)
+            if len(keys) == 100:
+                break
+        assert not all(cursor.is_finished() for cursor in cursors)
+        async for scanned_key in glide_client.scan_parallel(
+            match=f"{key}:*", count=10, cursors=cursors
+        ):
+            keys.add(scanned_key)
+        assert keys == expected_keys
+        assert all(cursor.is_finished() for cursor in cursors)
+
+    @pytest.mark.parametrize("cluster_mode", [True])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    async def test_cluster_scan_parallel_early_break(
+        self, glide_client: GlideClusterClient
+    ):
+        key = get_random_string(10)
+        expected_keys = {f"{key}:{i}".encode() for i in range(1000)}
+        await glide_client.mset({k: "value" for k in expected_keys})
+
+        # Stopping an iteration waits for the scans that are in flight, so none of them is left behind
+        tasks = asyncio.all_tasks()
+        iterator = cast(
+            AsyncGenerator[bytes, None],
+            glide_client.scan_parallel(match=f"{key}:*", count=10),
+        )
+        async for scanned_key in iterator:
+            assert scanned_key in expected_keys
+            break
+        await iterator.aclose()
+        assert asyncio.all_tasks() == tasks
+
+        assert {
+            scanned_key
+            async for scanned_key in glide_client.scan_parallel(match=f"{key}:*")
+        } == expected_keys
+
     # Standalone scan tests
     @pytest.mark.parametrize("cluster_mode", [False])
     @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP2, ProtocolVersion.RESP3])
@@ -629,3 +728,90 @@ class TestScan:
         assert not set(encoded_hash_keys).intersection(set(keys))
         assert not set(encoded_list_keys).intersection(set(keys))
         assert not set(encoded_zset_keys).intersection(set(keys))
+
+    @pytest.mark.parametrize("cluster_mode", [False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP2, ProtocolVersion.RESP3])
+    async def test_standalone_scan_iter(self, glide_client: GlideClient):
+        key = get_random_string(10)
+        expected_keys = {f"key:{key}:{i}".encode() for i in range(100)}
+        await glide_client.mset({k: "value" for k in expected_keys})
+        await glide_client.sadd(f"key:{key}:set", ["value"])
+        await glide_client.set(f"{key}:other", "value")
+
+        keys = [
+            key
+            async for key in glide_client.scan_iter(
+                match=f"key:{key}:*", count=10, type=ObjectType.STRING
+            )
+        ]
+        assert set(keys) == expected_keys
+
+        pages = [
+            page
+            async for page in glide_client.scan_iter(
+                match=f"key:{key}:*", count=10, batched=True
+            )
+        ]
+        assert len(pages) > 1
+        assert set(k for page in pages for k in cast(List[bytes], page)) == (
+            expected_keys | {f"key:{key}:set".encode()}
+        )
+
+        # The iteration can be stopped before its last page, while the next page is prefetched
+        iterator = glide_client.scan_iter(count=1)
+        assert isinstance(await iterator.__anext__(), bytes)
+        await iterator.aclose()
+        assert await glide_client.get(f"{key}:other") == b"value"
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP2, ProtocolVersion.RESP3])
+    async def test_collection_scan_iter(
+        self, glide_client: Union[GlideClient, GlideClusterClient]
+    ):
+        key = get_random_string(10)
+        members = {f"member{i}".encode() for i in range(100)}
+        assert await glide_client.sadd(key + "set", list(members)) == 100
+        assert (
+            await glide_client.hset(
+                key + "hash", {member: member + b"-value" for member in members}
+            )
+            == 100
+        )
+        assert (
+            await glide_client.zadd(
+                key + "zset", {member: i for i, member in enumerate(sorted(members))}
+            )
+            == 100
+        )
+
+        assert {
+            member async for member in glide_client.sscan_iter(key + "set", count=10)
+        } == members
+        assert {
+            member
+            async for member in glide_client.sscan_iter(key + "set", match="member1*")
+        } == {member for member in members if member.startswith(b"member1")}
+
+        assert {
+            cast(Tuple[bytes, bytes], pair)
+            async for pair in glide_client.hscan_iter(key + "hash", count=10)
+        } == {(member, member + b"-value") for member in members}
+
+        scores = {
+            cast(Tuple[bytes, float], pair)
+            async for pair in glide_client.zscan_iter(key + "zset", count=10)
+        }
+        assert scores == {
+            (member, float(i)) for i, member in enumerate(sorted(members))
+        }
+
+        pages = [
+            page
+            async for page in glide_client.hscan_iter(
+                key + "hash", count=10, batched=True
+            )
+        ]
+        assert len(pages) > 1
+        assert {
+            pair for page in pages for pair in cast(List[Tuple[bytes, bytes]], page)
+        } == {(member, member + b"-value") for member in members}
@@ -0,0 +1,193 @@
+# Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
+
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Set, cast
+
+import pytest
+from glide import ClusterScanCursor, Script
+from glide.async_commands.transaction import (
+    Batch,
+    ClusterBatch,
+    ClusterTransaction,
+    Transaction,
+)
+from glide.config import (
+    AdvancedGlideClientConfiguration,
+    GlideClientConfiguration,
+    NodeAddress,
+    ProtocolVersion,
+)
+from glide.constants import OK
+from glide.exceptions import ClosingError, ConfigurationError, RequestError
+from glide.glide_sync_client import (
+    GlideSyncClient,
+    GlideSyncClusterClient,
+    TGlideSyncClient,
+)
+from tests.conftest import create_sync_client
+from tests.utils.sync_client_stub import STUB_PATH, generate_sync_client_stub
+from tests.utils.utils import get_random_string
+
+
+@pytest.mark.asyncio
+class TestGlideSyncClients:
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP2, ProtocolVersion.RESP3])
+    async def test_sync_client_commands(self, glide_sync_client: TGlideSyncClient):
+        key = get_random_string(10)
+        assert glide_sync_client.set(key, "value") == OK
+        assert glide_sync_client.get(key) == b"value"
+        assert glide_sync_client.get(get_random_string(10)) is None
+        assert glide_sync_client.hset(key + "hash", {"field": "value"}) == 1
+        assert glide_sync_client.hgetall(key + "hash") == {b"field": b"value"}
+        assert glide_sync_client.custom_command(["PING"]) == b"PONG"
+        with pytest.raises(RequestError):
+            glide_sync_client.incr(key)
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    async def test_sync_client_transaction_and_script(
+        self, glide_sync_client: TGlideSyncClient
+    ):
+        key = get_random_string(10)
+        if isinstance(glide_sync_client, GlideSyncClusterClient):
+            cluster_transaction = ClusterTransaction().set(key, "value").get(key)
+            assert glide_sync_client.exec(cluster_transaction) == [OK, b"value"]
+        else:
+            transaction = Transaction().set(key, "value").get(key)
+            assert glide_sync_client.exec(transaction) == [OK, b"value"]
+
+        script = Script("return redis.call('GET', KEYS[1])")
+        assert glide_sync_client.invoke_script(script, keys=[key]) == b"value"
+
+        if isinstance(glide_sync_client, GlideSyncClusterClient):
+            result = glide_sync_client.exec_batch(ClusterBatch().incr(key).get(key))
+        else:
+            result = glide_sync_client.exec_batch(Batch().incr(key).get(key))
+        assert isinstance(result[0], RequestError) and result[1] == b"value"
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    async def test_sync_client_multiple_threads(
+        self, glide_sync_client: TGlideSyncClient
+    ):
+        keys = [get_random_string(10) for _ in range(100)]
+
+        def set_and_get(key: str) -> Optional[bytes]:
+            assert glide_sync_client.set(key, key) == OK
+            return glide_sync_client.get(key)
+
+        # All of the threads share the connections of the client
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(set_and_get, keys))
+        assert results == [key.encode() for key in keys]
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    async def test_sync_client_inherited_by_forked_process(
+        self, glide_sync_client: TGlideSyncClient
+    ):
+        key = get_random_string(10)
+        assert glide_sync_client.set(key, "value") == OK
+
+        def run_in_child(results: multiprocessing.Queue):
+            results.put(glide_sync_client.get(key))
+
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+        process = context.Process(target=run_in_child, args=(results,))
+        process.start()
+        assert results.get(timeout=10) == b"value"
+        process.join()
+        assert process.exitcode == 0
+        # The client of the parent process isn't affected
+        assert glide_sync_client.get(key) == b"value"
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    async def test_sync_client_scan_iter(self, glide_sync_client: TGlideSyncClient):
+        key = get_random_string(10)
+        members = {f"member{i}".encode() for i in range(50)}
+        assert glide_sync_client.sadd(key, list(members)) == 50
+        assert set(glide_sync_client.sscan_iter(key, count=10)) == members
+        pages = list(glide_sync_client.sscan_iter(key, count=10, batched=True))
+        assert len(pages) > 1
+        assert {member for page in pages for member in page} == members
+        if isinstance(glide_sync_client, GlideSyncClient):
+            assert key.encode() in set(glide_sync_client.scan_iter(match=key))
+
+    @pytest.mark.parametrize("cluster_mode", [True])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    async def test_sync_client_cluster_scan(self, glide_sync_client: TGlideSyncClient):
+        assert isinstance(glide_sync_client, GlideSyncClusterClient)
+        keys = {f"{{key}}-{get_random_string(5)}".encode() for _ in range(10)}
+        for key in keys:
+            assert glide_sync_client.set(key, "value") == OK
+        cursor = ClusterScanCursor()
+        scanned: Set[bytes] = set()
+        while not cursor.is_finished():
+            result = glide_sync_client.scan(cursor, match=b"{key}-*")
+            cursor = cast(ClusterScanCursor, result[0])
+            scanned.update(cast(List[bytes], result[1]))
+        assert scanned == keys
+        assert set(glide_sync_client.scan_parallel(match=b"{key}-*")) == keys
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    async def test_sync_client_decode_responses(self, request, cluster_mode, protocol):
+        client = create_sync_client(
+            request, cluster_mode, protocol=protocol, decode_responses=True
+        )
+        key = get_random_string(10)
+        assert client.set(key, "value") == OK
+        assert client.get(key) == "value"
+        client.close()
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    async def test_sync_client_close(self, request, cluster_mode, protocol):
+        client = create_sync_client(request, cluster_mode, protocol=protocol)
+        assert client.ping() == b"PONG"
+        client.close()
+        with pytest.raises(ClosingError):
+            client.ping()
+
+    async def test_sync_client_lazy_connect(self):
+        config = GlideClientConfiguration(
+            [NodeAddress("localhost", 1)],
+            request_timeout=100,
+            advanced_config=AdvancedGlideClientConfiguration(lazy_connect=True),
+        )
+        client = GlideSyncClient.create(config)
+        # The client connects on its first command, and again on the next one if it failed
+        for _ in range(2):
+            with pytest.raises(ClosingError):
+                client.ping()
+        client.close()
+
+    async def test_sync_client_errors(self):
+        config = GlideClientConfiguration(
+            [NodeAddress("localhost", 1)], request_timeout=100
+        )
+        with pytest.raises(ClosingError):
+            GlideSyncClient.create(config)
+
+        config = GlideClientConfiguration(
+            [NodeAddress()],
+            pubsub_subscriptions=GlideClientConfiguration.PubSubSubscriptions(
+                channels_and_patterns={
+                    GlideClientConfiguration.PubSubChannelModes.Exact: {"channel"}
+                },
+                callback=None,
+                context=None,
+            ),
+        )
+        with pytest.raises(ConfigurationError):
+            GlideSyncClient.create(config)
+
+
+def test_sync_client_stub_is_up_to_date():
+    # The signatures of the synchronous clients are declared by a generated stub, which has to be regenerated
+    # whenever the commands change
+    assert STUB_PATH.read_text() == generate_sync_client_stub()
@@ -50,10 +50,12 @@ from glide.async_commands.stream import (
 )
 from glide.async_commands.transaction import (
     BaseTransaction,
+    Batch,
+    ClusterBatch,
     ClusterTransaction,
     Transaction,
 )
-from glide.config import ProtocolVersion
+from glide.config import ClientTransport, ProtocolVersion
 from glide.constants import OK, TResult, TSingleNodeRoute
 from glide.glide_client import GlideClient, GlideClusterClient, TGlideClient
 from glide.routes import SlotIdRoute, SlotType
@@ -1249,3 +1251,59 @@ class TestTransaction:
 
             # Test clean up
             await glide_client.function_flush()
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP2, ProtocolVersion.RESP3])
+    async def test_batch(self, glide_client: TGlideClient):
+        # The keys of a batch may belong to different slots
+        keys = [get_random_string(10) for _ in range(20)]
+        batch = Batch() if isinstance(glide_client, GlideClient) else ClusterBatch()
+        for key in keys:
+            batch.set(key, key)
+        for key in keys:
+            batch.get(key)
+        if isinstance(glide_client, GlideClient):
+            result = await glide_client.exec_batch(cast(Batch, batch))
+        else:
+            result = await glide_client.exec_batch(cast(ClusterBatch, batch))
+        assert result == [OK] * len(keys) + [key.encode() for key in keys]
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    async def test_batch_errors_inline(self, glide_client: TGlideClient):
+        key = get_random_string(10)
+        batch = Batch() if isinstance(glide_client, GlideClient) else ClusterBatch()
+        batch.set(key, "value").incr(key).get(key).custom_command(["INCR", key, key])
+        if isinstance(glide_client, GlideClient):
+            result = await glide_client.exec_batch(cast(Batch, batch))
+        else:
+            result = await glide_client.exec_batch(cast(ClusterBatch, batch))
+        # Unlike in a transaction, the commands that failed don't affect the other commands
+        assert result[0] == OK
+        assert isinstance(result[1], RequestError)
+        assert result[2] == b"value"
+        assert isinstance(result[3], RequestError)
+
+    @pytest.mark.parametrize("cluster_mode", [True, False])
+    @pytest.mark.parametrize("protocol", [ProtocolVersion.RESP3])
+    @pytest.mark.parametrize(
+        "transport", [ClientTransport.SOCKET, ClientTransport.IN_PROCESS]
+    )
+    async def test_batch_larger_than_inflight_requests_limit(
+        self, request, cluster_mode, protocol, transport
+    ):
+        glide_client = await create_client(
+            request,
+            cluster_mode=cluster_mode,
+            protocol=protocol,
+            transport=transport,
+            inflight_requests_limit=10,
+        )
+        keys = [get_random_string(10) for _ in range(25)]
+        batch = Batch() if isinstance(glide_client, GlideClient) else ClusterBatch()
+        for key in keys:
+            batch.set(key, key).get(key)
+        result = await glide_client.exec_batch(batch)  # type: ignore[arg-type]
+        # Each GET reads the value of the SET that precedes it
+        assert result == [value for key in keys for value in (OK, key.encode())]
+        await glide_client.close()
@@ -0,0 +1,90 @@
+# Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
+
+from typing import Any, List, Tuple
+
+import pytest
+from glide.glide import RESPONSE_KIND_CLOSING_ERROR, RESPONSE_KIND_NIL
+from glide.protobuf.response_pb2 import Response
+from glide.protobuf_codec import ProtobufCodec
+from glide.uds_connection import UdsConnection
+
+
+def encode_responses(
+    callback_indexes: List[int], message: str = "", client_id: int = 0
+) -> bytearray:
+    b_arr = bytearray()
+    for callback_idx in callback_indexes:
+        response = Response()
+        response.callback_idx = callback_idx
+        response.client_id = client_id
+        if message:
+            response.closing_error = message
+        ProtobufCodec.encode_delimited(b_arr, response)
+    return b_arr
+
+
+def feed(connection: UdsConnection, data: bytes, chunk_size: int) -> None:
+    for offset in range(0, len(data), chunk_size):
+        chunk = data[offset : offset + chunk_size]
+        buffer = connection.get_buffer(len(chunk))
+        assert len(buffer) >= len(chunk)
+        buffer[: len(chunk)] = chunk
+        connection.buffer_updated(len(chunk))
+
+
+@pytest.mark.asyncio
+class TestUdsConnection:
+    async def test_frames_split_across_reads(self):
+        received: List[Tuple[int, int, Any]] = []
+        connection = UdsConnection(
+            lambda client_id, responses: received.extend(responses),
+            lambda exc: None,
+            buffer_size=16,
+        )
+        callback_indexes = list(range(1, 200))
+        feed(connection, encode_responses(callback_indexes), chunk_size=3)
+        assert received == [
+            (callback_idx, RESPONSE_KIND_NIL, None) for callback_idx in callback_indexes
+        ]
+
+    async def test_buffer_grows_for_large_frames(self):
+        received: List[Tuple[int, int, Any]] = []
+        connection = UdsConnection(
+            lambda client_id, responses: received.extend(responses),
+            lambda exc: None,
+            buffer_size=16,
+        )
+        message = "a" * 1000
+        feed(connection, encode_responses([1, 2], message), chunk_size=4)
+        assert received == [
+            (1, RESPONSE_KIND_CLOSING_ERROR, message),
+            (2, RESPONSE_KIND_CLOSING_ERROR, message),
+        ]
+        assert len(connection.get_buffer(-1)) >= 1000
+
+    async def test_responses_grouped_by_client(self):
+        received: List[Tuple[int, List[Tuple[int, int, Any]]]] = []
+        connection = UdsConnection(
+            lambda client_id, responses: received.append((client_id, responses)),
+            lambda exc: None,
+        )
+        data = (
+            encode_responses([1, 2], client_id=0)
+            + encode_responses([1], client_id=3)
+            + encode_responses([3], client_id=0)
+        )
+        feed(connection, data, chunk_size=len(data))
+        assert received == [
+            (0, [(1, RESPONSE_KIND_NIL, None), (2, RESPONSE_KIND_NIL, None)]),
+            (3, [(1, RESPONSE_KIND_NIL, None)]),
+            (0, [(3, RESPONSE_KIND_NIL, None)]),
+        ]
+
+    async def test_connection_lost(self):
+        lost = []
+        connection = UdsConnection(lambda client_id, responses: None, lost.append)
+        connection.connection_lost(None)
+        await connection.wait_closed()
+        assert lost == [None]
+        with pytest.raises(ConnectionResetError):
+            await connection.drain()
@@ -3,7 +3,7 @@
 import json
 import time
 import uuid
-from typing import List, Mapping, Union, cast
+from typing import Any, List, Mapping, Union, cast
 
 import pytest
 from glide.async_commands.command_args import OrderBy
@@ -41,6 +41,7 @@ from glide.config import ProtocolVersion
 from glide.constants import OK, FtSearchResponse, TEncodable
 from glide.exceptions import RequestError
 from glide.glide_client import GlideClusterClient
+from glide.response_options import ResultAdapter, result_adapter
 
 
 @pytest.mark.asyncio
@@ -271,6 +272,27 @@ class TestFt:
             fieldName2="b",
         )
 
+        # Search the index with the rows result adapter, which returns every document as a flat row.
+        with result_adapter(ResultAdapter.ROWS):
+            # Adapted results don't match the declared return type of the command
+            rows_result = cast(
+                List[Any],
+                await ft.search(glide_client, index, "*", options=ft_search_options),
+            )
+        TestFt._ft_search_deep_compare_result(
+            self,
+            result=[
+                rows_result[0],
+                {row[0]: dict(zip(row[1::2], row[2::2])) for row in rows_result[1]},
+            ],
+            json_key1=json_key1,
+            json_key2=json_key2,
+            json_value1=json_value1,
+            json_value2=json_value2,
+            fieldName1="a",
+            fieldName2="b",
+        )
+
         # Test FT.PROFILE for the above mentioned FT.SEARCH query and search options.
 
         ft_profile_result = await ft.profile(
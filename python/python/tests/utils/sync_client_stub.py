@@ -0,0 +1,231 @@
+# Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
+
+"""
+Generates `glide/glide_sync_client.pyi`, the type stub of the synchronous clients.
+
+The synchronous clients share the command implementations of the asyncio clients, and make them blocking when the
+classes are created. The stub declares the commands with the signatures they have at runtime: coroutine functions
+return their result, and async generators are regular generators.
+
+To regenerate the stub after changing the commands, run from the `python/python` directory:
+
+    python -m tests.utils.sync_client_stub
+"""
+
+import ast
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+GLIDE_DIR = Path(__file__).parent.parent.parent / "glide"
+STUB_PATH = GLIDE_DIR / "glide_sync_client.pyi"
+
+# (module, file) of the modules that define the classes of the stub
+SYNC_CLIENT_MODULE = ("glide.glide_sync_client", GLIDE_DIR / "glide_sync_client.py")
+COMMAND_MODULES = {
+    "CoreCommands": (
+        "glide.async_commands.core",
+        GLIDE_DIR / "async_commands" / "core.py",
+    ),
+    "StandaloneCommands": (
+        "glide.async_commands.standalone_commands",
+        GLIDE_DIR / "async_commands" / "standalone_commands.py",
+    ),
+    "ClusterCommands": (
+        "glide.async_commands.cluster_commands",
+        GLIDE_DIR / "async_commands" / "cluster_commands.py",
+    ),
+}
+# The command class that each class of the stub takes its commands from
+STUB_CLASSES = {
+    "BaseSyncClient": "CoreCommands",
+    "GlideSyncClusterClient": "ClusterCommands",
+    "GlideSyncClient": "StandaloneCommands",
+}
+
+HEADER = """# Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
+
+# Generated by `python -m tests.utils.sync_client_stub`, don't edit it manually.
+"""
+
+TFunction = Union[ast.FunctionDef, ast.AsyncFunctionDef]
+
+
+def _module_names(module: str, tree: ast.Module) -> Dict[str, Tuple[str, str]]:
+    """Returns the module and the name each name of the module's namespace is imported from."""
+    names: Dict[str, Tuple[str, str]] = {}
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom):
+            source = node.module or ""
+            if node.level:
+                source = ".".join(module.split(".")[: -node.level] + [source])
+            for alias in node.names:
+                names[alias.asname or alias.name] = (source, alias.name)
+        elif isinstance(node, (ast.ClassDef, ast.FunctionDef)):
+            names[node.name] = (module, node.name)
+        elif isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    names[target.id] = (module, target.id)
+    return names
+
+
+def _class(tree: ast.Module, name: str) -> ast.ClassDef:
+    return next(
+        node
+        for node in tree.body
+        if isinstance(node, ast.ClassDef) and node.name == name
+    )
+
+
+def _public_methods(cls: ast.ClassDef) -> List[TFunction]:
+    return [
+        node
+        for node in cls.body
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+        and (not node.name.startswith("_") or node.name == "__init__")
+    ]
+
+
+def _is_generator(function: TFunction) -> bool:
+    return any(
+        isinstance(node, (ast.Yield, ast.YieldFrom)) for node in ast.walk(function)
+    )
+
+
+def _blocking_return_type(function: TFunction) -> Optional[ast.expr]:
+    returns = function.returns
+    if function.name == "__init__":
+        return ast.Constant(None)
+    if not isinstance(function, ast.AsyncFunctionDef) or not _is_generator(function):
+        return returns
+    # `AsyncIterator[T]` and `AsyncGenerator[T, None]` are made `Generator[T, None, None]`
+    assert isinstance(returns, ast.Subscript)
+    item = (
+        returns.slice.elts[0] if isinstance(returns.slice, ast.Tuple) else returns.slice
+    )
+    return ast.Subscript(
+        value=ast.Name("Generator"),
+        slice=ast.Tuple([item, ast.Constant(None), ast.Constant(None)]),
+    )
+
+
+def _stub_method(function: TFunction) -> ast.FunctionDef:
+    return ast.FunctionDef(
+        name=function.name,
+        args=function.args,
+        body=[ast.Expr(ast.Constant(...))],
+        decorator_list=function.decorator_list,
+        returns=_blocking_return_type(function),
+        type_comment=None,
+        lineno=0,
+    )
+
+
+def _used_names(nodes: List[ast.AST]) -> Set[str]:
+    used = set()
+    for node in nodes:
+        for child in ast.walk(node):
+            if isinstance(child, ast.Name):
+                used.add(child.id)
+            elif isinstance(child, ast.Constant) and isinstance(child.value, str):
+                # Forward references
+                try:
+                    used |= _used_names([ast.parse(child.value, mode="eval")])
+                except SyntaxError:
+                    pass
+    return used
+
+
+def _imports(used: Set[str], namespaces: List[Dict[str, Tuple[str, str]]]) -> List[str]:
+    imports: Dict[str, Set[str]] = {}
+    for name in sorted(used):
+        for namespace in namespaces:
+            if name in namespace:
+                module, original = namespace[name]
+                alias = original if original == name else f"{original} as {name}"
+                imports.setdefault(module, set()).add(alias)
+                break
+    return [
+        f"from {module} import {', '.join(sorted(names))}"
+        for module, names in sorted(imports.items())
+    ]
+
+
+def generate_sync_client_stub() -> str:
+    """Returns the content of the type stub of the synchronous clients."""
+    import black
+    import isort
+
+    sync_module, sync_file = SYNC_CLIENT_MODULE
+    sync_tree = ast.parse(sync_file.read_text())
+    namespaces = [
+        # `Self` is imported from `typing` or `typing_extensions` depending on the Python version
+        {
+            "Generator": ("typing", "Generator"),
+            "Self": ("typing_extensions", "Self"),
+        },
+        _module_names(sync_module, sync_tree),
+    ]
+    command_classes: Dict[str, ast.ClassDef] = {}
+    for class_name, (module, file) in COMMAND_MODULES.items():
+        tree = ast.parse(file.read_text())
+        command_classes[class_name] = _class(tree, class_name)
+        namespaces.append(_module_names(module, tree))
+
+    classes: List[ast.stmt] = []
+    for class_name, command_class_name in STUB_CLASSES.items():
+        sync_class = _class(sync_tree, class_name)
+        methods = _public_methods(sync_class)
+        overridden = {method.name for method in methods}
+        methods += [
+            method
+            for method in _public_methods(command_classes[command_class_name])
+            if method.name not in overridden
+        ]
+        body: List[ast.stmt] = []
+        if class_name == "BaseSyncClient":
+            body.append(
+                ast.AnnAssign(
+                    target=ast.Name("config"),
+                    annotation=ast.Name("BaseClientConfiguration"),
+                    simple=1,
+                )
+            )
+        body += [_stub_method(method) for method in methods]
+        bases: List[ast.expr] = (
+            [] if class_name == "BaseSyncClient" else [ast.Name("BaseSyncClient")]
+        )
+        classes.append(
+            ast.ClassDef(
+                name=class_name, bases=bases, keywords=[], body=body, decorator_list=[]
+            )
+        )
+    aliases: List[ast.stmt] = [
+        node
+        for node in sync_tree.body
+        if isinstance(node, ast.Assign)
+        and any(
+            isinstance(target, ast.Name) and target.id == "TGlideSyncClient"
+            for target in node.targets
+        )
+    ]
+    stub = ast.Module(body=classes + aliases, type_ignores=[])
+    used = _used_names([stub]) - set(STUB_CLASSES) - {"TGlideSyncClient"}
+    used.add("BaseClientConfiguration")
+    source = "\n".join(
+        [
+            HEADER,
+            *_imports(used, namespaces),
+            "",
+            ast.unparse(ast.fix_missing_locations(stub)),
+        ]
+    )
+    # Sorted with the settings of the package, like `isort` run from the `python` directory
+    source = isort.code(
+        source, config=isort.Config(settings_path=str(GLIDE_DIR.parent.parent))
+    )
+    return black.format_str(source, mode=black.Mode(is_pyi=True))
+
+
+if __name__ == "__main__":
+    STUB_PATH.write_text(generate_sync_client_stub())
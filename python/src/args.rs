@@ -0,0 +1,154 @@
+// Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
+
+//! Conversion of the command arguments passed from Python.
+//!
+//! Arguments are taken as they were passed to the command, so the wrapper doesn't need to encode
+//! them to `bytes` first. `bytes` and `str` arguments are read in place, and so is the memory of any
+//! contiguous object that supports the buffer protocol, such as `bytearray`, `memoryview`, `mmap` or
+//! NumPy arrays. That removes the copy made by converting a buffer to `bytes` in Python; the core
+//! still copies every argument once, into the command it writes to the connection.
+
+use bytes::Bytes;
+use pyo3::buffer::PyBuffer;
+use pyo3::exceptions::PyTypeError;
+use pyo3::ffi;
+use pyo3::prelude::*;
+use pyo3::types::{PyBool, PyBytes, PyFloat, PyLong, PyString};
+use std::ops::Deref;
+
+/// A contiguous, read-only view of the memory of an object that supports the buffer protocol.
+///
+/// The view keeps the exporting object alive, and prevents resizable exporters such as `bytearray`
+/// from being resized, until it is dropped.
+pub(crate) struct ArgBuffer {
+    view: Box<ffi::Py_buffer>,
+}
+
+// The exported memory stays valid until the view is released, and releasing it takes the GIL.
+unsafe impl Send for ArgBuffer {}
+unsafe impl Sync for ArgBuffer {}
+
+impl ArgBuffer {
+    /// Returns a view of `obj`'s memory as plain bytes, or `None` if `obj` doesn't support the
+    /// buffer protocol or can't export its memory as a single contiguous block.
+    pub(crate) fn get(obj: &Bound<PyAny>) -> Option<Self> {
+        let mut view = Box::new(unsafe { std::mem::zeroed::<ffi::Py_buffer>() });
+        if unsafe { ffi::PyObject_GetBuffer(obj.as_ptr(), &mut *view, ffi::PyBUF_SIMPLE) } == -1 {
+            // Clear the error, the caller falls back to other conversions.
+            drop(PyErr::take(obj.py()));
+            return None;
+        }
+        Some(ArgBuffer { view })
+    }
+
+    fn as_slice(&self) -> &[u8] {
+        if self.view.len == 0 {
+            return &[];
+        }
+        unsafe { std::slice::from_raw_parts(self.view.buf as *const u8, self.view.len as usize) }
+    }
+}
+
+impl AsRef<[u8]> for ArgBuffer {
+    fn as_ref(&self) -> &[u8] {
+        self.as_slice()
+    }
+}
+
+// Releasing a view takes the GIL. Views that are shared with the socket listener are dropped on a
+// core thread once the command is built, so each large buffer argument briefly takes the GIL there.
+impl Drop for ArgBuffer {
+    fn drop(&mut self) {
+        Python::with_gil(|_| unsafe { ffi::PyBuffer_Release(&mut *self.view) });
+    }
+}
+
+/// The bytes of a single command argument.
+pub(crate) enum ArgBytes<'a, 'py> {
+    Bytes(&'a Bound<'py, PyBytes>),
+    Str(&'a str),
+    Owned(Vec<u8>),
+    Buffer(ArgBuffer),
+}
+
+impl ArgBytes<'_, '_> {
+    /// Converts the argument to `Bytes` that can outlive the GIL. The memory of `bytes` and buffer
+    /// arguments is shared with the Python object instead of being copied here, and is read by the
+    /// core when it copies the argument into the command.
+    pub(crate) fn into_shared(self) -> Bytes {
+        match self {
+            ArgBytes::Bytes(bytes) => match ArgBuffer::get(bytes.as_any()) {
+                Some(buffer) => Bytes::from_owner(buffer),
+                None => Bytes::copy_from_slice(bytes.as_bytes()),
+            },
+            ArgBytes::Str(string) => Bytes::copy_from_slice(string.as_bytes()),
+            ArgBytes::Owned(vec) => Bytes::from(vec),
+            ArgBytes::Buffer(buffer) => Bytes::from_owner(buffer),
+        }
+    }
+}
+
+impl Deref for ArgBytes<'_, '_> {
+    type Target = [u8];
+
+    fn deref(&self) -> &[u8] {
+        match self {
+            ArgBytes::Bytes(bytes) => bytes.as_bytes(),
+            ArgBytes::Str(string) => string.as_bytes(),
+            ArgBytes::Owned(vec) => vec,
+            ArgBytes::Buffer(buffer) => buffer.as_slice(),
+        }
+    }
+}
+
+/// Returns the bytes of a command argument.
+///
+/// `str` arguments are encoded as UTF-8, `int` and `float` arguments are formatted as Python
+/// formats them, and any other object that supports the buffer protocol is taken as its raw bytes.
+pub(crate) fn arg_bytes<'a, 'py>(arg: &'a Bound<'py, PyAny>) -> PyResult<ArgBytes<'a, 'py>> {
+    if let Ok(bytes) = arg.downcast::<PyBytes>() {
+        return Ok(ArgBytes::Bytes(bytes));
+    }
+    if let Ok(string) = arg.downcast::<PyString>() {
+        return Ok(ArgBytes::Str(string.to_str()?));
+    }
+    // `bool` is a subclass of `int`, but "True" is rarely the intended argument.
+    if arg.is_instance_of::<PyBool>() {
+        return Err(unsupported_arg_error(arg));
+    }
+    if arg.is_instance_of::<PyLong>() {
+        if let Ok(value) = arg.extract::<i64>() {
+            return Ok(ArgBytes::Owned(value.to_string().into_bytes()));
+        }
+        return Ok(ArgBytes::Owned(arg.str()?.to_str()?.as_bytes().to_vec()));
+    }
+    if arg.is_instance_of::<PyFloat>() {
+        return Ok(ArgBytes::Owned(arg.str()?.to_str()?.as_bytes().to_vec()));
+    }
+    if let Some(buffer) = ArgBuffer::get(arg) {
+        return Ok(ArgBytes::Buffer(buffer));
+    }
+    // Non-contiguous buffers, such as strided memoryviews, are copied.
+    if let Ok(buffer) = PyBuffer::<u8>::get_bound(arg) {
+        return Ok(ArgBytes::Owned(buffer.to_vec(arg.py())?));
+    }
+    Err(unsupported_arg_error(arg))
+}
+
+/// Returns the bytes of all of the arguments of a command.
+pub(crate) fn args_bytes<'a, 'py>(
+    args: &'a [Bound<'py, PyAny>],
+) -> PyResult<Vec<ArgBytes<'a, 'py>>> {
+    args.iter().map(arg_bytes).collect()
+}
+
+fn unsupported_arg_error(arg: &Bound<PyAny>) -> PyErr {
+    let type_name = arg
+        .get_type()
+        .name()
+        .map(|name| name.to_string())
+        .unwrap_or_else(|_| "unknown".to_string());
+    PyTypeError::new_err(format!(
+        "Expected a str, bytes, int or float argument, or an object that supports the buffer protocol, got {type_name}"
+    ))
+}
@@ -0,0 +1,112 @@
+// Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
+
+//! A read-only bytes object that shares the memory of a response instead of copying it.
+
+use crate::args::ArgBuffer;
+use pyo3::exceptions::{PyBufferError, PyValueError};
+use pyo3::ffi;
+use pyo3::prelude::*;
+use pyo3::types::PyBytes;
+use std::ffi::{c_int, c_void, CString};
+use std::sync::OnceLock;
+
+/// The value of a bulk string response, kept in the memory it was received into.
+///
+/// `GlideBuffer` supports the buffer protocol, so `memoryview`, `numpy.frombuffer`, `file.write`
+/// and `socket.send` can consume the value without copying it. `bytes(buffer)` copies it.
+#[pyclass(frozen, module = "glide")]
+pub struct GlideBuffer {
+    data: Vec<u8>,
+    /// The hash of `data`, computed on the first call to `__hash__`.
+    hash: OnceLock<isize>,
+}
+
+impl GlideBuffer {
+    pub(crate) fn new(data: Vec<u8>) -> Self {
+        GlideBuffer {
+            data,
+            hash: OnceLock::new(),
+        }
+    }
+}
+
+#[pymethods]
+impl GlideBuffer {
+    unsafe fn __getbuffer__(
+        slf: Bound<'_, Self>,
+        view: *mut ffi::Py_buffer,
+        flags: c_int,
+    ) -> PyResult<()> {
+        if view.is_null() {
+            return Err(PyBufferError::new_err("View is null"));
+        }
+        if (flags & ffi::PyBUF_WRITABLE) == ffi::PyBUF_WRITABLE {
+            return Err(PyBufferError::new_err("GlideBuffer is read-only"));
+        }
+        let data = &slf.get().data;
+        // Fills a one dimensional, read-only view and takes a reference to `slf`, which keeps the
+        // memory alive until the view is released. The memory is never modified nor moved.
+        let result = ffi::PyBuffer_FillInfo(
+            view,
+            slf.as_ptr(),
+            data.as_ptr() as *mut c_void,
+            data.len() as ffi::Py_ssize_t,
+            1,
+            flags,
+        );
+        if result == -1 {
+            return Err(PyErr::fetch(slf.py()));
+        }
+        Ok(())
+    }
+
+    fn __len__(&self) -> usize {
+        self.data.len()
+    }
+
+    fn __bytes__<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        PyBytes::new_bound(py, &self.data)
+    }
+
+    fn __eq__(&self, py: Python, other: &Bound<PyAny>) -> PyObject {
+        if let Ok(other) = other.downcast::<GlideBuffer>() {
+            return (self.data == other.get().data).into_py(py);
+        }
+        match ArgBuffer::get(other) {
+            Some(other) => (self.data.as_slice() == other.as_ref()).into_py(py),
+            None => py.NotImplemented(),
+        }
+    }
+
+    /// Hashes like `bytes` with the same content, so buffers and `bytes` can be used interchangeably
+    /// as dictionary keys. The data is hashed in place, once, like `bytes` caches its hash.
+    fn __hash__(&self) -> isize {
+        *self.hash.get_or_init(|| unsafe {
+            ffi::_Py_HashBytes(
+                self.data.as_ptr() as *const c_void,
+                self.data.len() as ffi::Py_ssize_t,
+            )
+        })
+    }
+
+    fn __repr__(&self) -> String {
+        format!("GlideBuffer({} bytes)", self.data.len())
+    }
+
+    /// Decodes the value into a `str`, like `bytes.decode`.
+    #[pyo3(signature = (encoding="utf-8", errors="strict"))]
+    fn decode(&self, py: Python, encoding: &str, errors: &str) -> PyResult<PyObject> {
+        let encoding =
+            CString::new(encoding).map_err(|err| PyValueError::new_err(err.to_string()))?;
+        let errors = CString::new(errors).map_err(|err| PyValueError::new_err(err.to_string()))?;
+        unsafe {
+            let decoded = ffi::PyUnicode_Decode(
+                self.data.as_ptr() as *const std::ffi::c_char,
+                self.data.len() as ffi::Py_ssize_t,
+                encoding.as_ptr(),
+                errors.as_ptr(),
+            );
+            PyObject::from_owned_ptr_or_err(py, decoded)
+        }
+    }
+}
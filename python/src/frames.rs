@@ -0,0 +1,310 @@
+// Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
+
+//! Encoding and decoding of the length-delimited protobuf frames exchanged with the socket listener.
+//!
+//! The wrapper used to parse every response into a Python protobuf message. Decoding here lets the
+//! reader loop work on `(callback_idx, kind, payload)` tuples, the same shape that is produced by
+//! the in-process client.
+//!
+//! In the other direction, single commands are written straight into the outgoing buffer from the
+//! `(callback_idx, request_type, args, route, client_id)` tuples queued by the wrapper, so no Python
+//! `CommandRequest` message is built for them.
+//!
+//! Several logical clients can share one socket connection. Requests carry the id of their client,
+//! and the socket listener echoes it in their responses, which are grouped by client here.
+
+use crate::args::{args_bytes, ArgBytes};
+use crate::native_client::Completion;
+use bytes::Bytes;
+use glide_core::response::{response, Response};
+use glide_core::MAX_REQUEST_ARGS_LENGTH;
+use protobuf::Message;
+use pyo3::buffer::PyBuffer;
+use pyo3::exceptions::{PyBufferError, PyValueError};
+use pyo3::prelude::*;
+use pyo3::types::{PyByteArray, PyBytes, PyList, PyTuple};
+use redis::Value;
+use std::ptr::from_mut;
+
+/// The maximal number of bytes in an encoded 64 bit varint.
+const MAX_VARINT_LENGTH: usize = 10;
+
+// Wire tags of the `CommandRequest` fields written by `encode_requests`, see `command_request.proto`.
+/// `CommandRequest.callback_idx`, field 1, varint.
+const CALLBACK_IDX_TAG: u8 = 0x08;
+/// `CommandRequest.single_command`, field 2, length delimited.
+const SINGLE_COMMAND_TAG: u8 = 0x12;
+/// `CommandRequest.route`, field 8, length delimited.
+const ROUTE_TAG: u8 = 0x42;
+/// `CommandRequest.client_id`, field 9, varint.
+const CLIENT_ID_TAG: u8 = 0x48;
+/// `Command.request_type`, field 1, varint.
+const REQUEST_TYPE_TAG: u8 = 0x08;
+/// `Command.args_array`, field 2, length delimited.
+const ARGS_ARRAY_TAG: u8 = 0x12;
+/// `Command.args_vec_pointer`, field 3, varint.
+const ARGS_VEC_POINTER_TAG: u8 = 0x18;
+/// `Command.ArgsArray.args`, field 1, length delimited.
+const ARG_TAG: u8 = 0x0A;
+
+/// Returns the number of bytes `value` takes when encoded as a varint.
+fn varint_length(value: u64) -> usize {
+    let bits = 64 - (value | 1).leading_zeros() as usize;
+    bits.div_ceil(7)
+}
+
+fn encode_varint(buffer: &mut Vec<u8>, mut value: u64) {
+    while value >= 0x80 {
+        buffer.push((value as u8) | 0x80);
+        value >>= 7;
+    }
+    buffer.push(value as u8);
+}
+
+/// Returns the number of bytes a length delimited field with a payload of `length` bytes takes.
+fn length_delimited_field_length(length: usize) -> usize {
+    1 + varint_length(length as u64) + length
+}
+
+fn encode_length_delimited_field(buffer: &mut Vec<u8>, tag: u8, payload: &[u8]) {
+    buffer.push(tag);
+    encode_varint(buffer, payload.len() as u64);
+    buffer.extend_from_slice(payload);
+}
+
+/// Writes a length-delimited `CommandRequest` holding a single command.
+///
+/// Arguments whose total length reaches `MAX_REQUEST_ARGS_LENGTH` aren't copied into the frame.
+/// Instead, like `create_leaked_bytes_vec`, they are leaked to the socket listener, which takes
+/// ownership of them by pointer. `bytes` and buffer arguments are shared with their Python objects
+/// rather than copied here; the core copies them into the command it builds.
+fn encode_single_command(
+    buffer: &mut Vec<u8>,
+    callback_idx: u32,
+    request_type: i32,
+    args: Vec<ArgBytes>,
+    route: Option<&[u8]>,
+    client_id: u32,
+) {
+    let args_length: usize = args.iter().map(|arg| arg.len()).sum();
+    let (args, args_vec_pointer) = if args_length >= MAX_REQUEST_ARGS_LENGTH {
+        let bytes_vec: Vec<Bytes> = args.into_iter().map(ArgBytes::into_shared).collect();
+        (
+            Vec::new(),
+            Some(from_mut(Box::leak(Box::new(bytes_vec))) as u64),
+        )
+    } else {
+        (args, None)
+    };
+    let args_array_length: usize = args
+        .iter()
+        .map(|arg| length_delimited_field_length(arg.len()))
+        .sum();
+
+    // Negative enum values are sign extended to 64 bits on the wire.
+    let request_type = request_type as i64 as u64;
+    let mut command_length = match args_vec_pointer {
+        Some(pointer) => 1 + varint_length(pointer),
+        None => length_delimited_field_length(args_array_length),
+    };
+    if request_type != 0 {
+        command_length += 1 + varint_length(request_type);
+    }
+    let mut request_length = length_delimited_field_length(command_length);
+    if callback_idx != 0 {
+        request_length += 1 + varint_length(callback_idx as u64);
+    }
+    if let Some(route) = route {
+        request_length += length_delimited_field_length(route.len());
+    }
+    if client_id != 0 {
+        request_length += 1 + varint_length(client_id as u64);
+    }
+
+    buffer.reserve(varint_length(request_length as u64) + request_length);
+    encode_varint(buffer, request_length as u64);
+    if callback_idx != 0 {
+        buffer.push(CALLBACK_IDX_TAG);
+        encode_varint(buffer, callback_idx as u64);
+    }
+    buffer.push(SINGLE_COMMAND_TAG);
+    encode_varint(buffer, command_length as u64);
+    if request_type != 0 {
+        buffer.push(REQUEST_TYPE_TAG);
+        encode_varint(buffer, request_type);
+    }
+    match args_vec_pointer {
+        Some(pointer) => {
+            buffer.push(ARGS_VEC_POINTER_TAG);
+            encode_varint(buffer, pointer);
+        }
+        None => {
+            buffer.push(ARGS_ARRAY_TAG);
+            encode_varint(buffer, args_array_length as u64);
+            for arg in args {
+                encode_length_delimited_field(buffer, ARG_TAG, arg);
+            }
+        }
+    }
+    if let Some(route) = route {
+        encode_length_delimited_field(buffer, ROUTE_TAG, route);
+    }
+    if client_id != 0 {
+        buffer.push(CLIENT_ID_TAG);
+        encode_varint(buffer, client_id as u64);
+    }
+}
+
+/// Encodes the requests buffered by the wrapper into a single buffer of length-delimited frames.
+///
+/// Every item is either a `(callback_idx, request_type, args, route, client_id)` tuple describing a
+/// single command, where `args` are converted with `arg_bytes` and `route` is a serialized `Routes`
+/// message or `None`, or a protobuf message
+/// (`CommandRequest` or `ConnectionRequest`), which is serialized as is.
+#[pyfunction]
+pub fn encode_requests<'py>(
+    py: Python<'py>,
+    requests: &Bound<'py, PyList>,
+) -> PyResult<Bound<'py, PyByteArray>> {
+    let mut buffer = Vec::new();
+    for request in requests.iter() {
+        if let Ok(command) = request.downcast::<PyTuple>() {
+            let (callback_idx, request_type, args, route, client_id): (
+                u32,
+                i32,
+                Vec<Bound<PyAny>>,
+                Option<Bound<PyBytes>>,
+                u32,
+            ) = command.extract()?;
+            encode_single_command(
+                &mut buffer,
+                callback_idx,
+                request_type,
+                args_bytes(&args)?,
+                route.as_ref().map(|route| route.as_bytes()),
+                client_id,
+            );
+        } else {
+            let message = request.call_method0("SerializeToString")?;
+            let message = message.downcast::<PyBytes>()?.as_bytes();
+            encode_varint(&mut buffer, message.len() as u64);
+            buffer.extend_from_slice(message);
+        }
+    }
+    Ok(PyByteArray::new_bound(py, &buffer))
+}
+
+/// Decodes a varint from the start of `buffer`, returning the value and the number of bytes it took.
+/// Returns `Ok(None)` if the buffer ends before the varint does.
+fn decode_varint(buffer: &[u8]) -> PyResult<Option<(u64, usize)>> {
+    let mut result: u64 = 0;
+    for (index, byte) in buffer.iter().take(MAX_VARINT_LENGTH).enumerate() {
+        result |= ((byte & 0x7F) as u64) << (7 * index);
+        if byte & 0x80 == 0 {
+            return Ok(Some((result, index + 1)));
+        }
+    }
+    if buffer.len() >= MAX_VARINT_LENGTH {
+        return Err(PyValueError::new_err(
+            "Too many bytes when decoding varint.",
+        ));
+    }
+    Ok(None)
+}
+
+/// Borrows the bytes of a contiguous Python buffer.
+///
+/// # Safety
+///
+/// The returned slice is only valid while `buffer` is alive, and as long as the exporting object
+/// isn't resized. Callers must not run arbitrary Python code while holding it.
+unsafe fn buffer_as_slice(buffer: &PyBuffer<u8>) -> PyResult<&[u8]> {
+    if !buffer.is_c_contiguous() {
+        return Err(PyBufferError::new_err("Expected a contiguous buffer"));
+    }
+    Ok(unsafe { std::slice::from_raw_parts(buffer.buf_ptr() as *const u8, buffer.len_bytes()) })
+}
+
+fn completion_from_response(response: Response) -> (u32, Completion) {
+    let completion = match response.value {
+        Some(response::Value::RespPointer(pointer)) if response.is_push => {
+            Completion::Push(pointer)
+        }
+        Some(response::Value::RespPointer(pointer)) => Completion::Value(pointer),
+        Some(response::Value::ConstantResponse(_)) => Completion::Ok,
+        Some(response::Value::RequestError(request_error)) => Completion::RequestError(
+            request_error.type_.value() as u32,
+            request_error.message.to_string(),
+        ),
+        Some(response::Value::ClosingError(message)) => {
+            Completion::ClosingError(message.to_string())
+        }
+        None if response.is_push => Completion::ClosingError(
+            "Client Error - push notification without resp_pointer".to_string(),
+        ),
+        None => Completion::Nil,
+    };
+    (response.callback_idx, completion)
+}
+
+/// Frees the value that a response that won't be converted points to.
+fn free_response_value(response: &Response) {
+    if let Some(response::Value::RespPointer(pointer)) = &response.value {
+        drop(unsafe { Box::from_raw(*pointer as *mut Value) });
+    }
+}
+
+/// Decodes all of the complete length-delimited `Response` frames found in `buffer`.
+///
+/// Returns a list of `(client_id, responses)` pairs, where `responses` is a list of
+/// `(callback_idx, kind, payload)` tuples, and the number of bytes left at the end of the buffer,
+/// which belong to a partially received frame. Consecutive responses of the same client are
+/// grouped in a single pair, so a connection that isn't shared returns at most one pair.
+#[pyfunction]
+pub fn decode_responses(py: Python, buffer: &Bound<PyAny>) -> PyResult<(PyObject, usize)> {
+    let buffer = PyBuffer::<u8>::get_bound(buffer)?;
+    let bytes = unsafe { buffer_as_slice(&buffer)? };
+    // All of the frames are parsed before any of them is converted, so the values of the responses
+    // that were parsed can be freed if a later frame fails to parse
+    let mut parsed = Vec::new();
+    let mut offset = 0;
+    while offset < bytes.len() {
+        let Some((length, varint_length)) = decode_varint(&bytes[offset..])? else {
+            break;
+        };
+        let start = offset + varint_length;
+        let end = start + length as usize;
+        if end > bytes.len() {
+            break;
+        }
+        match Response::parse_from_bytes(&bytes[start..end]) {
+            Ok(response) => parsed.push(response),
+            Err(err) => {
+                parsed.iter().for_each(free_response_value);
+                return Err(PyValueError::new_err(format!(
+                    "Failed to decode response: {err}"
+                )));
+            }
+        }
+        offset = end;
+    }
+    let groups = PyList::empty_bound(py);
+    let mut group_client_id = None;
+    let mut responses = PyList::empty_bound(py);
+    for response in parsed {
+        let client_id = response.client_id;
+        if group_client_id != Some(client_id) {
+            if let Some(group_client_id) = group_client_id {
+                groups.append((group_client_id, responses))?;
+                responses = PyList::empty_bound(py);
+            }
+            group_client_id = Some(client_id);
+        }
+        let (callback_idx, completion) = completion_from_response(response);
+        responses.append(completion.into_py_tuple(py, callback_idx))?;
+    }
+    if let Some(group_client_id) = group_client_id {
+        groups.append((group_client_id, responses))?;
+    }
+    Ok((groups.into_py(py), bytes.len() - offset))
+}
@@ -7,16 +7,26 @@ use glide_core::Telemetry;
 use glide_core::MAX_REQUEST_ARGS_LENGTH;
 use pyo3::exceptions::PyTypeError;
 use pyo3::prelude::*;
-use pyo3::types::{PyAny, PyBool, PyBytes, PyDict, PyFloat, PyList, PySet, PyString};
+use pyo3::types::{PyAny, PyBytes, PyDict, PyString};
 use pyo3::Python;
 use redis::Value;
 use std::collections::HashMap;
 use std::ptr::from_mut;
 use std::sync::Arc;
 
+mod args;
+mod buffer;
+mod frames;
+mod native_client;
+mod response;
+use buffer::GlideBuffer;
+use native_client::NativeClient;
+use response::{adapted_value_to_py, LazyArray, LazyArrayIterator, ResponseOptions};
+
 pub const DEFAULT_TIMEOUT_IN_MILLISECONDS: u32 =
     glide_core::client::DEFAULT_RESPONSE_TIMEOUT.as_millis() as u32;
 pub const MAX_REQUEST_ARGS_LEN: u32 = MAX_REQUEST_ARGS_LENGTH as u32;
+pub const DEFAULT_INFLIGHT_REQUESTS_LIMIT: u32 = glide_core::client::DEFAULT_MAX_INFLIGHT_REQUESTS;
 
 #[pyclass(eq, eq_int)]
 #[derive(PartialEq, Eq, PartialOrd, Clone)]
@@ -111,11 +121,38 @@ fn glide(_py: Python, m: &Bound<PyModule>) -> PyResult<()> {
     m.add_class::<Level>()?;
     m.add_class::<Script>()?;
     m.add_class::<ClusterScanCursor>()?;
+    m.add_class::<NativeClient>()?;
+    m.add_class::<GlideBuffer>()?;
+    m.add_class::<LazyArray>()?;
+    m.add_class::<LazyArrayIterator>()?;
     m.add(
         "DEFAULT_TIMEOUT_IN_MILLISECONDS",
         DEFAULT_TIMEOUT_IN_MILLISECONDS,
     )?;
     m.add("MAX_REQUEST_ARGS_LEN", MAX_REQUEST_ARGS_LEN)?;
+    m.add(
+        "DEFAULT_INFLIGHT_REQUESTS_LIMIT",
+        DEFAULT_INFLIGHT_REQUESTS_LIMIT,
+    )?;
+    m.add("RESPONSE_KIND_VALUE", native_client::RESPONSE_KIND_VALUE)?;
+    m.add("RESPONSE_KIND_NIL", native_client::RESPONSE_KIND_NIL)?;
+    m.add("RESPONSE_KIND_OK", native_client::RESPONSE_KIND_OK)?;
+    m.add(
+        "RESPONSE_KIND_REQUEST_ERROR",
+        native_client::RESPONSE_KIND_REQUEST_ERROR,
+    )?;
+    m.add(
+        "RESPONSE_KIND_CLOSING_ERROR",
+        native_client::RESPONSE_KIND_CLOSING_ERROR,
+    )?;
+    m.add("RESPONSE_KIND_PUSH", native_client::RESPONSE_KIND_PUSH)?;
+    m.add("RESULT_ADAPTER_NONE", response::RESULT_ADAPTER_NONE)?;
+    m.add("RESULT_ADAPTER_PAIRS", response::RESULT_ADAPTER_PAIRS)?;
+    m.add(
+        "RESULT_ADAPTER_PARALLEL_ARRAYS",
+        response::RESULT_ADAPTER_PARALLEL_ARRAYS,
+    )?;
+    m.add("RESULT_ADAPTER_ROWS", response::RESULT_ADAPTER_ROWS)?;
     m.add_function(wrap_pyfunction!(py_log, m)?)?;
     m.add_function(wrap_pyfunction!(py_init, m)?)?;
     m.add_function(wrap_pyfunction!(start_socket_listener_external, m)?)?;
@@ -123,6 +160,12 @@ fn glide(_py: Python, m: &Bound<PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(create_leaked_value, m)?)?;
     m.add_function(wrap_pyfunction!(create_leaked_bytes_vec, m)?)?;
     m.add_function(wrap_pyfunction!(get_statistics, m)?)?;
+    m.add_function(wrap_pyfunction!(frames::decode_responses, m)?)?;
+    m.add_function(wrap_pyfunction!(frames::encode_requests, m)?)?;
+    m.add_function(wrap_pyfunction!(
+        native_client::reset_runtime_after_fork,
+        m
+    )?)?;
 
     #[pyfunction]
     fn py_log(log_level: Level, log_identifier: String, message: String) {
@@ -182,81 +225,30 @@ fn glide(_py: Python, m: &Bound<PyModule>) -> PyResult<()> {
         Ok(Python::with_gil(|py| "OK".into_py(py)))
     }
 
-    fn iter_to_value<TIterator>(
-        py: Python,
-        iter: impl IntoIterator<Item = Value, IntoIter = TIterator>,
-    ) -> PyResult<Vec<PyObject>>
-    where
-        TIterator: ExactSizeIterator<Item = Value>,
-    {
-        let mut iterator = iter.into_iter();
-        let len = iterator.len();
-
-        iterator.try_fold(Vec::with_capacity(len), |mut acc, val| {
-            acc.push(resp_value_to_py(py, val)?);
-            Ok(acc)
-        })
-    }
-
-    fn resp_value_to_py(py: Python, val: Value) -> PyResult<PyObject> {
-        match val {
-            Value::Nil => Ok(py.None()),
-            Value::SimpleString(str) => {
-                let data_bytes = PyBytes::new_bound(py, str.as_bytes());
-                Ok(data_bytes.into_py(py))
-            }
-            Value::Okay => Ok("OK".into_py(py)),
-            Value::Int(num) => Ok(num.into_py(py)),
-            Value::BulkString(data) => {
-                let data_bytes = PyBytes::new_bound(py, &data);
-                Ok(data_bytes.into_py(py))
-            }
-            Value::Array(bulk) => {
-                let elements: Bound<PyList> = PyList::new_bound(py, iter_to_value(py, bulk)?);
-                Ok(elements.into_py(py))
-            }
-            Value::Map(map) => {
-                let dict = PyDict::new_bound(py);
-                for (key, value) in map {
-                    dict.set_item(resp_value_to_py(py, key)?, resp_value_to_py(py, value)?)?;
-                }
-                Ok(dict.into_py(py))
-            }
-            Value::Attribute { data, attributes } => {
-                let dict = PyDict::new_bound(py);
-                let value = resp_value_to_py(py, *data)?;
-                let attributes = resp_value_to_py(py, Value::Map(attributes))?;
-                dict.set_item("value", value)?;
-                dict.set_item("attributes", attributes)?;
-                Ok(dict.into_py(py))
-            }
-            Value::Set(set) => {
-                let set = iter_to_value(py, set)?;
-                let set = PySet::new_bound(py, set.iter())?;
-                Ok(set.into_py(py))
-            }
-            Value::Double(double) => Ok(PyFloat::new_bound(py, double).into_py(py)),
-            Value::Boolean(boolean) => Ok(PyBool::new_bound(py, boolean).into_py(py)),
-            Value::VerbatimString { format: _, text } => {
-                // TODO create MATCH on the format
-                let data_bytes = PyBytes::new_bound(py, text.as_bytes());
-                Ok(data_bytes.into_py(py))
-            }
-            Value::BigNumber(bigint) => Ok(bigint.into_py(py)),
-            Value::Push { kind, data } => {
-                let dict = PyDict::new_bound(py);
-                dict.set_item("kind", format!("{kind:?}"))?;
-                let values: Bound<PyList> = PyList::new_bound(py, iter_to_value(py, data)?);
-                dict.set_item("values", values)?;
-                Ok(dict.into_py(py))
-            }
-        }
-    }
-
+    /// Converts the leaked `Value` at `pointer` into Python objects and frees it.
+    ///
+    /// Bulk strings of at least `buffer_min_size` bytes are returned as `GlideBuffer` objects that
+    /// keep the received memory, instead of being copied into `bytes`. Arrays of at least
+    /// `lazy_min_length` elements are returned as `LazyArray` objects that convert their elements
+    /// on access. If `decode` is set, UTF-8 strings are returned as `str` instead of `bytes`.
+    /// `adapter` is one of the `RESULT_ADAPTER_*` constants, and changes the shape of the result.
     #[pyfunction]
-    pub fn value_from_pointer(py: Python, pointer: u64) -> PyResult<PyObject> {
+    #[pyo3(signature = (pointer, buffer_min_size=None, lazy_min_length=None, decode=false, adapter=0))]
+    pub fn value_from_pointer(
+        py: Python,
+        pointer: u64,
+        buffer_min_size: Option<usize>,
+        lazy_min_length: Option<usize>,
+        decode: bool,
+        adapter: u8,
+    ) -> PyResult<PyObject> {
         let value = unsafe { Box::from_raw(pointer as *mut Value) };
-        resp_value_to_py(py, *value)
+        let options = ResponseOptions {
+            buffer_min_size,
+            lazy_min_length,
+            decode,
+        };
+        adapted_value_to_py(py, *value, options, adapter)
     }
 
     #[pyfunction]
@@ -268,16 +260,13 @@ fn glide(_py: Python, m: &Bound<PyModule>) -> PyResult<()> {
     }
 
     #[pyfunction]
-    pub fn create_leaked_bytes_vec(args_vec: Vec<Bound<PyBytes>>) -> usize {
-        // Convert the bytes vec -> Bytes vector
-        let bytes_vec: Vec<Bytes> = args_vec
-            .iter()
-            .map(|v| {
-                let bytes = v.as_bytes();
-                Bytes::from(bytes.to_vec())
-            })
+    pub fn create_leaked_bytes_vec(args_vec: Vec<Bound<PyAny>>) -> PyResult<usize> {
+        // Convert the args vec -> Bytes vector, sharing the memory of bytes and buffer objects
+        let bytes_vec: Vec<Bytes> = args::args_bytes(&args_vec)?
+            .into_iter()
+            .map(args::ArgBytes::into_shared)
             .collect();
-        from_mut(Box::leak(Box::new(bytes_vec))) as usize
+        Ok(from_mut(Box::leak(Box::new(bytes_vec))) as usize)
     }
     Ok(())
 }
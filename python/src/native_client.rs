@@ -0,0 +1,624 @@
+// Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
+
+//! An in-process client that drives glide-core directly from the Python extension.
+//!
+//! The socket based client serializes every request with protobuf, writes it to the socket
+//! listener over a Unix domain socket, and reads the protobuf encoded response back the same way.
+//! `NativeClient` skips both hops: the wrapper hands the already encoded arguments to this module,
+//! the request runs on a Tokio runtime owned by the extension, and the result is queued until the
+//! wrapper's event loop drains it with `take_completions`.
+//!
+//! A client created with `connect` is blocking instead: every request waits for its result, with
+//! the GIL released, and returns it. Any number of threads can wait on the same client at once,
+//! and their requests are multiplexed over its connections.
+
+use crate::args::{arg_bytes, args_bytes};
+use futures::future::join_all;
+use glide_core::client::Client;
+use glide_core::cluster_scan_container::get_cluster_scan_cursor;
+use glide_core::command_request::{RequestType as ProtobufRequestType, Routes, SlotTypes};
+use glide_core::connection_request::ConnectionRequest;
+use glide_core::errors::{error_message, error_type, RequestErrorType};
+use glide_core::request_type::RequestType;
+use logger_core::log_warn;
+use protobuf::{EnumOrUnknown, Message};
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use pyo3::types::PyList;
+use redis::cluster_routing::{
+    MultipleNodeRoutingInfo, ResponsePolicy, Routable, Route, RoutingInfo, SingleNodeRoutingInfo,
+    SlotAddr,
+};
+use redis::{ClusterScanArgs, Cmd, PushInfo, RedisResult, ScanStateRC, Value};
+use std::future::Future;
+use std::ptr::{from_mut, null_mut};
+use std::sync::atomic::{AtomicPtr, Ordering};
+use std::sync::{Arc, Mutex, RwLock};
+use tokio::runtime::{Builder, Runtime};
+use tokio::sync::mpsc;
+
+/// The response holds a pointer to a leaked `Value`, to be converted with `value_from_pointer`.
+pub const RESPONSE_KIND_VALUE: u8 = 0;
+/// The response is a null value.
+pub const RESPONSE_KIND_NIL: u8 = 1;
+/// The response is the constant `OK` response.
+pub const RESPONSE_KIND_OK: u8 = 2;
+/// The request failed, the payload is a tuple of the error type and the error message.
+pub const RESPONSE_KIND_REQUEST_ERROR: u8 = 3;
+/// The client can no longer be used, the payload is the closing reason.
+pub const RESPONSE_KIND_CLOSING_ERROR: u8 = 4;
+/// The response is a push notification, the payload is a pointer to a leaked `Value::Push`.
+pub const RESPONSE_KIND_PUSH: u8 = 5;
+
+/// The runtime on which all of the in-process clients run their requests, or null until it is
+/// first used. Runtimes are leaked once published, so a loaded runtime is never freed.
+static RUNTIME: AtomicPtr<Runtime> = AtomicPtr::new(null_mut());
+
+/// Returns the runtime on which all of the in-process clients run their requests.
+pub(crate) fn runtime() -> &'static Runtime {
+    let current = RUNTIME.load(Ordering::Acquire);
+    if let Some(runtime) = unsafe { current.as_ref() } {
+        return runtime;
+    }
+    let runtime = Box::into_raw(Box::new(
+        Builder::new_multi_thread()
+            .enable_all()
+            .thread_name("glide-python-runtime")
+            .build()
+            .expect("Failed to create the native client runtime"),
+    ));
+    match RUNTIME.compare_exchange(current, runtime, Ordering::AcqRel, Ordering::Acquire) {
+        Ok(_) => unsafe { &*runtime },
+        Err(_) => {
+            // Another thread published a runtime first
+            drop(unsafe { Box::from_raw(runtime) });
+            self::runtime()
+        }
+    }
+}
+
+/// Discards the runtime inherited from the parent process, must be called in the child process
+/// right after a fork.
+///
+/// The worker threads of the inherited runtime don't exist in the child, so tasks spawned on it
+/// would never run. The runtime is leaked, rather than dropped, since dropping it would wait for
+/// these threads. A new runtime is created when it is next used.
+#[pyfunction]
+pub fn reset_runtime_after_fork() {
+    RUNTIME.store(null_mut(), Ordering::Release);
+}
+
+fn leak_value(value: Value) -> u64 {
+    from_mut(Box::leak(Box::new(value))) as u64
+}
+
+/// A completed request, kept without the GIL until the wrapper drains it.
+pub(crate) enum Completion {
+    Value(u64),
+    Nil,
+    Ok,
+    RequestError(u32, String),
+    ClosingError(String),
+    Push(u64),
+}
+
+impl From<RedisResult<Value>> for Completion {
+    fn from(result: RedisResult<Value>) -> Self {
+        match result {
+            Ok(Value::Okay) => Completion::Ok,
+            Ok(Value::Nil) => Completion::Nil,
+            Ok(value) => Completion::Value(leak_value(value)),
+            Err(err) => Completion::RequestError(error_type(&err) as u32, error_message(&err)),
+        }
+    }
+}
+
+impl Completion {
+    pub(crate) fn into_py_tuple(self, py: Python, callback_idx: u32) -> PyObject {
+        let (kind, payload) = match self {
+            Completion::Value(pointer) => (RESPONSE_KIND_VALUE, pointer.into_py(py)),
+            Completion::Nil => (RESPONSE_KIND_NIL, py.None()),
+            Completion::Ok => (RESPONSE_KIND_OK, py.None()),
+            Completion::RequestError(error_type, message) => (
+                RESPONSE_KIND_REQUEST_ERROR,
+                (error_type, message).into_py(py),
+            ),
+            Completion::ClosingError(message) => (RESPONSE_KIND_CLOSING_ERROR, message.into_py(py)),
+            Completion::Push(pointer) => (RESPONSE_KIND_PUSH, pointer.into_py(py)),
+        };
+        (callback_idx, kind, payload).into_py(py)
+    }
+}
+
+/// Completed requests waiting to be drained by the wrapper.
+///
+/// The `wakeup` callback is only invoked when the queue turns from empty to non-empty, so a burst of
+/// completions costs a single wakeup of the wrapper's event loop.
+pub(crate) struct CompletionQueue {
+    completions: Mutex<Vec<(u32, Completion)>>,
+    wakeup: PyObject,
+}
+
+impl CompletionQueue {
+    pub(crate) fn new(wakeup: PyObject) -> Self {
+        CompletionQueue {
+            completions: Mutex::new(Vec::new()),
+            wakeup,
+        }
+    }
+
+    pub(crate) fn push(&self, callback_idx: u32, completion: Completion) {
+        let should_wake = {
+            let mut completions = self
+                .completions
+                .lock()
+                .expect("Failed to acquire the completions lock");
+            completions.push((callback_idx, completion));
+            completions.len() == 1
+        };
+        if should_wake {
+            Python::with_gil(|py| {
+                if let Err(err) = self.wakeup.call0(py) {
+                    err.print(py);
+                }
+            });
+        }
+    }
+
+    pub(crate) fn take(&self, py: Python) -> PyResult<PyObject> {
+        let completions = std::mem::take(
+            &mut *self
+                .completions
+                .lock()
+                .expect("Failed to acquire the completions lock"),
+        );
+        let list = PyList::empty_bound(py);
+        for (callback_idx, completion) in completions {
+            list.append(completion.into_py_tuple(py, callback_idx))?;
+        }
+        Ok(list.into_py(py))
+    }
+}
+
+fn get_slot_addr(slot_type: &EnumOrUnknown<SlotTypes>) -> PyResult<SlotAddr> {
+    slot_type
+        .enum_value()
+        .map(|slot_type| match slot_type {
+            SlotTypes::Primary => SlotAddr::Master,
+            SlotTypes::Replica => SlotAddr::ReplicaRequired,
+        })
+        .map_err(|id| PyValueError::new_err(format!("Received unexpected slot id type {id}")))
+}
+
+/// Parses a serialized protobuf `Routes` message into the routing used by the core.
+fn get_route(route: Option<&[u8]>, cmd: Option<&Cmd>) -> PyResult<Option<RoutingInfo>> {
+    use glide_core::command_request::routes::Value as RouteValue;
+    use glide_core::command_request::SimpleRoutes;
+    let Some(route) = route else {
+        return Ok(None);
+    };
+    let route = Routes::parse_from_bytes(route)
+        .map_err(|err| PyValueError::new_err(format!("Received invalid route: {err}")))?;
+    let Some(route) = route.value else {
+        return Ok(None);
+    };
+    let get_response_policy = |cmd: Option<&Cmd>| {
+        cmd.and_then(|cmd| {
+            cmd.command()
+                .and_then(|cmd| ResponsePolicy::for_command(&cmd))
+        })
+    };
+    match route {
+        RouteValue::SimpleRoutes(simple_route) => {
+            let simple_route = simple_route.enum_value().map_err(|id| {
+                PyValueError::new_err(format!("Received unexpected simple route type {id}"))
+            })?;
+            match simple_route {
+                SimpleRoutes::AllNodes => Ok(Some(RoutingInfo::MultiNode((
+                    MultipleNodeRoutingInfo::AllNodes,
+                    get_response_policy(cmd),
+                )))),
+                SimpleRoutes::AllPrimaries => Ok(Some(RoutingInfo::MultiNode((
+                    MultipleNodeRoutingInfo::AllMasters,
+                    get_response_policy(cmd),
+                )))),
+                SimpleRoutes::Random => {
+                    Ok(Some(RoutingInfo::SingleNode(SingleNodeRoutingInfo::Random)))
+                }
+            }
+        }
+        RouteValue::SlotKeyRoute(slot_key_route) => Ok(Some(RoutingInfo::SingleNode(
+            SingleNodeRoutingInfo::SpecificNode(Route::new(
+                redis::cluster_topology::get_slot(slot_key_route.slot_key.as_bytes()),
+                get_slot_addr(&slot_key_route.slot_type)?,
+            )),
+        ))),
+        RouteValue::SlotIdRoute(slot_id_route) => Ok(Some(RoutingInfo::SingleNode(
+            SingleNodeRoutingInfo::SpecificNode(Route::new(
+                slot_id_route.slot_id as u16,
+                get_slot_addr(&slot_id_route.slot_type)?,
+            )),
+        ))),
+        RouteValue::ByAddressRoute(by_address_route) => {
+            match u16::try_from(by_address_route.port) {
+                Ok(port) => Ok(Some(RoutingInfo::SingleNode(
+                    SingleNodeRoutingInfo::ByAddress {
+                        host: by_address_route.host.to_string(),
+                        port,
+                    },
+                ))),
+                Err(err) => {
+                    log_warn("get route", format!("Failed to parse port: {err:?}"));
+                    Ok(None)
+                }
+            }
+        }
+    }
+}
+
+/// Builds the command for the given request type.
+///
+/// The arguments are read in place and copied once, into the command. Buffer arguments are not
+/// referenced after this returns, so callers may modify them as soon as the command is submitted.
+fn get_command(request_type: i32, args: &[Bound<PyAny>]) -> PyResult<Cmd> {
+    let request_type: RequestType =
+        EnumOrUnknown::<ProtobufRequestType>::from_i32(request_type).into();
+    let Some(mut cmd) = request_type.get_command() else {
+        return Err(PyValueError::new_err(format!(
+            "Received invalid request type: {request_type:?}"
+        )));
+    };
+    for arg in args {
+        cmd.arg(arg_bytes(arg)?.as_ref());
+    }
+    if cmd.args_iter().next().is_none() {
+        return Err(PyValueError::new_err(
+            "Received command without a command name or arguments",
+        ));
+    }
+    Ok(cmd)
+}
+
+/// A glide-core client that is called directly from Python, bypassing the socket listener.
+#[pyclass]
+pub struct NativeClient {
+    client: RwLock<Option<Client>>,
+    /// The queue of completed requests, or `None` if the client is blocking.
+    completions: Option<Arc<CompletionQueue>>,
+}
+
+impl NativeClient {
+    fn get_client(&self) -> PyResult<Client> {
+        self.client
+            .read()
+            .expect("Failed to acquire the client lock")
+            .clone()
+            .ok_or_else(|| {
+                PyValueError::new_err("Unable to execute requests; the native client is closed.")
+            })
+    }
+
+    /// Runs the request produced by `request` on the runtime.
+    ///
+    /// If the client isn't blocking, the result is queued under `callback_idx` and `None` is
+    /// returned. Otherwise, the result is waited for without holding the GIL and returned as a
+    /// `(callback_idx, kind, payload)` tuple.
+    fn submit_request<Fut>(
+        &self,
+        py: Python,
+        callback_idx: u32,
+        request: impl FnOnce(Client) -> Fut,
+    ) -> PyResult<PyObject>
+    where
+        Fut: Future<Output = RedisResult<Value>> + Send + 'static,
+    {
+        let client = self.get_client()?;
+        if !client.reserve_inflight_request() {
+            let completion = Completion::RequestError(
+                RequestErrorType::Unspecified as u32,
+                "Reached maximum inflight requests".to_string(),
+            );
+            return Ok(self.complete(py, callback_idx, completion));
+        }
+        let future = request(client.clone());
+        let Some(completions) = &self.completions else {
+            let result = py.allow_threads(|| runtime().block_on(future));
+            client.release_inflight_request();
+            return Ok(Completion::from(result).into_py_tuple(py, callback_idx));
+        };
+        let completions = Arc::clone(completions);
+        runtime().spawn(async move {
+            let result = future.await;
+            client.release_inflight_request();
+            completions.push(callback_idx, result.into());
+        });
+        Ok(py.None())
+    }
+
+    /// Queues the completion, or returns it if the client is blocking.
+    fn complete(&self, py: Python, callback_idx: u32, completion: Completion) -> PyObject {
+        match &self.completions {
+            Some(completions) => {
+                completions.push(callback_idx, completion);
+                py.None()
+            }
+            None => completion.into_py_tuple(py, callback_idx),
+        }
+    }
+}
+
+async fn push_notifications_loop(
+    mut push_rx: mpsc::UnboundedReceiver<PushInfo>,
+    completions: Arc<CompletionQueue>,
+) {
+    while let Some(push_msg) = push_rx.recv().await {
+        let push_value = Value::Push {
+            kind: push_msg.kind,
+            data: push_msg.data,
+        };
+        // callback_idx is not used with push notifications
+        completions.push(0, Completion::Push(leak_value(push_value)));
+    }
+}
+
+#[pymethods]
+impl NativeClient {
+    /// Connects a new client using a serialized protobuf `ConnectionRequest`.
+    ///
+    /// `wakeup` is called, from a runtime thread, whenever completed requests are waiting to be taken.
+    /// `init_callback` is called, from a runtime thread, with either the created client or an error message.
+    #[staticmethod]
+    fn create(
+        connection_request: &[u8],
+        wakeup: PyObject,
+        init_callback: PyObject,
+    ) -> PyResult<()> {
+        let request = ConnectionRequest::parse_from_bytes(connection_request).map_err(|err| {
+            PyValueError::new_err(format!("Received invalid connection request: {err}"))
+        })?;
+        let completions = Arc::new(CompletionQueue::new(wakeup));
+        runtime().spawn(async move {
+            let (push_tx, push_rx) = mpsc::unbounded_channel();
+            let result = Client::new(request.into(), Some(push_tx)).await;
+            let result = result.map(|client| {
+                runtime().spawn(push_notifications_loop(push_rx, Arc::clone(&completions)));
+                NativeClient {
+                    client: RwLock::new(Some(client)),
+                    completions: Some(completions),
+                }
+            });
+            Python::with_gil(|py| {
+                let args = match result
+                    .map_err(|err| err.to_string())
+                    .and_then(|client| Py::new(py, client).map_err(|err| err.to_string()))
+                {
+                    Ok(client) => (client.into_py(py), py.None()),
+                    Err(err_message) => (py.None(), err_message.into_py(py)),
+                };
+                if let Err(err) = init_callback.call1(py, args) {
+                    err.print(py);
+                }
+            });
+        });
+        Ok(())
+    }
+
+    /// Connects a new blocking client using a serialized protobuf `ConnectionRequest`.
+    ///
+    /// Waits for the connection without holding the GIL, and returns a tuple of either the created
+    /// client and `None`, or `None` and an error message. Push notifications aren't supported.
+    #[staticmethod]
+    fn connect(py: Python, connection_request: &[u8]) -> PyResult<(PyObject, PyObject)> {
+        let request = ConnectionRequest::parse_from_bytes(connection_request).map_err(|err| {
+            PyValueError::new_err(format!("Received invalid connection request: {err}"))
+        })?;
+        let result = py.allow_threads(|| runtime().block_on(Client::new(request.into(), None)));
+        match result {
+            Ok(client) => {
+                let client = NativeClient {
+                    client: RwLock::new(Some(client)),
+                    completions: None,
+                };
+                Ok((Py::new(py, client)?.into_py(py), py.None()))
+            }
+            Err(err) => Ok((py.None(), err.to_string().into_py(py))),
+        }
+    }
+
+    /// Returns the completed requests as a list of `(callback_idx, kind, payload)` tuples.
+    fn take_completions(&self, py: Python) -> PyResult<PyObject> {
+        match &self.completions {
+            Some(completions) => completions.take(py),
+            None => Ok(PyList::empty_bound(py).into_py(py)),
+        }
+    }
+
+    #[pyo3(signature = (callback_idx, request_type, args, route=None))]
+    fn send_command(
+        &self,
+        py: Python,
+        callback_idx: u32,
+        request_type: i32,
+        args: Vec<Bound<PyAny>>,
+        route: Option<&[u8]>,
+    ) -> PyResult<PyObject> {
+        let cmd = get_command(request_type, &args)?;
+        let routing = get_route(route, Some(&cmd))?;
+        self.submit_request(py, callback_idx, move |mut client| async move {
+            client.send_command(&cmd, routing).await
+        })
+    }
+
+    #[pyo3(signature = (callback_idx, commands, route=None))]
+    fn send_transaction(
+        &self,
+        py: Python,
+        callback_idx: u32,
+        commands: Vec<(i32, Vec<Bound<PyAny>>)>,
+        route: Option<&[u8]>,
+    ) -> PyResult<PyObject> {
+        let mut pipeline = redis::Pipeline::with_capacity(commands.len());
+        pipeline.atomic();
+        for (request_type, args) in commands.iter() {
+            pipeline.add_command(get_command(*request_type, args)?);
+        }
+        let routing = get_route(route, None)?;
+        self.submit_request(py, callback_idx, move |mut client| async move {
+            client.send_transaction(&pipeline, routing).await
+        })
+    }
+
+    /// Sends the commands without waiting for each other's responses.
+    ///
+    /// The commands are sent together, and each of them is routed like a single command. They are
+    /// driven by a single task that polls them in the order of the commands, so the commands that
+    /// are sent to the same connection are queued on it in that order, which separate requests run
+    /// on the multi-threaded runtime don't guarantee.
+    ///
+    /// The result of each command is queued under its own index of `callback_idxs`. If the client
+    /// is blocking, the results are waited for without holding the GIL instead, and returned as a
+    /// list of `(callback_idx, kind, payload)` tuples, in the order of the commands.
+    #[pyo3(signature = (callback_idxs, commands, route=None))]
+    fn send_commands(
+        &self,
+        py: Python,
+        callback_idxs: Vec<u32>,
+        commands: Vec<(i32, Vec<Bound<PyAny>>)>,
+        route: Option<&[u8]>,
+    ) -> PyResult<PyObject> {
+        if callback_idxs.len() != commands.len() {
+            return Err(PyValueError::new_err(
+                "Received a different number of callback indexes and commands",
+            ));
+        }
+        let client = self.get_client()?;
+        let mut requests = Vec::with_capacity(commands.len());
+        for (request_type, args) in commands.iter() {
+            let cmd = get_command(*request_type, args)?;
+            let routing = get_route(route, Some(&cmd))?;
+            requests.push((cmd, routing));
+        }
+        let requests = requests.into_iter().map(|(cmd, routing)| {
+            let mut client = client.clone();
+            async move {
+                if !client.reserve_inflight_request() {
+                    return Completion::RequestError(
+                        RequestErrorType::Unspecified as u32,
+                        "Reached maximum inflight requests".to_string(),
+                    );
+                }
+                let result = client.send_command(&cmd, routing).await;
+                client.release_inflight_request();
+                Completion::from(result)
+            }
+        });
+        let Some(completions) = &self.completions else {
+            let requests: Vec<_> = requests.collect();
+            let results = py.allow_threads(|| runtime().block_on(join_all(requests)));
+            let responses: Vec<PyObject> = results
+                .into_iter()
+                .zip(callback_idxs)
+                .map(|(completion, callback_idx)| completion.into_py_tuple(py, callback_idx))
+                .collect();
+            return Ok(PyList::new_bound(py, responses).into_py(py));
+        };
+        // Each result is queued as soon as it is received, without waiting for the other commands
+        let requests: Vec<_> = requests
+            .zip(callback_idxs)
+            .map(|(request, callback_idx)| {
+                let completions = Arc::clone(completions);
+                async move { completions.push(callback_idx, request.await) }
+            })
+            .collect();
+        runtime().spawn(join_all(requests));
+        Ok(py.None())
+    }
+
+    #[pyo3(signature = (callback_idx, hash, keys, args, route=None))]
+    fn invoke_script(
+        &self,
+        py: Python,
+        callback_idx: u32,
+        hash: String,
+        keys: Vec<Bound<PyAny>>,
+        args: Vec<Bound<PyAny>>,
+        route: Option<&[u8]>,
+    ) -> PyResult<PyObject> {
+        let keys: Vec<Vec<u8>> = args_bytes(&keys)?
+            .into_iter()
+            .map(|arg| arg.to_vec())
+            .collect();
+        let args: Vec<Vec<u8>> = args_bytes(&args)?
+            .into_iter()
+            .map(|arg| arg.to_vec())
+            .collect();
+        let routing = get_route(route, None)?;
+        self.submit_request(py, callback_idx, move |mut client| async move {
+            let keys: Vec<&[u8]> = keys.iter().map(|key| key.as_slice()).collect();
+            let args: Vec<&[u8]> = args.iter().map(|arg| arg.as_slice()).collect();
+            client.invoke_script(&hash, &keys, &args, routing).await
+        })
+    }
+
+    #[pyo3(signature = (callback_idx, cursor, match_pattern=None, count=None, object_type=None, allow_non_covered_slots=false, slot_ranges=None))]
+    #[allow(clippy::too_many_arguments)]
+    fn cluster_scan(
+        &self,
+        py: Python,
+        callback_idx: u32,
+        cursor: String,
+        match_pattern: Option<&[u8]>,
+        count: Option<u32>,
+        object_type: Option<String>,
+        allow_non_covered_slots: bool,
+        slot_ranges: Option<Vec<(u16, u16)>>,
+    ) -> PyResult<PyObject> {
+        let scan_state = if cursor.is_empty() {
+            ScanStateRC::new()
+        } else {
+            get_cluster_scan_cursor(cursor).map_err(|err| PyValueError::new_err(err.to_string()))?
+        };
+        let mut cluster_scan_args_builder =
+            ClusterScanArgs::builder().allow_non_covered_slots(allow_non_covered_slots);
+        if let Some(match_pattern) = match_pattern {
+            cluster_scan_args_builder = cluster_scan_args_builder.with_match_pattern(match_pattern);
+        }
+        if let Some(count) = count {
+            cluster_scan_args_builder = cluster_scan_args_builder.with_count(count);
+        }
+        if let Some(object_type) = object_type {
+            cluster_scan_args_builder =
+                cluster_scan_args_builder.with_object_type(object_type.into());
+        }
+        if let Some(slot_ranges) = slot_ranges {
+            cluster_scan_args_builder = cluster_scan_args_builder.with_slot_ranges(slot_ranges);
+        }
+        let cluster_scan_args = cluster_scan_args_builder.build();
+        self.submit_request(py, callback_idx, move |mut client| async move {
+            client.cluster_scan(&scan_state, cluster_scan_args).await
+        })
+    }
+
+    #[pyo3(signature = (callback_idx, password, immediate_auth))]
+    fn update_connection_password(
+        &self,
+        py: Python,
+        callback_idx: u32,
+        password: Option<String>,
+        immediate_auth: bool,
+    ) -> PyResult<PyObject> {
+        self.submit_request(py, callback_idx, move |mut client| async move {
+            client
+                .update_connection_password(password, immediate_auth)
+                .await
+        })
+    }
+
+    /// Releases the core client. Requests that are already running are allowed to complete.
+    fn close(&self) {
+        *self
+            .client
+            .write()
+            .expect("Failed to acquire the client lock") = None;
+    }
+}
@@ -0,0 +1,321 @@
+// Copyright Valkey GLIDE Project Contributors - SPDX Identifier: Apache-2.0
+
+//! Conversion of response `Value`s into Python objects.
+
+use crate::buffer::GlideBuffer;
+use pyo3::exceptions::{PyIndexError, PyTypeError};
+use pyo3::prelude::*;
+use pyo3::types::{PyBool, PyBytes, PyDict, PyFloat, PyList, PySet, PySlice, PyString, PyTuple};
+use redis::Value;
+
+/// The response is converted as is.
+pub const RESULT_ADAPTER_NONE: u8 = 0;
+/// A map response is returned as a list of `(key, value)` tuples.
+pub const RESULT_ADAPTER_PAIRS: u8 = 1;
+/// A map response is returned as a `(keys, values)` tuple of two lists.
+pub const RESULT_ADAPTER_PARALLEL_ARRAYS: u8 = 2;
+/// Every entry of a map of maps is returned as a `(key, field1, value1, field2, value2, ...)` row,
+/// and the maps in an array response are returned as lists of rows.
+pub const RESULT_ADAPTER_ROWS: u8 = 3;
+
+/// Options of the conversion of a response `Value` into Python objects.
+///
+/// Bulk strings that are large enough to be returned as `GlideBuffer` objects aren't decoded.
+#[derive(Clone, Copy, Default)]
+pub(crate) struct ResponseOptions {
+    /// Bulk strings of at least this many bytes are returned as `GlideBuffer` objects, rather than
+    /// copied into `bytes`.
+    pub(crate) buffer_min_size: Option<usize>,
+    /// Arrays of at least this many elements are returned as `LazyArray` objects, which convert
+    /// their elements only when they are accessed.
+    pub(crate) lazy_min_length: Option<usize>,
+    /// Bulk, simple and verbatim strings are returned as `str` rather than `bytes` when they hold
+    /// valid UTF-8.
+    pub(crate) decode: bool,
+}
+
+impl ResponseOptions {
+    /// The options for map keys and set members, which are always returned as hashable objects.
+    fn for_keys(self) -> Self {
+        ResponseOptions {
+            buffer_min_size: None,
+            lazy_min_length: None,
+            ..self
+        }
+    }
+
+    /// Returns the string as `str` if decoding is enabled and it is valid UTF-8, or as `bytes`
+    /// otherwise.
+    fn string_to_py(self, py: Python, data: &[u8]) -> PyObject {
+        if self.decode {
+            if let Ok(text) = std::str::from_utf8(data) {
+                return PyString::new_bound(py, text).into_py(py);
+            }
+        }
+        PyBytes::new_bound(py, data).into_py(py)
+    }
+}
+
+fn iter_to_value<TIterator>(
+    py: Python,
+    iter: impl IntoIterator<Item = Value, IntoIter = TIterator>,
+    options: ResponseOptions,
+) -> PyResult<Vec<PyObject>>
+where
+    TIterator: ExactSizeIterator<Item = Value>,
+{
+    let mut iterator = iter.into_iter();
+    let len = iterator.len();
+
+    iterator.try_fold(Vec::with_capacity(len), |mut acc, val| {
+        acc.push(resp_value_to_py(py, val, options)?);
+        Ok(acc)
+    })
+}
+
+pub(crate) fn resp_value_to_py(
+    py: Python,
+    val: Value,
+    options: ResponseOptions,
+) -> PyResult<PyObject> {
+    match val {
+        Value::Nil => Ok(py.None()),
+        Value::SimpleString(str) => Ok(options.string_to_py(py, str.as_bytes())),
+        Value::Okay => Ok("OK".into_py(py)),
+        Value::Int(num) => Ok(num.into_py(py)),
+        Value::BulkString(data) => match options.buffer_min_size {
+            Some(min_size) if data.len() >= min_size => {
+                Ok(Py::new(py, GlideBuffer::new(data))?.into_py(py))
+            }
+            _ => Ok(options.string_to_py(py, &data)),
+        },
+        Value::Array(bulk) => match options.lazy_min_length {
+            Some(min_length) if bulk.len() >= min_length => {
+                Ok(Py::new(py, LazyArray::new(bulk, options))?.into_py(py))
+            }
+            _ => {
+                let elements: Bound<PyList> =
+                    PyList::new_bound(py, iter_to_value(py, bulk, options)?);
+                Ok(elements.into_py(py))
+            }
+        },
+        Value::Map(map) => {
+            let dict = PyDict::new_bound(py);
+            for (key, value) in map {
+                dict.set_item(
+                    resp_value_to_py(py, key, options.for_keys())?,
+                    resp_value_to_py(py, value, options)?,
+                )?;
+            }
+            Ok(dict.into_py(py))
+        }
+        Value::Attribute { data, attributes } => {
+            let dict = PyDict::new_bound(py);
+            let value = resp_value_to_py(py, *data, options)?;
+            let attributes = resp_value_to_py(py, Value::Map(attributes), options)?;
+            dict.set_item("value", value)?;
+            dict.set_item("attributes", attributes)?;
+            Ok(dict.into_py(py))
+        }
+        Value::Set(set) => {
+            let set = iter_to_value(py, set, options.for_keys())?;
+            let set = PySet::new_bound(py, set.iter())?;
+            Ok(set.into_py(py))
+        }
+        Value::Double(double) => Ok(PyFloat::new_bound(py, double).into_py(py)),
+        Value::Boolean(boolean) => Ok(PyBool::new_bound(py, boolean).into_py(py)),
+        Value::VerbatimString { format: _, text } => {
+            // TODO create MATCH on the format
+            Ok(options.string_to_py(py, text.as_bytes()))
+        }
+        Value::BigNumber(bigint) => Ok(bigint.into_py(py)),
+        Value::Push { kind, data } => {
+            let dict = PyDict::new_bound(py);
+            dict.set_item("kind", format!("{kind:?}"))?;
+            let values: Bound<PyList> = PyList::new_bound(py, iter_to_value(py, data, options)?);
+            dict.set_item("values", values)?;
+            Ok(dict.into_py(py))
+        }
+    }
+}
+
+/// Converts a response with one of the `RESULT_ADAPTER_*` adapters, instead of building the
+/// generic containers. Responses that don't have the shape the adapter expects are converted as is.
+pub(crate) fn adapted_value_to_py(
+    py: Python,
+    val: Value,
+    options: ResponseOptions,
+    adapter: u8,
+) -> PyResult<PyObject> {
+    match (adapter, val) {
+        (RESULT_ADAPTER_PAIRS, Value::Map(map)) => {
+            let pairs = map
+                .into_iter()
+                .map(|(key, value)| {
+                    let key = resp_value_to_py(py, key, options.for_keys())?;
+                    let value = resp_value_to_py(py, value, options)?;
+                    Ok(PyTuple::new_bound(py, [key, value]).into_py(py))
+                })
+                .collect::<PyResult<Vec<_>>>()?;
+            Ok(PyList::new_bound(py, pairs).into_py(py))
+        }
+        (RESULT_ADAPTER_PARALLEL_ARRAYS, Value::Map(map)) => {
+            let mut keys = Vec::with_capacity(map.len());
+            let mut values = Vec::with_capacity(map.len());
+            for (key, value) in map {
+                keys.push(resp_value_to_py(py, key, options.for_keys())?);
+                values.push(resp_value_to_py(py, value, options)?);
+            }
+            let keys = PyList::new_bound(py, keys);
+            let values = PyList::new_bound(py, values);
+            Ok(PyTuple::new_bound(py, [keys.as_any(), values.as_any()]).into_py(py))
+        }
+        (RESULT_ADAPTER_ROWS, Value::Array(elements)) => {
+            let elements = elements
+                .into_iter()
+                .map(|element| adapted_value_to_py(py, element, options, RESULT_ADAPTER_ROWS))
+                .collect::<PyResult<Vec<_>>>()?;
+            Ok(PyList::new_bound(py, elements).into_py(py))
+        }
+        (RESULT_ADAPTER_ROWS, Value::Map(map)) => {
+            let rows = map
+                .into_iter()
+                .map(|(key, value)| {
+                    let mut row = vec![resp_value_to_py(py, key, options.for_keys())?];
+                    match value {
+                        Value::Map(fields) => {
+                            row.reserve(2 * fields.len());
+                            for (field, value) in fields {
+                                row.push(resp_value_to_py(py, field, options.for_keys())?);
+                                row.push(resp_value_to_py(py, value, options)?);
+                            }
+                        }
+                        value => row.push(resp_value_to_py(py, value, options)?),
+                    }
+                    Ok(PyTuple::new_bound(py, row).into_py(py))
+                })
+                .collect::<PyResult<Vec<_>>>()?;
+            Ok(PyList::new_bound(py, rows).into_py(py))
+        }
+        (_, val) => resp_value_to_py(py, val, options),
+    }
+}
+
+enum LazyElement {
+    Value(Value),
+    Converted(PyObject),
+}
+
+/// A read-only sequence holding the elements of an array response as they were received.
+///
+/// Elements are converted into Python objects when they are first indexed or iterated over, so
+/// `len()` and slicing don't convert the elements that aren't accessed. Comparing the array to a
+/// list, or calling `to_list()`, converts all of the elements.
+#[pyclass(sequence, module = "glide")]
+pub struct LazyArray {
+    elements: Vec<LazyElement>,
+    options: ResponseOptions,
+}
+
+impl LazyArray {
+    fn new(values: Vec<Value>, options: ResponseOptions) -> Self {
+        LazyArray {
+            elements: values.into_iter().map(LazyElement::Value).collect(),
+            options,
+        }
+    }
+
+    fn get(&mut self, py: Python, index: usize) -> PyResult<PyObject> {
+        let options = self.options;
+        let element = &mut self.elements[index];
+        if let LazyElement::Value(value) = element {
+            let value = std::mem::replace(value, Value::Nil);
+            *element = LazyElement::Converted(resp_value_to_py(py, value, options)?);
+        }
+        match element {
+            LazyElement::Converted(object) => Ok(object.clone_ref(py)),
+            LazyElement::Value(_) => unreachable!("the element was converted above"),
+        }
+    }
+}
+
+#[pymethods]
+impl LazyArray {
+    fn __len__(&self) -> usize {
+        self.elements.len()
+    }
+
+    fn __getitem__(&mut self, py: Python, index: &Bound<PyAny>) -> PyResult<PyObject> {
+        if let Ok(slice) = index.downcast::<PySlice>() {
+            let indices = slice.indices(self.elements.len() as _)?;
+            let mut elements = Vec::with_capacity(indices.slicelength as usize);
+            let mut position = indices.start as isize;
+            for _ in 0..indices.slicelength as usize {
+                elements.push(self.get(py, position as usize)?);
+                position += indices.step as isize;
+            }
+            return Ok(PyList::new_bound(py, elements).into_py(py));
+        }
+        let Ok(index) = index.extract::<isize>() else {
+            return Err(PyTypeError::new_err(
+                "LazyArray indices must be integers or slices",
+            ));
+        };
+        let length = self.elements.len() as isize;
+        let position = if index < 0 { index + length } else { index };
+        if position < 0 || position >= length {
+            return Err(PyIndexError::new_err("LazyArray index out of range"));
+        }
+        self.get(py, position as usize)
+    }
+
+    fn __iter__(slf: Bound<'_, Self>) -> LazyArrayIterator {
+        LazyArrayIterator {
+            array: slf.unbind(),
+            index: 0,
+        }
+    }
+
+    fn __eq__(slf: &Bound<'_, Self>, other: &Bound<PyAny>) -> PyResult<bool> {
+        if slf.is(other) {
+            return Ok(true);
+        }
+        let elements = slf.borrow_mut().to_list(slf.py())?;
+        elements.bind(slf.py()).eq(other)
+    }
+
+    fn __repr__(&self) -> String {
+        format!("LazyArray({} elements)", self.elements.len())
+    }
+
+    /// Converts all of the elements and returns them as a list.
+    fn to_list(&mut self, py: Python) -> PyResult<Py<PyList>> {
+        let elements = (0..self.elements.len())
+            .map(|index| self.get(py, index))
+            .collect::<PyResult<Vec<_>>>()?;
+        Ok(PyList::new_bound(py, elements).unbind())
+    }
+}
+
+#[pyclass(module = "glide")]
+pub struct LazyArrayIterator {
+    array: Py<LazyArray>,
+    index: usize,
+}
+
+#[pymethods]
+impl LazyArrayIterator {
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__(&mut self, py: Python) -> PyResult<Option<PyObject>> {
+        let mut array = self.array.bind(py).borrow_mut();
+        if self.index >= array.elements.len() {
+            return Ok(None);
+        }
+        let element = array.get(py, self.index)?;
+        self.index += 1;
+        Ok(Some(element))
+    }
+}